@@ -27,6 +27,7 @@ class Settings(BaseSettings):
     ado_organization: str = ""
     ado_project: str = ""
     ado_pat_token: str = ""
+    ado_mirror_path: str = "./qvf_work_items.db"
     
     class Config:
         env_file = ".env"
@@ -4,6 +4,8 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 
+from ..services.work_item_service import work_item_service
+
 router = APIRouter()
 
 
@@ -13,7 +15,7 @@ class WorkItem(BaseModel):
     state: str
     work_item_type: str
     assigned_to: Optional[str] = None
-    story_points: Optional[int] = None
+    story_points: Optional[float] = None
     priority: Optional[int] = None
     tags: List[str] = []
 
@@ -34,49 +36,21 @@ async def get_work_items(
     assigned_to: Optional[str] = None
 ):
     """Get work items with optional filtering."""
-    # TODO: Integrate with ADO sync service and QVF core
+    if not work_item_service.is_available():
+        raise HTTPException(status_code=503, detail="Work item mirror not available")
+    
     try:
-        # Placeholder implementation
-        items = [
-            WorkItem(
-                id=1,
-                title="Sample User Story",
-                state="Active",
-                work_item_type="User Story",
-                assigned_to="developer@example.com",
-                story_points=5,
-                priority=2,
-                tags=["frontend", "api"]
-            ),
-            WorkItem(
-                id=2,
-                title="Sample Bug Fix",
-                state="Active", 
-                work_item_type="Bug",
-                assigned_to="developer@example.com",
-                story_points=3,
-                priority=1,
-                tags=["bug", "critical"]
-            )
-        ]
-        
-        # Apply filters (placeholder logic)
-        filtered_items = items
-        if state:
-            filtered_items = [item for item in filtered_items if item.state == state]
-        if work_item_type:
-            filtered_items = [item for item in filtered_items if item.work_item_type == work_item_type]
-        if assigned_to:
-            filtered_items = [item for item in filtered_items if item.assigned_to == assigned_to]
-        
-        # Apply pagination
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_items = filtered_items[start_idx:end_idx]
+        result = work_item_service.list_work_items(
+            page=page,
+            page_size=page_size,
+            state=state,
+            work_item_type=work_item_type,
+            assigned_to=assigned_to
+        )
         
         return WorkItemsResponse(
-            items=paginated_items,
-            total_count=len(filtered_items),
+            items=[WorkItem(**item) for item in result["items"]],
+            total_count=result["total_count"],
             page=page,
             page_size=page_size
         )
@@ -88,32 +62,30 @@ async def get_work_items(
 @router.get("/{item_id}", response_model=WorkItem)
 async def get_work_item(item_id: int):
     """Get a specific work item by ID."""
-    # TODO: Implement actual work item lookup
-    if item_id == 1:
-        return WorkItem(
-            id=1,
-            title="Sample User Story",
-            state="Active",
-            work_item_type="User Story",
-            assigned_to="developer@example.com",
-            story_points=5,
-            priority=2,
-            tags=["frontend", "api"]
-        )
+    if not work_item_service.is_available():
+        raise HTTPException(status_code=503, detail="Work item mirror not available")
     
-    raise HTTPException(status_code=404, detail="Work item not found")
+    item = work_item_service.get_work_item(item_id)
+    if item is None:
+        raise HTTPException(status_code=404, detail="Work item not found")
+    
+    return WorkItem(**item)
 
 
 @router.post("/sync")
-async def sync_work_items():
-    """Trigger sync of work items from ADO."""
-    # TODO: Integrate with ADO sync service
+async def sync_work_items(full: bool = False):
+    """Sync the local work item mirror with ADO (changes only unless full)."""
+    if not work_item_service.is_available():
+        raise HTTPException(status_code=503, detail="Work item mirror not available")
+    if not work_item_service.is_sync_configured():
+        raise HTTPException(status_code=503, detail="ADO connection settings are not configured")
+    
     try:
-        # Placeholder implementation
+        result = await work_item_service.sync(full=full)
         return {
-            "message": "Sync initiated",
-            "status": "in_progress",
-            "estimated_completion": "2-3 minutes"
+            "message": "Sync completed",
+            "status": "completed",
+            **result
         }
     
     except Exception as e:
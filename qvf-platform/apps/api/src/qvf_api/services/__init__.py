@@ -2,5 +2,6 @@
 
 # Import the QVF service
 from .qvf_service import qvf_service, QVFService
+from .work_item_service import work_item_service, WorkItemService
 
-__all__ = ["qvf_service", "QVFService"]
\ No newline at end of file
+__all__ = ["qvf_service", "QVFService", "work_item_service", "WorkItemService"]
\ No newline at end of file
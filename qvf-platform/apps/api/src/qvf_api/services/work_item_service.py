@@ -0,0 +1,116 @@
+"""Work Item Service - Serves work items from the local ADO mirror."""
+
+from typing import Dict, Any, Optional
+import logging
+
+from ..config import get_settings
+from .qvf_service import QVF_CORE_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+try:
+    if not QVF_CORE_AVAILABLE:
+        raise ImportError("QVF Core not available")
+    # qvf_service has put the project root on the path
+    from src.datascience_platform.qvf.ado.mirror import WorkItemMirror
+    from src.datascience_platform.qvf.ado.work_items import WorkItemManager
+    MIRROR_AVAILABLE = True
+except ImportError as e:
+    logger.error(f"Work item mirror import failed: {e}")
+    WorkItemMirror = None
+    WorkItemManager = None
+    MIRROR_AVAILABLE = False
+
+
+class WorkItemService:
+    """Service layer for work item queries and ADO sync."""
+    
+    def __init__(self):
+        """Initialize work item service."""
+        self.settings = get_settings()
+        self._mirror = None
+    
+    def is_available(self) -> bool:
+        """Check if the work item mirror can be used."""
+        return MIRROR_AVAILABLE
+    
+    def is_sync_configured(self) -> bool:
+        """Check if ADO settings for syncing are present."""
+        return bool(self.settings.ado_organization and self.settings.ado_project and self.settings.ado_pat_token)
+    
+    @property
+    def mirror(self):
+        """Open the mirror database on first use."""
+        if self._mirror is None:
+            self._mirror = WorkItemMirror(self.settings.ado_mirror_path)
+        return self._mirror
+    
+    def list_work_items(
+        self,
+        page: int,
+        page_size: int,
+        state: Optional[str] = None,
+        work_item_type: Optional[str] = None,
+        assigned_to: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get one page of work items matching the filters."""
+        filters = {
+            "states": [state] if state else None,
+            "work_item_types": [work_item_type] if work_item_type else None,
+            "assigned_to": assigned_to
+        }
+        project = self.settings.ado_project
+        
+        items = self.mirror.query(project, limit=page_size, offset=(page - 1) * page_size, **filters)
+        return {
+            "items": [self._format_work_item(item) for item in items],
+            "total_count": self.mirror.count(project, **filters)
+        }
+    
+    def get_work_item(self, item_id: int) -> Optional[Dict[str, Any]]:
+        """Get a work item by ID."""
+        item = self.mirror.get_work_item(item_id)
+        return self._format_work_item(item) if item else None
+    
+    async def sync(self, full: bool = False) -> Dict[str, Any]:
+        """Sync the mirror with ADO."""
+        organization_url = self.settings.ado_organization
+        if not organization_url.startswith("https://"):
+            organization_url = f"https://dev.azure.com/{organization_url}"
+        
+        manager = WorkItemManager(organization_url, self.settings.ado_pat_token, mirror=self.mirror)
+        async with manager:
+            result = await manager.sync_mirror(self.settings.ado_project, full=full)
+        
+        return {
+            "work_items_synced": result.work_items_synced,
+            "full_sync": result.full_sync,
+            "watermark": result.watermark.isoformat() if result.watermark else None,
+            "processing_time_seconds": result.processing_time_seconds
+        }
+    
+    @staticmethod
+    def _format_work_item(item: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a mirrored ADO payload to the API work item shape."""
+        fields = item["fields"]
+        assigned_to = fields.get("System.AssignedTo")
+        if isinstance(assigned_to, dict):
+            assigned_to = assigned_to.get("uniqueName") or assigned_to.get("displayName")
+        
+        story_points = fields.get("Microsoft.VSTS.Scheduling.StoryPoints")
+        tags = fields.get("System.Tags") or ""
+        
+        return {
+            "id": item["id"],
+            "title": fields.get("System.Title", ""),
+            "state": fields.get("System.State", ""),
+            "work_item_type": fields.get("System.WorkItemType", ""),
+            "assigned_to": assigned_to,
+            "story_points": float(story_points) if story_points is not None else None,
+            "priority": fields.get("Microsoft.VSTS.Common.Priority"),
+            "tags": [tag.strip() for tag in tags.split(";") if tag.strip()]
+        }
+
+
+# Global service instance
+work_item_service = WorkItemService()
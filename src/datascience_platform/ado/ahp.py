@@ -4,6 +4,7 @@ This module implements the AHP methodology for multi-criteria decision making,
 enabling objective prioritization of ADO work items based on configurable criteria.
 """
 
+import heapq
 import numpy as np
 from typing import List, Dict, Tuple, Optional, Any, Union
 from pydantic import BaseModel, Field, validator
@@ -267,6 +268,35 @@ class AHPEngine:
         self.consistency_ratio = cr
         return cr
     
+    def calculate_weights_batch(self, matrices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate weights and consistency ratios for stacked comparison matrices.
+        
+        All principal eigenvectors are solved in one batched eigendecomposition.
+        Unlike calculate_weights, the engine state is left unchanged.
+        
+        Args:
+            matrices: Comparison matrices of shape (count, n, n)
+            
+        Returns:
+            Tuple of (weights of shape (count, n), consistency ratios of shape (count,))
+        """
+        count, n = matrices.shape[0], matrices.shape[-1]
+        
+        eigenvalues, eigenvectors = np.linalg.eig(matrices)
+        
+        # Principal eigenvector of each matrix, normalized to sum to 1 and made positive
+        max_idx = np.argmax(eigenvalues.real, axis=1)
+        principal_eigenvectors = np.take_along_axis(eigenvectors, max_idx[:, np.newaxis, np.newaxis], axis=2)[:, :, 0].real
+        weights = np.abs(principal_eigenvectors / principal_eigenvectors.sum(axis=1, keepdims=True))
+        
+        # λmax, CI and CR per matrix
+        lambda_max = np.mean((matrices @ weights[:, :, np.newaxis])[:, :, 0] / weights, axis=1)
+        ci = (lambda_max - n) / (n - 1) if n > 1 else np.zeros(count)
+        ri = self.random_index.get(n, 1.49)
+        consistency_ratios = ci / ri if ri > 0 else np.zeros(count)
+        
+        return weights, consistency_ratios
+    
     def is_consistent(self) -> bool:
         """Check if comparison matrix is consistent."""
         if self.consistency_ratio is None:
@@ -456,19 +486,115 @@ class AHPEngine:
         
         return total_score, criterion_scores
     
+    @staticmethod
+    def extract_criterion_value(item: Dict[str, Any], criterion: AHPCriterion) -> float:
+        """Extract the raw numeric value of a criterion from a work item.
+        
+        Args:
+            item: Work item values keyed by data source
+            criterion: Criterion to extract
+            
+        Returns:
+            Numeric value (categorical values mapped, invalid values as 0.0)
+        """
+        value = item.get(criterion.data_source, 0)
+        if criterion.value_mapping and isinstance(value, str):
+            value = criterion.value_mapping.get(value, 0)
+        try:
+            return float(value) if value is not None else 0.0
+        except (ValueError, TypeError):
+            return 0.0
+    
+    @staticmethod
+    def calculate_normalization_stats(values: np.ndarray, method: str) -> Dict[str, float]:
+        """Calculate the population statistics a normalization method depends on.
+        
+        Args:
+            values: Raw criterion values across all work items
+            method: Normalization method (minmax, zscore, none)
+            
+        Returns:
+            Statistics dictionary consumed by apply_normalization
+        """
+        stats = {'count': float(len(values))}
+        
+        if len(values) > 1:
+            if method == 'minmax':
+                stats['min'] = float(values.min())
+                stats['max'] = float(values.max())
+            elif method == 'zscore':
+                stats['mean'] = float(values.mean())
+                stats['std'] = float(values.std())
+        
+        return stats
+    
+    @staticmethod
+    def apply_normalization(values: np.ndarray, method: str, stats: Dict[str, float]) -> np.ndarray:
+        """Normalize criterion values using previously calculated statistics.
+        
+        Args:
+            values: Raw criterion values (any subset of the population)
+            method: Normalization method (minmax, zscore, none)
+            stats: Statistics from calculate_normalization_stats
+            
+        Returns:
+            Normalized values
+        """
+        if method == 'minmax' and stats.get('count', 0) > 1:
+            min_val, max_val = stats['min'], stats['max']
+            if max_val > min_val:
+                return (values - min_val) / (max_val - min_val)
+            return np.ones_like(values) * 0.5
+        
+        if method == 'zscore' and stats.get('count', 0) > 1:
+            mean, std = stats['mean'], stats['std']
+            if std > 0:
+                # Convert to 0-1 range using sigmoid
+                return 1 / (1 + np.exp(-((values - mean) / std)))
+            return np.ones_like(values) * 0.5
+        
+        return values
+    
     def rank_work_items(
         self, 
-        work_items: List[Dict[str, Any]]
+        work_items: List[Dict[str, Any]],
+        top_k: Optional[int] = None
     ) -> List[Tuple[int, float, Dict[str, float]]]:
         """Rank work items using AHP scoring.
         
         Args:
             work_items: List of work items with values
+            top_k: Only return the k highest scoring items (selected with a
+                heap instead of sorting every score)
             
         Returns:
             List of tuples (work_item_index, total_score, criterion_scores)
             sorted by score descending
         """
+        scores = self.score_work_items(work_items)
+        
+        if top_k is not None:
+            # Same order as the stable sort below, without sorting the tail
+            return heapq.nlargest(top_k, scores, key=lambda x: x[1])
+        
+        # Sort by score descending
+        scores.sort(key=lambda x: x[1], reverse=True)
+        
+        return scores
+    
+    def score_work_items(
+        self,
+        work_items: List[Dict[str, Any]]
+    ) -> List[Tuple[int, float, Dict[str, float]]]:
+        """Score work items using AHP without ranking them.
+        
+        Args:
+            work_items: List of work items with values
+            
+        Returns:
+            List of tuples (work_item_index, total_score, criterion_scores)
+            in input order
+        """
         if not self.is_consistent():
             logger.warning(f"Comparison matrix is inconsistent (CR={self.consistency_ratio:.3f})")
         
@@ -479,38 +605,16 @@ class AHPEngine:
         
         for item in work_items:
             for criterion in self.config.criteria:
-                value = item.get(criterion.data_source, 0)
-                if criterion.value_mapping and isinstance(value, str):
-                    value = criterion.value_mapping.get(value, 0)
-                try:
-                    value = float(value) if value is not None else 0.0
-                except (ValueError, TypeError):
-                    value = 0.0
-                all_values[criterion.name].append(value)
+                all_values[criterion.name].append(self.extract_criterion_value(item, criterion))
         
         # Normalize values by criterion
         normalized_values = {}
         for criterion in self.config.criteria:
             values = np.array(all_values[criterion.name])
-            
-            if criterion.normalization_method == 'minmax' and len(values) > 1:
-                min_val, max_val = values.min(), values.max()
-                if max_val > min_val:
-                    normalized = (values - min_val) / (max_val - min_val)
-                else:
-                    normalized = np.ones_like(values) * 0.5
-            elif criterion.normalization_method == 'zscore' and len(values) > 1:
-                mean, std = values.mean(), values.std()
-                if std > 0:
-                    normalized = (values - mean) / std
-                    # Convert to 0-1 range using sigmoid
-                    normalized = 1 / (1 + np.exp(-normalized))
-                else:
-                    normalized = np.ones_like(values) * 0.5
-            else:
-                normalized = values
-            
-            normalized_values[criterion.name] = normalized
+            stats = self.calculate_normalization_stats(values, criterion.normalization_method)
+            normalized_values[criterion.name] = self.apply_normalization(
+                values, criterion.normalization_method, stats
+            )
         
         # Second pass: calculate scores with normalized values
         for idx, item in enumerate(work_items):
@@ -521,9 +625,6 @@ class AHPEngine:
             score, criterion_scores = self.calculate_work_item_score(item_normalized)
             scores.append((idx, score, criterion_scores))
         
-        # Sort by score descending
-        scores.sort(key=lambda x: x[1], reverse=True)
-        
         return scores
     
     def perform_advanced_sensitivity_analysis(
@@ -939,29 +1040,51 @@ class AHPEngine:
         
         logger.info(f"Performing group AHP analysis with {len(participant_matrices)} participants")
         
-        # Calculate individual weights for each participant
+        # Stack well-formed participant matrices for a single batched solve
+        n = len(self.config.criteria)
+        participant_ids = []
+        stacked_matrices = []
+        for participant_id, matrix in participant_matrices.items():
+            try:
+                matrix = np.asarray(matrix, dtype=float)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Failed to process participant {participant_id}: {e}")
+                continue
+            
+            if matrix.shape != (n, n) or not np.all(np.isfinite(matrix)):
+                logger.warning(f"Failed to process participant {participant_id}: expected a finite {n}x{n} matrix")
+                continue
+            
+            participant_ids.append(participant_id)
+            stacked_matrices.append(matrix)
+        
         individual_weights = {}
         participant_consistency = {}
         
-        for participant_id, matrix in participant_matrices.items():
+        if stacked_matrices:
             try:
-                # Temporarily store current matrix
-                original_matrix = self.comparison_matrix
-                
-                # Calculate weights for this participant
-                self.comparison_matrix = matrix
-                weights = self.calculate_weights(matrix)
-                cr = self.calculate_consistency_ratio(matrix, weights)
-                
-                individual_weights[participant_id] = weights
-                participant_consistency[participant_id] = cr
+                weights, consistency_ratios = self.calculate_weights_batch(np.stack(stacked_matrices))
+            except np.linalg.LinAlgError:
+                # Solve one by one so a single failing matrix only drops its participant
+                weights, consistency_ratios, solved_ids = [], [], []
+                for participant_id, matrix in zip(participant_ids, stacked_matrices):
+                    try:
+                        matrix_weights, matrix_ratios = self.calculate_weights_batch(matrix[np.newaxis])
+                    except np.linalg.LinAlgError as e:
+                        logger.warning(f"Failed to process participant {participant_id}: {e}")
+                        continue
+                    weights.append(matrix_weights[0])
+                    consistency_ratios.append(matrix_ratios[0])
+                    solved_ids.append(participant_id)
+                participant_ids = solved_ids
                 
-                # Restore original matrix
-                self.comparison_matrix = original_matrix
+            for participant_id, participant_weights, cr in zip(participant_ids, weights, consistency_ratios):
+                individual_weights[participant_id] = participant_weights
+                participant_consistency[participant_id] = float(cr)
                 
-            except Exception as e:
-                logger.warning(f"Failed to process participant {participant_id}: {e}")
-                continue
+            # Engine consistency reflects the last participant, as with sequential calculate_weights calls
+            if participant_consistency:
+                self.consistency_ratio = participant_consistency[participant_ids[-1]]
         
         if not individual_weights:
             raise ValueError("No valid participant matrices")
@@ -1012,53 +1135,29 @@ class AHPEngine:
     ) -> np.ndarray:
         """Calculate group weights using consistency-weighted average."""
         # Weight participants by their consistency (lower CR = higher weight)
-        participant_weights = {}
-        for participant_id in individual_weights.keys():
-            cr = participant_consistency.get(participant_id, 1.0)
-            # Convert CR to weight (higher consistency = higher weight)
-            participant_weights[participant_id] = max(0.1, 1.0 - cr)
-        
-        # Normalize participant weights
-        total_weight = sum(participant_weights.values())
-        for participant_id in participant_weights:
-            participant_weights[participant_id] /= total_weight
+        consistency_ratios = np.array([participant_consistency.get(participant_id, 1.0) for participant_id in individual_weights])
+        participant_weights = np.maximum(0.1, 1.0 - consistency_ratios)
+        participant_weights /= participant_weights.sum()
         
         # Calculate weighted average
-        group_weights = np.zeros(len(self.config.criteria))
-        for participant_id, weights in individual_weights.items():
-            p_weight = participant_weights[participant_id]
-            group_weights += p_weight * weights
-        
-        return group_weights
+        return participant_weights @ np.array(list(individual_weights.values()))
     
     def _calculate_agreement_matrix(self, individual_weights: Dict[str, np.ndarray]) -> np.ndarray:
         """Calculate agreement matrix between participants."""
-        participants = list(individual_weights.keys())
-        n_participants = len(participants)
-        agreement_matrix = np.zeros((n_participants, n_participants))
-        
-        for i, p1 in enumerate(participants):
-            for j, p2 in enumerate(participants):
-                if i == j:
-                    agreement_matrix[i, j] = 1.0
-                else:
-                    # Calculate correlation between weight vectors
-                    weights1 = individual_weights[p1]
-                    weights2 = individual_weights[p2]
-                    
-                    correlation = np.corrcoef(weights1, weights2)[0, 1]
-                    agreement_matrix[i, j] = max(0, correlation)  # Ensure non-negative
+        weights_array = np.array(list(individual_weights.values()))
+        
+        # Correlation between every pair of weight vectors (undefined correlations count as no agreement)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlations = np.atleast_2d(np.corrcoef(weights_array))
+        agreement_matrix = np.maximum(0, np.nan_to_num(correlations, nan=0.0))  # Ensure non-negative
+        np.fill_diagonal(agreement_matrix, 1.0)
         
         return agreement_matrix
     
     def _calculate_consensus_ratio(self, individual_weights: Dict[str, np.ndarray], group_weights: np.ndarray) -> float:
         """Calculate consensus ratio (how well group weights represent individuals)."""
-        deviations = []
-        
-        for weights in individual_weights.values():
-            # Calculate Euclidean distance to group weights
-            deviation = np.linalg.norm(weights - group_weights)
-            deviations.append(deviation)
+        # Euclidean distance of every participant to the group weights
+        deviations = np.linalg.norm(np.array(list(individual_weights.values())) - group_weights, axis=1)
         
         # Convert to consensus ratio (0-1, higher is better consensus)
         avg_deviation = np.mean(deviations)
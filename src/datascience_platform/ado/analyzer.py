@@ -9,18 +9,40 @@ import numpy as np
 from typing import List, Dict, Optional, Tuple, Any, Union
 from pathlib import Path
 import json
+import heapq
 import logging
 
 from ..orchestrator.pipeline import AnalyticsPipeline, PipelineConfig
 from ..dashboard.generator import DashboardGenerator
-from .models import ADOWorkItem, WorkItemHierarchy, WorkItemType
+from .models import ADOWorkItem, WorkItemHierarchy, WorkItemType, WorkItemState
 from .ahp import AHPEngine, AHPConfiguration, AHPCriterion
 from .metrics import AgileMetricsCalculator
 from .simulation import ADODataSimulator
-from .data_validator import RobustDataProcessor, FilterableDataProcessor, DataValidationError
+from .data_validator import RobustDataProcessor, FilterableDataProcessor, DataValidationError, DataTypeInferencer
 
 logger = logging.getLogger(__name__)
 
+# ADOWorkItem fields converted column by column in load_from_dataframe
+_REQUIRED_FIELDS = ('work_item_id', 'title', 'work_item_type', 'state')
+_ENUM_FIELDS = {'work_item_type': WorkItemType, 'state': WorkItemState}
+_INT_FIELDS = ('work_item_id', 'parent_id', 'pi_number')
+_TEXT_FIELDS = ('title', 'iteration_path', 'area_path', 'assigned_to', 'strategy_pillar', 'okr_alignment')
+_DATE_FIELDS = ('created_date', 'activated_date', 'resolved_date', 'closed_date', 'target_date')
+_FLOAT_BOUNDS = {
+    'business_value_raw': (0, None),
+    'business_value_normalized': (0, 1),
+    'story_points': (0, None),
+    'effort_hours': (0, None),
+    'complexity_score': (0, 100),
+    'risk_score': (0, 100),
+    'cycle_time_days': (0, None),
+    'lead_time_days': (0, None),
+    'blocked_days': (0, None)
+}
+_COLUMNAR_FIELDS = (
+    tuple(_ENUM_FIELDS) + _INT_FIELDS + _TEXT_FIELDS + _DATE_FIELDS + tuple(_FLOAT_BOUNDS) + ('tags',)
+)
+
 
 class ADOAnalyzer:
     """Main analyzer for ADO work items with AHP and metrics."""
@@ -108,6 +130,24 @@ class ADOAnalyzer:
         
         return self.load_from_dataframe(df)
     
+    def load_from_mirror(self, mirror, project_name: str, **filters) -> List[ADOWorkItem]:
+        """Load ADO work items from a local work item mirror.
+        
+        Args:
+            mirror: WorkItemMirror kept in sync with ADO
+            project_name: Name of the ADO project
+            **filters: Mirror query filters (states, work_item_types,
+                area_path, iteration_path, ...)
+            
+        Returns:
+            List of loaded work items
+        """
+        df = mirror.to_dataframe(project_name, **filters)
+        if df.empty:
+            raise DataValidationError(f"No work items in mirror for project {project_name}")
+        
+        return self.load_from_dataframe(df)
+    
     def load_from_dataframe(self, df: pd.DataFrame) -> List[ADOWorkItem]:
         """Load ADO work items from pandas DataFrame with validation.
         
@@ -179,10 +219,133 @@ class ADOAnalyzer:
         # Rename columns based on mapping
         df_renamed = df.rename(columns=column_mapping)
         
-        # Convert to work items
-        for _, row in df_renamed.iterrows():
-            work_item_data = row.to_dict()
+        # Convert to work items column by column
+        self.work_items = self._work_items_from_columns(df_renamed)
+            
+        # Build hierarchy
+        self._build_hierarchy()
+        
+        return self.work_items
+    
+    def _work_items_from_columns(self, df: pd.DataFrame) -> List[ADOWorkItem]:
+        """Build work items from a DataFrame with model field columns.
+        
+        Each column is converted and checked against the ADOWorkItem field
+        constraints once; rows failing a check are skipped, as model
+        validation would. The remaining rows are built without per-row
+        validation. Frames with fields not handled here fall back to
+        validating each row.
+        
+        Args:
+            df: DataFrame with columns named after ADOWorkItem fields
+            
+        Returns:
+            List of work items
+        """
+        # Later duplicate columns win, as with a per-row dict
+        df = df.loc[:, ~df.columns.duplicated(keep='last')].reset_index(drop=True)
+        fields = [column for column in df.columns if column in ADOWorkItem.model_fields]
+        
+        unsupported = set(fields) - set(_COLUMNAR_FIELDS)
+        if unsupported:
+            logger.debug(f"Validating work items row by row for fields {sorted(unsupported)}")
+            return self._work_items_from_rows(df[fields])
+        
+        missing_required = [name for name in _REQUIRED_FIELDS if name not in df.columns]
+        if missing_required:
+            logger.warning(f"Failed to parse work items: missing required fields {missing_required}")
+            return []
+        
+        valid = np.ones(len(df), dtype=bool)
+        columns = {}
+        for name in fields:
+            values, invalid = self._convert_column(name, df[name])
+            if invalid.any():
+                logger.warning(f"Skipping {int(invalid.sum())} work items with invalid {name}")
+                valid &= ~invalid
+            columns[name] = values
+        
+        # Fresh containers for factory defaults (model_construct resolves
+        # default factories through slow signature inspection)
+        factory_fields = [
+            (name, field_info.default_factory)
+            for name, field_info in ADOWorkItem.model_fields.items()
+            if field_info.default_factory is not None
+        ]
+        
+        work_items = []
+        for row, is_valid in zip(zip(*(columns[name] for name in fields)), valid):
+            if not is_valid:
+                continue
+            values = {name: factory() for name, factory in factory_fields}
+            values.update((name, value) for name, value in zip(fields, row) if value is not None)
+            work_items.append(ADOWorkItem.model_construct(**values))
+        
+        return work_items
+    
+    def _convert_column(self, name: str, series: pd.Series) -> Tuple[List[Any], np.ndarray]:
+        """Convert a column to field values (None if missing) and flag invalid rows."""
+        missing = series.isna().to_numpy()
+        
+        if name in _ENUM_FIELDS:
+            enum_type = _ENUM_FIELDS[name]
+            converted = series.map({member.value: member for member in enum_type})
+            invalid = converted.isna().to_numpy()
+            return converted.astype(object).where(~invalid, None).tolist(), invalid
+        
+        if name in _TEXT_FIELDS:
+            is_text = series.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+            invalid = ~missing & ~is_text
+            if name in _REQUIRED_FIELDS:
+                invalid |= missing
+            return series.astype(object).where(is_text, None).tolist(), invalid
+        
+        if name == 'tags':
+            def to_tags(value):
+                if isinstance(value, str):
+                    return value.split(';')
+                if isinstance(value, (list, np.ndarray)) and len(value) > 0:
+                    return list(value)
+                return None
             
+            return series.map(to_tags).tolist(), np.zeros(len(series), dtype=bool)
+        
+        if name in _DATE_FIELDS:
+            parsed = self._parse_date_column(series)
+            unparsed = ~missing & parsed.isna().to_numpy()
+            if unparsed.any():
+                logger.warning(f"Ignoring {int(unparsed.sum())} unparseable {name} values")
+            return parsed.astype(object).where(parsed.notna(), None).tolist(), np.zeros(len(series), dtype=bool)
+        
+        numeric = pd.to_numeric(series, errors='coerce')
+        invalid = ~missing & numeric.isna().to_numpy()
+        
+        if name in _INT_FIELDS:
+            invalid |= (numeric % 1 != 0).to_numpy(dtype=bool, na_value=False) & ~missing
+            if name in _REQUIRED_FIELDS:
+                invalid |= missing
+            ok = ~invalid & ~missing
+            return [int(value) if keep else None for value, keep in zip(numeric.tolist(), ok)], invalid
+        
+        lower, upper = _FLOAT_BOUNDS[name]
+        if lower is not None:
+            invalid |= (numeric < lower).to_numpy(dtype=bool, na_value=False)
+        if upper is not None:
+            invalid |= (numeric > upper).to_numpy(dtype=bool, na_value=False)
+        return numeric.astype(object).where(numeric.notna(), None).tolist(), invalid
+    
+    @staticmethod
+    def _parse_date_column(series: pd.Series) -> pd.Series:
+        """Parse a date column, trying known formats per column if the format is mixed."""
+        try:
+            return pd.to_datetime(series)
+        except (ValueError, TypeError, OverflowError):
+            return DataTypeInferencer().convert_to_date(series)
+    
+    def _work_items_from_rows(self, df: pd.DataFrame) -> List[ADOWorkItem]:
+        """Build work items with full model validation of each row."""
+        work_items = []
+        for work_item_data in df.to_dict('records'):
             # Clean up data - handle arrays properly
             cleaned_data = {}
             for k, v in work_item_data.items():
@@ -197,30 +360,23 @@ class ADOAnalyzer:
             work_item_data = cleaned_data
             
             # Parse dates
-            for date_field in ['created_date', 'closed_date', 'activated_date', 'resolved_date']:
+            for date_field in _DATE_FIELDS:
                 if date_field in work_item_data:
-                    work_item_data[date_field] = pd.to_datetime(work_item_data[date_field])
+                    work_item_data[date_field] = pd.to_datetime(work_item_data[date_field], errors='coerce')
+                    if pd.isna(work_item_data[date_field]):
+                        del work_item_data[date_field]
             
             # Parse tags
             if 'tags' in work_item_data and isinstance(work_item_data['tags'], str):
                 work_item_data['tags'] = work_item_data['tags'].split(';')
             
-            # Create appropriate work item type
             try:
-                work_item_type = WorkItemType(work_item_data.get('work_item_type', 'User Story'))
-                
-                # Create work item
-                work_item = ADOWorkItem(**work_item_data)
-                self.work_items.append(work_item)
-                
+                work_items.append(ADOWorkItem(**work_item_data))
             except Exception as e:
                 logger.warning(f"Failed to parse work item: {e}")
                 continue
         
-        # Build hierarchy
-        self._build_hierarchy()
-        
-        return self.work_items
+        return work_items
     
     def load_simulated_data(
         self,
@@ -446,12 +602,12 @@ class ADOAnalyzer:
             }
             work_items_data.append(item_data)
         
-        # Rank work items
-        rankings = self.ahp_engine.rank_work_items(work_items_data)
+        # Score work items; only the head and tail of the ranking are needed
+        scores = self.ahp_engine.score_work_items(work_items_data)
         
         # Create prioritized list
         prioritized_items = []
-        for idx, score, criterion_scores in rankings[:20]:  # Top 20 items
+        for idx, score, criterion_scores in heapq.nlargest(20, scores, key=lambda x: x[1]):  # Top 20 items
             item = self.work_items[idx]
             prioritized_items.append({
                 'rank': len(prioritized_items) + 1,
@@ -465,10 +621,11 @@ class ADOAnalyzer:
                 'state': item.state.value
             })
         
-        # Identify items to defer (bottom 10%)
-        defer_threshold = int(len(rankings) * 0.9)
+        # Identify items to defer (bottom 10%, in descending ranking order)
+        defer_count = len(scores) - int(len(scores) * 0.9)
+        bottom_items = heapq.nsmallest(defer_count, scores, key=lambda x: (x[1], -x[0]))
         defer_candidates = []
-        for idx, score, _ in rankings[defer_threshold:]:
+        for idx, score, _ in reversed(bottom_items):
             item = self.work_items[idx]
             if not item.is_completed():
                 defer_candidates.append({
@@ -482,7 +639,7 @@ class ADOAnalyzer:
             'ahp_config': self.ahp_engine.export_results(),
             'top_priorities': prioritized_items,
             'defer_candidates': defer_candidates[:10],  # Top 10 to defer
-            'total_items_ranked': len(rankings)
+            'total_items_ranked': len(scores)
         }
     
     def create_dashboard(
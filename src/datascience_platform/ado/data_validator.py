@@ -90,72 +90,93 @@ class DataTypeInferencer:
         return max(type_counts, key=type_counts.get)
     
     def convert_to_numeric(self, series: pd.Series, column_name: str = '') -> pd.Series:
-        """Convert series to numeric, handling various formats."""
-        def clean_numeric(value):
-            if pd.isna(value):
-                return np.nan
+        """Convert series to numeric, handling various formats.
             
-            str_val = str(value).strip()
+        Percentages are divided by 100, currency symbols and thousands
+        separators are stripped and parenthesized values are negated, all
+        with vectorized string operations. Story point columns are snapped
+        to the nearest valid story point value.
+        """
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            values = series.astype(float)
+            is_percentage = pd.Series(False, index=series.index)
+        else:
+            str_vals = series.astype('string').str.strip()
             
             # Handle percentage
-            if '%' in str_val:
-                str_val = str_val.replace('%', '').strip()
-                try:
-                    return float(str_val) / 100
-                except:
-                    return np.nan
+            is_percentage = str_vals.str.contains('%', regex=False).fillna(False).astype(bool)
+            percentages = pd.to_numeric(
+                str_vals.where(is_percentage).str.replace('%', '', regex=False).str.strip(),
+                errors='coerce'
+            ) / 100
             
             # Handle currency
-            str_val = re.sub(r'[$£€¥,]', '', str_val).strip()
+            str_vals = str_vals.where(~is_percentage).str.replace(r'[$£€¥,]', '', regex=True).str.strip()
             
             # Handle parentheses for negative numbers
-            if str_val.startswith('(') and str_val.endswith(')'):
-                str_val = '-' + str_val[1:-1]
+            negated = str_vals.str.startswith('(') & str_vals.str.endswith(')')
+            str_vals = str_vals.mask(negated.fillna(False).astype(bool), '-' + str_vals.str[1:-1])
             
-            # Handle story points (allow .5 values)
-            if column_name.lower() in ['story points', 'story_points', 'storypoints']:
-                try:
-                    val = float(str_val)
-                    # Common story point values: 0.5, 1, 2, 3, 5, 8, 13, 21
-                    if val in [0.5, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89]:
-                        return val
-                    else:
-                        # Round to nearest valid story point
-                        valid_points = [0.5, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89]
-                        return min(valid_points, key=lambda x: abs(x - val))
-                except:
-                    return np.nan
+            values = pd.to_numeric(str_vals, errors='coerce').astype(float)
+            values = values.mask(is_percentage, percentages.astype(float))
             
-            # Try conversion
-            try:
-                return float(str_val)
-            except:
-                return np.nan
-        
-        return series.apply(clean_numeric)
+        # Handle story points (allow .5 values)
+        if column_name.lower() in ['story points', 'story_points', 'storypoints']:
+            # Round to nearest valid story point: 0.5, 1, 2, 3, 5, 8, 13, 21, ...
+            valid_points = np.array([0.5, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89])
+            snap = values.notna() & ~is_percentage
+            raw = values[snap].to_numpy()
+            nearest = valid_points[np.abs(raw[:, None] - valid_points).argmin(axis=1)]
+            values = values.copy()
+            values[snap] = nearest
+        
+        return values
     
     def convert_to_date(self, series: pd.Series) -> pd.Series:
-        """Convert series to datetime, trying multiple formats."""
+        """Convert series to datetime, trying multiple formats.
+        
+        Each known format is parsed once for the whole column; only values
+        no format matched fall back to pandas' per-value parsing.
+        """
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series
+        
+        str_vals = series.astype('string').str.strip().reset_index(drop=True)
+        remaining = str_vals[str_vals.notna()]
+        parsed_parts = []
+        
+        # Try each date format on the values not parsed yet
+        for fmt in self.date_formats:
+            if remaining.empty:
+                break
+            parsed = pd.to_datetime(remaining, format=fmt, errors='coerce')
+            matched = parsed.notna()
+            parsed_parts.append(parsed[matched])
+            remaining = remaining[~matched]
+        
+        # Try pandas intelligent parsing as fallback
         def parse_date(value):
-            if pd.isna(value):
+            try:
+                return pd.to_datetime(value)
+            except (ValueError, TypeError, OverflowError):
                 return pd.NaT
             
-            str_val = str(value).strip()
+        if not remaining.empty:
+            parsed_parts.append(remaining.map(parse_date))
             
-            # Try each date format
-            for fmt in self.date_formats:
-                try:
-                    return pd.to_datetime(str_val, format=fmt)
-                except:
-                    continue
+        parsed_parts.append(pd.Series(pd.NaT, index=str_vals.index[str_vals.isna()], dtype='datetime64[ns]'))
+        parsed_parts = [part for part in parsed_parts if not part.empty]
+        if not parsed_parts:
+            return pd.Series(pd.NaT, index=series.index, dtype='datetime64[ns]')
             
-            # Try pandas intelligent parsing as fallback
-            try:
-                return pd.to_datetime(str_val)
-            except:
-                return pd.NaT
+        result = pd.concat(parsed_parts).sort_index()
         
-        return series.apply(parse_date)
+        # Fallback values are parsed one by one; unify them unless time zones differ
+        if result.dtype == object and not any(getattr(value, 'tzinfo', None) for value in result):
+            result = pd.to_datetime(result)
+        
+        result.index = series.index
+        return result
 
 
 class RobustDataProcessor:
@@ -447,9 +468,7 @@ class RobustDataProcessor:
                 'initiative': 'Epic'
             }
             
-            df['Work Item Type'] = df['Work Item Type'].str.lower().map(
-                lambda x: type_mapping.get(x, x.title()) if pd.notna(x) else 'Unknown'
-            )
+            df['Work Item Type'] = self._standardize_labels(df['Work Item Type'], type_mapping, 'Unknown')
         
         # Handle State standardization
         if 'State' in df.columns:
@@ -464,18 +483,15 @@ class RobustDataProcessor:
                 'completed': 'Closed'
             }
             
-            df['State'] = df['State'].str.lower().map(
-                lambda x: state_mapping.get(x, x.title()) if pd.notna(x) else 'New'
-            )
+            df['State'] = self._standardize_labels(df['State'], state_mapping, 'New')
         
         # Create engineered features
         if 'Business Value' in df.columns and 'Story Points' in df.columns:
             # Value per point (handle division by zero)
-            df['Value_Per_Point'] = df.apply(
-                lambda row: row['Business Value'] / row['Story Points'] 
-                if row['Story Points'] > 0 else 0,
-                axis=1
-            )
+            has_points = df['Story Points'] > 0
+            df['Value_Per_Point'] = (
+                df['Business Value'] / df['Story Points'].where(has_points)
+            ).where(has_points, 0)
             
             # Value categories
             df['Value_Category'] = pd.cut(
@@ -493,6 +509,13 @@ class RobustDataProcessor:
         
         return df
     
+    @staticmethod
+    def _standardize_labels(series: pd.Series, mapping: Dict[str, str], default: str) -> pd.Series:
+        """Map lower-cased labels through mapping, title-casing unknown labels."""
+        lowered = series.astype(object).str.lower()
+        standardized = lowered.map(mapping)
+        return standardized.fillna(lowered.str.title()).fillna(default)
+    
     def _remove_duplicates(self, df: pd.DataFrame, data_type: str) -> pd.DataFrame:
         """Remove duplicate entries."""
         original_count = len(df)
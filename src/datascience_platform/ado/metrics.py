@@ -7,7 +7,7 @@ including velocity, cycle time, lead time, and predictability scoring.
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Any
 from collections import defaultdict
 import logging
 from dataclasses import dataclass
@@ -62,19 +62,41 @@ class FlowMetrics:
     rework_percentage: float
 
 
+# Columns of the metrics frame built from work items
+_FRAME_COLUMNS = (
+    "work_item_type", "state", "team", "story_points", "completed", "active",
+    "created_date", "reference_date", "cycle_time_days", "lead_time_days",
+    "blocked_days", "has_closed_date"
+)
+
+
 class AgileMetricsCalculator:
-    """Calculate Agile metrics for ADO work items."""
+    """Calculate Agile metrics for ADO work items.
+    
+    Work items are converted once into a columnar frame and every PI, team,
+    flow and bottleneck metric is computed from it with grouped
+    aggregations. Results that other metrics build on are kept in
+    metrics_cache, so create a new calculator when the work items change.
+    """
     
-    def __init__(self, work_items: List[ADOWorkItem], hierarchy: Optional[WorkItemHierarchy] = None):
+    def __init__(
+        self,
+        work_items: List[ADOWorkItem],
+        hierarchy: Optional[WorkItemHierarchy] = None,
+        seed: Optional[int] = None
+    ):
         """Initialize calculator with work items.
         
         Args:
             work_items: List of ADO work items
             hierarchy: Optional work item hierarchy
+            seed: Random seed for reproducible Monte Carlo forecasts
         """
         self.work_items = work_items
         self.hierarchy = hierarchy or self._build_hierarchy(work_items)
+        self.seed = seed
         self.metrics_cache = {}
+        self._frame: Optional[pd.DataFrame] = None
         
     def _build_hierarchy(self, work_items: List[ADOWorkItem]) -> WorkItemHierarchy:
         """Build hierarchy from work items list."""
@@ -83,6 +105,40 @@ class AgileMetricsCalculator:
             hierarchy.add_work_item(item)
         return hierarchy
     
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Columnar view of the work items, one row per item in list order."""
+        if self._frame is None:
+            self._frame = self._build_frame(self.work_items)
+        return self._frame
+    
+    @staticmethod
+    def _build_frame(work_items: List[ADOWorkItem]) -> pd.DataFrame:
+        """Convert work items into the metrics frame."""
+        columns = {name: [] for name in _FRAME_COLUMNS}
+        for item in work_items:
+            columns["work_item_type"].append(item.work_item_type)
+            columns["state"].append(item.state)
+            columns["team"].append(item.area_path or "Unassigned")
+            columns["story_points"].append(item.story_points or 0)
+            columns["completed"].append(item.is_completed())
+            columns["active"].append(item.is_active())
+            columns["created_date"].append(item.created_date)
+            columns["reference_date"].append(item.target_date or item.created_date)
+            columns["cycle_time_days"].append(item.cycle_time_days)
+            columns["lead_time_days"].append(item.lead_time_days)
+            columns["blocked_days"].append(item.blocked_days)
+            columns["has_closed_date"].append(bool(item.closed_date))
+        
+        frame = pd.DataFrame(columns)
+        for name in ("story_points", "cycle_time_days", "lead_time_days", "blocked_days"):
+            frame[name] = pd.to_numeric(frame[name], errors='coerce').astype(float)
+        for name in ("created_date", "reference_date"):
+            frame[name] = pd.to_datetime(pd.Series(columns[name], dtype=object))
+        for name in ("completed", "active", "has_closed_date"):
+            frame[name] = frame[name].astype(bool)
+        return frame
+    
     def calculate_pi_metrics(
         self, 
         pi_duration_weeks: int = 10,
@@ -97,150 +153,112 @@ class AgileMetricsCalculator:
         Returns:
             List of PI metrics
         """
-        # Group work items by PI
-        pi_groups = self._group_by_pi(pi_duration_weeks, start_date)
-        pi_metrics_list = []
+        cache_key = ('pi_metrics', pi_duration_weeks, start_date)
+        if cache_key in self.metrics_cache:
+            return self.metrics_cache[cache_key]
         
-        for pi_num, (pi_start, pi_end, items) in pi_groups.items():
-            # Calculate planned vs actual
-            planned_points = sum(
-                item.story_points or 0 
-                for item in items 
-                if item.created_date and item.created_date <= pi_start
-            )
-            
-            completed_points = sum(
-                item.story_points or 0 
-                for item in items 
-                if item.is_completed()
-            )
-            
-            cancelled_points = sum(
-                item.story_points or 0 
-                for item in items 
-                if item.state == WorkItemState.CANCELLED
-            )
-            
-            deferred_points = sum(
-                item.story_points or 0 
-                for item in items 
-                if item.state == WorkItemState.DEFERRED
-            )
+        frame = self.frame
+        
+        # Find earliest date if not provided
+        if not start_date:
+            created_dates = frame["created_date"].dropna()
+            start_date = created_dates.min().to_pydatetime() if len(created_dates) else datetime.now()
+        
+        pi_duration = timedelta(weeks=pi_duration_weeks)
+        frame = frame[frame["reference_date"].notna()]
+        
+        # PI number from target date or created date
+        days_since_start = (frame["reference_date"] - start_date).dt.days
+        pi_numbers = np.trunc(days_since_start / (pi_duration_weeks * 7)).astype(int) + 1
+        pi_starts = start_date + (pi_numbers - 1) * pi_duration
+        
+        points = frame["story_points"]
+        states = frame["state"]
+        frame = frame.assign(
+            pi_number=pi_numbers,
+            planned_points=points.where(frame["created_date"] <= pi_starts, 0),
+            completed_points=points.where(frame["completed"], 0),
+            cancelled_points=points.where(states == WorkItemState.CANCELLED, 0),
+            deferred_points=points.where(states == WorkItemState.DEFERRED, 0)
+        )
+        
+        pi_totals = frame.groupby("pi_number", sort=False)[
+            ["planned_points", "completed_points", "cancelled_points", "deferred_points"]
+        ].sum()
+        team_metrics_by_pi = self._calculate_team_metrics_by_pi(frame)
+        
+        pi_metrics_list = []
+        for pi_num, totals in pi_totals.iterrows():
+            planned_points = totals["planned_points"]
+            completed_points = totals["completed_points"]
+            cancelled_points = totals["cancelled_points"]
             
             # Calculate rates
             total_points = planned_points if planned_points > 0 else 1
-            velocity = completed_points
             predictability = (completed_points / planned_points * 100) if planned_points > 0 else 0
-            completion_rate = (completed_points / total_points * 100)
-            cancellation_rate = (cancelled_points / total_points * 100)
-            
-            # Calculate team-specific metrics
-            team_metrics = self._calculate_team_metrics_for_pi(items)
             
-            pi_metrics = PIMetrics(
-                pi_number=pi_num,
+            pi_start = start_date + (int(pi_num) - 1) * pi_duration
+            pi_metrics_list.append(PIMetrics(
+                pi_number=int(pi_num),
                 start_date=pi_start,
-                end_date=pi_end,
+                end_date=pi_start + pi_duration,
                 planned_story_points=planned_points,
                 completed_story_points=completed_points,
                 cancelled_story_points=cancelled_points,
-                deferred_story_points=deferred_points,
-                velocity=velocity,
+                deferred_story_points=totals["deferred_points"],
+                velocity=completed_points,
                 predictability=predictability,
-                completion_rate=completion_rate,
-                cancellation_rate=cancellation_rate,
-                team_metrics=team_metrics
-            )
+                completion_rate=completed_points / total_points * 100,
+                cancellation_rate=cancelled_points / total_points * 100,
+                team_metrics=team_metrics_by_pi.get(pi_num, {})
+            ))
             
-            pi_metrics_list.append(pi_metrics)
-        
+        self.metrics_cache[cache_key] = pi_metrics_list
         return pi_metrics_list
     
-    def _group_by_pi(
-        self, 
-        pi_duration_weeks: int,
-        start_date: Optional[datetime] = None
-    ) -> Dict[int, Tuple[datetime, datetime, List[ADOWorkItem]]]:
-        """Group work items by PI number."""
-        # Find earliest date if not provided
-        if not start_date:
-            dates = [item.created_date for item in self.work_items if item.created_date]
-            start_date = min(dates) if dates else datetime.now()
-        
-        pi_groups = defaultdict(lambda: (None, None, []))
-        pi_duration = timedelta(weeks=pi_duration_weeks)
-        
-        for item in self.work_items:
-            # Determine PI based on target date or created date
-            reference_date = item.target_date or item.created_date
-            if not reference_date:
-                continue
-            
-            # Calculate PI number
-            time_since_start = reference_date - start_date
-            pi_number = int(time_since_start.days / (pi_duration_weeks * 7)) + 1
-            
-            # Calculate PI boundaries
-            pi_start = start_date + (pi_number - 1) * pi_duration
-            pi_end = pi_start + pi_duration
-            
-            # Add to group
-            if pi_groups[pi_number][0] is None:
-                pi_groups[pi_number] = (pi_start, pi_end, [item])
-            else:
-                pi_groups[pi_number][2].append(item)
-        
-        return dict(pi_groups)
-    
-    def _calculate_team_metrics_for_pi(
-        self, 
-        items: List[ADOWorkItem]
-    ) -> Dict[str, Dict[str, float]]:
-        """Calculate team-specific metrics for a PI."""
-        team_groups = defaultdict(list)
-        
-        # Group by team
-        for item in items:
-            team = item.area_path or "Unassigned"
-            team_groups[team].append(item)
-        
-        team_metrics = {}
-        for team, team_items in team_groups.items():
-            completed_points = sum(
-                item.story_points or 0 
-                for item in team_items 
-                if item.is_completed()
-            )
-            
-            cycle_times = [
-                item.cycle_time_days 
-                for item in team_items 
-                if item.cycle_time_days is not None
-            ]
-            
-            team_metrics[team] = {
-                'velocity': completed_points,
-                'throughput': len([i for i in team_items if i.is_completed()]),
-                'cycle_time_avg': np.mean(cycle_times) if cycle_times else 0,
-                'items_count': len(team_items)
+    def _calculate_team_metrics_by_pi(self, frame: pd.DataFrame) -> Dict[int, Dict[str, Dict[str, float]]]:
+        """Calculate team-specific metrics for every PI in one grouped pass."""
+        grouped = frame.groupby(["pi_number", "team"], sort=False)
+        team_totals = pd.DataFrame({
+            'velocity': grouped["completed_points"].sum(),
+            'throughput': grouped["completed"].sum(),
+            'cycle_time_avg': grouped["cycle_time_days"].mean().fillna(0),
+            'items_count': grouped.size()
+        })
+        
+        team_metrics_by_pi = defaultdict(dict)
+        for (pi_num, team), row in zip(team_totals.index, team_totals.itertuples(index=False)):
+            team_metrics_by_pi[pi_num][team] = {
+                'velocity': row.velocity,
+                'throughput': int(row.throughput),
+                'cycle_time_avg': row.cycle_time_avg,
+                'items_count': int(row.items_count)
             }
         
-        return team_metrics
+        return team_metrics_by_pi
     
     def calculate_team_metrics(self) -> Dict[str, TeamMetrics]:
         """Calculate comprehensive metrics by team."""
-        team_groups = defaultdict(list)
+        if 'team_metrics' in self.metrics_cache:
+            return self.metrics_cache['team_metrics']
         
-        # Group by team
-        for item in self.work_items:
-            team = item.area_path or "Unassigned"
-            team_groups[team].append(item)
+        frame = self.frame
+        pi_metrics = self.calculate_pi_metrics()
         
-        team_metrics_dict = {}
+        grouped = frame.groupby("team", sort=False)
+        team_totals = pd.DataFrame({
+            'completed_items': grouped["completed"].sum(),
+            'blocked_time': grouped["blocked_days"].sum(),
+            'total_time': grouped["cycle_time_days"].sum(),
+            'cycle_time_p50': grouped["cycle_time_days"].quantile(0.5),
+            'cycle_time_p90': grouped["cycle_time_days"].quantile(0.9),
+            'lead_time_p50': grouped["lead_time_days"].quantile(0.5),
+            'lead_time_p90': grouped["lead_time_days"].quantile(0.9)
+        }).fillna(0)
         
-        for team, items in team_groups.items():
-            # Calculate velocity trend by PI
-            pi_metrics = self.calculate_pi_metrics()
+        team_metrics_dict = {}
+        for team, totals in team_totals.iterrows():
+            # Velocity trend by PI
             velocity_trend = [
                 pi.team_metrics.get(team, {}).get('velocity', 0)
                 for pi in pi_metrics
@@ -252,48 +270,26 @@ class AgileMetricsCalculator:
                 if avg_velocity > 0 else 0
             )
             
-            # Calculate cycle and lead times
-            cycle_times = [
-                item.cycle_time_days 
-                for item in items 
-                if item.cycle_time_days is not None
-            ]
-            lead_times = [
-                item.lead_time_days 
-                for item in items 
-                if item.lead_time_days is not None
-            ]
-            
-            # Calculate flow metrics
-            blocked_time = sum(
-                item.blocked_days or 0 
-                for item in items
-            )
-            total_time = sum(
-                item.cycle_time_days or 0 
-                for item in items
-            )
             blocked_percentage = (
-                (blocked_time / total_time * 100) 
-                if total_time > 0 else 0
+                (totals["blocked_time"] / totals["total_time"] * 100) 
+                if totals["total_time"] > 0 else 0
             )
             
-            metrics = TeamMetrics(
+            team_metrics_dict[team] = TeamMetrics(
                 team_name=team,
                 velocity_trend=velocity_trend,
                 average_velocity=avg_velocity,
                 velocity_stability=velocity_stability,
-                cycle_time_p50=np.percentile(cycle_times, 50) if cycle_times else 0,
-                cycle_time_p90=np.percentile(cycle_times, 90) if cycle_times else 0,
-                lead_time_p50=np.percentile(lead_times, 50) if lead_times else 0,
-                lead_time_p90=np.percentile(lead_times, 90) if lead_times else 0,
-                throughput=len([i for i in items if i.is_completed()]) / len(pi_metrics) if pi_metrics else 0,
+                cycle_time_p50=totals["cycle_time_p50"],
+                cycle_time_p90=totals["cycle_time_p90"],
+                lead_time_p50=totals["lead_time_p50"],
+                lead_time_p90=totals["lead_time_p90"],
+                throughput=totals["completed_items"] / len(pi_metrics) if pi_metrics else 0,
                 wip_limit_violations=0,  # Would need WIP limits to calculate
                 blocked_time_percentage=blocked_percentage
             )
             
-            team_metrics_dict[team] = metrics
-        
+        self.metrics_cache['team_metrics'] = team_metrics_dict
         return team_metrics_dict
     
     def calculate_flow_metrics(
@@ -308,48 +304,21 @@ class AgileMetricsCalculator:
         Returns:
             Flow metrics
         """
+        cache_key = ('flow_metrics', tuple(work_item_types) if work_item_types else None)
+        if cache_key in self.metrics_cache:
+            return self.metrics_cache[cache_key]
+        
         # Filter items if needed
-        items = self.work_items
+        frame = self.frame
         if work_item_types:
-            items = [i for i in items if i.work_item_type in work_item_types]
-        
-        # Calculate cycle time distribution
-        cycle_times = [
-            item.cycle_time_days 
-            for item in items 
-            if item.cycle_time_days is not None
-        ]
-        
-        cycle_time_dist = {
-            'p25': np.percentile(cycle_times, 25) if cycle_times else 0,
-            'p50': np.percentile(cycle_times, 50) if cycle_times else 0,
-            'p75': np.percentile(cycle_times, 75) if cycle_times else 0,
-            'p90': np.percentile(cycle_times, 90) if cycle_times else 0,
-            'p95': np.percentile(cycle_times, 95) if cycle_times else 0,
-            'mean': np.mean(cycle_times) if cycle_times else 0,
-            'std': np.std(cycle_times) if cycle_times else 0
-        }
+            frame = frame[frame["work_item_type"].isin(work_item_types)]
         
-        # Calculate lead time distribution
-        lead_times = [
-            item.lead_time_days 
-            for item in items 
-            if item.lead_time_days is not None
-        ]
-        
-        lead_time_dist = {
-            'p25': np.percentile(lead_times, 25) if lead_times else 0,
-            'p50': np.percentile(lead_times, 50) if lead_times else 0,
-            'p75': np.percentile(lead_times, 75) if lead_times else 0,
-            'p90': np.percentile(lead_times, 90) if lead_times else 0,
-            'p95': np.percentile(lead_times, 95) if lead_times else 0,
-            'mean': np.mean(lead_times) if lead_times else 0,
-            'std': np.std(lead_times) if lead_times else 0
-        }
+        cycle_times = frame["cycle_time_days"].dropna().to_numpy()
+        lead_times = frame["lead_time_days"].dropna().to_numpy()
         
         # Calculate flow efficiency
-        total_cycle_time = sum(cycle_times)
-        total_lead_time = sum(lead_times)
+        total_cycle_time = cycle_times.sum()
+        total_lead_time = lead_times.sum()
         flow_efficiency = (
             (total_cycle_time / total_lead_time * 100) 
             if total_lead_time > 0 else 0
@@ -361,7 +330,7 @@ class AgileMetricsCalculator:
         touch_percentage = 100 - wait_percentage
         
         # Calculate blocked time percentage
-        blocked_time = sum(item.blocked_days or 0 for item in items)
+        blocked_time = frame["blocked_days"].sum()
         blocked_percentage = (
             (blocked_time / total_cycle_time * 100) 
             if total_cycle_time > 0 else 0
@@ -369,18 +338,15 @@ class AgileMetricsCalculator:
         
         # Calculate rework (items that went from closed back to active)
         # This is simplified - would need state history for accurate calculation
-        rework_items = len([
-            item for item in items 
-            if item.state == WorkItemState.ACTIVE and item.closed_date
-        ])
+        rework_items = int(((frame["state"] == WorkItemState.ACTIVE) & frame["has_closed_date"]).sum())
         rework_percentage = (
-            (rework_items / len(items) * 100) 
-            if items else 0
+            (rework_items / len(frame) * 100) 
+            if len(frame) else 0
         )
         
-        return FlowMetrics(
-            cycle_time_distribution=cycle_time_dist,
-            lead_time_distribution=lead_time_dist,
+        flow_metrics = FlowMetrics(
+            cycle_time_distribution=self._time_distribution(cycle_times),
+            lead_time_distribution=self._time_distribution(lead_times),
             flow_efficiency=flow_efficiency,
             wait_time_percentage=wait_percentage,
             touch_time_percentage=touch_percentage,
@@ -388,8 +354,31 @@ class AgileMetricsCalculator:
             rework_percentage=rework_percentage
         )
     
+        self.metrics_cache[cache_key] = flow_metrics
+        return flow_metrics
+    
+    @staticmethod
+    def _time_distribution(values: np.ndarray) -> Dict[str, float]:
+        """Percentiles, mean and standard deviation of cycle or lead times."""
+        if len(values) == 0:
+            return {'p25': 0, 'p50': 0, 'p75': 0, 'p90': 0, 'p95': 0, 'mean': 0, 'std': 0}
+        
+        p25, p50, p75, p90, p95 = np.percentile(values, [25, 50, 75, 90, 95])
+        return {
+            'p25': p25,
+            'p50': p50,
+            'p75': p75,
+            'p90': p90,
+            'p95': p95,
+            'mean': np.mean(values),
+            'std': np.std(values)
+        }
+    
     def calculate_predictability_metrics(self) -> Dict[str, Any]:
         """Calculate predictability metrics across PIs."""
+        if 'predictability' in self.metrics_cache:
+            return self.metrics_cache['predictability']
+        
         pi_metrics = self.calculate_pi_metrics()
         
         if not pi_metrics:
@@ -410,23 +399,30 @@ class AgileMetricsCalculator:
             if np.mean(velocities) > 0 else 0
         )
         
-        # Monte Carlo simulation for future PI
-        monte_carlo_forecast = self._monte_carlo_velocity_forecast(velocities)
+        # Monte Carlo simulation for future PI, overall and for every team at once
+        team_metrics = self.calculate_team_metrics()
+        forecasts = self._monte_carlo_velocity_forecasts(
+            np.array([velocities] + [metrics.velocity_trend for metrics in team_metrics.values()], dtype=float)
+        )
         
-        return {
+        predictability = {
             'average_velocity': np.mean(velocities),
             'velocity_trend': velocity_trend,
             'velocity_stability': 1 - velocity_cv,  # Higher is more stable
             'average_predictability': np.mean(predictabilities),
             'predictability_trend': predictability_trend,
             'average_completion_rate': np.mean(completion_rates),
-            'monte_carlo_forecast': monte_carlo_forecast,
+            'monte_carlo_forecast': forecasts[0],
+            'team_forecasts': dict(zip(team_metrics, forecasts[1:])),
             'confidence_intervals': {
                 'velocity_p10': np.percentile(velocities, 10),
                 'velocity_p50': np.percentile(velocities, 50),
                 'velocity_p90': np.percentile(velocities, 90)
             }
         }
+        
+        self.metrics_cache['predictability'] = predictability
+        return predictability
     
     def _calculate_trend(self, values: List[float]) -> str:
         """Calculate trend direction."""
@@ -458,39 +454,68 @@ class AgileMetricsCalculator:
         simulations: int = 1000
     ) -> Dict[str, float]:
         """Forecast next PI velocity using Monte Carlo simulation."""
-        if not historical_velocities:
+        if not len(historical_velocities):
             return {}
         
-        # Generate simulations based on historical distribution
-        mean_velocity = np.mean(historical_velocities)
-        std_velocity = np.std(historical_velocities)
-        
-        if std_velocity == 0:
-            # No variation, return deterministic forecast
-            return {
-                'p10': mean_velocity,
-                'p50': mean_velocity,
-                'p90': mean_velocity,
-                'mean': mean_velocity
-            }
+        return self._monte_carlo_velocity_forecasts(
+            np.array([historical_velocities], dtype=float), simulations
+        )[0]
+        
+    def _monte_carlo_velocity_forecasts(
+        self,
+        velocity_histories: np.ndarray,
+        simulations: int = 1000
+    ) -> List[Dict[str, float]]:
+        """Forecast next PI velocity for several histories in one simulation.
         
-        # Run simulations
-        simulated_velocities = np.random.normal(
-            mean_velocity, 
-            std_velocity, 
-            simulations
+        Args:
+            velocity_histories: Array of shape (histories, PIs)
+            simulations: Number of simulated PIs per history
+            
+        Returns:
+            One forecast per history row
+        """
+        if velocity_histories.size == 0:
+            return [{} for _ in range(len(velocity_histories))]
+        
+        # Generate simulations based on each historical distribution
+        mean_velocities = velocity_histories.mean(axis=1)
+        std_velocities = velocity_histories.std(axis=1)
+        
+        rng = np.random.default_rng(self.seed)
+        simulated_velocities = rng.normal(
+            mean_velocities[:, np.newaxis],
+            std_velocities[:, np.newaxis],
+            (len(velocity_histories), simulations)
         )
         
         # Ensure non-negative
         simulated_velocities = np.maximum(simulated_velocities, 0)
         
-        return {
-            'p10': np.percentile(simulated_velocities, 10),
-            'p50': np.percentile(simulated_velocities, 50),
-            'p90': np.percentile(simulated_velocities, 90),
-            'mean': np.mean(simulated_velocities),
-            'std': np.std(simulated_velocities)
-        }
+        p10, p50, p90 = np.percentile(simulated_velocities, [10, 50, 90], axis=1)
+        simulated_means = simulated_velocities.mean(axis=1)
+        simulated_stds = simulated_velocities.std(axis=1)
+        
+        forecasts = []
+        for row, (mean_velocity, std_velocity) in enumerate(zip(mean_velocities, std_velocities)):
+            if std_velocity == 0:
+                # No variation, return deterministic forecast
+                forecasts.append({
+                    'p10': mean_velocity,
+                    'p50': mean_velocity,
+                    'p90': mean_velocity,
+                    'mean': mean_velocity
+                })
+            else:
+                forecasts.append({
+                    'p10': p10[row],
+                    'p50': p50[row],
+                    'p90': p90[row],
+                    'mean': simulated_means[row],
+                    'std': simulated_stds[row]
+                })
+        
+        return forecasts
     
     def identify_bottlenecks(self) -> Dict[str, Any]:
         """Identify process bottlenecks and improvement opportunities."""
@@ -501,50 +526,46 @@ class AgileMetricsCalculator:
             'team_imbalances': {},
             'work_type_issues': {}
         }
+        frame = self.frame
         
         # Analyze state transitions
-        state_counts = defaultdict(int)
-        for item in self.work_items:
-            state_counts[item.state] += 1
+        state_counts = frame.groupby("state", sort=False).size()
         
-        total_items = len(self.work_items)
+        total_items = len(frame)
         for state, count in state_counts.items():
             percentage = (count / total_items * 100) if total_items > 0 else 0
             if percentage > 20 and state not in [WorkItemState.CLOSED, WorkItemState.NEW]:
                 bottlenecks['state_transitions'][state] = {
-                    'count': count,
+                    'count': int(count),
                     'percentage': percentage,
                     'severity': 'high' if percentage > 30 else 'medium'
                 }
         
         # Find blocked items
         blocked_threshold = 5  # days
-        for item in self.work_items:
-            if item.blocked_days and item.blocked_days > blocked_threshold:
-                bottlenecks['blocked_items'].append({
+        for position in np.flatnonzero(frame["blocked_days"].to_numpy() > blocked_threshold):
+            item = self.work_items[position]
+            bottlenecks['blocked_items'].append({
+                'work_item_id': item.work_item_id,
+                'title': item.title,
+                'blocked_days': item.blocked_days,
+                'team': item.area_path
+            })
+        
+        # Find items with long cycle times
+        cycle_times = frame["cycle_time_days"]
+        has_cycle_time = cycle_times.notna() & (cycle_times != 0)
+        if cycle_times.notna().any():
+            p90_cycle_time = np.percentile(cycle_times.dropna(), 90)
+            for position in np.flatnonzero(has_cycle_time & (cycle_times > p90_cycle_time)):
+                item = self.work_items[position]
+                bottlenecks['long_cycle_time'].append({
                     'work_item_id': item.work_item_id,
                     'title': item.title,
-                    'blocked_days': item.blocked_days,
-                    'team': item.area_path
+                    'cycle_time_days': item.cycle_time_days,
+                    'type': item.work_item_type.value
                 })
         
-        # Find items with long cycle times
-        cycle_times = [
-            item.cycle_time_days 
-            for item in self.work_items 
-            if item.cycle_time_days is not None
-        ]
-        if cycle_times:
-            p90_cycle_time = np.percentile(cycle_times, 90)
-            for item in self.work_items:
-                if item.cycle_time_days and item.cycle_time_days > p90_cycle_time:
-                    bottlenecks['long_cycle_time'].append({
-                        'work_item_id': item.work_item_id,
-                        'title': item.title,
-                        'cycle_time_days': item.cycle_time_days,
-                        'type': item.work_item_type.value
-                    })
-        
         # Analyze team imbalances
         team_metrics = self.calculate_team_metrics()
         avg_velocity = np.mean([tm.average_velocity for tm in team_metrics.values()])
@@ -560,23 +581,18 @@ class AgileMetricsCalculator:
                 }
         
         # Analyze work type distribution issues
-        type_counts = defaultdict(int)
-        type_cycle_times = defaultdict(list)
-        
-        for item in self.work_items:
-            type_counts[item.work_item_type] += 1
-            if item.cycle_time_days:
-                type_cycle_times[item.work_item_type].append(item.cycle_time_days)
-        
-        for work_type, cycle_times in type_cycle_times.items():
-            if cycle_times:
-                avg_cycle_time = np.mean(cycle_times)
-                if work_type == WorkItemType.USER_STORY and avg_cycle_time > 10:
-                    bottlenecks['work_type_issues'][work_type.value] = {
-                        'average_cycle_time': avg_cycle_time,
-                        'count': type_counts[work_type],
-                        'issue': 'stories_too_large'
-                    }
+        type_counts = frame.groupby("work_item_type", sort=False).size()
+        type_cycle_times = cycle_times[has_cycle_time].groupby(
+            frame.loc[has_cycle_time, "work_item_type"], sort=False
+        ).mean()
+        
+        for work_type, avg_cycle_time in type_cycle_times.items():
+            if work_type == WorkItemType.USER_STORY and avg_cycle_time > 10:
+                bottlenecks['work_type_issues'][work_type.value] = {
+                    'average_cycle_time': avg_cycle_time,
+                    'count': int(type_counts[work_type]),
+                    'issue': 'stories_too_large'
+                }
         
         return bottlenecks
     
@@ -633,12 +649,17 @@ class AgileMetricsCalculator:
     
     def export_metrics_summary(self) -> Dict[str, Any]:
         """Export comprehensive metrics summary."""
+        frame = self.frame
+        flow_metrics = self.calculate_flow_metrics()
+        
         return {
             'summary': {
-                'total_work_items': len(self.work_items),
-                'completed_items': len([i for i in self.work_items if i.is_completed()]),
-                'active_items': len([i for i in self.work_items if i.is_active()]),
-                'cancelled_items': len([i for i in self.work_items if i.is_cancelled()])
+                'total_work_items': len(frame),
+                'completed_items': int(frame["completed"].sum()),
+                'active_items': int(frame["active"].sum()),
+                'cancelled_items': int(frame["state"].isin(
+                    [WorkItemState.CANCELLED, WorkItemState.DEFERRED, WorkItemState.REMOVED]
+                ).sum())
             },
             'pi_metrics': [
                 {
@@ -659,9 +680,9 @@ class AgileMetricsCalculator:
                 for team, metrics in self.calculate_team_metrics().items()
             },
             'flow_metrics': {
-                'flow_efficiency': self.calculate_flow_metrics().flow_efficiency,
-                'cycle_time_p50': self.calculate_flow_metrics().cycle_time_distribution['p50'],
-                'lead_time_p50': self.calculate_flow_metrics().lead_time_distribution['p50']
+                'flow_efficiency': flow_metrics.flow_efficiency,
+                'cycle_time_p50': flow_metrics.cycle_time_distribution['p50'],
+                'lead_time_p50': flow_metrics.lead_time_distribution['p50']
             },
             'predictability': self.calculate_predictability_metrics(),
             'insights': self.generate_insights()
@@ -7,7 +7,7 @@ hierarchical relationships and business value normalization.
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional, Dict, Any, Union, Literal
-from pydantic import BaseModel, Field, validator, ConfigDict
+from pydantic import BaseModel, Field, validator, ConfigDict, PrivateAttr
 import numpy as np
 
 
@@ -230,17 +230,122 @@ class UserStory(ADOWorkItem):
         return all(ready_criteria)
 
 
+# Columns of the per-item values accumulated for roll-up metrics
+_ROLLUP_COLUMNS = (
+    "total_story_points", "completed_story_points", "cancelled_story_points",
+    "completed_items", "active_items", "risk_sum", "risk_count",
+    "complexity_sum", "complexity_count"
+)
+
+
+class _HierarchyIndex:
+    """Pre-order (Euler tour) index over a work item hierarchy.
+    
+    Items are laid out in depth-first pre-order, so the subtree of the item
+    at position p is the contiguous slice order[p:p + subtree_size[p]].
+    Parent positions and depths are kept as arrays, and roll-up values are
+    accumulated bottom-up one depth level at a time.
+    """
+    
+    def __init__(self, hierarchy: 'WorkItemHierarchy'):
+        all_items = hierarchy.all_items
+        parent_child_map = hierarchy.parent_child_map
+        
+        self.order: List[int] = []
+        self.position: Dict[int, int] = {}
+        parent_positions: List[int] = []
+        depths: List[int] = []
+        
+        # Items whose parent is not loaded are roots; anything left unvisited
+        # afterwards sits on a cycle and is entered at an arbitrary item
+        roots = [
+            item_id for item_id in all_items
+            if hierarchy.child_parent_map.get(item_id) not in all_items
+        ]
+        for start_id in roots + list(all_items):
+            if start_id in self.position:
+                continue
+            
+            stack = [(start_id, -1, 0)]
+            while stack:
+                item_id, parent_position, depth = stack.pop()
+                if item_id in self.position:
+                    continue
+                
+                self.position[item_id] = len(self.order)
+                self.order.append(item_id)
+                parent_positions.append(parent_position)
+                depths.append(depth)
+                
+                current_position = self.position[item_id]
+                for child_id in reversed(parent_child_map.get(item_id, [])):
+                    if child_id in all_items and child_id not in self.position:
+                        stack.append((child_id, current_position, depth + 1))
+        
+        self.parent_position = np.array(parent_positions, dtype=np.int64)
+        self.depth = np.array(depths, dtype=np.int64)
+        self.subtree_size = self._accumulate(np.ones((len(self.order), 1), dtype=np.int64))[:, 0]
+        self._rollups: Optional[np.ndarray] = None
+    
+    def _accumulate(self, values: np.ndarray) -> np.ndarray:
+        """Sum per-item values over each subtree, deepest level first."""
+        totals = values.copy()
+        if len(totals) == 0:
+            return totals
+        
+        for level in range(int(self.depth.max()), 0, -1):
+            positions = np.flatnonzero(self.depth == level)
+            np.add.at(totals, self.parent_position[positions], totals[positions])
+        return totals
+    
+    def descendant_ids(self, item_id: int) -> List[int]:
+        """IDs of all descendants in depth-first pre-order."""
+        position = self.position[item_id]
+        return self.order[position + 1:position + int(self.subtree_size[position])]
+    
+    def rollups(self, all_items: Dict[int, 'ADOWorkItem']) -> np.ndarray:
+        """Subtree totals of the roll-up columns, computed once and cached."""
+        if self._rollups is None:
+            values = np.zeros((len(self.order), len(_ROLLUP_COLUMNS)))
+            for position, item_id in enumerate(self.order):
+                item = all_items[item_id]
+                points = item.story_points or 0
+                completed = item.is_completed()
+                values[position, 0] = points
+                values[position, 1] = points if completed else 0
+                values[position, 2] = points if item.is_cancelled() else 0
+                values[position, 3] = completed
+                values[position, 4] = item.is_active()
+                if item.risk_score is not None:
+                    values[position, 5] = item.risk_score
+                    values[position, 6] = 1
+                if item.complexity_score is not None:
+                    values[position, 7] = item.complexity_score
+                    values[position, 8] = 1
+            self._rollups = self._accumulate(values)
+        return self._rollups
+
+
 class WorkItemHierarchy(BaseModel):
-    """Represents the hierarchical structure of work items."""
+    """Represents the hierarchical structure of work items.
+    
+    Descendant, level and roll-up queries are answered from a pre-order
+    index that is built on first use and dropped whenever an item is added.
+    Roll-up totals are cached with the index; call invalidate_index() after
+    changing the points, state, risk or complexity of items in place.
+    """
     
     root_items: List[ADOWorkItem] = Field(default_factory=list, description="Top-level work items")
     all_items: Dict[int, ADOWorkItem] = Field(default_factory=dict, description="All items by ID")
     parent_child_map: Dict[int, List[int]] = Field(default_factory=dict, description="Parent to children mapping")
     child_parent_map: Dict[int, int] = Field(default_factory=dict, description="Child to parent mapping")
     
+    _index: Optional[_HierarchyIndex] = PrivateAttr(default=None)
+    
     def add_work_item(self, item: ADOWorkItem):
         """Add a work item to the hierarchy."""
         self.all_items[item.work_item_id] = item
+        self._index = None
         
         # Update parent-child relationships
         if item.parent_id:
@@ -252,6 +357,18 @@ class WorkItemHierarchy(BaseModel):
             # Root item
             self.root_items.append(item)
     
+    def invalidate_index(self):
+        """Drop the hierarchy index and cached roll-ups."""
+        self._index = None
+    
+    @property
+    def index(self) -> _HierarchyIndex:
+        """Pre-order hierarchy index, rebuilt after items were added."""
+        index = self._index
+        if index is None:
+            index = self._index = _HierarchyIndex(self)
+        return index
+    
     def get_children(self, parent_id: int) -> List[ADOWorkItem]:
         """Get all direct children of a work item."""
         child_ids = self.parent_child_map.get(parent_id, [])
@@ -259,14 +376,15 @@ class WorkItemHierarchy(BaseModel):
     
     def get_descendants(self, parent_id: int) -> List[ADOWorkItem]:
         """Get all descendants (recursive) of a work item."""
-        descendants = []
-        children = self.get_children(parent_id)
+        if parent_id not in self.all_items:
+            # Children of a parent that was not loaded are roots of the index
+            descendants = []
+            for child in self.get_children(parent_id):
+                descendants.append(child)
+                descendants.extend(self.get_descendants(child.work_item_id))
+            return descendants
         
-        for child in children:
-            descendants.append(child)
-            descendants.extend(self.get_descendants(child.work_item_id))
-        
-        return descendants
+        return [self.all_items[item_id] for item_id in self.index.descendant_ids(parent_id)]
     
     def get_parent(self, child_id: int) -> Optional[ADOWorkItem]:
         """Get parent of a work item."""
@@ -276,54 +394,57 @@ class WorkItemHierarchy(BaseModel):
     def get_ancestors(self, child_id: int) -> List[ADOWorkItem]:
         """Get all ancestors (recursive) of a work item."""
         ancestors = []
+        seen = set()
         parent = self.get_parent(child_id)
         
-        while parent:
+        # Stop when a cycle comes back around
+        while parent and parent.work_item_id not in seen:
             ancestors.append(parent)
+            seen.add(parent.work_item_id)
             parent = self.get_parent(parent.work_item_id)
         
         return ancestors
     
     def calculate_rollup_metrics(self, item_id: int) -> Dict[str, Any]:
         """Calculate roll-up metrics for a work item including all descendants."""
-        item = self.all_items.get(item_id)
-        if not item:
+        if item_id not in self.all_items:
             return {}
         
-        descendants = self.get_descendants(item_id)
-        all_items = [item] + descendants
-        
-        # Calculate metrics
-        total_points = sum(i.story_points or 0 for i in all_items)
-        completed_points = sum(i.story_points or 0 for i in all_items if i.is_completed())
-        cancelled_points = sum(i.story_points or 0 for i in all_items if i.is_cancelled())
+        index = self.index
+        position = index.position[item_id]
+        totals = dict(zip(_ROLLUP_COLUMNS, index.rollups(self.all_items)[position].tolist()))
+        total_items = int(index.subtree_size[position])
         
+        total_points = totals["total_story_points"]
+        completed_points = totals["completed_story_points"]
         completion_rate = completed_points / total_points if total_points > 0 else 0
         
         # Risk and complexity averages
-        risk_scores = [i.risk_score for i in all_items if i.risk_score is not None]
-        avg_risk = np.mean(risk_scores) if risk_scores else None
-        
-        complexity_scores = [i.complexity_score for i in all_items if i.complexity_score is not None]
-        avg_complexity = np.mean(complexity_scores) if complexity_scores else None
+        avg_risk = totals["risk_sum"] / totals["risk_count"] if totals["risk_count"] else None
+        avg_complexity = (
+            totals["complexity_sum"] / totals["complexity_count"] if totals["complexity_count"] else None
+        )
         
         return {
             "total_story_points": total_points,
             "completed_story_points": completed_points,
-            "cancelled_story_points": cancelled_points,
+            "cancelled_story_points": totals["cancelled_story_points"],
             "completion_percentage": completion_rate * 100,
-            "total_items": len(all_items),
-            "completed_items": sum(1 for i in all_items if i.is_completed()),
-            "active_items": sum(1 for i in all_items if i.is_active()),
+            "total_items": total_items,
+            "completed_items": int(totals["completed_items"]),
+            "active_items": int(totals["active_items"]),
             "average_risk_score": avg_risk,
             "average_complexity_score": avg_complexity,
-            "descendant_count": len(descendants)
+            "descendant_count": total_items - 1
         }
     
     def get_hierarchy_level(self, item_id: int) -> int:
         """Get the hierarchy level of a work item (0 for root)."""
-        ancestors = self.get_ancestors(item_id)
-        return len(ancestors)
+        if item_id not in self.all_items:
+            return 0
+        
+        index = self.index
+        return int(index.depth[index.position[item_id]])
     
     def validate_hierarchy(self) -> Dict[str, List[str]]:
         """Validate the hierarchy for consistency issues."""
@@ -5,12 +5,22 @@ and demonstration purposes without requiring real data.
 """
 
 import random
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple, Iterator, Union
 from faker import Faker
 import numpy as np
 import pandas as pd
 
+# Optional Parquet/Arrow output for bulk generation
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 from .models import (
     ADOWorkItem, Epic, PIO, Feature, UserStory,
     WorkItemState, WorkItemType, WorkItemHierarchy, TeamMetrics
@@ -18,6 +28,30 @@ from .models import (
 
 fake = Faker()
 
+# File formats supported by write_bulk_data, keyed by file suffix
+BULK_FILE_FORMATS = {
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow'
+}
+
+
+@dataclass
+class BulkGenerationSettings:
+    """Shape and outcome settings for bulk data generation."""
+    num_epics: int
+    num_pis: int
+    pios_per_epic: Tuple[int, int]
+    features_per_pio: Tuple[int, int]
+    features_per_epic: Tuple[int, int]
+    stories_per_feature: Tuple[int, int]
+    pi_duration_weeks: int
+    completion_rate: float
+    cancellation_rate: float
+    start_date: datetime
+    as_of: datetime
+
 
 class ADODataSimulator:
     """Generate realistic ADO work item hierarchies and data."""
@@ -33,6 +67,7 @@ class ADODataSimulator:
             np.random.seed(seed)
             Faker.seed(seed)
         
+        self.seed = seed
         self.fake = Faker()
         
         # Configuration for realistic distributions
@@ -561,4 +596,431 @@ class ADODataSimulator:
             
             data.append(row)
         
-        return pd.DataFrame(data)
\ No newline at end of file
+        return pd.DataFrame(data)
+    
+    def iter_bulk_data(
+        self,
+        num_epics: int = 1000,
+        num_pis: int = 4,
+        pios_per_epic: Tuple[int, int] = (1, 3),
+        features_per_pio: Tuple[int, int] = (1, 2),
+        features_per_epic: Tuple[int, int] = (2, 5),
+        stories_per_feature: Tuple[int, int] = (3, 8),
+        pi_duration_weeks: int = 10,
+        completion_rate: float = 0.75,
+        cancellation_rate: float = 0.10,
+        start_date: Optional[datetime] = None,
+        as_of: Optional[datetime] = None,
+        epics_per_chunk: int = 2000,
+        seed: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Generate a large work item set as a stream of DataFrames.
+        
+        High-volume counterpart of generate_multi_pi_data. Work items are
+        generated column-wise with numpy instead of one pydantic object at a
+        time, using the same value distributions. Each chunk holds complete
+        Epic -> PIO -> Feature -> User Story subtrees (parents before
+        children), in the export_to_csv_format column layout that
+        ADOAnalyzer.load_from_dataframe reads. Roll-up metrics are not
+        applied; build a WorkItemHierarchy from the loaded items for those.
+        
+        Args:
+            num_epics: Total number of epics (about 45 work items each)
+            num_pis: Number of PIs to spread the epics over
+            pios_per_epic: Range of PIOs per epic
+            features_per_pio: Range of features per PIO
+            features_per_epic: Range of features directly under each epic
+            stories_per_feature: Range of stories per feature
+            pi_duration_weeks: Duration of each PI
+            completion_rate: Percentage of items completed
+            cancellation_rate: Percentage of items cancelled
+            start_date: Start date for generation
+            as_of: Date the states are simulated at (defaults to the end of the last PI)
+            epics_per_chunk: Number of epic subtrees per DataFrame
+            seed: Random seed (defaults to the simulator seed)
+            
+        Yields:
+            DataFrames of work items with contiguous work item IDs
+        """
+        if start_date is None:
+            start_date = datetime.now() - timedelta(weeks=pi_duration_weeks * num_pis)
+        if as_of is None:
+            as_of = start_date + timedelta(weeks=pi_duration_weeks * num_pis)
+        
+        settings = BulkGenerationSettings(
+            num_epics=num_epics,
+            num_pis=num_pis,
+            pios_per_epic=pios_per_epic,
+            features_per_pio=features_per_pio,
+            features_per_epic=features_per_epic,
+            stories_per_feature=stories_per_feature,
+            pi_duration_weeks=pi_duration_weeks,
+            completion_rate=completion_rate,
+            cancellation_rate=cancellation_rate,
+            start_date=start_date,
+            as_of=as_of
+        )
+        
+        seed = self.seed if seed is None else seed
+        rng = np.random.default_rng(seed)
+        pools = self._build_text_pools(seed)
+        
+        for first_epic in range(0, num_epics, epics_per_chunk):
+            chunk = self._generate_bulk_chunk(
+                rng, pools, settings, first_epic, min(epics_per_chunk, num_epics - first_epic)
+            )
+            self.work_item_counter += len(chunk)
+            yield chunk
+    
+    def generate_bulk_data(self, num_epics: int = 1000, **kwargs) -> pd.DataFrame:
+        """Generate a large work item set as one DataFrame.
+        
+        Args:
+            num_epics: Total number of epics
+            **kwargs: Additional parameters for iter_bulk_data
+            
+        Returns:
+            DataFrame of all generated work items
+        """
+        chunks = list(self.iter_bulk_data(num_epics=num_epics, **kwargs))
+        if not chunks:
+            return pd.DataFrame()
+        return pd.concat(chunks, ignore_index=True)
+    
+    def write_bulk_data(
+        self,
+        path: Union[str, Path],
+        num_epics: int = 1000,
+        file_format: Optional[str] = None,
+        **kwargs
+    ) -> int:
+        """Stream a large generated work item set straight to disk.
+        
+        Only one chunk is held in memory at a time. Parquet and Arrow
+        output require pyarrow.
+        
+        Args:
+            path: Output file path
+            num_epics: Total number of epics
+            file_format: 'csv', 'parquet' or 'arrow' (inferred from the suffix if omitted)
+            **kwargs: Additional parameters for iter_bulk_data
+            
+        Returns:
+            Number of work items written
+        """
+        path = Path(path)
+        file_format = file_format or BULK_FILE_FORMATS.get(path.suffix.lower())
+        if file_format not in BULK_FILE_FORMATS.values():
+            raise ValueError(f"Unsupported bulk output format for {path}: {file_format}")
+        if file_format != 'csv' and not PYARROW_AVAILABLE:
+            raise ImportError(f"pyarrow is required for {file_format} output")
+        
+        path.parent.mkdir(parents=True, exist_ok=True)
+        rows_written = 0
+        writer = None
+        schema = None
+        
+        try:
+            for chunk in self.iter_bulk_data(num_epics=num_epics, **kwargs):
+                if file_format == 'csv':
+                    chunk.to_csv(path, mode='w' if rows_written == 0 else 'a', header=rows_written == 0, index=False)
+                else:
+                    table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                    if writer is None:
+                        schema = table.schema
+                        if file_format == 'parquet':
+                            writer = pq.ParquetWriter(str(path), schema)
+                        else:
+                            writer = pa.ipc.new_file(str(path), schema)
+                    writer.write_table(table)
+                
+                rows_written += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        return rows_written
+    
+    def _build_text_pools(self, seed: Optional[int], size: int = 500) -> Dict[str, np.ndarray]:
+        """Pre-generate names and title fragments to sample from in bulk."""
+        faker = Faker()
+        if seed is not None:
+            faker.seed_instance(seed)
+        
+        user_types = ["user", "admin", "developer", "customer", "analyst", "manager"]
+        actions = ["access", "create", "update", "view", "export", "configure", "manage"]
+        benefits = ["efficiency", "visibility", "control", "automation", "insights", "compliance"]
+        
+        story_titles = []
+        for index in range(size):
+            if index % 2 == 0:
+                story_titles.append(
+                    f"As a {user_types[index % len(user_types)]}, I want to "
+                    f"{faker.word()} {actions[index % len(actions)]} so that "
+                    f"improve {benefits[index % len(benefits)]}"
+                )
+            else:
+                story_titles.append(f"Implement {faker.word()} to support {faker.bs()}")
+        
+        return {
+            'names': np.array([faker.name() for _ in range(size)], dtype=object),
+            'phrases': np.array([faker.bs().title() for _ in range(size)], dtype=object),
+            'story_titles': np.array(story_titles, dtype=object)
+        }
+    
+    def _generate_bulk_chunk(
+        self,
+        rng: np.random.Generator,
+        pools: Dict[str, np.ndarray],
+        settings: BulkGenerationSettings,
+        first_epic: int,
+        num_epics: int
+    ) -> pd.DataFrame:
+        """Generate complete epic subtrees column-wise."""
+        def days(low: int, high: int, size: int) -> np.ndarray:
+            return rng.integers(low, high + 1, size).astype('timedelta64[D]')
+        
+        def counts(bounds: Tuple[int, int], size: int) -> np.ndarray:
+            return rng.integers(bounds[0], bounds[1] + 1, size)
+        
+        teams = np.array(self.team_names, dtype=object)
+        categories = np.array(self.feature_categories, dtype=object)
+        pillars = np.array(self.strategy_pillars, dtype=object)
+        names = pools['names']
+        pi_duration = np.timedelta64(settings.pi_duration_weeks * 7, 'D')
+        
+        # Epics, spread evenly over the PIs
+        epics_per_pi = max(1, settings.num_epics // settings.num_pis)
+        epic_pi = np.minimum((first_epic + np.arange(num_epics)) // epics_per_pi, settings.num_pis - 1) + 1
+        pi_start = np.datetime64(settings.start_date, 'us') + (epic_pi - 1) * pi_duration
+        pi_end = pi_start + pi_duration
+        
+        epic_category = categories[rng.integers(0, len(categories), num_epics)]
+        epic_pillar = pillars[rng.integers(0, len(pillars), num_epics)]
+        epic_pi_label = pd.Series(epic_pi).astype(str)
+        epics = {
+            'title': ("[PI" + epic_pi_label + "] " + epic_category + " Enhancement Initiative").to_numpy(),
+            'bv': rng.integers(50, 101, num_epics).astype(float),
+            'story_points': np.full(num_epics, np.nan),
+            'complexity': rng.integers(60, 96, num_epics).astype(float),
+            'risk': rng.integers(20, 81, num_epics).astype(float),
+            'created': pi_start - days(14, 30, num_epics),
+            'target': pi_end,
+            'pi': epic_pi,
+            'area': teams[rng.integers(0, 3, num_epics)],  # Epics owned by senior teams
+            'assigned': names[rng.integers(0, len(names), num_epics)],
+            'pillar': epic_pillar,
+            'iteration': np.full(num_epics, None, dtype=object),
+            'tags': (epic_pillar + ";" + epic_category + ";PI" + epic_pi_label).to_numpy()
+        }
+        
+        # PIOs under epics
+        pio_epic = np.repeat(np.arange(num_epics), counts(settings.pios_per_epic, num_epics))
+        num_pios = len(pio_epic)
+        confidence = pd.Series(rng.integers(60, 96, num_pios)).astype(str)
+        quarter = pd.Series(rng.integers(1, 5, num_pios)).astype(str)
+        pios = {
+            'title': ("PIO: " + pd.Series(epic_category[pio_epic]) + " Enhancement Initiative - Q"
+                      + quarter + " Objective").to_numpy(),
+            'bv': epics['bv'][pio_epic] * rng.uniform(0.2, 0.4, num_pios),
+            'story_points': np.full(num_pios, np.nan),
+            'complexity': rng.integers(40, 81, num_pios).astype(float),
+            'risk': epics['risk'][pio_epic] * rng.uniform(0.8, 1.2, num_pios),
+            'created': epics['created'][pio_epic] + days(1, 7, num_pios),
+            'target': pi_end[pio_epic] - days(0, 14, num_pios),
+            'pi': epic_pi[pio_epic],
+            'area': epics['area'][pio_epic],
+            'assigned': epics['assigned'][pio_epic],
+            'pillar': epic_pillar[pio_epic],
+            'iteration': np.full(num_pios, None, dtype=object),
+            'tags': (pd.Series(epics['tags'][pio_epic]) + ";PIO;Confidence-" + confidence).to_numpy()
+        }
+        
+        # Features under PIOs, then directly under epics
+        feature_pio = np.repeat(np.arange(num_pios), counts(settings.features_per_pio, num_pios))
+        direct_epic = np.repeat(np.arange(num_epics), counts(settings.features_per_epic, num_epics))
+        feature_epic = np.concatenate([pio_epic[feature_pio], direct_epic])
+        # Row of each feature's parent within the chunk (epics first, then PIOs)
+        feature_parent = np.concatenate([num_epics + feature_pio, direct_epic])
+        num_features = len(feature_epic)
+        
+        parent_bv = np.concatenate([epics['bv'], pios['bv']])[feature_parent]
+        parent_created = np.concatenate([epics['created'], pios['created']])[feature_parent]
+        parent_tags = np.concatenate([epics['tags'], pios['tags']])[feature_parent]
+        feature_category = categories[rng.integers(0, len(categories), num_features)]
+        features = {
+            'title': (pd.Series(feature_category) + " - "
+                      + pools['phrases'][rng.integers(0, len(pools['phrases']), num_features)]).to_numpy(),
+            'bv': parent_bv * rng.uniform(0.1, 0.3, num_features),
+            'story_points': rng.integers(8, 41, num_features).astype(float),
+            'complexity': rng.integers(30, 71, num_features).astype(float),
+            'risk': rng.integers(10, 61, num_features).astype(float),
+            'created': parent_created + days(5, 15, num_features),
+            'target': pi_end[feature_epic] - days(7, 21, num_features),
+            'pi': epic_pi[feature_epic],
+            'area': teams[rng.integers(0, len(teams), num_features)],
+            'assigned': names[rng.integers(0, len(names), num_features)],
+            'pillar': epic_pillar[feature_epic],
+            'iteration': np.full(num_features, None, dtype=object),
+            'tags': (pd.Series(parent_tags) + ";" + feature_category + ";Feature").to_numpy()
+        }
+        
+        # Stories under features
+        story_feature = np.repeat(np.arange(num_features), counts(settings.stories_per_feature, num_features))
+        num_stories = len(story_feature)
+        sprint = pd.Series(rng.integers(1, 6, num_stories)).astype(str)
+        story_pi = features['pi'][story_feature]
+        assigned = names[rng.integers(0, len(names), num_stories)]
+        assigned[rng.random(num_stories) <= 0.2] = None
+        stories = {
+            'title': pools['story_titles'][rng.integers(0, len(pools['story_titles']), num_stories)],
+            'bv': features['bv'][story_feature] * rng.uniform(0.05, 0.2, num_stories),
+            'story_points': rng.choice([1, 2, 3, 5, 8, 13], num_stories).astype(float),
+            'complexity': rng.integers(10, 51, num_stories).astype(float),
+            'risk': rng.integers(5, 41, num_stories).astype(float),
+            'created': features['created'][story_feature] + days(3, 10, num_stories),
+            'target': features['target'][story_feature] - days(0, 7, num_stories),
+            'pi': story_pi,
+            'area': features['area'][story_feature],
+            'assigned': assigned,
+            'pillar': features['pillar'][story_feature],
+            'iteration': ("PI" + pd.Series(story_pi).astype(str) + "/Sprint" + sprint).to_numpy(),
+            'tags': (pd.Series(features['tags'][story_feature]) + ";Story;Sprint" + sprint).to_numpy()
+        }
+        
+        # Assign IDs in row order: epics, PIOs, features, stories
+        groups = [epics, pios, features, stories]
+        sizes = [num_epics, num_pios, num_features, num_stories]
+        num_rows = sum(sizes)
+        first_id = self.work_item_counter + 1
+        ids = first_id + np.arange(num_rows)
+        
+        parent_rows = np.concatenate([
+            np.full(num_epics, -1),
+            pio_epic,
+            feature_parent,
+            num_epics + num_pios + story_feature
+        ])
+        parent_ids = pd.array(np.where(parent_rows >= 0, first_id + parent_rows, 0), dtype='Int64')
+        parent_ids[parent_rows < 0] = pd.NA
+        
+        columns = {key: np.concatenate([group[key] for group in groups]) for key in epics}
+        work_item_types = np.repeat(
+            np.array([WorkItemType.EPIC.value, WorkItemType.PIO.value,
+                      WorkItemType.FEATURE.value, WorkItemType.USER_STORY.value], dtype=object),
+            sizes
+        )
+        is_story = np.repeat([False, False, False, True], sizes)
+        initial_states = np.repeat(
+            np.array([WorkItemState.ACTIVE.value, WorkItemState.ACTIVE.value,
+                      WorkItemState.NEW.value, WorkItemState.NEW.value], dtype=object),
+            sizes
+        )
+        states = self._apply_bulk_states(rng, settings, columns['created'], is_story, initial_states)
+        
+        return pd.DataFrame({
+            'WorkItemId': ids,
+            'Title': columns['title'],
+            'WorkItemType': work_item_types,
+            'State': states['state'],
+            'ParentId': parent_ids,
+            'BusinessValue': columns['bv'],
+            'BusinessValueNormalized': columns['bv'] / 100.0,
+            'StoryPoints': columns['story_points'],
+            'EffortHours': np.full(num_rows, np.nan),
+            'ComplexityScore': columns['complexity'],
+            'RiskScore': columns['risk'],
+            'CreatedDate': columns['created'],
+            'ActivatedDate': states['activated'],
+            'ResolvedDate': states['resolved'],
+            'ClosedDate': states['closed'],
+            'TargetDate': columns['target'],
+            'IterationPath': columns['iteration'],
+            'AreaPath': columns['area'],
+            'AssignedTo': columns['assigned'],
+            'PINumber': columns['pi'],
+            'StrategyPillar': columns['pillar'],
+            'Tags': columns['tags'],
+            'CycleTimeDays': states['cycle_time'],
+            'LeadTimeDays': states['lead_time'],
+            'BlockedDays': states['blocked'],
+            'IsCompleted': np.isin(states['state'], [WorkItemState.CLOSED.value, WorkItemState.RESOLVED.value]),
+            'IsCancelled': np.isin(states['state'], [WorkItemState.CANCELLED.value, WorkItemState.DEFERRED.value,
+                                                     WorkItemState.REMOVED.value]),
+            'IsActive': np.isin(states['state'], [WorkItemState.ACTIVE.value, WorkItemState.IN_PROGRESS.value])
+        })
+    
+    def _apply_bulk_states(
+        self,
+        rng: np.random.Generator,
+        settings: BulkGenerationSettings,
+        created: np.ndarray,
+        is_story: np.ndarray,
+        initial_states: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """Vectorized counterpart of _apply_realistic_states."""
+        size = len(created)
+        as_of = np.datetime64(settings.as_of, 'us')
+        not_a_time = np.full(size, np.datetime64('NaT'), dtype='datetime64[us]')
+        one_day = np.timedelta64(1, 'D')
+        
+        state = initial_states.copy()
+        activated = not_a_time.copy()
+        resolved = not_a_time.copy()
+        closed = not_a_time.copy()
+        cycle_time = np.full(size, np.nan)
+        lead_time = np.full(size, np.nan)
+        blocked = np.full(size, np.nan)
+        
+        # Items created in the future keep their initial state
+        started = created <= as_of
+        roll = rng.random(size)
+        completed = started & (roll < settings.completion_rate)
+        cancelled = started & ~completed & (roll < settings.completion_rate + settings.cancellation_rate)
+        in_flight = started & ~completed & ~cancelled
+        
+        # Completed items, reverted to active if they would close after as_of
+        days_to_activate = rng.integers(1, 8, size).astype('timedelta64[D]')
+        days_to_resolve = np.where(
+            is_story, rng.integers(5, 21, size), rng.integers(20, 61, size)
+        ).astype('timedelta64[D]')
+        days_to_close = rng.integers(1, 4, size).astype('timedelta64[D]')
+        
+        activated[completed] = (created + days_to_activate)[completed]
+        resolved_at = activated + days_to_resolve
+        closed_at = resolved_at + days_to_close
+        finished = completed & (closed_at <= as_of)
+        
+        state[finished] = WorkItemState.CLOSED.value
+        state[completed & ~finished] = WorkItemState.ACTIVE.value
+        resolved[finished] = resolved_at[finished]
+        closed[finished] = closed_at[finished]
+        cycle_time[finished] = (resolved - activated)[finished] // one_day
+        lead_time[finished] = (resolved - created)[finished] // one_day
+        
+        # Add some blocked time (30% chance of being blocked)
+        is_blocked = completed & (rng.random(size) < 0.3)
+        blocked[is_blocked] = rng.integers(1, 6, size)[is_blocked]
+        
+        # Cancelled or deferred items
+        state[cancelled] = np.where(
+            rng.random(size) < 0.5, WorkItemState.CANCELLED.value, WorkItemState.DEFERRED.value
+        )[cancelled]
+        cancel_date = created + rng.integers(10, 31, size).astype('timedelta64[D]')
+        closed[cancelled & (cancel_date <= as_of)] = cancel_date[cancelled & (cancel_date <= as_of)]
+        
+        # Items still in flight
+        activated_in_flight = in_flight & ((as_of - created) // one_day > 7)
+        state[in_flight] = WorkItemState.NEW.value
+        state[activated_in_flight] = WorkItemState.ACTIVE.value
+        activated[activated_in_flight] = (created + days_to_activate)[activated_in_flight]
+        
+        return {
+            'state': state,
+            'activated': activated,
+            'resolved': resolved,
+            'closed': closed,
+            'cycle_time': cycle_time,
+            'lead_time': lead_time,
+            'blocked': blocked
+        }
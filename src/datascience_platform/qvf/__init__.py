@@ -162,16 +162,16 @@ def get_ai_status() -> dict:
     
     try:
         from .ai import OllamaManager
-        manager = OllamaManager()
-        health = manager.get_health_status()
-        
-        return {
-            "available": True,
-            "ollama_available": manager.is_available(),
-            "ollama_status": health["status"],
-            "available_models": health["available_models"],
-            "fallback_available": True
-        }
+        with OllamaManager() as manager:
+            health = manager.get_health_status()
+            
+            return {
+                "available": True,
+                "ollama_available": manager.is_available(),
+                "ollama_status": health["status"],
+                "available_models": health["available_models"],
+                "fallback_available": True
+            }
     except Exception as e:
         return {
             "available": True,
@@ -72,6 +72,16 @@ from .rest_client import (
     ADOPermissionError
 )
 
+from .fingerprints import (
+    FieldFingerprintStore,
+    FieldFingerprint
+)
+
+from .mirror import (
+    WorkItemMirror,
+    MirrorSyncState
+)
+
 from .work_items import (
     WorkItemManager,
     QVFWorkItemScore,
@@ -107,6 +117,14 @@ __all__ = [
     'ADOAuthenticationError',
     'ADOPermissionError',
     
+    # Write Suppression
+    'FieldFingerprintStore',
+    'FieldFingerprint',
+    
+    # Local Mirror
+    'WorkItemMirror',
+    'MirrorSyncState',
+    
     # Work Items
     'WorkItemManager',
     'QVFWorkItemScore',
@@ -55,7 +55,6 @@ Architecture:
 """
 
 import logging
-import asyncio
 from datetime import datetime, timezone
 from enum import Enum
 from typing import List, Dict, Optional, Any, Union, Tuple, Set
@@ -68,7 +67,7 @@ from urllib.parse import quote
 from ...core.exceptions import DataSciencePlatformError
 from ...ado.models import WorkItemType, ADOWorkItem
 from ..core.criteria import QVFCriteriaConfiguration, QVFCriterion, CriteriaCategory
-from .rest_client import ADORestClient, ADOApiError, ADOAuthenticationError
+from .rest_client import ADORestClient, ADOApiError, ADOAuthenticationError, MAX_WORK_ITEMS_PER_BATCH
 
 
 logger = logging.getLogger(__name__)
@@ -1154,30 +1153,16 @@ class CustomFieldsManager:
             if update_timestamp:
                 current_time = datetime.now(timezone.utc)
                 for work_item_id, scores in work_item_scores.items():
-                    if "QVF.LastCalculated" not in scores:
+                    if "QVF.LastCalculated" not in scores and "Custom.QVFLastCalculated" not in scores:
                         scores["QVF.LastCalculated"] = current_time
             
-            # Process in batches for performance
-            work_item_ids = list(work_item_scores.keys())
-            
-            for batch_start in range(0, len(work_item_ids), batch_size):
-                batch_end = min(batch_start + batch_size, len(work_item_ids))
-                batch_ids = work_item_ids[batch_start:batch_end]
-                
-                logger.debug(f"Processing batch {batch_start//batch_size + 1}: items {batch_start+1}-{batch_end}")
-                
-                # Process batch
-                batch_results = await self._update_work_items_batch(
-                    project_name,
-                    {wid: work_item_scores[wid] for wid in batch_ids},
-                    field_definitions
-                )
-                
-                results.update(batch_results)
-                
-                # Brief pause between batches to avoid rate limiting
-                if batch_end < len(work_item_ids):
-                    await asyncio.sleep(0.1)
+            # Validate everything up front, then write through $batch requests
+            results = await self._update_work_items_batch(
+                project_name,
+                work_item_scores,
+                field_definitions,
+                chunk_size=min(batch_size, MAX_WORK_ITEMS_PER_BATCH)
+            )
         
         except Exception as e:
             logger.error(f"Error updating work item scores: {e}")
@@ -1208,80 +1193,92 @@ class CustomFieldsManager:
         self,
         project_name: str,
         batch_scores: Dict[int, Dict[str, Any]],
-        field_definitions: Dict[str, QVFFieldDefinition]
+        field_definitions: Dict[str, QVFFieldDefinition],
+        chunk_size: int = MAX_WORK_ITEMS_PER_BATCH
     ) -> Dict[int, FieldOperationResult]:
         """Update a batch of work items with QVF scores.
         
+        Field updates may be keyed by QVF field name (QVF.Score) or by ADO
+        reference name (Custom.QVFScore). Items that pass validation are
+        written through the client's $batch pipeline; items it could not
+        update are reported with the ADO error.
+        
         Args:
             project_name: ADO project name
             batch_scores: Dictionary mapping work item IDs to field updates
             field_definitions: QVF field definitions for validation
+            chunk_size: Number of work items per $batch request
             
         Returns:
             Dictionary mapping work item IDs to update results
         """
         results = {}
+        validated_batch = {}
+        
+        field_lookup = dict(field_definitions)
+        for field_def in field_definitions.values():
+            field_lookup[field_def.reference_name] = field_def
         
-        # Process each work item in the batch
+        # Validate each work item in the batch
         for work_item_id, field_updates in batch_scores.items():
             result = FieldOperationResult(
                 success=False,
                 operation="update",
                 field_name="qvf_scores"
             )
+            results[work_item_id] = result
             
-            try:
-                # Validate field updates
-                validated_updates = {}
-                validation_errors = []
+            validated_updates = {}
+            validation_errors = []
                 
-                for field_name, value in field_updates.items():
-                    field_def = field_definitions.get(field_name)
-                    if not field_def:
-                        validation_errors.append(f"Unknown field: {field_name}")
-                        continue
-                    
-                    is_valid, error_msg = field_def.validate_value(value)
-                    if not is_valid:
-                        validation_errors.append(f"{field_name}: {error_msg}")
-                        continue
-                    
-                    # Convert field name to reference name for ADO API
-                    validated_updates[field_def.reference_name] = value
-                
-                if validation_errors:
-                    for error in validation_errors:
-                        result.add_error(error)
-                    results[work_item_id] = result
+            for field_name, value in field_updates.items():
+                field_def = field_lookup.get(field_name)
+                if not field_def:
+                    validation_errors.append(f"Unknown field: {field_name}")
                     continue
                 
-                # Update work item via ADO API
-                updated_item = await self.rest_client.update_work_item(
-                    project_name,
-                    work_item_id,
-                    validated_updates
-                )
+                is_valid, error_msg = field_def.validate_value(value)
+                if not is_valid:
+                    validation_errors.append(f"{field_name}: {error_msg}")
+                    continue
                 
-                if updated_item:
-                    result.success = True
-                    result.message = f"Updated {len(validated_updates)} QVF fields"
-                    result.items_processed = 1
-                    result.items_succeeded = 1
-                    result.ado_response = updated_item
+                # Convert field name to reference name for ADO API
+                validated_updates[field_def.reference_name] = value
                     
-                    logger.debug(f"Successfully updated work item {work_item_id}")
-                else:
-                    result.add_error("Work item update returned no response")
+            if validation_errors:
+                for error in validation_errors:
+                    result.add_error(error)
+                continue
             
-            except ADOApiError as e:
-                result.add_error(f"ADO API error: {str(e)}")
-                logger.error(f"ADO API error updating work item {work_item_id}: {e}")
+            validated_batch[work_item_id] = validated_updates
             
-            except Exception as e:
-                result.add_error(f"Unexpected error: {str(e)}")
-                logger.error(f"Unexpected error updating work item {work_item_id}: {e}")
+        if not validated_batch:
+            return results
             
-            results[work_item_id] = result
+        # Update work items via ADO $batch API
+        update_responses = await self.rest_client.batch_update_work_items(
+            project_name,
+            validated_batch,
+            chunk_size=chunk_size
+        )
+        
+        for work_item_id, validated_updates in validated_batch.items():
+            result = results[work_item_id]
+            updated_item = update_responses.get(work_item_id)
+            
+            if not updated_item:
+                result.add_error("Work item update returned no response")
+            elif "error" in updated_item:
+                result.add_error(f"ADO API error: {updated_item['error']}")
+                logger.error(f"ADO API error updating work item {work_item_id}: {updated_item['error']}")
+            else:
+                result.success = True
+                result.message = f"Updated {len(validated_updates)} QVF fields"
+                result.items_processed = 1
+                result.items_succeeded = 1
+                result.ado_response = updated_item
+                
+                logger.debug(f"Successfully updated work item {work_item_id}")
         
         return results
     
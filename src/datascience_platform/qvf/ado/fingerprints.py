@@ -0,0 +1,260 @@
+"""QVF Field Fingerprints for Write Suppression
+
+Tracks what each work item's QVF fields were last known to hold in Azure
+DevOps so that scoring runs only write items (and fields) whose values
+actually changed.
+
+Key Features:
+- Per-item hash of the rounded QVF field values for a fast unchanged check
+- Field-level diffing with an optional tolerance for float noise
+- ADO revision tracking to detect edits made outside QVF
+- Seeding from loaded work items, so a cold store still skips unchanged items
+- JSON persistence between runs
+
+Usage:
+    store = FieldFingerprintStore.load(path, tolerance=1e-4)
+    manager = WorkItemManager(organization_url, pat_token, fingerprint_store=store)
+    
+    result = await manager.update_work_item_scores("MyProject", scores)
+    print(f"Skipped {result.skipped_updates} unchanged work items")
+    
+    store.save(path)
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field, asdict
+from numbers import Real
+from pathlib import Path
+from typing import Dict, Optional, Any, Iterable, Union
+
+logger = logging.getLogger(__name__)
+
+
+# Store format version, bumped when the persisted layout changes
+STORE_VERSION = 1
+
+# Fields that change on every run and never make an item "changed" by themselves
+DEFAULT_IGNORED_FIELDS = frozenset({"Custom.QVFLastCalculated", "QVF.LastCalculated"})
+
+_MISSING = object()
+
+
+@dataclass
+class FieldFingerprint:
+    """Last known QVF field values of a work item in ADO."""
+    
+    fingerprint: str
+    values: Dict[str, Any] = field(default_factory=dict)
+    rev: Optional[int] = None
+
+
+class FieldFingerprintStore:
+    """Local store of QVF field fingerprints keyed by work item ID.
+    
+    Values are rounded to the QVF field precision before hashing, so float
+    noise below that precision never triggers a write. A tolerance can be
+    set to also ignore larger differences. Timestamp fields listed in
+    ignored_fields are excluded from change detection but are still sent
+    along with any other changed field.
+    
+    The ADO revision returned by each write is kept with the fingerprint.
+    When a later load sees a different revision the item was edited outside
+    QVF, and its fingerprint is re-seeded from the loaded field values (or
+    dropped if those were not loaded).
+    """
+    
+    def __init__(
+        self,
+        precision: int = 4,
+        tolerance: float = 0.0,
+        ignored_fields: Iterable[str] = DEFAULT_IGNORED_FIELDS
+    ):
+        """Initialize fingerprint store.
+        
+        Args:
+            precision: Decimal places numeric values are rounded to
+            tolerance: Maximum absolute difference treated as unchanged
+            ignored_fields: Field names excluded from change detection
+        """
+        if tolerance < 0:
+            raise ValueError("tolerance must be non-negative")
+        
+        self.precision = precision
+        self.tolerance = tolerance
+        self.ignored_fields = frozenset(ignored_fields)
+        self._entries: Dict[int, FieldFingerprint] = {}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, work_item_id: int) -> bool:
+        return work_item_id in self._entries
+    
+    def get(self, work_item_id: int) -> Optional[FieldFingerprint]:
+        """Get the stored fingerprint of a work item."""
+        return self._entries.get(work_item_id)
+    
+    def changed_fields(self, work_item_id: int, field_updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Select the field updates that need to be written.
+        
+        Args:
+            work_item_id: ID of the work item
+            field_updates: Dictionary mapping field names to new values
+            
+        Returns:
+            Changed fields plus ignored (timestamp) fields, or an empty
+            dictionary if no tracked field changed
+        """
+        entry = self._entries.get(work_item_id)
+        if entry is None:
+            return dict(field_updates)
+        
+        tracked = self._tracked_values(field_updates)
+        if self._fingerprint({**entry.values, **tracked}) == entry.fingerprint:
+            return {}
+        
+        changed = {
+            field_name: field_updates[field_name]
+            for field_name, value in tracked.items()
+            if not self._same_value(entry.values.get(field_name, _MISSING), value)
+        }
+        if not changed:
+            return {}
+        
+        for field_name, value in field_updates.items():
+            if field_name in self.ignored_fields:
+                changed[field_name] = value
+        
+        return changed
+    
+    def record(self, work_item_id: int, field_updates: Dict[str, Any], rev: Optional[int] = None) -> None:
+        """Record field values that were written to ADO.
+        
+        Args:
+            work_item_id: ID of the work item
+            field_updates: Fields that were written (merged into known values)
+            rev: Work item revision returned by the write
+        """
+        entry = self._entries.get(work_item_id)
+        values = dict(entry.values) if entry else {}
+        values.update(self._tracked_values(field_updates))
+        
+        if rev is None and entry is not None:
+            rev = entry.rev
+        
+        self._entries[work_item_id] = FieldFingerprint(
+            fingerprint=self._fingerprint(values),
+            values=values,
+            rev=rev
+        )
+    
+    def observe(self, work_item_id: int, rev: Optional[int], fields: Optional[Dict[str, Any]] = None) -> None:
+        """Reconcile the store with a work item loaded from ADO.
+        
+        Args:
+            work_item_id: ID of the work item
+            rev: Current work item revision
+            fields: Loaded QVF field values, if they were requested
+        """
+        entry = self._entries.get(work_item_id)
+        if entry is not None and entry.rev is not None and rev is not None and rev <= entry.rev:
+            # Our last write is current, or the load (e.g. a stale mirror) predates it
+            return
+        
+        if fields is None:
+            # Edited elsewhere and we cannot tell how; write everything next time
+            if entry is not None and rev is not None:
+                self._entries.pop(work_item_id, None)
+            return
+        
+        values = self._tracked_values({
+            field_name: value for field_name, value in fields.items() if value is not None
+        })
+        self._entries[work_item_id] = FieldFingerprint(
+            fingerprint=self._fingerprint(values),
+            values=values,
+            rev=rev
+        )
+    
+    def invalidate(self, work_item_ids: Iterable[int]) -> None:
+        """Forget work items so their next update writes every field."""
+        for work_item_id in work_item_ids:
+            self._entries.pop(work_item_id, None)
+    
+    def clear(self) -> None:
+        """Forget all work items."""
+        self._entries.clear()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert store to a JSON-serializable dictionary."""
+        return {
+            'version': STORE_VERSION,
+            'precision': self.precision,
+            'entries': {str(work_item_id): asdict(entry) for work_item_id, entry in self._entries.items()}
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], **kwargs) -> 'FieldFingerprintStore':
+        """Create store from a dictionary produced by to_dict."""
+        store = cls(**kwargs)
+        if data.get('version') != STORE_VERSION or data.get('precision') != store.precision:
+            logger.warning("Discarding fingerprint store with a different version or precision")
+            return store
+        
+        store._entries = {
+            int(work_item_id): FieldFingerprint(**entry)
+            for work_item_id, entry in data['entries'].items()
+        }
+        return store
+    
+    def save(self, path: Union[str, Path]) -> None:
+        """Save store to a JSON file (written atomically)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        temp_path = path.with_suffix(path.suffix + '.tmp')
+        temp_path.write_text(json.dumps(self.to_dict()))
+        temp_path.replace(path)
+    
+    @classmethod
+    def load(cls, path: Union[str, Path], **kwargs) -> 'FieldFingerprintStore':
+        """Load store from a JSON file, returning an empty store if it does not exist."""
+        path = Path(path)
+        if not path.exists():
+            return cls(**kwargs)
+        
+        try:
+            return cls.from_dict(json.loads(path.read_text()), **kwargs)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable fingerprint store {path}: {e}")
+            return cls(**kwargs)
+    
+    def _tracked_values(self, field_updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalized values of the fields that take part in change detection."""
+        return {
+            field_name: self._normalize(value)
+            for field_name, value in field_updates.items()
+            if field_name not in self.ignored_fields
+        }
+    
+    def _normalize(self, value: Any) -> Any:
+        """Round numbers and stringify everything that is not JSON-native."""
+        if isinstance(value, Real) and not isinstance(value, bool):
+            return round(float(value), self.precision)
+        if value is None or isinstance(value, (str, bool)):
+            return value
+        return str(value)
+    
+    def _same_value(self, old: Any, new: Any) -> bool:
+        """Compare normalized values, allowing the tolerance for numbers."""
+        if isinstance(old, float) and isinstance(new, float):
+            return abs(old - new) <= self.tolerance
+        return old == new
+    
+    @staticmethod
+    def _fingerprint(values: Dict[str, Any]) -> str:
+        """Hash normalized field values."""
+        payload = json.dumps(values, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
@@ -0,0 +1,455 @@
+"""Local Work Item Mirror for Azure DevOps
+
+Keeps a SQLite copy of a project's work items so that scoring runs,
+analytics and the API read work items locally instead of querying ADO on
+every request. The mirror is kept current by delta syncs (see
+WorkItemManager.sync_mirror), which only fetch items changed since the
+last sync.
+
+Key Features:
+- One row per work item with the raw ADO field payload
+- Indexed filters on state, type, area path, iteration path and changed date
+- Area and iteration path filters with WIQL UNDER semantics
+- Per-project sync state (changed-date watermark and revisions API token)
+- Payloads in the same shape as the ADO REST API, so callers need no changes
+
+Usage:
+    mirror = WorkItemMirror("work_items.db")
+    manager = WorkItemManager(organization_url, pat_token, mirror=mirror)
+    
+    await manager.sync_mirror("MyProject")
+    work_items = await manager.load_work_items_for_scoring("MyProject")
+    
+    analyzer = ADOAnalyzer()
+    analyzer.load_from_mirror(mirror, "MyProject")
+"""
+
+import json
+import logging
+import re
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Optional, Any, Iterable, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+# Default location of the mirror database
+DEFAULT_MIRROR_PATH = Path.home() / ".cache" / "qvf" / "work_items.db"
+
+# ADO path separator; "X\\" up to (but excluding) "X]" spans every path under X
+_PATH_SEPARATOR = "\\"
+_PATH_UPPER_BOUND = "]"
+
+# ISO timestamp with an optional fraction of any length and an optional offset
+_ISO_DATETIME = re.compile(
+    r'^(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2})?)(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?$'
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_items (
+    id INTEGER PRIMARY KEY,
+    project TEXT NOT NULL,
+    rev INTEGER,
+    work_item_type TEXT,
+    state TEXT,
+    area_path TEXT,
+    iteration_path TEXT,
+    assigned_to TEXT,
+    changed_date TEXT,
+    fields TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_work_items_state ON work_items (project, state);
+CREATE INDEX IF NOT EXISTS idx_work_items_type ON work_items (project, work_item_type);
+CREATE INDEX IF NOT EXISTS idx_work_items_area ON work_items (project, area_path);
+CREATE INDEX IF NOT EXISTS idx_work_items_iteration ON work_items (project, iteration_path);
+CREATE INDEX IF NOT EXISTS idx_work_items_changed ON work_items (project, changed_date);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project TEXT PRIMARY KEY,
+    watermark TEXT,
+    continuation_token TEXT,
+    last_synced TEXT
+);
+"""
+
+# Mirror columns exported by to_dataframe, named like an ADO CSV export
+_EXPORT_COLUMNS = {
+    'ID': 'System.Id',
+    'Title': 'System.Title',
+    'Work Item Type': 'System.WorkItemType',
+    'State': 'System.State',
+    'Parent': 'System.Parent',
+    'Business Value': 'Microsoft.VSTS.Common.BusinessValue',
+    'Story Points': 'Microsoft.VSTS.Scheduling.StoryPoints',
+    'Created Date': 'System.CreatedDate',
+    'Closed Date': 'Microsoft.VSTS.Common.ClosedDate',
+    'Iteration Path': 'System.IterationPath',
+    'Area Path': 'System.AreaPath',
+    'Assigned To': 'System.AssignedTo',
+    'Tags': 'System.Tags'
+}
+
+
+@dataclass
+class MirrorSyncState:
+    """Sync position of one project in the mirror."""
+    
+    watermark: Optional[datetime] = None
+    continuation_token: Optional[str] = None
+    last_synced: Optional[datetime] = None
+
+
+def parse_ado_datetime(value: Any) -> Optional[datetime]:
+    """Parse an ADO timestamp into a UTC-aware datetime.
+    
+    ADO trims trailing zeros from fractional seconds (e.g.
+    "2024-01-15T10:30:47.42Z"), which datetime.fromisoformat rejects before
+    Python 3.11, so the fraction is padded or cut to microseconds first.
+    
+    Args:
+        value: ISO string or datetime (naive values are taken as UTC)
+        
+    Returns:
+        Aware datetime, or None for empty or unparsable values
+    """
+    if value is None or value == "":
+        return None
+    if not isinstance(value, datetime):
+        match = _ISO_DATETIME.match(str(value).strip())
+        if match is None:
+            return None
+        base, fraction, offset = match.groups()
+        text = base
+        if fraction:
+            text += "." + fraction[:6].ljust(6, "0")
+        if offset and offset != "Z":
+            text += offset if ":" in offset else f"{offset[:3]}:{offset[3:]}"
+        try:
+            value = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class WorkItemMirror:
+    """SQLite mirror of ADO work items.
+    
+    Work items are stored as their ADO payloads (id, rev and fields) with
+    the commonly filtered fields copied into indexed columns. Queries return
+    payloads in ADO order (by ID), so the mirror can stand in for the live
+    WIQL plus workitemsbatch path.
+    """
+    
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """Initialize work item mirror.
+        
+        Args:
+            path: SQLite database file (":memory:" for an in-memory mirror,
+                defaults to ~/.cache/qvf/work_items.db)
+        """
+        if path is None:
+            path = DEFAULT_MIRROR_PATH
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        
+        self.path = str(path)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+    
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM work_items").fetchone()[0]
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+    
+    def upsert_work_items(self, project_name: str, work_items: Iterable[Dict[str, Any]]) -> int:
+        """Insert or replace work items from ADO payloads.
+        
+        Payloads with a lower revision than the stored one are ignored, so
+        late pages from an older sync never overwrite newer data.
+        
+        Args:
+            project_name: Name of the ADO project
+            work_items: Work item payloads with id, rev and fields
+            
+        Returns:
+            Number of work items written
+        """
+        rows = []
+        for item in work_items:
+            fields = item.get("fields", {})
+            work_item_id = item.get("id", fields.get("System.Id"))
+            if work_item_id is None:
+                continue
+            
+            rows.append((
+                int(work_item_id),
+                project_name,
+                item.get("rev", fields.get("System.Rev")),
+                fields.get("System.WorkItemType"),
+                fields.get("System.State"),
+                fields.get("System.AreaPath"),
+                fields.get("System.IterationPath"),
+                self._identity_name(fields.get("System.AssignedTo")),
+                self._format_date(fields.get("System.ChangedDate")),
+                json.dumps(fields, default=str)
+            ))
+        
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO work_items (
+                    id, project, rev, work_item_type, state, area_path,
+                    iteration_path, assigned_to, changed_date, fields
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    project = excluded.project,
+                    rev = excluded.rev,
+                    work_item_type = excluded.work_item_type,
+                    state = excluded.state,
+                    area_path = excluded.area_path,
+                    iteration_path = excluded.iteration_path,
+                    assigned_to = excluded.assigned_to,
+                    changed_date = excluded.changed_date,
+                    fields = excluded.fields
+                WHERE work_items.rev IS NULL OR excluded.rev IS NULL OR excluded.rev >= work_items.rev
+                """,
+                rows
+            )
+        
+        return len(rows)
+    
+    def merge_fields(
+        self,
+        project_name: str,
+        updates: Dict[int, Tuple[Dict[str, Any], Optional[int]]]
+    ) -> int:
+        """Merge written field values into mirrored work items.
+        
+        Keeps the mirror in line with writes made through the API until the
+        next sync brings in the new revisions. Items that are not mirrored
+        are left out.
+        
+        Args:
+            project_name: Name of the ADO project
+            updates: Work item ID -> (written fields, revision after the write)
+            
+        Returns:
+            Number of work items updated
+        """
+        payloads = []
+        for work_item_id, (fields, rev) in updates.items():
+            item = self.get_work_item(work_item_id)
+            if item is None:
+                continue
+            
+            item["fields"].update(fields)
+            if rev is not None:
+                item["rev"] = rev
+            payloads.append(item)
+        
+        return self.upsert_work_items(project_name, payloads)
+    
+    def remove_work_items(self, work_item_ids: Iterable[int]) -> int:
+        """Remove work items (e.g. deleted in ADO) from the mirror."""
+        with self._conn:
+            cursor = self._conn.executemany(
+                "DELETE FROM work_items WHERE id = ?",
+                [(int(work_item_id),) for work_item_id in work_item_ids]
+            )
+        return cursor.rowcount
+    
+    def get_work_item(self, work_item_id: int) -> Optional[Dict[str, Any]]:
+        """Get a work item payload by ID."""
+        row = self._conn.execute(
+            "SELECT id, rev, fields FROM work_items WHERE id = ?", (work_item_id,)
+        ).fetchone()
+        return self._to_payload(row) if row else None
+    
+    def query(
+        self,
+        project_name: str,
+        work_item_types: Optional[Iterable[Any]] = None,
+        states: Optional[Iterable[Any]] = None,
+        exclude_states: Optional[Iterable[Any]] = None,
+        area_path: Optional[str] = None,
+        iteration_path: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        changed_since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Query work item payloads ordered by ID.
+        
+        Args:
+            project_name: Name of the ADO project
+            work_item_types: Work item types to include (all if None)
+            states: States to include (all if None)
+            exclude_states: States to leave out
+            area_path: Only items under this area path
+            iteration_path: Only items under this iteration path
+            assigned_to: Only items assigned to this identity
+            changed_since: Only items changed after this time
+            limit: Maximum number of items to return
+            offset: Number of matching items to skip
+            
+        Returns:
+            List of work item payloads (id, rev and fields)
+        """
+        where_clause, params = self._build_filters(
+            project_name, work_item_types, states, exclude_states,
+            area_path, iteration_path, assigned_to, changed_since
+        )
+        sql = f"SELECT id, rev, fields FROM work_items WHERE {where_clause} ORDER BY id"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit if limit is not None else -1, offset]
+        
+        return [self._to_payload(row) for row in self._conn.execute(sql, params)]
+    
+    def count(self, project_name: str, **filters) -> int:
+        """Count work items matching the query filters."""
+        where_clause, params = self._build_filters(
+            project_name,
+            filters.get('work_item_types'),
+            filters.get('states'),
+            filters.get('exclude_states'),
+            filters.get('area_path'),
+            filters.get('iteration_path'),
+            filters.get('assigned_to'),
+            filters.get('changed_since')
+        )
+        return self._conn.execute(f"SELECT COUNT(*) FROM work_items WHERE {where_clause}", params).fetchone()[0]
+    
+    def to_dataframe(self, project_name: str, **filters):
+        """Export matching work items as a DataFrame with ADO export column names.
+        
+        Args:
+            project_name: Name of the ADO project
+            **filters: Filters accepted by query
+            
+        Returns:
+            pandas DataFrame suitable for ADOAnalyzer.load_from_dataframe
+        """
+        import pandas as pd
+        
+        records = []
+        for item in self.query(project_name, **filters):
+            fields = item["fields"]
+            record = {column: fields.get(field_name) for column, field_name in _EXPORT_COLUMNS.items()}
+            record['ID'] = item["id"]
+            record['Assigned To'] = self._identity_name(record['Assigned To'])
+            if record['Tags']:
+                record['Tags'] = ";".join(tag.strip() for tag in record['Tags'].split(";"))
+            records.append(record)
+        
+        return pd.DataFrame(records, columns=list(_EXPORT_COLUMNS))
+    
+    def get_sync_state(self, project_name: str) -> MirrorSyncState:
+        """Get the sync position of a project."""
+        row = self._conn.execute(
+            "SELECT watermark, continuation_token, last_synced FROM sync_state WHERE project = ?",
+            (project_name,)
+        ).fetchone()
+        if row is None:
+            return MirrorSyncState()
+        
+        watermark, continuation_token, last_synced = row
+        return MirrorSyncState(
+            watermark=datetime.fromisoformat(watermark) if watermark else None,
+            continuation_token=continuation_token,
+            last_synced=datetime.fromisoformat(last_synced) if last_synced else None
+        )
+    
+    def set_sync_state(self, project_name: str, state: MirrorSyncState) -> None:
+        """Store the sync position of a project."""
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO sync_state (project, watermark, continuation_token, last_synced)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    project_name,
+                    state.watermark.isoformat() if state.watermark else None,
+                    state.continuation_token,
+                    state.last_synced.isoformat() if state.last_synced else None
+                )
+            )
+    
+    def clear(self, project_name: str) -> None:
+        """Drop all work items and the sync state of a project."""
+        with self._conn:
+            self._conn.execute("DELETE FROM work_items WHERE project = ?", (project_name,))
+            self._conn.execute("DELETE FROM sync_state WHERE project = ?", (project_name,))
+    
+    def _build_filters(
+        self,
+        project_name: str,
+        work_item_types: Optional[Iterable[Any]],
+        states: Optional[Iterable[Any]],
+        exclude_states: Optional[Iterable[Any]],
+        area_path: Optional[str],
+        iteration_path: Optional[str],
+        assigned_to: Optional[str],
+        changed_since: Optional[datetime]
+    ) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause and parameters for the query filters."""
+        conditions = ["project = ?"]
+        params: List[Any] = [project_name]
+        
+        for column, values, operator in (
+            ("work_item_type", work_item_types, "IN"),
+            ("state", states, "IN"),
+            ("state", exclude_states, "NOT IN")
+        ):
+            if values:
+                names = [getattr(value, 'value', value) for value in values]
+                conditions.append(f"{column} {operator} ({', '.join('?' * len(names))})")
+                params.extend(names)
+        
+        for column, path in (("area_path", area_path), ("iteration_path", iteration_path)):
+            if path:
+                # UNDER: the path itself or any child, as an index-friendly range
+                path = path.rstrip(_PATH_SEPARATOR)
+                conditions.append(f"({column} = ? OR ({column} >= ? AND {column} < ?))")
+                params.extend([path, path + _PATH_SEPARATOR, path + _PATH_UPPER_BOUND])
+        
+        if assigned_to:
+            conditions.append("assigned_to = ?")
+            params.append(assigned_to)
+        
+        if changed_since:
+            conditions.append("changed_date > ?")
+            params.append(self._format_date(changed_since))
+        
+        return " AND ".join(conditions), params
+    
+    @staticmethod
+    def _to_payload(row: Tuple[Any, ...]) -> Dict[str, Any]:
+        """Convert a database row to an ADO work item payload."""
+        work_item_id, rev, fields = row
+        return {"id": work_item_id, "rev": rev, "fields": json.loads(fields)}
+    
+    @staticmethod
+    def _identity_name(value: Any) -> Optional[str]:
+        """Get a comparable name from an ADO identity field."""
+        if isinstance(value, dict):
+            return value.get("uniqueName") or value.get("displayName")
+        return value
+    
+    @staticmethod
+    def _format_date(value: Any) -> Optional[str]:
+        """Normalize a date to a sortable UTC ISO string (None if unparsable)."""
+        parsed = parse_ado_datetime(value)
+        if parsed is None:
+            if value:
+                logger.warning(f"Ignoring unparsable work item date {value!r}")
+            return None
+        return parsed.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
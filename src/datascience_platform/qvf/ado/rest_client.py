@@ -8,7 +8,7 @@ Key Features:
 - Full Azure DevOps REST API v7.0+ support
 - Authentication via Personal Access Tokens
 - Automatic retry logic with exponential backoff
-- Rate limiting and throttling protection
+- Adaptive rate limiting driven by ADO throttling headers
 - Comprehensive error handling and logging
 - Performance optimized for enterprise scale (10,000+ items)
 - Connection pooling and request batching
@@ -66,15 +66,22 @@ Architecture:
 import logging
 import asyncio
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Optional, Any, Union, Tuple
+from typing import List, Dict, Optional, Any, Union, Tuple, AsyncIterator, MutableMapping
 from pydantic import model_validator
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 import json
 import base64
+import copy
+import hashlib
+from collections import deque
+from contextlib import asynccontextmanager
+from pathlib import Path
 from urllib.parse import quote, urljoin
 import aiohttp
+import threading
 import time
+from multidict import CIMultiDict
 from pydantic import BaseModel, Field, field_validator
 
 # Internal imports
@@ -82,6 +89,9 @@ from ...core.exceptions import DataSciencePlatformError
 
 logger = logging.getLogger(__name__)
 
+# Azure DevOps returns at most 200 work items per batch request
+MAX_WORK_ITEMS_PER_BATCH = 200
+
 
 class ADOApiError(DataSciencePlatformError):
     """Base exception for Azure DevOps API errors."""
@@ -139,6 +149,25 @@ class ADOClientConfig(BaseModel):
     # Rate limiting
     requests_per_minute: int = Field(200, ge=1, le=1000, description="Maximum requests per minute")
     rate_limit_buffer: float = Field(0.9, ge=0.1, le=1.0, description="Rate limit safety buffer (0.9 = 90%)")
+    adaptive_rate_limiting: bool = Field(
+        True, description="Adapt rate and concurrency to ADO throttling headers (limiter shared per organization)"
+    )
+    adaptive_max_rate_factor: float = Field(
+        1.0, ge=1.0, le=5.0,
+        description="Highest rate, as a multiple of requests_per_minute, the adaptive limiter may climb to while ADO reports spare budget"
+    )
+    adaptive_max_concurrency: Optional[int] = Field(
+        None, ge=1, le=100,
+        description="Highest concurrency the adaptive limiter may climb to (defaults to max_concurrent_requests)"
+    )
+    
+    # Metadata response caching (fields, work item types, projects)
+    response_cache_ttl_seconds: int = Field(
+        300, ge=0, le=86400, description="Time metadata responses are served without revalidation (0 disables caching)"
+    )
+    response_cache_dir: Optional[str] = Field(
+        None, description="Directory for persisting cached responses between runs (memory only if None)"
+    )
     
     # Connection pooling
     connection_pool_size: int = Field(20, ge=5, le=100, description="HTTP connection pool size")
@@ -160,6 +189,15 @@ class ADOClientConfig(BaseModel):
         
         return v.rstrip('/')
     
+    @field_validator('adaptive_max_concurrency')
+    @classmethod
+    def validate_adaptive_max_concurrency(cls, v: Optional[int], info) -> Optional[int]:
+        """Ensure the concurrency ceiling is not below the starting concurrency."""
+        start = info.data.get('max_concurrent_requests')
+        if v is not None and start is not None and v < start:
+            raise ValueError("adaptive_max_concurrency must be at least max_concurrent_requests")
+        return v
+    
     def model_post_init(self, __context: Any) -> None:
         """Set computed fields after initialization."""
         if not self.base_url:
@@ -256,6 +294,480 @@ class RateLimiter:
             # Consume a token
             self.tokens -= 1
 
+    def release(self) -> None:
+        """Release a request slot (no-op for the fixed-rate limiter)."""
+    
+    def record_response(self, status_code: int, headers: Any) -> None:
+        """Feed a response back to the limiter (ignored by the fixed-rate limiter)."""
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get limiter state as metrics."""
+        return {
+            "requests_per_minute": self.refill_rate * 60.0,
+            "current_tokens": self.tokens,
+            "max_tokens": self.max_tokens
+        }
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """Rate and concurrency limiter driven by ADO throttling feedback.
+    
+    Extends the token bucket with AIMD control of both the refill rate and
+    the number of requests in flight. Every response is fed back through
+    record_response:
+    
+    - No throttling headers, or X-RateLimit-Remaining at or above
+      backoff_headroom of X-RateLimit-Limit (TSTUs): additive increase of
+      rate and concurrency, up to max_rate_factor and max_concurrency
+    - Remaining below backoff_headroom of the limit, X-RateLimit-Delay > 0,
+      Retry-After or HTTP 429: multiplicative decrease (at most once per
+      cooldown), plus a pause of all requests for Retry-After seconds
+    
+    The limiter starts at requests_per_minute and initial_concurrency; set
+    max_rate_factor above 1.0 and max_concurrency above initial_concurrency
+    to let it use spare budget beyond the starting point.
+    
+    ADO throttles per identity and organization, so clients for the same
+    organization should share one limiter; use AdaptiveRateLimiter.shared.
+    State changes are guarded by a thread lock and waiters are woken on their
+    own event loop, so a shared instance can be used from event loops running
+    in several threads of the same process.
+    """
+    
+    # Process-wide limiters keyed by organization
+    _shared: Dict[str, 'AdaptiveRateLimiter'] = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        requests_per_minute: int,
+        buffer_factor: float = 0.9,
+        max_concurrency: int = 10,
+        min_concurrency: int = 1,
+        initial_concurrency: Optional[int] = None,
+        min_rate_factor: float = 0.1,
+        max_rate_factor: float = 1.0,
+        rate_increase: float = 0.02,
+        decrease_factor: float = 0.5,
+        backoff_headroom: float = 0.2,
+        decrease_cooldown_seconds: float = 1.0
+    ):
+        """Initialize adaptive rate limiter.
+        
+        Args:
+            requests_per_minute: Starting requests per minute
+            buffer_factor: Safety buffer (0.9 = use 90% of limit)
+            max_concurrency: Upper bound for requests in flight
+            min_concurrency: Lower bound for requests in flight
+            initial_concurrency: Starting requests in flight (defaults to max_concurrency)
+            min_rate_factor: Lowest rate as a fraction of the starting rate
+            max_rate_factor: Highest rate as a multiple of the starting rate (the
+                default keeps the rate at or below requests_per_minute)
+            rate_increase: Rate factor added per unthrottled response
+            decrease_factor: Multiplier applied to rate and concurrency on back-off
+            backoff_headroom: Remaining/limit ratio below which to back off
+            decrease_cooldown_seconds: Minimum time between two back-offs
+        """
+        super().__init__(requests_per_minute, buffer_factor)
+        self.base_refill_rate = self.refill_rate
+        self.last_refill = time.monotonic()
+        
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max(max_concurrency, min_concurrency)
+        self.initial_concurrency = min(
+            self.max_concurrency,
+            max(initial_concurrency if initial_concurrency is not None else self.max_concurrency, min_concurrency)
+        )
+        self.concurrency_limit = float(self.initial_concurrency)
+        
+        self.min_rate_factor = min_rate_factor
+        self.max_rate_factor = max_rate_factor
+        self.rate_factor = 1.0
+        self.rate_increase = rate_increase
+        self.decrease_factor = decrease_factor
+        self.backoff_headroom = backoff_headroom
+        self.decrease_cooldown_seconds = decrease_cooldown_seconds
+        
+        self._state_lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters = deque()
+        self._paused_until = 0.0
+        self._last_decrease = float('-inf')
+        
+        # Last reported budget and counters exported through get_metrics
+        self.rate_limit_remaining: Optional[float] = None
+        self.rate_limit_limit: Optional[float] = None
+        self.rate_limit_reset: Optional[float] = None
+        self.rate_limit_resource: Optional[str] = None
+        self._counters = {
+            "responses": 0,
+            "throttled_responses": 0,
+            "delayed_responses": 0,
+            "backoffs": 0,
+            "pauses": 0
+        }
+    
+    @classmethod
+    def shared(cls, key: str, **kwargs) -> 'AdaptiveRateLimiter':
+        """Get the process-wide limiter for key, creating it on first use.
+        
+        Args:
+            key: Sharing key, normally the organization URL
+            **kwargs: Constructor arguments; if the limiter already exists, its
+                limits are tightened to the more conservative of both settings
+            
+        Returns:
+            Limiter shared by every caller using the same key
+        """
+        key = key.rstrip('/').lower()
+        with cls._shared_lock:
+            limiter = cls._shared.get(key)
+            if limiter is None:
+                limiter = cls._shared[key] = cls(**kwargs)
+            elif kwargs:
+                limiter.merge_settings(cls(**kwargs), key)
+        return limiter
+    
+    def merge_settings(self, other: 'AdaptiveRateLimiter', key: str = "") -> None:
+        """Adopt the more conservative limits of another limiter's settings.
+        
+        Used when a later client shares this limiter with different settings:
+        the lower rate, token budget, concurrency and rate ceiling win. Other
+        differing tuning parameters keep the values of the first client.
+        
+        Args:
+            other: Limiter built from the later client's settings
+            key: Sharing key, for logging
+        """
+        with self._state_lock:
+            tightened = []
+            if other.base_refill_rate < self.base_refill_rate:
+                self.base_refill_rate = other.base_refill_rate
+                self.max_tokens = min(self.max_tokens, other.max_tokens)
+                self.tokens = min(self.tokens, self.max_tokens)
+                tightened.append(f"requests_per_minute={other.base_refill_rate * 60.0:.0f}")
+            if other.max_concurrency < self.max_concurrency:
+                self.max_concurrency = max(other.max_concurrency, self.min_concurrency)
+                self.initial_concurrency = min(self.initial_concurrency, self.max_concurrency)
+                self.concurrency_limit = min(self.concurrency_limit, float(self.max_concurrency))
+                tightened.append(f"max_concurrency={self.max_concurrency}")
+            if other.initial_concurrency < self.initial_concurrency:
+                self.initial_concurrency = max(other.initial_concurrency, self.min_concurrency)
+                self.concurrency_limit = min(self.concurrency_limit, float(self.initial_concurrency))
+                tightened.append(f"initial_concurrency={self.initial_concurrency}")
+            if other.max_rate_factor < self.max_rate_factor:
+                self.max_rate_factor = other.max_rate_factor
+                self.rate_factor = min(self.rate_factor, self.max_rate_factor)
+                tightened.append(f"max_rate_factor={self.max_rate_factor}")
+            self.refill_rate = self.base_refill_rate * self.rate_factor
+        
+        if tightened:
+            logger.warning(f"Shared rate limiter {key} tightened to {', '.join(tightened)} for a client with lower limits")
+        
+        ignored = [
+            name for name in (
+                "min_concurrency", "min_rate_factor", "rate_increase",
+                "decrease_factor", "backoff_headroom", "decrease_cooldown_seconds"
+            )
+            if getattr(other, name) != getattr(self, name)
+        ]
+        if ignored:
+            logger.warning(f"Shared rate limiter {key} keeps its existing {', '.join(ignored)}")
+    
+    @classmethod
+    def get_shared_metrics(cls) -> Dict[str, Dict[str, Any]]:
+        """Get metrics of all shared limiters keyed by sharing key."""
+        return {key: limiter.get_metrics() for key, limiter in cls._shared.items()}
+    
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Drop all shared limiters, so the next clients start from fresh state."""
+        with cls._shared_lock:
+            cls._shared.clear()
+    
+    async def acquire(self) -> None:
+        """Wait for any server-requested pause, a token and a request slot.
+        
+        Each successful acquire must be paired with a call to release.
+        """
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            logger.debug(f"Paused by ADO throttling, waiting {pause:.2f}s")
+            await asyncio.sleep(pause)
+        
+        # Reserve a token now; a negative balance is paid back by waiting
+        with self._state_lock:
+            now = time.monotonic()
+            self.tokens = min(self.max_tokens, self.tokens + (now - self.last_refill) * self.refill_rate)
+            self.last_refill = now
+            self.tokens -= 1
+            wait_time = -self.tokens / self.refill_rate
+        if wait_time > 0:
+            logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
+            await asyncio.sleep(wait_time)
+        
+        with self._state_lock:
+            if self._in_flight < int(self.concurrency_limit) and not self._waiters:
+                self._in_flight += 1
+                return
+            
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was granted just before cancellation; hand it on
+                self.release()
+            raise
+    
+    def release(self) -> None:
+        """Release the request slot taken by acquire."""
+        with self._state_lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._grant_slots()
+    
+    def record_response(self, status_code: int, headers: Any) -> None:
+        """Adjust rate and concurrency from a response's throttling headers.
+        
+        Args:
+            status_code: HTTP status code
+            headers: Response headers (mapping)
+        """
+        headers = headers or {}
+        with self._state_lock:
+            self._record_response(status_code, headers)
+    
+    def _record_response(self, status_code: int, headers: Any) -> None:
+        """Apply a response to the limiter state (caller holds the state lock)."""
+        self._counters["responses"] += 1
+        
+        remaining = self._header_float(headers, 'X-RateLimit-Remaining')
+        limit = self._header_float(headers, 'X-RateLimit-Limit')
+        delay = self._header_float(headers, 'X-RateLimit-Delay')
+        retry_after = self._header_float(headers, 'Retry-After')
+        
+        if remaining is not None:
+            self.rate_limit_remaining = remaining
+        if limit is not None:
+            self.rate_limit_limit = limit
+        reset = self._header_float(headers, 'X-RateLimit-Reset')
+        if reset is not None:
+            self.rate_limit_reset = reset
+        if headers.get('X-RateLimit-Resource'):
+            self.rate_limit_resource = headers.get('X-RateLimit-Resource')
+        
+        headroom = remaining / limit if remaining is not None and limit else None
+        
+        if status_code == 429:
+            self._counters["throttled_responses"] += 1
+            self._pause(retry_after if retry_after is not None else 60.0)
+            self._decrease()
+        elif retry_after is not None:
+            self._pause(retry_after)
+            self._decrease()
+        elif delay:
+            self._counters["delayed_responses"] += 1
+            self._decrease()
+        elif headroom is not None and headroom < self.backoff_headroom:
+            self._decrease()
+        else:
+            self._increase()
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get limiter state and throttling counters as metrics."""
+        return {
+            "requests_per_minute": self.refill_rate * 60.0,
+            "rate_factor": self.rate_factor,
+            "current_tokens": self.tokens,
+            "max_tokens": self.max_tokens,
+            "concurrency_limit": int(self.concurrency_limit),
+            "max_concurrency": self.max_concurrency,
+            "max_rate_factor": self.max_rate_factor,
+            "in_flight": self._in_flight,
+            "waiting": sum(1 for waiter in self._waiters if not waiter.done()),
+            "paused_seconds": max(0.0, self._paused_until - time.monotonic()),
+            "rate_limit_remaining": self.rate_limit_remaining,
+            "rate_limit_limit": self.rate_limit_limit,
+            "rate_limit_reset": self.rate_limit_reset,
+            "rate_limit_resource": self.rate_limit_resource,
+            **self._counters
+        }
+    
+    def _increase(self) -> None:
+        """Additive increase of rate and concurrency."""
+        self.rate_factor = min(self.max_rate_factor, self.rate_factor + self.rate_increase)
+        self.refill_rate = self.base_refill_rate * self.rate_factor
+        
+        # About one extra slot per full window of responses
+        self.concurrency_limit = min(
+            float(self.max_concurrency),
+            self.concurrency_limit + 1.0 / max(self.concurrency_limit, 1.0)
+        )
+        self._grant_slots()
+    
+    def _decrease(self) -> None:
+        """Multiplicative decrease of rate and concurrency (once per cooldown)."""
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown_seconds:
+            return
+        self._last_decrease = now
+        self._counters["backoffs"] += 1
+        
+        self.rate_factor = max(self.min_rate_factor, self.rate_factor * self.decrease_factor)
+        self.refill_rate = self.base_refill_rate * self.rate_factor
+        self.concurrency_limit = max(float(self.min_concurrency), self.concurrency_limit * self.decrease_factor)
+        
+        logger.info(
+            f"Backing off ADO requests: {self.refill_rate * 60.0:.0f}/min, "
+            f"{int(self.concurrency_limit)} in flight"
+        )
+    
+    def _pause(self, seconds: float) -> None:
+        """Hold back all new requests for the given time."""
+        self._counters["pauses"] += 1
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+    
+    def _grant_slots(self) -> None:
+        """Hand free slots to waiters (caller holds the state lock).
+        
+        Waiters may belong to other threads' event loops, so they are resolved
+        on their own loop via call_soon_threadsafe.
+        """
+        while self._waiters and self._in_flight < int(self.concurrency_limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            try:
+                waiter.get_loop().call_soon_threadsafe(self._wake, waiter)
+            except RuntimeError:
+                # Loop closed, the waiter will never run
+                continue
+            self._in_flight += 1
+    
+    def _wake(self, waiter: asyncio.Future) -> None:
+        """Resolve a waiter granted a slot, on the waiter's own loop."""
+        if waiter.done():
+            # Cancelled between grant and wake-up; hand the slot on
+            self.release()
+        else:
+            waiter.set_result(None)
+    
+    @staticmethod
+    def _header_float(headers: Any, name: str) -> Optional[float]:
+        """Read a numeric header, ignoring missing or malformed values."""
+        value = headers.get(name)
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+
+@dataclass
+class CachedResponse:
+    """Cached body of a metadata GET request."""
+    
+    url: str
+    data: Any
+    etag: Optional[str] = None
+    stored_at: float = field(default_factory=time.time)
+
+
+class ResponseCache:
+    """Response cache for ADO metadata GET requests.
+    
+    Entries are keyed by method, URL and parameters. Fresh entries (younger
+    than the TTL) are served without a request; stale entries carrying an
+    ETag are revalidated with If-None-Match. Entries live in memory and,
+    when a cache directory is given, in one JSON file per key so they
+    survive between runs.
+    """
+    
+    def __init__(self, ttl_seconds: float, cache_dir: Optional[Union[str, Path]] = None):
+        """Initialize response cache.
+        
+        Args:
+            ttl_seconds: Time an entry is served without revalidation
+            cache_dir: Optional directory for persisting entries
+        """
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        self._entries: Dict[str, CachedResponse] = {}
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for a request."""
+        payload = json.dumps([method.upper(), url, sorted((params or {}).items())], default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get an entry (fresh or stale) from memory or disk."""
+        entry = self._entries.get(key)
+        if entry is None and self.cache_dir:
+            cache_file = self.cache_dir / f"{key}.json"
+            try:
+                if cache_file.exists():
+                    entry = CachedResponse(**json.loads(cache_file.read_text()))
+                    self._entries[key] = entry
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable cache entry {cache_file}: {e}")
+        return entry
+    
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Check whether an entry can be served without revalidation."""
+        return time.time() - entry.stored_at < self.ttl_seconds
+    
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """Store an entry in memory and on disk."""
+        self._entries[key] = entry
+        if self.cache_dir:
+            cache_file = self.cache_dir / f"{key}.json"
+            temp_file = cache_file.with_suffix('.tmp')
+            try:
+                temp_file.write_text(json.dumps(asdict(entry)))
+                temp_file.replace(cache_file)
+            except (OSError, TypeError) as e:
+                logger.warning(f"Failed to cache response: {e}")
+    
+    def invalidate(self, url_contains: Optional[str] = None) -> int:
+        """Drop entries whose URL contains the given text (all if None).
+        
+        Returns:
+            Number of entries dropped
+        """
+        if self.cache_dir:
+            # Pull persisted entries in so they can be matched by URL
+            for cache_file in self.cache_dir.glob("*.json"):
+                self.get(cache_file.stem)
+        
+        dropped = [
+            key for key, entry in self._entries.items()
+            if url_contains is None or url_contains in entry.url
+        ]
+        for key in dropped:
+            del self._entries[key]
+            if self.cache_dir:
+                (self.cache_dir / f"{key}.json").unlink(missing_ok=True)
+        
+        return len(dropped)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "revalidations": self.revalidations,
+            "misses": self.misses
+        }
+
 
 class ADORestClient:
     """High-performance Azure DevOps REST API client.
@@ -299,18 +811,38 @@ class ADORestClient:
         """
         self.config = config
         self.session: Optional[aiohttp.ClientSession] = None
-        self.rate_limiter = RateLimiter(
-            config.requests_per_minute,
-            config.rate_limit_buffer
-        )
+        if config.adaptive_rate_limiting:
+            # ADO throttles per identity and organization, so share one limiter
+            self.rate_limiter = AdaptiveRateLimiter.shared(
+                config.organization_url,
+                requests_per_minute=config.requests_per_minute,
+                buffer_factor=config.rate_limit_buffer,
+                initial_concurrency=config.max_concurrent_requests,
+                max_concurrency=config.adaptive_max_concurrency or config.max_concurrent_requests,
+                max_rate_factor=config.adaptive_max_rate_factor
+            )
+        else:
+            self.rate_limiter = RateLimiter(
+                config.requests_per_minute,
+                config.rate_limit_buffer
+            )
         
         # Performance tracking
         self._request_count = 0
         self._error_count = 0
         self._total_request_time = 0.0
         
-        # Semaphore for concurrent request limiting
-        self._semaphore = asyncio.Semaphore(config.max_concurrent_requests)
+        # Semaphore for concurrent request limiting (the adaptive limiter may
+        # raise concurrency up to its ceiling)
+        max_concurrent = config.max_concurrent_requests
+        if config.adaptive_rate_limiting and config.adaptive_max_concurrency:
+            max_concurrent = config.adaptive_max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        
+        # Cache for metadata that rarely changes
+        self.response_cache: Optional[ResponseCache] = None
+        if config.response_cache_ttl_seconds > 0:
+            self.response_cache = ResponseCache(config.response_cache_ttl_seconds, config.response_cache_dir)
         
         logger.info(f"ADORestClient initialized for {config.organization_url}")
     
@@ -356,13 +888,25 @@ class ADORestClient:
             self.session = None
             logger.debug("HTTP session closed")
     
+    @asynccontextmanager
+    async def _request_slot(self) -> AsyncIterator[None]:
+        """Hold a rate limiter slot and a client semaphore slot."""
+        await self.rate_limiter.acquire()
+        try:
+            async with self._semaphore:
+                yield
+        finally:
+            self.rate_limiter.release()
+    
     async def _make_request(
         self,
         method: str,
         url: str,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        response_headers: Optional[MutableMapping[str, str]] = None,
+        max_retries: Optional[int] = None
     ) -> Tuple[int, Dict[str, Any]]:
         """Make HTTP request with retry logic and error handling.
         
@@ -372,6 +916,9 @@ class ADORestClient:
             data: Request body data
             params: URL parameters
             headers: Additional headers
+            response_headers: Optional mapping filled with the response headers
+                (pass a CIMultiDict to look them up case-insensitively)
+            max_retries: Retries for transient errors (defaults to config.max_retries)
             
         Returns:
             Tuple of (status_code, response_data)
@@ -388,13 +935,12 @@ class ADORestClient:
         
         metrics = RequestMetrics()
         last_exception = None
+        if max_retries is None:
+            max_retries = self.config.max_retries
         
-        # Apply rate limiting
-        await self.rate_limiter.acquire()
-        
-        # Use semaphore to limit concurrent requests
-        async with self._semaphore:
-            for attempt in range(self.config.max_retries + 1):
+        # Apply rate limiting and limit concurrent requests
+        async with self._request_slot():
+            for attempt in range(max_retries + 1):
                 try:
                     if attempt > 0:
                         # Exponential backoff for retries
@@ -428,16 +974,19 @@ class ADORestClient:
                             response_data = {"raw_response": response_text}
                         
                         metrics.complete(response.status, len(response_text))
+                        self.rate_limiter.record_response(response.status, response.headers)
                         
                         # Log response if enabled
                         if self.config.log_requests:
                             logger.debug(f"Response {response.status}: {response_text[:500]}")
                         
                         # Handle different status codes
-                        if response.status == 200 or response.status == 201:
-                            # Success
+                        if response.status in (200, 201, 304):
+                            # Success (304: conditional request, cached copy still valid)
                             self._request_count += 1
                             self._total_request_time += metrics.duration_ms
+                            if response_headers is not None:
+                                response_headers.update(response.headers)
                             return response.status, response_data
                         
                         elif response.status == 401:
@@ -457,7 +1006,7 @@ class ADORestClient:
                         elif response.status == 429:
                             # Rate limit exceeded
                             retry_after = int(response.headers.get('Retry-After', 60))
-                            if attempt < self.config.max_retries:
+                            if attempt < max_retries:
                                 logger.warning(f"Rate limit exceeded, waiting {retry_after}s")
                                 await asyncio.sleep(retry_after)
                                 continue
@@ -471,7 +1020,7 @@ class ADORestClient:
                         
                         elif response.status >= 500:
                             # Server error - retry
-                            if attempt < self.config.max_retries:
+                            if attempt < max_retries:
                                 logger.warning(f"Server error {response.status}, retrying...")
                                 continue
                             else:
@@ -492,22 +1041,27 @@ class ADORestClient:
                 
                 except asyncio.TimeoutError as e:
                     last_exception = ADOTimeoutError(f"Request timeout after {self.config.timeout_seconds}s")
-                    if attempt >= self.config.max_retries:
+                    if attempt >= max_retries:
                         break
                 
                 except aiohttp.ClientError as e:
                     last_exception = ADOApiError(f"HTTP client error: {str(e)}")
-                    if attempt >= self.config.max_retries:
+                    if attempt >= max_retries:
                         break
                 
                 except (ADOAuthenticationError, ADOPermissionError) as e:
                     # Don't retry auth/permission errors
                     raise e
                 
+                except ADOApiError:
+                    # Client errors and exhausted retries raised above keep their status
+                    self._error_count += 1
+                    raise
+                
                 except Exception as e:
                     last_exception = ADOApiError(f"Unexpected error: {str(e)}")
                     logger.error(f"Unexpected error in request: {e}")
-                    if attempt >= self.config.max_retries:
+                    if attempt >= max_retries:
                         break
         
         # All retries exhausted
@@ -517,6 +1071,72 @@ class ADORestClient:
         else:
             raise ADOApiError("Request failed after all retries")
     
+    async def _cached_get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """GET a metadata resource through the response cache.
+        
+        Fresh entries are returned without a request. Stale entries with an
+        ETag are revalidated with If-None-Match, so an unchanged resource
+        costs a 304 instead of a full response.
+        
+        Args:
+            url: Request URL
+            params: URL parameters
+            
+        Returns:
+            Response data (a copy callers may modify)
+        """
+        if self.response_cache is None:
+            status_code, response_data = await self._make_request("GET", url, params=params)
+            return response_data
+        
+        cache = self.response_cache
+        key = cache.make_key("GET", url, params)
+        entry = cache.get(key)
+        
+        if entry is not None and cache.is_fresh(entry):
+            cache.hits += 1
+            return copy.deepcopy(entry.data)
+        
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        response_headers = CIMultiDict()
+        status_code, response_data = await self._make_request(
+            "GET", url, params=params, headers=headers, response_headers=response_headers
+        )
+        
+        if status_code == 304 and entry is not None:
+            cache.revalidations += 1
+            entry.stored_at = time.time()
+            cache.put(key, entry)
+            return copy.deepcopy(entry.data)
+        
+        cache.misses += 1
+        cache.put(key, CachedResponse(url=url, data=copy.deepcopy(response_data), etag=response_headers.get('ETag')))
+        return response_data
+    
+    def invalidate_cache(self, url_contains: Optional[str] = None) -> int:
+        """Drop cached metadata responses.
+        
+        Called automatically after field changes; call it after changing
+        projects or processes outside this client.
+        
+        Args:
+            url_contains: Only drop entries whose URL contains this text (all if None)
+            
+        Returns:
+            Number of entries dropped
+        """
+        if self.response_cache is None:
+            return 0
+        
+        dropped = self.response_cache.invalidate(url_contains)
+        logger.debug(f"Invalidated {dropped} cached responses")
+        return dropped
+    
+    def _invalidate_field_metadata(self) -> None:
+        """Drop cached responses that list fields (field lists and work item types)."""
+        self.invalidate_cache("/wit/")
+        self.invalidate_cache("/work/processes/")
+    
     # =============================================================================
     # PROJECT API METHODS
     # =============================================================================
@@ -533,8 +1153,7 @@ class ADORestClient:
         url = self.config.get_api_url(f"projects/{quote(project_name)}")
         
         try:
-            status_code, response_data = await self._make_request("GET", url)
-            return response_data
+            return await self._cached_get(url)
         except ADOApiError as e:
             if e.status_code == 404:
                 return None
@@ -565,7 +1184,7 @@ class ADORestClient:
             List of field definitions
         """
         url = self.config.get_api_url("wit/fields", project_name)
-        status_code, response_data = await self._make_request("GET", url)
+        response_data = await self._cached_get(url)
         
         return response_data.get('value', [])
     
@@ -606,6 +1225,9 @@ class ADORestClient:
         url = self.config.get_api_url("wit/fields", project_name)
         status_code, response_data = await self._make_request("POST", url, data=field_definition)
         
+        # Field lists and work item types now include the new field
+        self._invalidate_field_metadata()
+        
         return response_data
     
     async def update_work_item_field(
@@ -627,6 +1249,8 @@ class ADORestClient:
         url = self.config.get_api_url(f"wit/fields/{quote(field_name)}", project_name)
         status_code, response_data = await self._make_request("PATCH", url, data=field_updates)
         
+        self._invalidate_field_metadata()
+        
         return response_data
     
     async def delete_work_item_field(self, project_name: str, field_id: str) -> bool:
@@ -643,6 +1267,7 @@ class ADORestClient:
         
         try:
             status_code, response_data = await self._make_request("DELETE", url)
+            self._invalidate_field_metadata()
             return status_code in [200, 204]
         except ADOApiError:
             return False
@@ -661,7 +1286,7 @@ class ADORestClient:
             List of work item type definitions
         """
         url = self.config.get_api_url("wit/workitemtypes", project_name)
-        status_code, response_data = await self._make_request("GET", url)
+        response_data = await self._cached_get(url)
         
         return response_data.get('value', [])
     
@@ -736,7 +1361,7 @@ class ADORestClient:
                 process_id = project_info.get('capabilities', {}).get('processTemplate', {}).get('templateTypeId')
                 if process_id:
                     url = self.config.get_api_url(f"work/processes/{process_id}/workitemtypes")
-                    status_code, response_data = await self._make_request("GET", url)
+                    response_data = await self._cached_get(url)
                     return response_data.get('value', [])
         except ADOApiError:
             pass  # Fall back to regular work item types
@@ -790,6 +1415,9 @@ class ADORestClient:
     ) -> List[Dict[str, Any]]:
         """Get multiple work items by ID.
         
+        ID lists longer than the 200-item API limit are split into pages
+        that are fetched concurrently (see iter_work_items_pages).
+        
         Args:
             project_name: Name of the project
             work_item_ids: List of work item IDs
@@ -798,20 +1426,87 @@ class ADORestClient:
         Returns:
             List of work item data
         """
-        if not work_item_ids:
-            return []
+        work_items = []
+        async for page in self.iter_work_items_pages(project_name, work_item_ids, fields):
+            work_items.extend(page)
+        
+        return work_items
+    
+    async def iter_work_items_pages(
+        self,
+        project_name: str,
+        work_item_ids: List[int],
+        fields: Optional[List[str]] = None,
+        page_size: int = MAX_WORK_ITEMS_PER_BATCH,
+        max_in_flight: Optional[int] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Fetch work items page by page with several requests in flight.
         
-        params = {
-            'ids': ','.join(map(str, work_item_ids))
+        IDs are split into pages of at most 200 and requested through the
+        workitemsbatch endpoint. Up to max_in_flight page requests run at
+        once, each passing the rate limiter and request semaphore. Pages are
+        yielded in ID order as soon as they arrive, so callers can start on
+        the first page while later pages are still loading.
+        
+        Args:
+            project_name: Name of the project
+            work_item_ids: List of work item IDs
+            fields: Optional list of fields to include
+            page_size: Number of IDs per request (at most 200)
+            max_in_flight: Concurrent page requests (defaults to max_concurrent_requests)
+            
+        Yields:
+            Lists of work item data, one per page (IDs that no longer exist are omitted)
+        """
+        if not 1 <= page_size <= MAX_WORK_ITEMS_PER_BATCH:
+            raise ValueError(f"page_size must be between 1 and {MAX_WORK_ITEMS_PER_BATCH}")
+        
+        max_in_flight = max_in_flight or self.config.max_concurrent_requests
+        pages = [
+            work_item_ids[page_start:page_start + page_size]
+            for page_start in range(0, len(work_item_ids), page_size)
+        ]
+        
+        in_flight = deque()
+        next_page = 0
+        try:
+            while next_page < len(pages) or in_flight:
+                # Keep the pipeline full before waiting on the oldest page
+                while next_page < len(pages) and len(in_flight) < max_in_flight:
+                    in_flight.append(asyncio.ensure_future(
+                        self._fetch_work_items_page(project_name, pages[next_page], fields)
+                    ))
+                    next_page += 1
+                
+                yield await in_flight.popleft()
+        finally:
+            # Stop outstanding requests if the caller stops early or a page fails,
+            # and wait for them so their outcomes are retrieved
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+    
+    async def _fetch_work_items_page(
+        self,
+        project_name: str,
+        work_item_ids: List[int],
+        fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch one page of work items through the workitemsbatch endpoint."""
+        request_data = {
+            "ids": list(work_item_ids),
+            "errorPolicy": "omit"
         }
         
         if fields:
-            params['fields'] = ','.join(fields)
+            request_data["fields"] = fields
         
-        url = self.config.get_api_url("wit/workitems", project_name)
-        status_code, response_data = await self._make_request("GET", url, params=params)
+        url = self.config.get_api_url("wit/workitemsbatch", project_name)
+        status_code, response_data = await self._make_request("POST", url, data=request_data)
         
-        return response_data.get('value', [])
+        # Omitted (deleted or inaccessible) items come back as null entries
+        return [item for item in response_data.get('value', []) if item]
     
     async def update_work_item(
         self,
@@ -832,13 +1527,7 @@ class ADORestClient:
             Updated work item data
         """
         # Build JSON Patch operations
-        operations = []
-        for field_ref, value in field_updates.items():
-            operations.append({
-                "op": "add",
-                "path": f"/fields/{field_ref}",
-                "value": value
-            })
+        operations = self._build_patch_operations(field_updates)
         
         params = {}
         if bypass_rules:
@@ -901,7 +1590,8 @@ class ADORestClient:
         self,
         project_name: str,
         wiql_query: str,
-        max_results: Optional[int] = None
+        max_results: Optional[int] = None,
+        time_precision: bool = False
     ) -> Dict[str, Any]:
         """Execute WIQL query for work items.
         
@@ -909,6 +1599,7 @@ class ADORestClient:
             project_name: Name of the project
             wiql_query: WIQL query string
             max_results: Maximum number of results to return
+            time_precision: Compare date fields with time precision instead of whole days
             
         Returns:
             Query results including work item IDs
@@ -918,12 +1609,64 @@ class ADORestClient:
         params = {}
         if max_results:
             params['$top'] = max_results
+        if time_precision:
+            params['timePrecision'] = 'true'
         
         url = self.config.get_api_url("wit/wiql", project_name)
         status_code, response_data = await self._make_request("POST", url, data=query_data, params=params)
         
         return response_data
     
+    async def iter_reporting_revisions(
+        self,
+        project_name: str,
+        fields: Optional[List[str]] = None,
+        continuation_token: Optional[str] = None,
+        start_date_time: Optional[datetime] = None,
+        include_latest_only: bool = True,
+        include_deleted: bool = False
+    ) -> AsyncIterator[Tuple[List[Dict[str, Any]], Optional[str]]]:
+        """Stream work item revisions from the reporting revisions API.
+        
+        The API returns revisions in change order together with a
+        continuation token. Storing the token from the last batch and passing
+        it back later returns only the revisions made since then, which makes
+        it a cheap delta feed for local mirrors.
+        
+        Args:
+            project_name: Name of the project
+            fields: Fields to include in each revision
+            continuation_token: Token returned by a previous call
+            start_date_time: Start of the feed when no token is given
+            include_latest_only: Return only the latest revision of each item
+            include_deleted: Also return deleted work items (System.IsDeleted set)
+            
+        Yields:
+            Tuples of (revisions in the batch, continuation token after the batch)
+        """
+        url = self.config.get_api_url("wit/reporting/workitemrevisions", project_name)
+        
+        while True:
+            params = {}
+            if fields:
+                params['fields'] = ",".join(fields)
+            if include_latest_only:
+                params['includeLatestOnly'] = 'true'
+            if include_deleted:
+                params['includeDeleted'] = 'true'
+            if continuation_token:
+                params['continuationToken'] = continuation_token
+            elif start_date_time:
+                params['startDateTime'] = start_date_time.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+            
+            status_code, response_data = await self._make_request("GET", url, params=params)
+            
+            continuation_token = response_data.get('continuationToken', continuation_token)
+            yield response_data.get('values', []), continuation_token
+            
+            if response_data.get('isLastBatch', True):
+                break
+    
     # =============================================================================
     # BATCH OPERATIONS
     # =============================================================================
@@ -987,6 +1730,183 @@ class ADORestClient:
         
         return results
     
+    async def batch_update_work_items(
+        self,
+        project_name: str,
+        work_item_updates: Dict[int, Dict[str, Any]],
+        bypass_rules: bool = False,
+        chunk_size: int = MAX_WORK_ITEMS_PER_BATCH,
+        max_in_flight: Optional[int] = None,
+        retry_failed: bool = True,
+        chunk_retries: int = 2
+    ) -> Dict[int, Dict[str, Any]]:
+        """Update many work items through the $batch endpoint.
+        
+        Updates are packed into $batch requests of up to 200 JSON-Patch
+        sub-requests each. Up to max_in_flight batch requests run at once,
+        each passing the rate limiter and request semaphore, so one token
+        covers up to 200 work item updates. A batch request that fails as a
+        whole with a transient error (throttling, timeout, server error) is
+        sent again after an exponential backoff (the only retry layer for
+        batch requests, so a chunk is sent at most chunk_retries + 1 times).
+        Sub-requests that fail inside
+        an otherwise successful batch, and items of batch requests that still
+        fail, are retried one at a time through update_work_item with at most
+        max_in_flight individual requests running at once.
+        
+        Args:
+            project_name: Name of the project (used for individual retries)
+            work_item_updates: Dictionary mapping work item IDs to field updates
+            bypass_rules: Whether to bypass work item rules
+            chunk_size: Number of work items per $batch request (at most 200)
+            max_in_flight: Concurrent batch requests (defaults to max_concurrent_requests)
+            retry_failed: Whether to retry failed items individually
+            chunk_retries: Extra attempts for a batch request that fails transiently
+            
+        Returns:
+            Dictionary mapping work item IDs to updated work item data, or to
+            {"error": message} for items that could not be updated
+        """
+        if not 1 <= chunk_size <= MAX_WORK_ITEMS_PER_BATCH:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_WORK_ITEMS_PER_BATCH}")
+        
+        work_item_ids = list(work_item_updates.keys())
+        chunks = [
+            work_item_ids[chunk_start:chunk_start + chunk_size]
+            for chunk_start in range(0, len(work_item_ids), chunk_size)
+        ]
+        
+        in_flight = asyncio.Semaphore(max_in_flight or self.config.max_concurrent_requests)
+        
+        async def send_chunk(chunk_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+            chunk_updates = {work_item_id: work_item_updates[work_item_id] for work_item_id in chunk_ids}
+            for attempt in range(chunk_retries + 1):
+                try:
+                    async with in_flight:
+                        return await self._send_batch_chunk(chunk_updates, bypass_rules)
+                except ADOApiError as e:
+                    if attempt >= chunk_retries or not self._is_transient_error(e):
+                        raise
+                    
+                    # Back off without holding a request slot
+                    delay = self.config.retry_delay_seconds * (2 ** attempt)
+                    if isinstance(e, ADORateLimitError) and e.retry_after:
+                        delay = max(delay, e.retry_after)
+                    logger.warning(
+                        f"$batch request for {len(chunk_ids)} work items failed ({e}), "
+                        f"retrying in {delay:.1f}s"
+                    )
+                    await asyncio.sleep(delay)
+        
+        async def update_single(work_item_id: int) -> Dict[str, Any]:
+            async with in_flight:
+                return await self.update_work_item(
+                    project_name, work_item_id, work_item_updates[work_item_id], bypass_rules
+                )
+        
+        chunk_results = await asyncio.gather(
+            *[send_chunk(chunk_ids) for chunk_ids in chunks],
+            return_exceptions=True
+        )
+        
+        results = {}
+        for chunk_ids, chunk_result in zip(chunks, chunk_results):
+            if isinstance(chunk_result, Exception):
+                logger.error(f"$batch request for {len(chunk_ids)} work items failed: {chunk_result}")
+                for work_item_id in chunk_ids:
+                    results[work_item_id] = {"error": str(chunk_result)}
+            else:
+                results.update(chunk_result)
+        
+        failed_ids = [work_item_id for work_item_id in work_item_ids if "error" in results[work_item_id]]
+        if failed_ids and retry_failed:
+            logger.info(f"Retrying {len(failed_ids)} failed work item updates individually")
+            retry_results = await asyncio.gather(
+                *[update_single(work_item_id) for work_item_id in failed_ids],
+                return_exceptions=True
+            )
+            
+            for work_item_id, result in zip(failed_ids, retry_results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error updating work item {work_item_id}: {result}")
+                    results[work_item_id] = {"error": str(result)}
+                else:
+                    results[work_item_id] = result
+        
+        return results
+    
+    @staticmethod
+    def _is_transient_error(error: ADOApiError) -> bool:
+        """Check whether a failed request may succeed when sent again."""
+        if isinstance(error, (ADOAuthenticationError, ADOPermissionError)):
+            return False
+        if isinstance(error, (ADORateLimitError, ADOTimeoutError)):
+            return True
+        # Server errors, and client errors without a status (connection failures)
+        return error.status_code is None or error.status_code >= 500
+    
+    async def _send_batch_chunk(
+        self,
+        work_item_updates: Dict[int, Dict[str, Any]],
+        bypass_rules: bool = False
+    ) -> Dict[int, Dict[str, Any]]:
+        """Send one $batch request and split the response per work item."""
+        query = f"api-version={self.config.api_version}"
+        if bypass_rules:
+            query += "&bypassRules=true"
+        
+        sub_requests = [
+            {
+                "method": "PATCH",
+                "uri": f"/_apis/wit/workitems/{work_item_id}?{query}",
+                "headers": {"Content-Type": "application/json-patch+json"},
+                "body": self._build_patch_operations(field_updates)
+            }
+            for work_item_id, field_updates in work_item_updates.items()
+        ]
+        
+        url = self.config.get_api_url("wit/$batch")
+        # No request-level retries: batch_update_work_items retries the chunk
+        status_code, response_data = await self._make_request("POST", url, data=sub_requests, max_retries=0)
+        
+        # Sub-responses come back in request order with a JSON-encoded body
+        sub_responses = response_data.get('value', [])
+        results = {}
+        for index, work_item_id in enumerate(work_item_updates):
+            if index >= len(sub_responses):
+                results[work_item_id] = {"error": "Missing response in $batch result"}
+                continue
+            
+            sub_response = sub_responses[index]
+            body = sub_response.get('body')
+            if isinstance(body, str):
+                try:
+                    body = json.loads(body) if body else {}
+                except json.JSONDecodeError:
+                    body = {"raw_response": body}
+            body = body or {}
+            
+            code = sub_response.get('code', 0)
+            if 200 <= code < 300:
+                results[work_item_id] = body
+            else:
+                error_message = body.get('message', f"HTTP {code}")
+                results[work_item_id] = {"error": f"API error: {error_message}", "status_code": code}
+        
+        return results
+    
+    @staticmethod
+    def _build_patch_operations(field_updates: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build JSON Patch "add" operations for field updates."""
+        return [
+            {
+                "op": "add",
+                "path": f"/fields/{field_ref}",
+                "value": value.isoformat() if isinstance(value, datetime) else value
+            }
+            for field_ref, value in field_updates.items()
+        ]
+    
     # =============================================================================
     # PERFORMANCE AND MONITORING
     # =============================================================================
@@ -1010,7 +1930,9 @@ class ADORestClient:
             "average_request_time_ms": avg_request_time,
             "total_request_time_ms": self._total_request_time,
             "current_tokens": self.rate_limiter.tokens,
-            "max_tokens": self.rate_limiter.max_tokens
+            "max_tokens": self.rate_limiter.max_tokens,
+            "rate_limiter": self.rate_limiter.get_metrics(),
+            "response_cache": self.response_cache.get_stats() if self.response_cache else None
         }
     
     def reset_performance_stats(self) -> None:
@@ -431,6 +431,9 @@ class TestCustomFieldsManager:
         mock_client.create_work_item_field = AsyncMock(return_value={"id": "field-123", "referenceName": "Custom.QVFScore"})
         mock_client.add_field_to_work_item_type = AsyncMock(return_value=True)
         mock_client.update_work_item = AsyncMock(return_value={"id": 123, "rev": 2})
+        mock_client.batch_update_work_items = AsyncMock(
+            side_effect=lambda project, updates, **kwargs: {wid: {"id": wid, "rev": 2} for wid in updates}
+        )
         return mock_client
     
     @pytest.fixture
@@ -633,13 +636,6 @@ class TestCustomFieldsManager:
     
     async def test_update_work_item_scores(self, fields_manager, mock_rest_client):
         """Test updating work item scores."""
-        # Mock work item updates
-        mock_rest_client.update_work_item.return_value = {
-            "id": 123,
-            "rev": 2,
-            "fields": {"Custom.QVFScore": 0.85}
-        }
-        
         # Test data
         work_item_scores = {
             123: {"QVF.Score": 0.85, "QVF.BusinessValue": 0.90},
@@ -655,20 +651,42 @@ class TestCustomFieldsManager:
         assert 123 in results
         assert 124 in results
         
-        # Check that update calls were made
-        assert mock_rest_client.update_work_item.call_count == 2
+        assert all(result.is_successful for result in results.values())
+        
+        # Both items go out in a single $batch write
+        assert mock_rest_client.batch_update_work_items.call_count == 1
         
         # Verify call arguments
-        call_args_list = mock_rest_client.update_work_item.call_args_list
+        call_args = mock_rest_client.batch_update_work_items.call_args[0]
+        assert call_args[0] == "TestProject"
+        assert set(call_args[1]) == {123, 124}
+        
+        first_item_updates = call_args[1][123]
+        assert "Custom.QVFScore" in first_item_updates
+        assert first_item_updates["Custom.QVFScore"] == 0.85
+        
+    async def test_update_work_item_scores_reference_names(self, fields_manager, mock_rest_client):
+        """Test updates keyed by ADO reference names and partial $batch failures."""
+        mock_rest_client.batch_update_work_items.side_effect = None
+        mock_rest_client.batch_update_work_items.return_value = {
+            123: {"id": 123, "rev": 2},
+            124: {"error": "API error: Conflict", "status_code": 409}
+        }
+        
+        work_item_scores = {
+            123: {"Custom.QVFScore": 0.85, "Custom.QVFConfidence": 0.9},
+            124: {"Custom.QVFScore": 0.75}
+        }
+        
+        results = await fields_manager.update_work_item_scores("TestProject", work_item_scores)
         
-        # Check first call (work item 123)
-        first_call_args = call_args_list[0][0]
-        assert first_call_args[0] == "TestProject"
-        assert first_call_args[1] == 123
+        assert results[123].is_successful
+        assert results[124].success == False
+        assert "Conflict" in results[124].errors[0]
         
-        first_call_updates = first_call_args[2]
-        assert "Custom.QVFScore" in first_call_updates
-        assert first_call_updates["Custom.QVFScore"] == 0.85
+        sent_updates = mock_rest_client.batch_update_work_items.call_args[0][1]
+        assert sent_updates[123]["Custom.QVFConfidence"] == 0.9
+        assert "Custom.QVFLastCalculated" in sent_updates[124]
     
     async def test_batch_processing_performance(self, fields_manager, mock_rest_client):
         """Test batch processing with large datasets."""
@@ -677,9 +695,6 @@ class TestCustomFieldsManager:
         for i in range(250):  # 250 work items
             work_item_scores[i] = {"QVF.Score": 0.5 + (i % 100) / 200}
         
-        # Mock successful updates
-        mock_rest_client.update_work_item.return_value = {"id": 1, "rev": 2}
-        
         start_time = datetime.now()
         
         results = await fields_manager.update_work_item_scores(
@@ -695,9 +710,11 @@ class TestCustomFieldsManager:
         assert all(result.is_successful for result in results.values())
         assert processing_time < 30  # Should complete within 30 seconds
         
-        # Verify batch processing (should be 5 batches of 50)
-        # Each batch should have slight delays, so total calls should be 250
-        assert mock_rest_client.update_work_item.call_count == 250
+        # Verify batch processing (one $batch write split into requests of 50)
+        assert mock_rest_client.batch_update_work_items.call_count == 1
+        call = mock_rest_client.batch_update_work_items.call_args
+        assert len(call[0][1]) == 250
+        assert call[1]["chunk_size"] == 50
     
     def test_get_operation_statistics(self, fields_manager):
         """Test operation statistics tracking."""
@@ -735,6 +752,7 @@ class TestErrorHandling:
         mock_client.get_project = AsyncMock(side_effect=ADOAuthenticationError("Invalid token", status_code=401))
         mock_client.create_work_item_field = AsyncMock(side_effect=ADOPermissionError("Insufficient permissions", status_code=403))
         mock_client.update_work_item = AsyncMock(side_effect=ADORateLimitError("Rate limit exceeded", status_code=429))
+        mock_client.batch_update_work_items = AsyncMock(side_effect=ADORateLimitError("Rate limit exceeded", status_code=429))
         
         return mock_client
     
@@ -829,6 +847,7 @@ class TestErrorHandling:
         """Test handling of network timeouts."""
         mock_rest_client = Mock()
         mock_rest_client.update_work_item = AsyncMock(side_effect=asyncio.TimeoutError())
+        mock_rest_client.batch_update_work_items = AsyncMock(side_effect=asyncio.TimeoutError())
         
         with patch('src.datascience_platform.qvf.ado.custom_fields.ADORestClient') as mock_client_class:
             mock_client_class.return_value = mock_rest_client
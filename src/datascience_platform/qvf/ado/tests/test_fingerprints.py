@@ -0,0 +1,96 @@
+"""Tests for QVF field fingerprints used to suppress unchanged writes.
+
+Test Coverage:
+- Unchanged, partially changed and new items
+- Rounding and tolerance for float noise
+- Revision tracking and seeding from loaded work items
+- JSON persistence
+"""
+
+import pytest
+from datetime import datetime, timezone
+
+from datascience_platform.qvf.ado.fingerprints import FieldFingerprintStore
+
+
+def field_updates(score=0.85, confidence=0.9):
+    return {
+        "Custom.QVFScore": score,
+        "Custom.QVFConfidence": confidence,
+        "Custom.QVFConfigurationId": "qvf_v1",
+        "Custom.QVFLastCalculated": datetime.now(timezone.utc)
+    }
+
+
+class TestFieldFingerprintStore:
+    """Test change detection in FieldFingerprintStore."""
+    
+    def test_unknown_item_writes_everything(self):
+        """Test items without a fingerprint send all fields."""
+        store = FieldFingerprintStore()
+        updates = field_updates()
+        
+        assert store.changed_fields(1, updates) == updates
+    
+    def test_unchanged_and_changed_fields(self):
+        """Test only changed fields (plus the timestamp) are selected."""
+        store = FieldFingerprintStore()
+        store.record(1, field_updates(), rev=5)
+        
+        # Float noise below the field precision is not a change
+        assert store.changed_fields(1, field_updates(score=0.85000001)) == {}
+        
+        changed = store.changed_fields(1, field_updates(score=0.7))
+        assert set(changed) == {"Custom.QVFScore", "Custom.QVFLastCalculated"}
+        assert changed["Custom.QVFScore"] == 0.7
+    
+    def test_tolerance(self):
+        """Test differences within the tolerance are ignored."""
+        store = FieldFingerprintStore(tolerance=0.01)
+        store.record(1, field_updates())
+        
+        assert store.changed_fields(1, field_updates(score=0.855)) == {}
+        assert "Custom.QVFScore" in store.changed_fields(1, field_updates(score=0.87))
+        
+        with pytest.raises(ValueError):
+            FieldFingerprintStore(tolerance=-1)
+    
+    def test_observe_revisions(self):
+        """Test external edits re-seed or drop fingerprints."""
+        store = FieldFingerprintStore()
+        store.record(1, field_updates(), rev=5)
+        store.record(2, field_updates(), rev=3)
+        
+        # Same revision: our last write is still current
+        store.observe(1, 5, {"Custom.QVFScore": 0.1})
+        assert store.changed_fields(1, field_updates()) == {}
+        
+        # Older revision (e.g. a stale mirror): our write is newer
+        store.observe(1, 4, {"Custom.QVFScore": 0.1})
+        assert store.changed_fields(1, field_updates()) == {}
+        
+        # Edited elsewhere: loaded values become the new baseline
+        store.observe(1, 6, {"Custom.QVFScore": 0.85, "Custom.QVFConfidence": 0.5, "Custom.QVFConfigurationId": "qvf_v1"})
+        assert set(store.changed_fields(1, field_updates())) == {"Custom.QVFConfidence", "Custom.QVFLastCalculated"}
+        
+        # Edited elsewhere without loaded values: forget the item
+        store.observe(2, 4)
+        assert 2 not in store
+        
+        # Cold store: seed from loaded values
+        store.observe(3, 1, {"Custom.QVFScore": 0.85, "Custom.QVFConfidence": 0.9, "Custom.QVFConfigurationId": "qvf_v1"})
+        assert store.changed_fields(3, field_updates()) == {}
+    
+    def test_save_and_load(self, tmp_path):
+        """Test the store round-trips through JSON."""
+        store = FieldFingerprintStore()
+        store.record(1, field_updates(), rev=5)
+        
+        path = tmp_path / "fingerprints.json"
+        store.save(path)
+        restored = FieldFingerprintStore.load(path)
+        
+        assert restored.get(1) == store.get(1)
+        assert restored.changed_fields(1, field_updates()) == {}
+        assert len(FieldFingerprintStore.load(tmp_path / "missing.json")) == 0
+        assert len(FieldFingerprintStore.load(path, precision=2)) == 0
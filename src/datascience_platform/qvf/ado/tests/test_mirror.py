@@ -0,0 +1,141 @@
+"""Tests for the local ADO work item mirror.
+
+Test Coverage:
+- Upserts with revision guarding
+- Indexed filters (state, type, area/iteration UNDER, changed date)
+- Paging and counts
+- Sync state persistence
+- DataFrame export for ADOAnalyzer
+"""
+
+import pytest
+from datetime import datetime, timezone
+
+from datascience_platform.qvf.ado.mirror import WorkItemMirror, MirrorSyncState, parse_ado_datetime
+
+
+def payload(work_item_id, state="Active", area_path="Project\\Team A", rev=1, **fields):
+    return {
+        "id": work_item_id,
+        "rev": rev,
+        "fields": {
+            "System.Id": work_item_id,
+            "System.Title": f"Item {work_item_id}",
+            "System.WorkItemType": "User Story",
+            "System.State": state,
+            "System.AreaPath": area_path,
+            "System.IterationPath": "Project\\Sprint 1",
+            "System.ChangedDate": f"2024-01-0{work_item_id}T10:00:00Z",
+            **fields
+        }
+    }
+
+
+@pytest.fixture
+def mirror():
+    mirror = WorkItemMirror(":memory:")
+    mirror.upsert_work_items("Project", [
+        payload(1),
+        payload(2, state="Closed"),
+        payload(3, area_path="Project\\Team A\\Backend"),
+        payload(4, area_path="Project\\Team AB"),
+        payload(5, **{"System.AssignedTo": {"displayName": "Dev", "uniqueName": "dev@example.com"}})
+    ])
+    return mirror
+
+
+class TestWorkItemMirror:
+    """Test WorkItemMirror storage and queries."""
+    
+    def test_filters(self, mirror):
+        """Test state, area path (UNDER), assignee and changed date filters."""
+        def ids(**filters):
+            return [item["id"] for item in mirror.query("Project", **filters)]
+        
+        assert ids() == [1, 2, 3, 4, 5]
+        assert ids(states=["Closed"]) == [2]
+        assert ids(exclude_states=["Closed"]) == [1, 3, 4, 5]
+        assert ids(area_path="Project\\Team A") == [1, 2, 3, 5]
+        assert ids(assigned_to="dev@example.com") == [5]
+        assert ids(changed_since=datetime(2024, 1, 3, 10, tzinfo=timezone.utc)) == [4, 5]
+        assert ids(limit=2, offset=1) == [2, 3]
+        assert mirror.count("Project", states=["Active"]) == 4
+        assert mirror.query("Other") == []
+    
+    def test_older_revisions_do_not_overwrite(self, mirror):
+        """Test upserts keep the newest revision of an item."""
+        mirror.upsert_work_items("Project", [payload(1, state="Resolved", rev=3)])
+        mirror.upsert_work_items("Project", [payload(1, state="New", rev=2)])
+        
+        item = mirror.get_work_item(1)
+        assert item["rev"] == 3
+        assert item["fields"]["System.State"] == "Resolved"
+        
+        assert mirror.remove_work_items([1]) == 1
+        assert mirror.get_work_item(1) is None
+    
+    def test_variable_length_fractions_are_normalized(self, mirror):
+        """Test ADO dates with trimmed fractional seconds sort and filter correctly."""
+        mirror.upsert_work_items("Project", [
+            payload(6, **{"System.ChangedDate": "2024-01-06T10:00:47.42Z"}),
+            payload(7, **{"System.ChangedDate": "2024-01-06T10:00:47.5+00:00"}),
+            payload(8, **{"System.ChangedDate": "not a date"})
+        ])
+        
+        assert parse_ado_datetime("2024-01-06T10:00:47.4212345Z") == datetime(
+            2024, 1, 6, 10, 0, 47, 421234, tzinfo=timezone.utc
+        )
+        stored = dict(mirror._conn.execute("SELECT id, changed_date FROM work_items WHERE id >= 6").fetchall())
+        assert stored == {6: "2024-01-06T10:00:47.420000Z", 7: "2024-01-06T10:00:47.500000Z", 8: None}
+        
+        since = datetime(2024, 1, 6, 10, 0, 47, 450000, tzinfo=timezone.utc)
+        assert [item["id"] for item in mirror.query("Project", changed_since=since)] == [7]
+    
+    def test_merge_fields(self, mirror):
+        """Test written fields and revisions are merged into mirrored items."""
+        merged = mirror.merge_fields("Project", {
+            1: ({"Custom.QVFScore": 0.75}, 2),
+            3: ({"Custom.QVFScore": 0.5}, None),
+            99: ({"Custom.QVFScore": 0.1}, 1)
+        })
+        
+        assert merged == 2
+        item = mirror.get_work_item(1)
+        assert item["rev"] == 2
+        assert item["fields"]["Custom.QVFScore"] == 0.75
+        assert item["fields"]["System.State"] == "Active"
+        assert mirror.get_work_item(3)["rev"] == 1
+        assert mirror.get_work_item(99) is None
+    
+    def test_sync_state_round_trip(self, tmp_path):
+        """Test sync state persists in the database file."""
+        path = tmp_path / "mirror.db"
+        state = MirrorSyncState(
+            watermark=datetime(2024, 1, 2, 10, tzinfo=timezone.utc),
+            continuation_token="token",
+            last_synced=datetime(2024, 1, 2, 11, tzinfo=timezone.utc)
+        )
+        
+        mirror = WorkItemMirror(path)
+        mirror.upsert_work_items("Project", [payload(1)])
+        mirror.set_sync_state("Project", state)
+        mirror.close()
+        
+        restored = WorkItemMirror(path)
+        assert len(restored) == 1
+        assert restored.get_sync_state("Project") == state
+        assert restored.get_sync_state("Other") == MirrorSyncState()
+        
+        restored.clear("Project")
+        assert len(restored) == 0
+        assert restored.get_sync_state("Project") == MirrorSyncState()
+    
+    def test_to_dataframe(self, mirror):
+        """Test export uses ADO column names the analyzer understands."""
+        mirror.upsert_work_items("Project", [payload(6, **{"System.Tags": "api; backend"})])
+        
+        df = mirror.to_dataframe("Project", states=["Active"])
+        
+        assert list(df['ID']) == [1, 3, 4, 5, 6]
+        assert df.loc[df['ID'] == 5, 'Assigned To'].item() == "dev@example.com"
+        assert df.loc[df['ID'] == 6, 'Tags'].item() == "api;backend"
@@ -14,6 +14,8 @@ Tests use mocked responses to avoid dependencies on live ADO instances.
 import pytest
 import asyncio
 import json
+import threading
+import time
 from datetime import datetime, timezone
 from unittest.mock import Mock, AsyncMock, patch
 from typing import Dict, Any, List
@@ -31,10 +33,20 @@ from datascience_platform.qvf.ado.rest_client import (
     ADORateLimitError,
     ADOTimeoutError,
     RateLimiter,
-    RequestMetrics
+    AdaptiveRateLimiter,
+    RequestMetrics,
+    ResponseCache
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_rate_limiters():
+    """Give every test fresh per-organization rate limiters."""
+    AdaptiveRateLimiter.reset_shared()
+    yield
+    AdaptiveRateLimiter.reset_shared()
+
+
 class TestADOClientConfig:
     """Test ADO client configuration validation and setup."""
     
@@ -168,6 +180,217 @@ class TestRateLimiter:
         assert limiter.max_tokens == 80
 
 
+class TestAdaptiveRateLimiter:
+    """Test header-driven rate and concurrency adaptation."""
+    
+    def test_backs_off_before_throttling(self):
+        """Test low remaining budget and delays shrink rate and concurrency."""
+        limiter = AdaptiveRateLimiter(requests_per_minute=120, buffer_factor=1.0, max_concurrency=8)
+        
+        limiter.record_response(200, {'X-RateLimit-Remaining': '10', 'X-RateLimit-Limit': '200'})
+        
+        assert limiter.rate_factor == 0.5
+        assert limiter.refill_rate == pytest.approx(1.0)
+        assert limiter.get_metrics()["concurrency_limit"] == 4
+        
+        # Further back-offs inside the cooldown are ignored
+        limiter.record_response(200, {'X-RateLimit-Delay': '0.5'})
+        assert limiter.rate_factor == 0.5
+        
+        metrics = limiter.get_metrics()
+        assert metrics["backoffs"] == 1
+        assert metrics["delayed_responses"] == 1
+        assert metrics["rate_limit_remaining"] == 10
+    
+    def test_increases_with_headroom(self):
+        """Test unthrottled responses raise rate and concurrency up to their caps."""
+        limiter = AdaptiveRateLimiter(requests_per_minute=120, buffer_factor=1.0, max_concurrency=8)
+        limiter.record_response(429, {'Retry-After': '0'})
+        assert limiter.rate_factor == 0.5
+        
+        for _ in range(200):
+            limiter.record_response(200, {})
+        limiter.record_response(200, {'X-RateLimit-Remaining': '150', 'X-RateLimit-Limit': '200'})
+        
+        # Recovery stops at the configured requests_per_minute
+        assert limiter.rate_factor == 1.0
+        assert limiter.get_metrics()["requests_per_minute"] == pytest.approx(120)
+        assert limiter.get_metrics()["concurrency_limit"] == 8
+    
+    def test_uses_spare_budget_up_to_ceiling(self):
+        """Test reported headroom raises rate and concurrency above the starting point."""
+        limiter = AdaptiveRateLimiter(
+            requests_per_minute=120, buffer_factor=1.0,
+            initial_concurrency=4, max_concurrency=8, max_rate_factor=1.5
+        )
+        assert limiter.get_metrics()["concurrency_limit"] == 4
+        
+        for _ in range(200):
+            limiter.record_response(200, {'X-RateLimit-Remaining': '60', 'X-RateLimit-Limit': '200'})
+        
+        assert limiter.rate_factor == pytest.approx(1.5)
+        assert limiter.get_metrics()["requests_per_minute"] == pytest.approx(180)
+        assert limiter.get_metrics()["concurrency_limit"] == 8
+        
+        # Dropping below the headroom threshold backs off again
+        limiter.record_response(200, {'X-RateLimit-Remaining': '20', 'X-RateLimit-Limit': '200'})
+        assert limiter.rate_factor == pytest.approx(0.75)
+        assert limiter.get_metrics()["concurrency_limit"] == 4
+    
+    def test_reset_shared(self):
+        """Test reset_shared discards state carried by shared limiters."""
+        limiter = AdaptiveRateLimiter.shared("https://dev.azure.com/resetorg", requests_per_minute=120)
+        limiter.record_response(429, {'Retry-After': '30'})
+        
+        AdaptiveRateLimiter.reset_shared()
+        fresh = AdaptiveRateLimiter.shared("https://dev.azure.com/resetorg", requests_per_minute=120)
+        
+        assert fresh is not limiter
+        assert fresh.rate_factor == 1.0
+        assert fresh.get_metrics()["paused_seconds"] == 0.0
+    
+    @pytest.mark.asyncio
+    async def test_throttled_response_pauses_requests(self):
+        """Test a 429 with Retry-After holds back the next acquire."""
+        limiter = AdaptiveRateLimiter(requests_per_minute=120)
+        limiter.record_response(429, {'Retry-After': '0.2'})
+        
+        start = time.monotonic()
+        await limiter.acquire()
+        limiter.release()
+        
+        assert time.monotonic() - start >= 0.15
+        assert limiter.get_metrics()["throttled_responses"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """Test no more than concurrency_limit requests hold a slot."""
+        limiter = AdaptiveRateLimiter(requests_per_minute=600, max_concurrency=2)
+        in_flight = 0
+        max_seen = 0
+        
+        async def request():
+            nonlocal in_flight, max_seen
+            await limiter.acquire()
+            try:
+                in_flight += 1
+                max_seen = max(max_seen, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+            finally:
+                limiter.release()
+        
+        await asyncio.gather(*[request() for _ in range(6)])
+        
+        assert max_seen == 2
+        assert limiter.get_metrics()["in_flight"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_release_from_another_thread_wakes_waiter(self):
+        """Test a slot released on another thread's loop is handed to a waiter on this loop."""
+        limiter = AdaptiveRateLimiter(requests_per_minute=600, max_concurrency=1)
+        
+        def hold_and_release():
+            async def hold():
+                await limiter.acquire()
+                acquired.set()
+                await asyncio.sleep(0.05)
+                limiter.release()
+            asyncio.run(hold())
+        
+        acquired = threading.Event()
+        other = threading.Thread(target=hold_and_release)
+        other.start()
+        assert await asyncio.get_running_loop().run_in_executor(None, acquired.wait, 5)
+        
+        start = time.monotonic()
+        await asyncio.wait_for(limiter.acquire(), timeout=5)
+        other.join()
+        
+        # Woken by the release rather than by the next unrelated loop event
+        assert time.monotonic() - start < 1.0
+        assert limiter.get_metrics()["in_flight"] == 1
+        limiter.release()
+    
+    @pytest.mark.asyncio
+    async def test_waiter_cancelled_after_grant_hands_slot_on(self):
+        """Test a slot granted to a waiter cancelled before waking is released again."""
+        limiter = AdaptiveRateLimiter(requests_per_minute=600, max_concurrency=1)
+        await limiter.acquire()
+        
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        limiter.release()
+        waiting.cancel()
+        
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        await asyncio.sleep(0)
+        
+        assert limiter.get_metrics()["in_flight"] == 0
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+        limiter.release()
+    
+    def test_shared_per_organization(self):
+        """Test clients of one organization share a limiter."""
+        first = ADORestClient(ADOClientConfig(
+            organization_url="https://dev.azure.com/sharedorg", personal_access_token="pat"
+        ))
+        second = ADORestClient(ADOClientConfig(
+            organization_url="https://dev.azure.com/sharedorg/", personal_access_token="pat"
+        ))
+        fixed = ADORestClient(ADOClientConfig(
+            organization_url="https://dev.azure.com/sharedorg",
+            personal_access_token="pat",
+            adaptive_rate_limiting=False
+        ))
+        
+        assert first.rate_limiter is second.rate_limiter
+        assert not isinstance(fixed.rate_limiter, AdaptiveRateLimiter)
+        assert "https://dev.azure.com/sharedorg" in AdaptiveRateLimiter.get_shared_metrics()
+        assert "concurrency_limit" in first.get_performance_stats()["rate_limiter"]
+    
+    def test_shared_limiter_uses_most_conservative_settings(self):
+        """Test a later client with lower limits tightens the shared limiter."""
+        first = ADORestClient(ADOClientConfig(
+            organization_url="https://dev.azure.com/mergedorg", personal_access_token="pat",
+            requests_per_minute=600, max_concurrent_requests=10
+        ))
+        second = ADORestClient(ADOClientConfig(
+            organization_url="https://dev.azure.com/mergedorg", personal_access_token="pat",
+            requests_per_minute=120, max_concurrent_requests=4
+        ))
+        third = ADORestClient(ADOClientConfig(
+            organization_url="https://dev.azure.com/mergedorg", personal_access_token="pat",
+            requests_per_minute=1000, max_concurrent_requests=20
+        ))
+        
+        assert first.rate_limiter is second.rate_limiter is third.rate_limiter
+        metrics = first.rate_limiter.get_metrics()
+        assert metrics["requests_per_minute"] == pytest.approx(120 * 0.9)
+        assert metrics["max_tokens"] == 108
+        assert metrics["concurrency_limit"] == 4
+    
+    def test_config_ceiling_opts_into_spare_budget(self):
+        """Test the adaptive ceilings in the config reach the limiter and semaphore."""
+        client = ADORestClient(ADOClientConfig(
+            organization_url="https://dev.azure.com/ceilingorg", personal_access_token="pat",
+            max_concurrent_requests=5, adaptive_max_concurrency=12, adaptive_max_rate_factor=2.0
+        ))
+        
+        metrics = client.rate_limiter.get_metrics()
+        assert metrics["concurrency_limit"] == 5
+        assert metrics["max_concurrency"] == 12
+        assert metrics["max_rate_factor"] == 2.0
+        assert client._semaphore._value == 12
+        
+        with pytest.raises(ValidationError):
+            ADOClientConfig(
+                organization_url="https://dev.azure.com/ceilingorg", personal_access_token="pat",
+                max_concurrent_requests=10, adaptive_max_concurrency=5
+            )
+
+
 class TestRequestMetrics:
     """Test request performance metrics tracking."""
     
@@ -552,6 +775,92 @@ class TestADORestClient:
             assert work_items[0]["id"] == 123
             assert work_items[1]["id"] == 124
     
+    @pytest.mark.asyncio
+    async def test_iter_work_items_pages(self, rest_client):
+        """Test paged work item retrieval splits IDs and limits requests in flight."""
+        in_flight = 0
+        max_seen = 0
+        
+        async def fake_request(method, url, data=None, params=None, headers=None):
+            nonlocal in_flight, max_seen
+            in_flight += 1
+            max_seen = max(max_seen, in_flight)
+            await asyncio.sleep(0.01 if data["ids"][0] == 1 else 0)
+            in_flight -= 1
+            
+            # ID 7 no longer exists and comes back as null
+            items = [None if wid == 7 else {"id": wid} for wid in data["ids"]]
+            return 200, {"value": items}
+        
+        work_item_ids = list(range(1, 451))
+        with patch.object(rest_client, '_make_request', side_effect=fake_request) as mock_request:
+            pages = [
+                page async for page in rest_client.iter_work_items_pages(
+                    "TestProject", work_item_ids, fields=["System.Title"], max_in_flight=2
+                )
+            ]
+        
+        assert [len(page) for page in pages] == [199, 200, 50]
+        assert [item["id"] for page in pages for item in page] == [wid for wid in work_item_ids if wid != 7]
+        assert max_seen == 2
+        
+        method, url = mock_request.call_args_list[0][0][:2]
+        assert method == "POST"
+        assert "wit/workitemsbatch" in url
+        assert mock_request.call_args_list[0][1]["data"]["fields"] == ["System.Title"]
+        
+        with pytest.raises(ValueError):
+            await rest_client.iter_work_items_pages("TestProject", work_item_ids, page_size=201).__anext__()
+    
+    @pytest.mark.asyncio
+    async def test_iter_work_items_pages_stops_prefetches(self, rest_client):
+        """Test prefetched pages are cancelled and awaited when the caller stops early."""
+        cancelled = []
+        
+        async def fake_request(method, url, data=None, params=None, headers=None):
+            if data["ids"][0] != 1:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(data["ids"][0])
+                    raise
+            return 200, {"value": [{"id": wid} for wid in data["ids"]]}
+        
+        with patch.object(rest_client, '_make_request', side_effect=fake_request):
+            pages = rest_client.iter_work_items_pages("TestProject", list(range(1, 601)), max_in_flight=3)
+            first_page = await pages.__anext__()
+            await pages.aclose()
+        
+        assert len(first_page) == 200
+        assert sorted(cancelled) == [201, 401]
+        
+        current = asyncio.current_task()
+        assert [task for task in asyncio.all_tasks() if task is not current] == []
+    
+    @pytest.mark.asyncio
+    async def test_iter_reporting_revisions(self, rest_client):
+        """Test the revisions feed follows continuation tokens to the last batch."""
+        responses = [
+            (200, {"values": [{"id": 1, "rev": 3}], "continuationToken": "token-1", "isLastBatch": False}),
+            (200, {"values": [{"id": 2, "rev": 1}], "continuationToken": "token-2", "isLastBatch": True})
+        ]
+        
+        with patch.object(rest_client, '_make_request', side_effect=responses) as mock_request:
+            batches = [
+                batch async for batch in rest_client.iter_reporting_revisions(
+                    "TestProject", fields=["System.State", "System.Title"], continuation_token="token-0"
+                )
+            ]
+        
+        assert batches == [([{"id": 1, "rev": 3}], "token-1"), ([{"id": 2, "rev": 1}], "token-2")]
+        
+        url = mock_request.call_args_list[0][0][1]
+        first_params = mock_request.call_args_list[0][1]["params"]
+        assert "wit/reporting/workitemrevisions" in url
+        assert first_params["continuationToken"] == "token-0"
+        assert first_params["fields"] == "System.State,System.Title"
+        assert mock_request.call_args_list[1][1]["params"]["continuationToken"] == "token-1"
+    
     @pytest.mark.asyncio
     async def test_update_work_item(self, rest_client):
         """Test work item field updates."""
@@ -713,6 +1022,124 @@ class TestADORestClient:
             assert "error" in results[124]
             assert "Permission denied" in results[124]["error"]
     
+    @pytest.mark.asyncio
+    async def test_batch_update_work_items(self, rest_client):
+        """Test $batch updates pack sub-requests and retry failures individually."""
+        calculated = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        work_item_updates = {
+            wid: {"Custom.QVFScore": 0.5, "Custom.QVFLastCalculated": calculated}
+            for wid in range(1, 451)
+        }
+        
+        async def fake_request(method, url, data=None, params=None, headers=None, max_retries=None):
+            responses = []
+            for sub_request in data:
+                wid = int(sub_request["uri"].split("/")[-1].split("?")[0])
+                if wid == 7:
+                    responses.append({"code": 409, "body": json.dumps({"message": "Conflict"})})
+                else:
+                    responses.append({"code": 200, "body": json.dumps({"id": wid, "rev": 2})})
+            return 200, {"count": len(responses), "value": responses}
+        
+        async def fake_update(project, wid, updates, bypass_rules=False):
+            return {"id": wid, "rev": 3}
+        
+        with patch.object(rest_client, '_make_request', side_effect=fake_request) as mock_request, \
+             patch.object(rest_client, 'update_work_item', side_effect=fake_update) as mock_update:
+            results = await rest_client.batch_update_work_items("TestProject", work_item_updates)
+        
+        assert mock_request.call_count == 3
+        assert [len(c[1]["data"]) for c in mock_request.call_args_list] == [200, 200, 50]
+        
+        method, url = mock_request.call_args_list[0][0][:2]
+        assert method == "POST"
+        assert "wit/$batch" in url
+        
+        sub_request = mock_request.call_args_list[0][1]["data"][0]
+        assert sub_request["method"] == "PATCH"
+        assert sub_request["headers"]["Content-Type"] == "application/json-patch+json"
+        assert {"op": "add", "path": "/fields/Custom.QVFLastCalculated", "value": calculated.isoformat()} in sub_request["body"]
+        
+        # Only the failed sub-request is retried on its own
+        assert mock_update.call_count == 1
+        assert mock_update.call_args[0][:2] == ("TestProject", 7)
+        assert results[7]["rev"] == 3
+        assert all(results[wid]["rev"] == 2 for wid in work_item_updates if wid != 7)
+        
+        with pytest.raises(ValueError):
+            await rest_client.batch_update_work_items("TestProject", work_item_updates, chunk_size=201)
+    
+    @pytest.mark.asyncio
+    async def test_batch_update_retries_failed_chunks(self, rest_client):
+        """Test failed $batch requests are retried before bounded per-item fallback."""
+        work_item_updates = {wid: {"Custom.QVFScore": 0.5} for wid in range(1, 31)}
+        attempts = {}
+        updating = 0
+        max_updating = 0
+        
+        async def fake_request(method, url, data=None, params=None, headers=None, max_retries=None):
+            # Chunk sends leave retries to the chunk loop
+            assert max_retries == 0
+            first_id = int(data[0]["uri"].split("/")[-1].split("?")[0])
+            attempts[first_id] = attempts.get(first_id, 0) + 1
+            if first_id == 1 and attempts[first_id] == 1:
+                raise ADOApiError("Server error: 503", status_code=503)
+            if first_id == 11:
+                raise ADORateLimitError("Rate limit exceeded", status_code=429)
+            if first_id == 21:
+                raise ADOApiError("API error: Bad request", status_code=400)
+            return 200, {"value": [{"code": 200, "body": json.dumps({"id": first_id + i, "rev": 2})} for i in range(len(data))]}
+        
+        async def fake_update(project, wid, updates, bypass_rules=False):
+            nonlocal updating, max_updating
+            updating += 1
+            max_updating = max(max_updating, updating)
+            await asyncio.sleep(0.001)
+            updating -= 1
+            return {"id": wid, "rev": 3}
+        
+        with patch.object(rest_client, '_make_request', side_effect=fake_request), \
+             patch.object(rest_client, 'update_work_item', side_effect=fake_update) as mock_update:
+            results = await rest_client.batch_update_work_items(
+                "TestProject", work_item_updates, chunk_size=10, max_in_flight=2, chunk_retries=1
+            )
+        
+        # Transient failures are retried as a chunk, client errors are not
+        assert attempts == {1: 2, 11: 2, 21: 1}
+        assert all(results[wid]["rev"] == 2 for wid in range(1, 11))
+        
+        # Items of chunks that still failed fall back to bounded individual updates
+        assert sorted(c[0][1] for c in mock_update.call_args_list) == list(range(11, 31))
+        assert max_updating <= 2
+        assert all(results[wid]["rev"] == 3 for wid in range(11, 31))
+    
+    @pytest.mark.asyncio
+    async def test_request_retry_override(self, rest_client):
+        """Test max_retries=0 sends once and client errors are never retried."""
+        server_error = AsyncMock()
+        server_error.status = 503
+        server_error.text = AsyncMock(return_value='{}')
+        server_error.headers = {}
+        
+        not_found = AsyncMock()
+        not_found.status = 404
+        not_found.text = AsyncMock(return_value='{"message": "Not found"}')
+        not_found.headers = {}
+        
+        with patch.object(rest_client, 'session') as mock_session:
+            mock_session.request.return_value.__aenter__.return_value = server_error
+            with pytest.raises(ADOApiError) as exc_info:
+                await rest_client._make_request("POST", "https://dev.azure.com/testorg/_apis/wit/$batch", max_retries=0)
+            assert exc_info.value.status_code == 503
+            assert mock_session.request.call_count == 1
+            
+            mock_session.request.reset_mock()
+            mock_session.request.return_value.__aenter__.return_value = not_found
+            with pytest.raises(ADOApiError) as exc_info:
+                await rest_client._make_request("GET", "https://dev.azure.com/testorg/_apis/projects/x")
+            assert exc_info.value.status_code == 404
+            assert mock_session.request.call_count == 1
+    
     def test_performance_stats_tracking(self, rest_client):
         """Test performance statistics tracking."""
         # Initial stats should be zero
@@ -776,6 +1203,134 @@ class TestADORestClient:
             assert len(request_ends) == 15
 
 
+class TestResponseCache:
+    """Test caching and revalidation of metadata responses."""
+    
+    def _response(self, status, body, headers=None):
+        response = AsyncMock()
+        response.status = status
+        response.text = AsyncMock(return_value=json.dumps(body) if body is not None else "")
+        response.headers = headers or {}
+        return response
+    
+    @pytest.mark.asyncio
+    async def test_fresh_entry_skips_request(self, rest_client):
+        """Test a second call inside the TTL is served from the cache."""
+        fields = {"value": [{"referenceName": "System.Title"}]}
+        
+        with patch.object(rest_client, 'session') as mock_session:
+            mock_session.request.return_value.__aenter__.return_value = self._response(200, fields)
+            
+            first = await rest_client.list_work_item_fields("TestProject")
+            first.append({"referenceName": "Local.Change"})
+            second = await rest_client.list_work_item_fields("TestProject")
+            
+            assert mock_session.request.call_count == 1
+            assert second == fields["value"]
+        
+        stats = rest_client.get_performance_stats()["response_cache"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("etag_header", ["ETag", "etag"])
+    async def test_stale_entry_revalidates_with_etag(self, rest_client, etag_header):
+        """Test a stale entry sends If-None-Match and a 304 reuses the cached body."""
+        types = {"value": [{"name": "User Story"}]}
+        
+        with patch.object(rest_client, 'session') as mock_session:
+            mock_session.request.return_value.__aenter__.side_effect = [
+                self._response(200, types, {etag_header: '"v1"'}),
+                self._response(304, None)
+            ]
+            
+            await rest_client.get_work_item_types("TestProject")
+            rest_client.response_cache.ttl_seconds = 0
+            work_item_types = await rest_client.get_work_item_types("TestProject")
+            
+            assert work_item_types == types["value"]
+            headers = mock_session.request.call_args_list[1].kwargs['headers']
+            assert headers['If-None-Match'] == '"v1"'
+        
+        assert rest_client.response_cache.revalidations == 1
+    
+    @pytest.mark.asyncio
+    async def test_field_creation_invalidates_cache(self, rest_client):
+        """Test creating a field drops cached field lists."""
+        with patch.object(rest_client, 'session') as mock_session:
+            mock_session.request.return_value.__aenter__.side_effect = [
+                self._response(200, {"value": []}),
+                self._response(201, {"referenceName": "Custom.QVFScore"}),
+                self._response(200, {"value": [{"referenceName": "Custom.QVFScore"}]})
+            ]
+            
+            assert await rest_client.list_work_item_fields("TestProject") == []
+            await rest_client.create_work_item_field("TestProject", {"referenceName": "Custom.QVFScore"})
+            fields = await rest_client.list_work_item_fields("TestProject")
+            
+            assert fields == [{"referenceName": "Custom.QVFScore"}]
+            assert mock_session.request.call_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_field_deletion_invalidates_process_work_item_types(self, rest_client):
+        """Test deleting a field drops cached process work item types but keeps the project."""
+        project = {"id": "project-1", "capabilities": {"processTemplate": {"templateTypeId": "process-1"}}}
+        
+        with patch.object(rest_client, 'session') as mock_session:
+            mock_session.request.return_value.__aenter__.side_effect = [
+                self._response(200, project),
+                self._response(200, {"value": [{"name": "Epic", "fields": ["Custom.QVFScore"]}]}),
+                self._response(200, None),
+                self._response(200, {"value": [{"name": "Epic", "fields": []}]})
+            ]
+            
+            await rest_client.list_process_work_item_types("TestProject")
+            assert await rest_client.delete_work_item_field("TestProject", "Custom.QVFScore") is True
+            work_item_types = await rest_client.list_process_work_item_types("TestProject")
+            
+            assert work_item_types == [{"name": "Epic", "fields": []}]
+            assert mock_session.request.call_count == 4
+            assert "work/processes/process-1/workitemtypes" in mock_session.request.call_args_list[3].args[1]
+    
+    @pytest.mark.asyncio
+    async def test_cache_persists_between_clients(self, tmp_path):
+        """Test entries written to the cache directory are reused by a new client."""
+        config = ADOClientConfig(
+            organization_url="https://dev.azure.com/testorg",
+            personal_access_token="test_pat_token",
+            response_cache_dir=str(tmp_path)
+        )
+        project = {"id": "project-1", "name": "TestProject"}
+        
+        first_client = ADORestClient(config)
+        with patch.object(first_client, 'session') as mock_session:
+            mock_session.request.return_value.__aenter__.return_value = self._response(200, project)
+            await first_client.get_project("TestProject")
+        
+        second_client = ADORestClient(config)
+        with patch.object(second_client, 'session') as mock_session:
+            restored = await second_client.get_project("TestProject")
+            
+            assert restored == project
+            assert mock_session.request.call_count == 0
+        
+        cache = ResponseCache(300, tmp_path)
+        assert cache.invalidate("projects/") == 1
+        assert list(tmp_path.glob("*.json")) == []
+    
+    def test_caching_disabled(self):
+        """Test a zero TTL disables the cache."""
+        config = ADOClientConfig(
+            organization_url="https://dev.azure.com/testorg",
+            personal_access_token="test_pat_token",
+            response_cache_ttl_seconds=0
+        )
+        client = ADORestClient(config)
+        
+        assert client.response_cache is None
+        assert client.invalidate_cache() == 0
+
+
 class TestADORestClientIntegration:
     """Integration tests for complete workflows."""
     
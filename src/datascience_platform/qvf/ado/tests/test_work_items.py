@@ -27,6 +27,7 @@ from datascience_platform.qvf.ado.work_items import (
     UpdateResult,
     WorkItemManagementError
 )
+from datascience_platform.qvf.ado.mirror import WorkItemMirror
 from datascience_platform.qvf.ado.rest_client import ADOClientConfig, ADOApiError
 from datascience_platform.ado.models import WorkItemType, WorkItemState
 
@@ -449,6 +450,216 @@ class TestWorkItemManager:
         # Verify max_items parameter
         assert query_call[1]["max_results"] == 100
     
+    @pytest.mark.asyncio
+    async def test_load_work_items_changed_since(self, work_item_manager):
+        """Test incremental loading filters by changed date and can include inactive items."""
+        project_name = "TestProject"
+        
+        work_item_manager.rest_client.query_work_items = AsyncMock(return_value={"workItems": []})
+        work_item_manager.fields_manager.get_qvf_field_definitions.return_value = {}
+        
+        await work_item_manager.load_work_items_for_scoring(
+            project_name,
+            changed_since=datetime(2024, 1, 2, 10, 30, tzinfo=timezone.utc),
+            include_inactive=True
+        )
+        
+        query_call = work_item_manager.rest_client.query_work_items.call_args
+        query_str = query_call[0][1]
+        
+        assert "[System.ChangedDate] > '2024-01-02T10:30:00.000000Z'" in query_str
+        assert "[State] NOT IN" not in query_str
+        assert query_call[1]["time_precision"] is True
+    
+    @pytest.mark.asyncio
+    async def test_iter_work_items_for_scoring_streams_pages(self, work_item_manager):
+        """Test scoring loads stream hydrated pages of the WIQL result."""
+        project_name = "TestProject"
+        requested = {}
+        
+        async def fake_pages(project, ids, fields=None, page_size=200):
+            requested.update(ids=ids, page_size=page_size)
+            for page_start in range(0, len(ids), page_size):
+                yield [{"id": wid} for wid in ids[page_start:page_start + page_size]]
+        
+        work_item_manager.rest_client.query_work_items = AsyncMock(
+            return_value={"workItems": [{"id": wid} for wid in range(1, 451)]}
+        )
+        work_item_manager.rest_client.iter_work_items_pages = fake_pages
+        work_item_manager.fields_manager.get_qvf_field_definitions.return_value = {}
+        
+        # Pages follow batch_size, capped at the workitemsbatch limit
+        work_item_manager.batch_size = 150
+        pages = [page async for page in work_item_manager.iter_work_items_for_scoring(project_name)]
+        assert [len(page) for page in pages] == [150, 150, 150]
+        assert requested["page_size"] == 150
+        
+        work_item_manager.batch_size = 1000
+        pages = [page async for page in work_item_manager.iter_work_items_for_scoring(project_name)]
+        assert [len(page) for page in pages] == [200, 200, 50]
+        assert requested["page_size"] == 200
+        
+        work_items = await work_item_manager.load_work_items_for_scoring(project_name)
+        assert [item["id"] for item in work_items] == list(range(1, 451))
+    
+    @pytest.mark.asyncio
+    async def test_sync_mirror_and_load_from_mirror(self, work_item_manager):
+        """Test delta syncs fill the mirror and scoring loads read from it."""
+        project_name = "TestProject"
+        
+        def payload(wid, state="Active", changed="2024-01-02T10:00:00Z", rev=1):
+            return {"id": wid, "rev": rev, "fields": {
+                "System.Id": wid,
+                "System.State": state,
+                "System.WorkItemType": "User Story",
+                "System.ChangedDate": changed
+            }}
+        
+        async def fake_pages(project, ids, fields=None, page_size=200):
+            yield [payload(wid) for wid in ids]
+        
+        revision_calls = []
+        
+        async def fake_revisions(project, fields=None, continuation_token=None, start_date_time=None,
+                                 include_deleted=False):
+            revision_calls.append(continuation_token)
+            if continuation_token is None:
+                yield [], "token-1"
+            else:
+                yield [payload(2, state="Closed", changed="2024-01-03T09:00:00Z", rev=2)], "token-2"
+        
+        work_item_manager.mirror = WorkItemMirror(":memory:")
+        work_item_manager.fields_manager.get_qvf_field_definitions.return_value = {}
+        work_item_manager.rest_client.query_work_items = AsyncMock(
+            return_value={"workItems": [{"id": wid} for wid in (1, 2, 3)]}
+        )
+        work_item_manager.rest_client.iter_work_items_pages = fake_pages
+        work_item_manager.rest_client.iter_reporting_revisions = fake_revisions
+        
+        first = await work_item_manager.sync_mirror(project_name)
+        assert first.full_sync is True
+        assert first.work_items_synced == 3
+        assert "[State] NOT IN" not in work_item_manager.rest_client.query_work_items.call_args[0][1]
+        
+        second = await work_item_manager.sync_mirror(project_name)
+        assert second.full_sync is False
+        assert second.watermark == datetime(2024, 1, 3, 9, tzinfo=timezone.utc)
+        assert revision_calls == [None, "token-1"]
+        assert work_item_manager.rest_client.query_work_items.call_count == 1
+        assert work_item_manager.mirror.get_sync_state(project_name).continuation_token == "token-2"
+        
+        # Scoring loads read the mirror with the default active-state filter
+        work_items = await work_item_manager.load_work_items_for_scoring(project_name)
+        assert [item["id"] for item in work_items] == [1, 3]
+        assert work_item_manager.rest_client.query_work_items.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_full_mirror_sync_pages_wiql_by_id(self, work_item_manager):
+        """Test the first sync pages WIQL by ID to stay under ADO's result limit."""
+        project_name = "TestProject"
+        all_ids = list(range(1, 26))
+        queries = []
+        
+        async def fake_query(project, wiql, max_results=None, time_precision=False):
+            queries.append((wiql, max_results))
+            last_id = int(wiql.split("[System.Id] > ")[1].split()[0]) if "[System.Id] >" in wiql else 0
+            return {"workItems": [{"id": wid} for wid in all_ids if wid > last_id][:max_results]}
+        
+        async def fake_pages(project, ids, fields=None, page_size=200):
+            yield [{"id": wid, "rev": 1, "fields": {"System.Id": wid}} for wid in ids]
+        
+        work_item_manager.mirror = WorkItemMirror(":memory:")
+        work_item_manager.fields_manager.get_qvf_field_definitions.return_value = {}
+        work_item_manager.rest_client.query_work_items = fake_query
+        work_item_manager.rest_client.iter_work_items_pages = fake_pages
+        
+        with patch("datascience_platform.qvf.ado.work_items.WIQL_MAX_RESULTS", 10):
+            result = await work_item_manager.sync_mirror(project_name, use_revisions_api=False)
+        
+        assert result.work_items_synced == 25
+        assert len(work_item_manager.mirror) == 25
+        assert [max_results for _, max_results in queries] == [10, 10, 10]
+        assert "[System.Id] > 20" in queries[2][0]
+    
+    @pytest.mark.asyncio
+    async def test_mirror_follows_writes_and_deletions(self, work_item_manager):
+        """Test writes update the mirror and stale mirrors are synced, dropping deleted items."""
+        project_name = "TestProject"
+        
+        def payload(wid, rev=1, **fields):
+            return {"id": wid, "rev": rev, "fields": {
+                "System.Id": wid,
+                "System.State": "Active",
+                "System.WorkItemType": "User Story",
+                "System.ChangedDate": "2024-01-02T10:00:00Z",
+                **fields
+            }}
+        
+        async def fake_pages(project, ids, fields=None, page_size=200):
+            yield [payload(wid) for wid in ids]
+        
+        revision_batches = [
+            ([], "token-1"),
+            ([
+                {"id": 2, "rev": 3, "fields": {"System.Id": 2, "System.IsDeleted": True}},
+                payload(3, **{"System.ChangedDate": "2024-01-04T08:00:00Z"})
+            ], "token-2")
+        ]
+        
+        async def fake_revisions(project, fields=None, continuation_token=None, start_date_time=None,
+                                 include_deleted=False):
+            assert include_deleted is True
+            yield revision_batches.pop(0)
+        
+        written = {}
+        
+        async def fake_update(project, field_updates, batch_size=None):
+            written.update(field_updates)
+            return {
+                wid: Mock(is_successful=True, errors=[], ado_response={"id": wid, "rev": 2})
+                for wid in field_updates
+            }
+        
+        work_item_manager.mirror = WorkItemMirror(":memory:")
+        work_item_manager.fields_manager.get_qvf_field_definitions.return_value = {
+            "qvf_score": Mock(reference_name="Custom.QVFScore")
+        }
+        work_item_manager.fields_manager.update_work_item_scores = fake_update
+        work_item_manager.rest_client.query_work_items = AsyncMock(
+            return_value={"workItems": [{"id": wid} for wid in (1, 2)]}
+        )
+        work_item_manager.rest_client.iter_work_items_pages = fake_pages
+        work_item_manager.rest_client.iter_reporting_revisions = fake_revisions
+        
+        # The first load syncs the empty mirror
+        work_items = await work_item_manager.load_work_items_for_scoring(project_name)
+        assert [item["id"] for item in work_items] == [1, 2]
+        
+        scores = {1: QVFWorkItemScore(work_item_id=1, overall_score=0.5, configuration_id="test")}
+        await work_item_manager.update_work_item_scores(project_name, scores)
+        
+        mirrored = work_item_manager.mirror.get_work_item(1)
+        assert mirrored["rev"] == 2
+        assert mirrored["fields"]["Custom.QVFScore"] == 0.5
+        
+        # Reloading from the mirror keeps the write fingerprints, so nothing is rewritten
+        await work_item_manager.load_work_items_for_scoring(project_name)
+        written.clear()
+        result = await work_item_manager.update_work_item_scores(project_name, scores)
+        assert result.skipped_updates == 1
+        assert written == {}
+        
+        # A stale mirror is synced before the load and deleted items leave it
+        state = work_item_manager.mirror.get_sync_state(project_name)
+        state.last_synced -= timedelta(hours=1)
+        work_item_manager.mirror.set_sync_state(project_name, state)
+        
+        work_items = await work_item_manager.load_work_items_for_scoring(project_name)
+        assert [item["id"] for item in work_items] == [1, 3]
+        assert work_item_manager.mirror.get_work_item(2) is None
+        assert work_item_manager.get_mirror_watermark(project_name) == datetime(2024, 1, 4, 8, tzinfo=timezone.utc)
+        assert work_item_manager.rest_client.query_work_items.call_count == 1
+    
     @pytest.mark.asyncio
     async def test_load_work_items_empty_result(self, work_item_manager):
         """Test work item loading with empty result."""
@@ -559,6 +770,85 @@ class TestWorkItemManager:
         assert 123 in field_updates
         assert 124 in field_updates
     
+    @pytest.mark.asyncio
+    async def test_update_batches_run_concurrently(self, work_item_manager):
+        """Test update batches are written concurrently, one fields call per batch."""
+        project_name = "TestProject"
+        in_flight = 0
+        max_seen = 0
+        
+        async def fake_update(project, field_updates, batch_size=None):
+            nonlocal in_flight, max_seen
+            in_flight += 1
+            max_seen = max(max_seen, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {
+                wid: Mock(is_successful=wid != 7, errors=["API error: Conflict"])
+                for wid in field_updates
+            }
+        
+        work_item_manager.fields_manager.update_work_item_scores = fake_update
+        
+        scores = {
+            wid: QVFWorkItemScore(work_item_id=wid, overall_score=0.5, configuration_id="test")
+            for wid in range(1, 13)
+        }
+        
+        result = await work_item_manager.update_work_item_scores(project_name, scores)
+        
+        assert len(result.batch_results) == 3
+        assert max_seen == 3
+        assert result.successful_updates == 11
+        assert result.failed_updates == 1
+        assert "Conflict" in result.batch_results[1].failed_updates[7]
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_scores_are_not_written(self, work_item_manager):
+        """Test a repeat run only writes items and fields that changed."""
+        project_name = "TestProject"
+        written = {}
+        
+        async def fake_update(project, field_updates, batch_size=None):
+            written.update(field_updates)
+            return {
+                wid: Mock(is_successful=True, errors=[], ado_response={"id": wid, "rev": 2})
+                for wid in field_updates
+            }
+        
+        work_item_manager.fields_manager.update_work_item_scores = fake_update
+        
+        def scores(changed_score=0.5):
+            return {
+                wid: QVFWorkItemScore(
+                    work_item_id=wid,
+                    overall_score=changed_score if wid == 3 else 0.5,
+                    configuration_id="test"
+                )
+                for wid in range(1, 11)
+            }
+        
+        first = await work_item_manager.update_work_item_scores(project_name, scores())
+        assert first.successful_updates == 10
+        assert first.skipped_updates == 0
+        
+        written.clear()
+        second = await work_item_manager.update_work_item_scores(project_name, scores(changed_score=0.8))
+        
+        assert second.successful_updates == 1
+        assert second.skipped_updates == 9
+        assert second.success_rate == 100.0
+        assert set(written) == {3}
+        assert set(written[3]) == {"Custom.QVFScore", "Custom.QVFLastCalculated"}
+        assert work_item_manager._operation_stats["writes_skipped"] == 9
+        
+        written.clear()
+        forced = await work_item_manager.update_work_item_scores(
+            project_name, scores(changed_score=0.8), skip_unchanged=False
+        )
+        assert forced.successful_updates == 10
+        assert len(written) == 10
+    
     @pytest.mark.asyncio
     async def test_update_work_item_scores_dict_input(self, work_item_manager):
         """Test work item score updates with dictionary input."""
@@ -52,8 +52,8 @@ Architecture:
 
 import logging
 import asyncio
-from datetime import datetime, timezone
-from typing import List, Dict, Optional, Any, Union, Tuple, Set
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Any, Union, Tuple, Set, AsyncIterator
 from dataclasses import dataclass, field
 from enum import Enum
 from pydantic import BaseModel, Field, field_validator
@@ -63,11 +63,46 @@ import json
 from ...core.exceptions import DataSciencePlatformError
 from ...ado.models import WorkItemType, ADOWorkItem, WorkItemState
 from ..core.criteria import QVFCriteriaConfiguration, CriteriaCategory
-from .rest_client import ADORestClient, ADOClientConfig, ADOApiError
+from .rest_client import ADORestClient, ADOClientConfig, ADOApiError, MAX_WORK_ITEMS_PER_BATCH
 from .custom_fields import CustomFieldsManager, QVFFieldDefinition
+from .fingerprints import FieldFingerprintStore
+from .mirror import WorkItemMirror, MirrorSyncState, parse_ado_datetime
 
 logger = logging.getLogger(__name__)
 
+# States excluded from scoring unless explicitly requested
+INACTIVE_STATES = ('Closed', 'Resolved', 'Removed', 'Cancelled')
+
+# Fields loaded for QVF scoring (QVF custom fields are added on top)
+SCORING_FIELDS = (
+    "System.Id",
+    "System.Title",
+    "System.WorkItemType",
+    "System.State",
+    "System.AreaPath",
+    "System.IterationPath",
+    "System.CreatedDate",
+    "System.ChangedDate",
+    "Microsoft.VSTS.Common.BusinessValue",
+    "Microsoft.VSTS.Scheduling.StoryPoints",
+    "Microsoft.VSTS.Common.Risk",
+    "Microsoft.VSTS.Common.Priority",
+    "System.AssignedTo"
+)
+
+# Additional fields kept in the local mirror for analytics and the API
+MIRROR_FIELDS = (
+    "System.Parent",
+    "System.Tags",
+    "Microsoft.VSTS.Common.ClosedDate"
+)
+
+# ADO rejects WIQL queries matching more than 20,000 work items
+WIQL_MAX_RESULTS = 20000
+
+# Mirror syncs older than this are refreshed before loads read the mirror
+DEFAULT_MIRROR_MAX_AGE = timedelta(minutes=5)
+
 
 class WorkItemManagementError(DataSciencePlatformError):
     """Exception raised for work item management errors."""
@@ -164,6 +199,9 @@ class WorkItemUpdateBatch:
     batch_size: int = 100
     created_timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     
+    # Field updates to send per item (all QVF fields of the score if absent)
+    field_updates: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    
     # Processing status
     is_processed: bool = False
     processing_started: Optional[datetime] = None
@@ -221,17 +259,28 @@ class UpdateResult:
     failed_updates: int
     processing_time_seconds: float
     
+    # Items whose QVF fields already held the new values in ADO
+    skipped_work_item_ids: Set[int] = field(default_factory=set)
+    
     # Detailed results
     batch_results: List[WorkItemUpdateBatch] = field(default_factory=list)
     error_summary: Dict[str, int] = field(default_factory=dict)  # error_type -> count
     performance_metrics: Dict[str, float] = field(default_factory=dict)
     
+    @property
+    def skipped_updates(self) -> int:
+        """Number of writes suppressed because nothing changed."""
+        return len(self.skipped_work_item_ids)
+    
     @property
     def success_rate(self) -> float:
-        """Overall success rate as percentage."""
+        """Overall success rate as percentage (of items that needed a write)."""
         if self.total_items == 0:
             return 0.0
-        return (self.successful_updates / self.total_items) * 100
+        attempted = self.total_items - self.skipped_updates
+        if attempted == 0:
+            return 100.0
+        return (self.successful_updates / attempted) * 100
     
     @property
     def items_per_second(self) -> float:
@@ -266,12 +315,25 @@ class UpdateResult:
         """Get human-readable result summary."""
         return (
             f"Updated {self.successful_updates}/{self.total_items} work items "
-            f"({self.success_rate:.1f}% success rate) "
+            f"({self.success_rate:.1f}% success rate, {self.skipped_updates} unchanged skipped) "
             f"in {self.processing_time_seconds:.1f}s "
             f"({self.items_per_second:.1f} items/sec)"
         )
 
 
+@dataclass
+class MirrorSyncResult:
+    """Result of a work item mirror sync."""
+    
+    project_name: str
+    work_items_synced: int
+    full_sync: bool
+    used_revisions_api: bool
+    watermark: Optional[datetime]
+    processing_time_seconds: float
+    work_items_removed: int = 0
+
+
 class WorkItemManager:
     """High-level work item manager for QVF operations.
     
@@ -318,7 +380,10 @@ class WorkItemManager:
         personal_access_token: str,
         api_version: str = "7.0",
         batch_size: int = 100,
-        max_concurrent_requests: int = 10
+        max_concurrent_requests: int = 10,
+        fingerprint_store: Optional[FieldFingerprintStore] = None,
+        mirror: Optional[WorkItemMirror] = None,
+        mirror_max_age: Optional[timedelta] = DEFAULT_MIRROR_MAX_AGE
     ):
         """Initialize work item manager.
         
@@ -328,10 +393,18 @@ class WorkItemManager:
             api_version: ADO REST API version
             batch_size: Default batch size for operations
             max_concurrent_requests: Maximum concurrent API requests
+            fingerprint_store: Store of last written QVF field values used to
+                skip unchanged writes (in-memory store if None)
+            mirror: Local work item mirror that loads read from (ADO if None)
+            mirror_max_age: Sync the mirror before a load when its last sync is
+                older than this (None leaves syncing to the caller)
         """
         self.organization_url = organization_url
         self.personal_access_token = personal_access_token
         self.batch_size = batch_size
+        self.fingerprint_store = fingerprint_store if fingerprint_store is not None else FieldFingerprintStore()
+        self.mirror = mirror
+        self.mirror_max_age = mirror_max_age
         
         # Initialize REST client
         client_config = ADOClientConfig(
@@ -355,6 +428,8 @@ class WorkItemManager:
         self._operation_stats = {
             "work_items_loaded": 0,
             "work_items_updated": 0,
+            "writes_skipped": 0,
+            "work_items_synced": 0,
             "total_operation_time": 0.0,
             "batches_processed": 0
         }
@@ -378,7 +453,10 @@ class WorkItemManager:
         area_path: Optional[str] = None,
         iteration_path: Optional[str] = None,
         max_items: Optional[int] = None,
-        include_qvf_fields: bool = True
+        include_qvf_fields: bool = True,
+        changed_since: Optional[datetime] = None,
+        include_inactive: bool = False,
+        use_mirror: bool = True
     ) -> List[Dict[str, Any]]:
         """Load work items that need QVF scoring.
         
@@ -390,13 +468,264 @@ class WorkItemManager:
             iteration_path: Optional iteration path filter
             max_items: Maximum number of items to load
             include_qvf_fields: Whether to include existing QVF field values
+            changed_since: Only load items changed after this time
+            include_inactive: Include inactive items when no state filter is given
+                (lets incremental callers see items that left the active set)
+            use_mirror: Read from the local mirror when one is configured
             
         Returns:
             List of work item dictionaries with fields needed for QVF scoring
         """
         start_time = datetime.now()
         
-        # Build WIQL query
+        all_work_items = []
+        async for page in self.iter_work_items_for_scoring(
+            project_name,
+            work_item_types=work_item_types,
+            states=states,
+            area_path=area_path,
+            iteration_path=iteration_path,
+            max_items=max_items,
+            include_qvf_fields=include_qvf_fields,
+            changed_since=changed_since,
+            include_inactive=include_inactive,
+            use_mirror=use_mirror
+        ):
+            all_work_items.extend(page)
+        
+        execution_time = (datetime.now() - start_time).total_seconds()
+        self._operation_stats["total_operation_time"] += execution_time
+        
+        if all_work_items:
+            logger.info(
+                f"Loaded {len(all_work_items)} work items from project {project_name} "
+                f"in {execution_time:.2f}s"
+            )
+        
+        return all_work_items
+    
+    async def iter_work_items_for_scoring(
+        self,
+        project_name: str,
+        work_item_types: Optional[List[WorkItemType]] = None,
+        states: Optional[List[WorkItemState]] = None,
+        area_path: Optional[str] = None,
+        iteration_path: Optional[str] = None,
+        max_items: Optional[int] = None,
+        include_qvf_fields: bool = True,
+        changed_since: Optional[datetime] = None,
+        include_inactive: bool = False,
+        use_mirror: bool = True
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream work items that need QVF scoring, one page at a time.
+        
+        Runs the WIQL query, then hydrates the matching IDs in pages of
+        batch_size items (at most 200, the workitemsbatch limit) with several
+        page requests in flight. Pages arrive in ID
+        order, so callers can process early pages while later ones load.
+        When a local mirror is configured the same filters are answered from
+        the mirror instead, after a delta sync if the mirror is older than
+        mirror_max_age.
+        
+        Args:
+            project_name: Name of the ADO project
+            work_item_types: Work item types to include (all if None)
+            states: Work item states to include (active states if None)
+            area_path: Optional area path filter
+            iteration_path: Optional iteration path filter
+            max_items: Maximum number of items to load
+            include_qvf_fields: Whether to include existing QVF field values
+            changed_since: Only load items changed after this time
+            include_inactive: Include inactive items when no state filter is given
+                (lets incremental callers see items that left the active set)
+            use_mirror: Read from the local mirror when one is configured
+            
+        Yields:
+            Pages of work item dictionaries with fields needed for QVF scoring
+        """
+        qvf_fields = self._get_qvf_field_names() if include_qvf_fields else []
+        
+        if self.mirror is not None and use_mirror:
+            await self._ensure_mirror_fresh(project_name)
+            
+            work_items = self.mirror.query(
+                project_name,
+                work_item_types=work_item_types,
+                states=states,
+                exclude_states=INACTIVE_STATES if not states and not include_inactive else None,
+                area_path=area_path,
+                iteration_path=iteration_path,
+                changed_since=changed_since,
+                limit=max_items
+            )
+            
+            page_size = self._page_size
+            for page_start in range(0, len(work_items), page_size):
+                page = work_items[page_start:page_start + page_size]
+                self._operation_stats["work_items_loaded"] += len(page)
+                self._observe_page(page, qvf_fields)
+                yield page
+            return
+        
+        where_clause = self._build_where_clause(
+            work_item_types, states, area_path, iteration_path, changed_since, include_inactive
+        )
+        
+        async for page in self._iter_ado_pages(
+            project_name,
+            where_clause,
+            list(SCORING_FIELDS) + qvf_fields,
+            qvf_fields,
+            max_items=max_items,
+            time_precision=changed_since is not None
+        ):
+            yield page
+    
+    async def sync_mirror(
+        self,
+        project_name: str,
+        full: bool = False,
+        use_revisions_api: bool = True
+    ) -> MirrorSyncResult:
+        """Bring the local work item mirror up to date with ADO.
+        
+        The first (or a full) sync loads every work item with WIQL, paged by
+        ID to stay under ADO's 20,000-result WIQL limit. Later
+        syncs only fetch changes: through the reporting revisions API when a
+        continuation token is stored, otherwise with a WIQL query on
+        System.ChangedDate after the stored watermark. Work items deleted in
+        ADO are removed from the mirror when they show up in the revisions
+        feed (WIQL deltas cannot see deletions).
+        
+        Args:
+            project_name: Name of the ADO project
+            full: Reload every work item instead of syncing changes
+            use_revisions_api: Track changes through the reporting revisions API
+            
+        Returns:
+            MirrorSyncResult describing the sync
+        """
+        if self.mirror is None:
+            raise WorkItemManagementError("No work item mirror configured")
+        
+        start_time = datetime.now(timezone.utc)
+        
+        if full:
+            self.mirror.clear(project_name)
+        state = self.mirror.get_sync_state(project_name)
+        
+        qvf_fields = self._get_qvf_field_names()
+        fields = list(SCORING_FIELDS) + list(MIRROR_FIELDS) + qvf_fields
+        revision_fields = fields + ["System.IsDeleted"]
+        watermark = state.watermark
+        synced = 0
+        removed = 0
+        
+        try:
+            if use_revisions_api and state.continuation_token:
+                revision_pages = self.rest_client.iter_reporting_revisions(
+                    project_name, revision_fields,
+                    continuation_token=state.continuation_token, include_deleted=True
+                )
+            else:
+                where_clause = self._build_where_clause(changed_since=state.watermark, include_inactive=True)
+                async for page in self._iter_ado_pages(
+                    project_name,
+                    where_clause,
+                    fields,
+                    qvf_fields,
+                    time_precision=state.watermark is not None,
+                    page_by_id=True
+                ):
+                    synced += self.mirror.upsert_work_items(project_name, page)
+                    watermark = self._latest_changed_date(page, watermark)
+                
+                # Start the revisions feed here so the next sync is a token-based delta
+                revision_pages = self.rest_client.iter_reporting_revisions(
+                    project_name, revision_fields, start_date_time=start_time, include_deleted=True
+                ) if use_revisions_api else None
+            
+            continuation_token = None
+            if revision_pages is not None:
+                async for revisions, continuation_token in revision_pages:
+                    deleted_ids = [
+                        revision["id"] for revision in revisions
+                        if revision.get("fields", {}).get("System.IsDeleted")
+                    ]
+                    if deleted_ids:
+                        removed += self.mirror.remove_work_items(deleted_ids)
+                        deleted = set(deleted_ids)
+                        revisions = [revision for revision in revisions if revision["id"] not in deleted]
+                    
+                    synced += self.mirror.upsert_work_items(project_name, revisions)
+                    watermark = self._latest_changed_date(revisions, watermark)
+        
+        except Exception as e:
+            logger.error(f"Error syncing work item mirror for project {project_name}: {e}")
+            raise WorkItemManagementError(f"Failed to sync work item mirror: {str(e)}")
+        
+        self.mirror.set_sync_state(project_name, MirrorSyncState(
+            watermark=watermark,
+            continuation_token=continuation_token,
+            last_synced=start_time
+        ))
+        
+        self._operation_stats["work_items_synced"] += synced
+        execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+        self._operation_stats["total_operation_time"] += execution_time
+        
+        logger.info(
+            f"Synced {synced} work items from project {project_name} "
+            f"({removed} deleted) in {execution_time:.2f}s"
+        )
+        
+        return MirrorSyncResult(
+            project_name=project_name,
+            work_items_synced=synced,
+            full_sync=state.watermark is None,
+            used_revisions_api=use_revisions_api,
+            watermark=watermark,
+            processing_time_seconds=execution_time,
+            work_items_removed=removed
+        )
+    
+    def get_mirror_watermark(self, project_name: str) -> Optional[datetime]:
+        """Get the newest System.ChangedDate the mirror has synced for a project.
+        
+        Loads from the mirror see every change up to this point, so
+        incremental callers should resume from it rather than the clock.
+        
+        Returns:
+            Sync high-water mark, or None without a mirror or before the first sync
+        """
+        if self.mirror is None:
+            return None
+        return self.mirror.get_sync_state(project_name).watermark
+    
+    async def _ensure_mirror_fresh(self, project_name: str) -> None:
+        """Delta sync the mirror when its last sync is older than mirror_max_age."""
+        if self.mirror_max_age is None:
+            return
+        
+        last_synced = self.mirror.get_sync_state(project_name).last_synced
+        if last_synced is None or datetime.now(timezone.utc) - last_synced > self.mirror_max_age:
+            await self.sync_mirror(project_name)
+    
+    def _get_qvf_field_names(self) -> List[str]:
+        """Get reference names of the QVF custom fields."""
+        qvf_field_definitions = self.fields_manager.get_qvf_field_definitions()
+        return [field_def.reference_name for field_def in qvf_field_definitions.values()]
+    
+    def _build_where_clause(
+        self,
+        work_item_types: Optional[List[WorkItemType]] = None,
+        states: Optional[List[WorkItemState]] = None,
+        area_path: Optional[str] = None,
+        iteration_path: Optional[str] = None,
+        changed_since: Optional[datetime] = None,
+        include_inactive: bool = False
+    ) -> str:
+        """Build the WIQL WHERE clause for work item filters."""
         query_conditions = []
         
         # Work item types filter
@@ -416,9 +745,17 @@ class WorkItemManager:
             else:
                 state_list = "', '".join(state_names)
                 query_conditions.append(f"[State] IN ('{state_list}')")
-        else:
+        elif not include_inactive:
             # Default to active states
-            query_conditions.append("[State] NOT IN ('Closed', 'Resolved', 'Removed', 'Cancelled')")
+            inactive_list = "', '".join(INACTIVE_STATES)
+            query_conditions.append(f"[State] NOT IN ('{inactive_list}')")
+        
+        # Changed date filter for incremental loads
+        if changed_since:
+            if changed_since.tzinfo is None:
+                changed_since = changed_since.replace(tzinfo=timezone.utc)
+            changed_iso = changed_since.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+            query_conditions.append(f"[System.ChangedDate] > '{changed_iso}'")
         
         # Area path filter
         if area_path:
@@ -428,116 +765,132 @@ class WorkItemManager:
         if iteration_path:
             query_conditions.append(f"[Iteration Path] UNDER '{iteration_path}'")
         
-        # Build complete WIQL query
-        where_clause = " AND ".join(query_conditions) if query_conditions else "1=1"
-        
-        # Fields to retrieve
-        base_fields = [
-            "System.Id",
-            "System.Title", 
-            "System.WorkItemType",
-            "System.State",
-            "System.AreaPath",
-            "System.IterationPath",
-            "System.CreatedDate",
-            "System.ChangedDate",
-            "Microsoft.VSTS.Common.BusinessValue",
-            "Microsoft.VSTS.Scheduling.StoryPoints",
-            "Microsoft.VSTS.Common.Risk",
-            "Microsoft.VSTS.Common.Priority",
-            "System.AssignedTo"
-        ]
-        
-        # Add QVF fields if requested
-        qvf_fields = []
-        if include_qvf_fields:
-            qvf_field_definitions = self.fields_manager.get_qvf_field_definitions()
-            qvf_fields = [field_def.reference_name for field_def in qvf_field_definitions.values()]
-            base_fields.extend(qvf_fields)
-        
-        fields_clause = ", ".join(f"[{field}]" for field in base_fields)
-        
-        wiql_query = f"""
-        SELECT {fields_clause}
-        FROM WorkItems
-        WHERE {where_clause}
-        ORDER BY [System.Id]
+        return " AND ".join(query_conditions) if query_conditions else "1=1"
+        
+    async def _iter_ado_pages(
+        self,
+        project_name: str,
+        where_clause: str,
+        fields: List[str],
+        qvf_fields: List[str],
+        max_items: Optional[int] = None,
+        time_precision: bool = False,
+        page_by_id: bool = False
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Run a WIQL query and stream the matching work items from ADO.
+        
+        With page_by_id, the query is repeated on ID ranges of up to
+        WIQL_MAX_RESULTS items, so result sets above ADO's WIQL limit load
+        completely.
         """
+        fields_clause = ", ".join(f"[{field}]" for field in fields)
         
         try:
             logger.info(f"Loading work items from project {project_name} with query: {where_clause}")
             
-            # Execute WIQL query
-            query_result = await self.rest_client.query_work_items(
-                project_name,
-                wiql_query,
-                max_results=max_items
-            )
-            
-            # Extract work item IDs
-            work_item_ids = []
-            if "workItems" in query_result:
-                work_item_ids = [item["id"] for item in query_result["workItems"]]
-            
-            if not work_item_ids:
-                logger.info(f"No work items found matching criteria in project {project_name}")
-                return []
-            
-            logger.info(f"Found {len(work_item_ids)} work items, loading detailed data...")
-            
-            # Load detailed work item data in batches
-            all_work_items = []
-            
-            for batch_start in range(0, len(work_item_ids), self.batch_size):
-                batch_end = min(batch_start + self.batch_size, len(work_item_ids))
-                batch_ids = work_item_ids[batch_start:batch_end]
+            work_item_ids: List[int] = []
+            while True:
+                page_clause = where_clause
+                if page_by_id and work_item_ids:
+                    page_clause = f"({where_clause}) AND [System.Id] > {work_item_ids[-1]}"
+                top = max_items - len(work_item_ids) if max_items else None
+                if page_by_id:
+                    top = min(top, WIQL_MAX_RESULTS) if top else WIQL_MAX_RESULTS
                 
-                logger.debug(f"Loading batch {batch_start//self.batch_size + 1}: items {batch_start+1}-{batch_end}")
+                wiql_query = f"""
+                SELECT {fields_clause}
+                FROM WorkItems
+                WHERE {page_clause}
+                ORDER BY [System.Id]
+                """
                 
-                # Load work items batch
-                work_items_batch = await self.rest_client.get_work_items_batch(
+                # Execute WIQL query
+                query_result = await self.rest_client.query_work_items(
                     project_name,
-                    batch_ids,
-                    fields=base_fields
+                    wiql_query,
+                    max_results=top,
+                    time_precision=time_precision
                 )
                 
-                all_work_items.extend(work_items_batch)
+                # Extract work item IDs
+                page_ids = [item["id"] for item in query_result.get("workItems", [])]
+                work_item_ids.extend(page_ids)
                 
-                # Brief pause between batches
-                if batch_end < len(work_item_ids):
-                    await asyncio.sleep(0.1)
+                if not page_by_id or len(page_ids) < top or (max_items and len(work_item_ids) >= max_items):
+                    break
             
-            execution_time = (datetime.now() - start_time).total_seconds()
-            self._operation_stats["work_items_loaded"] += len(all_work_items)
-            self._operation_stats["total_operation_time"] += execution_time
+            if not work_item_ids:
+                logger.info(f"No work items found matching criteria in project {project_name}")
+                return
             
-            logger.info(
-                f"Loaded {len(all_work_items)} work items from project {project_name} "
-                f"in {execution_time:.2f}s"
-            )
+            logger.info(f"Found {len(work_item_ids)} work items, loading detailed data...")
             
-            return all_work_items
+            # Hydrate work items in pipelined pages
+            async for page in self.rest_client.iter_work_items_pages(
+                project_name,
+                work_item_ids,
+                fields=fields,
+                page_size=self._page_size
+            ):
+                self._operation_stats["work_items_loaded"] += len(page)
+                self._observe_page(page, qvf_fields)
+                yield page
         
         except Exception as e:
             logger.error(f"Error loading work items from project {project_name}: {e}")
             raise WorkItemManagementError(f"Failed to load work items: {str(e)}")
     
+    @property
+    def _page_size(self) -> int:
+        """Work items per load page: batch_size capped at the workitemsbatch limit."""
+        return max(1, min(self.batch_size, MAX_WORK_ITEMS_PER_BATCH))
+    
+    def _observe_page(self, page: List[Dict[str, Any]], qvf_fields: List[str]) -> None:
+        """Keep write fingerprints in line with the loaded work items."""
+        for item in page:
+            item_fields = item.get("fields", {})
+            self.fingerprint_store.observe(
+                item["id"],
+                item.get("rev"),
+                {name: item_fields.get(name) for name in qvf_fields} if qvf_fields else None
+            )
+    
+    @staticmethod
+    def _latest_changed_date(
+        work_items: List[Dict[str, Any]],
+        current: Optional[datetime]
+    ) -> Optional[datetime]:
+        """Advance a watermark to the newest System.ChangedDate in work items."""
+        for item in work_items:
+            changed_date = parse_ado_datetime(item.get("fields", {}).get("System.ChangedDate"))
+            if changed_date is None:
+                continue
+            if current is None or changed_date > current:
+                current = changed_date
+        return current
+    
     async def update_work_item_scores(
         self,
         project_name: str,
         work_item_scores: Dict[int, Union[QVFWorkItemScore, Dict[str, Any]]],
         configuration_id: Optional[str] = None,
         batch_size: Optional[int] = None,
-        validate_scores: bool = True
+        validate_scores: bool = True,
+        skip_unchanged: bool = True
     ) -> UpdateResult:
         """Update QVF scores for multiple work items.
         
+        With skip_unchanged, scores are compared against the fingerprint
+        store: items whose QVF fields already hold the new values are not
+        written, and changed items only send the fields that changed.
+        
         Args:
             project_name: Name of the ADO project
             work_item_scores: Dictionary mapping work item IDs to QVF scores
             configuration_id: QVF configuration ID (added to all updates)
             batch_size: Batch size for updates (uses instance default if None)
             validate_scores: Whether to validate scores before updating
+            skip_unchanged: Whether to suppress writes of unchanged fields
             
         Returns:
             UpdateResult containing detailed operation results
@@ -586,8 +939,27 @@ class WorkItemManager:
             logger.info(f"Score validation completed: {len(validated_scores)}/{len(normalized_scores)} valid")
             normalized_scores = validated_scores
         
+        # Drop items and fields whose values ADO already holds
+        field_updates = {
+            work_item_id: score.to_field_updates()
+            for work_item_id, score in normalized_scores.items()
+        }
+        skipped_ids = set()
+        
+        if skip_unchanged:
+            for work_item_id in list(field_updates):
+                changed = self.fingerprint_store.changed_fields(work_item_id, field_updates[work_item_id])
+                if changed:
+                    field_updates[work_item_id] = changed
+                else:
+                    del field_updates[work_item_id]
+                    skipped_ids.add(work_item_id)
+            
+            if skipped_ids:
+                logger.info(f"Skipping {len(skipped_ids)} work items with unchanged QVF fields")
+        
         # Create batches
-        work_item_ids = list(normalized_scores.keys())
+        work_item_ids = list(field_updates.keys())
         batches = []
         
         for batch_start in range(0, len(work_item_ids), batch_size):
@@ -600,7 +972,8 @@ class WorkItemManager:
                 batch_id=f"batch_{batch_start//batch_size + 1}",
                 project_name=project_name,
                 work_item_scores=batch_scores,
-                batch_size=len(batch_ids)
+                batch_size=len(batch_ids),
+                field_updates={wid: field_updates[wid] for wid in batch_ids}
             )
             
             batches.append(batch)
@@ -619,7 +992,8 @@ class WorkItemManager:
                 total_items=len(work_item_scores),
                 successful_updates=total_successful,
                 failed_updates=total_failed,
-                processing_time_seconds=execution_time
+                processing_time_seconds=execution_time,
+                skipped_work_item_ids=skipped_ids
             )
             
             # Add batch results
@@ -628,6 +1002,7 @@ class WorkItemManager:
             
             # Update statistics
             self._operation_stats["work_items_updated"] += total_successful
+            self._operation_stats["writes_skipped"] += len(skipped_ids)
             self._operation_stats["batches_processed"] += len(processed_batches)
             self._operation_stats["total_operation_time"] += execution_time
             
@@ -719,6 +1094,11 @@ class WorkItemManager:
     async def _process_batches(self, batches: List[WorkItemUpdateBatch]) -> List[WorkItemUpdateBatch]:
         """Process work item update batches.
         
+        Batches run concurrently. Each one is written as a single $batch
+        request (split at 200 items), and the custom fields manager's client
+        keeps the requests within the rate limit and concurrency cap.
+        Written values and revisions are merged into the mirror, if any.
+        
         Args:
             batches: List of work item update batches
             
@@ -727,10 +1107,9 @@ class WorkItemManager:
         """
         logger.info(f"Processing {len(batches)} work item update batches")
         
-        processed_batches = []
+        written: Dict[str, Dict[int, Tuple[Dict[str, Any], Optional[int]]]] = {}
         
-        # Process batches sequentially to avoid overwhelming the API
-        for i, batch in enumerate(batches):
+        async def process_batch(i: int, batch: WorkItemUpdateBatch) -> WorkItemUpdateBatch:
             logger.debug(f"Processing batch {i+1}/{len(batches)} with {batch.total_items} items")
             
             batch.mark_started()
@@ -739,18 +1118,26 @@ class WorkItemManager:
                 # Convert QVF scores to field updates
                 field_updates = {}
                 for work_item_id, score in batch.work_item_scores.items():
-                    field_updates[work_item_id] = score.to_field_updates()
+                    field_updates[work_item_id] = batch.field_updates.get(work_item_id) or score.to_field_updates()
                 
                 # Update work items via custom fields manager
                 update_results = await self.fields_manager.update_work_item_scores(
                     batch.project_name,
-                    field_updates
+                    field_updates,
+                    batch_size=max(batch.total_items, 1)
                 )
                 
                 # Process results
                 for work_item_id, result in update_results.items():
                     if result.is_successful:
                         batch.add_success(work_item_id)
+                        
+                        response = result.ado_response
+                        rev = response.get("rev") if isinstance(response, dict) else None
+                        self.fingerprint_store.record(work_item_id, field_updates.get(work_item_id, {}), rev=rev)
+                        written.setdefault(batch.project_name, {})[work_item_id] = (
+                            field_updates.get(work_item_id, {}), rev
+                        )
                     else:
                         error_msg = "; ".join(result.errors) if result.errors else "Unknown error"
                         batch.add_failure(work_item_id, error_msg)
@@ -762,13 +1149,17 @@ class WorkItemManager:
                     batch.add_failure(work_item_id, f"Batch processing error: {str(e)}")
             
             batch.mark_completed()
-            processed_batches.append(batch)
+            return batch
             
-            # Brief pause between batches
-            if i < len(batches) - 1:
-                await asyncio.sleep(0.1)
+        processed_batches = await asyncio.gather(
+            *[process_batch(i, batch) for i, batch in enumerate(batches)]
+        )
+        
+        if self.mirror is not None:
+            for project_name, updates in written.items():
+                self.mirror.merge_fields(project_name, updates)
         
-        return processed_batches
+        return list(processed_batches)
     
     async def get_work_item_qvf_history(
         self,
@@ -20,12 +20,12 @@ Components:
 Usage:
     from datascience_platform.qvf.ai import OllamaManager, SemanticAnalyzer
     
-    # Initialize with automatic fallback
-    ollama = OllamaManager()
-    analyzer = SemanticAnalyzer(ollama_manager=ollama)
-    
-    # Analyze work item (falls back to math if AI unavailable)
-    analysis = analyzer.analyze_work_item(work_item)
+    # Initialize with automatic fallback; the with block releases pooled connections
+    with OllamaManager() as ollama:
+        analyzer = SemanticAnalyzer(ollama_manager=ollama)
+        
+        # Analyze work item (falls back to math if AI unavailable)
+        analysis = analyzer.analyze_work_item(work_item)
 """
 
 from .ollama_manager import OllamaManager, OllamaHealth
@@ -9,6 +9,7 @@ Key Features:
 - Model management and selection
 - Health monitoring with automatic reconnection
 - Async operations for non-blocking inference
+- Pooled keep-alive HTTP connections for sync and async requests
 - Response caching to reduce redundant calls
 - Graceful degradation when service unavailable
 
@@ -107,6 +108,11 @@ class OllamaManager:
     This class provides a high-level interface for interacting with Ollama,
     including connection management, model selection, health monitoring,
     and caching for performance optimization.
+    
+    HTTP connections are pooled: sync calls share one requests.Session and
+    async calls share one aiohttp.ClientSession, both created on first use.
+    Sync callers release them with close() or a with block; async callers
+    with aclose() or an async with block.
     """
     
     def __init__(self, 
@@ -114,7 +120,9 @@ class OllamaManager:
                  timeout: float = 30.0,
                  max_retries: int = 3,
                  cache_dir: Optional[Path] = None,
-                 cache_ttl: int = 3600):
+                 cache_ttl: int = 3600,
+                 max_connections: int = 8,
+                 keepalive_timeout: float = 60.0):
         """Initialize Ollama manager.
         
         Args:
@@ -123,11 +131,20 @@ class OllamaManager:
             max_retries: Maximum connection retries
             cache_dir: Directory for response caching
             cache_ttl: Cache time-to-live in seconds
+            max_connections: Size of the HTTP connection pools
+            keepalive_timeout: Seconds idle async connections are kept open
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.max_retries = max_retries
         self.cache_ttl = cache_ttl
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        
+        # Pooled HTTP sessions, created on first use
+        self._sync_session: Optional[requests.Session] = None
+        # aiohttp sessions are bound to the event loop they were created on
+        self._async_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
         
         # Initialize cache
         if cache_dir is None:
@@ -150,6 +167,87 @@ class OllamaManager:
         # Initialize connection
         self._check_health()
     
+    def __enter__(self) -> 'OllamaManager':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    async def __aenter__(self) -> 'OllamaManager':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+    
+    @property
+    def session(self) -> requests.Session:
+        """Pooled requests session for sync calls."""
+        if self._sync_session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.max_connections)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._sync_session = session
+        return self._sync_session
+    
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """Pooled aiohttp session for async calls on the running event loop."""
+        loop = asyncio.get_running_loop()
+        
+        session = self._async_sessions.get(loop)
+        if session is not None and not session.closed:
+            return session
+        
+        # Sessions of loops that have since closed can no longer be used or closed
+        for stale_loop in [stale for stale in self._async_sessions if stale.is_closed()]:
+            logger.debug("Dropping Ollama HTTP session of a closed event loop")
+            del self._async_sessions[stale_loop]
+        
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        self._async_sessions[loop] = session
+        return session
+    
+    def close(self) -> None:
+        """Close the pooled requests session used by sync calls.
+        
+        aiohttp sessions can only be closed on an event loop; use aclose()
+        when the manager was also used for async calls.
+        """
+        if self._sync_session is not None:
+            self._sync_session.close()
+            self._sync_session = None
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP sessions, sync and async.
+        
+        Sessions created on other event loops are closed on their own loop
+        while it is running; sessions of idle loops are kept until aclose()
+        is called on that loop.
+        """
+        current_loop = asyncio.get_running_loop()
+        sessions, self._async_sessions = self._async_sessions, {}
+        
+        for loop, session in sessions.items():
+            if session.closed or loop.is_closed():
+                continue
+            if loop is current_loop:
+                await session.close()
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+            else:
+                # Keep it so aclose() on its own loop can still release it
+                self._async_sessions[loop] = session
+        
+        self.close()
+    
     def is_available(self) -> bool:
         """Check if Ollama is available and healthy."""
         if (datetime.now() - self._last_health_check) > self._health_check_interval:
@@ -188,7 +286,7 @@ class OllamaManager:
                 return
             
             # Test API connection
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/tags",
                 timeout=5.0
             )
@@ -384,7 +482,7 @@ class OllamaManager:
         # Make API request
         start_time = time.time()
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json=request.to_dict(),
                 timeout=self.timeout
@@ -467,41 +565,41 @@ class OllamaManager:
         # Make async API request
         start_time = time.time()
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                async with session.post(
-                    f"{self.base_url}/api/generate",
-                    json=request.to_dict()
-                ) as response:
-                    if response.status == 200:
-                        result_data = await response.json()
-                        
-                        inference_response = InferenceResponse(
-                            model=result_data.get("model", model),
-                            response=result_data.get("response", ""),
-                            context=result_data.get("context"),
-                            total_duration=result_data.get("total_duration"),
-                            load_duration=result_data.get("load_duration"),
-                            prompt_eval_count=result_data.get("prompt_eval_count"),
-                            prompt_eval_duration=result_data.get("prompt_eval_duration"),
-                            eval_count=result_data.get("eval_count"),
-                            eval_duration=result_data.get("eval_duration"),
-                            done=result_data.get("done", True)
-                        )
-                        
-                        # Update performance metrics
-                        inference_time = time.time() - start_time
-                        self._request_count += 1
-                        self._total_inference_time += inference_time
-                        
-                        # Cache successful response
-                        if use_cache:
-                            self._cache_response(cache_key, inference_response)
-                        
-                        return inference_response
-                    else:
-                        logger.error(f"Async Ollama API error: {response.status}")
-                        return None
-                        
+            session = self._get_async_session()
+            async with session.post(
+                f"{self.base_url}/api/generate",
+                json=request.to_dict()
+            ) as response:
+                if response.status == 200:
+                    result_data = await response.json()
+                    
+                    inference_response = InferenceResponse(
+                        model=result_data.get("model", model),
+                        response=result_data.get("response", ""),
+                        context=result_data.get("context"),
+                        total_duration=result_data.get("total_duration"),
+                        load_duration=result_data.get("load_duration"),
+                        prompt_eval_count=result_data.get("prompt_eval_count"),
+                        prompt_eval_duration=result_data.get("prompt_eval_duration"),
+                        eval_count=result_data.get("eval_count"),
+                        eval_duration=result_data.get("eval_duration"),
+                        done=result_data.get("done", True)
+                    )
+                    
+                    # Update performance metrics
+                    inference_time = time.time() - start_time
+                    self._request_count += 1
+                    self._total_inference_time += inference_time
+                    
+                    # Cache successful response
+                    if use_cache:
+                        self._cache_response(cache_key, inference_response)
+                    
+                    return inference_response
+                else:
+                    logger.error(f"Async Ollama API error: {response.status}")
+                    return None
+                    
         except asyncio.TimeoutError:
             logger.error(f"Async Ollama request timeout after {self.timeout}s")
             return None
@@ -517,7 +615,7 @@ class OllamaManager:
         
         try:
             logger.info(f"Pulling model: {model_name}")
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/pull",
                 json={"name": model_name},
                 timeout=300.0  # Model pulls can take a while
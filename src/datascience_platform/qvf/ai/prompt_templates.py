@@ -10,6 +10,7 @@ Key Features:
 - Domain-specific context for Agile/SAFe environments
 - Temperature and parameter optimization
 - Response validation patterns
+- Combined multi-analysis prompts that send the work item once
 """
 
 from typing import Dict, List, Optional, Any
@@ -115,382 +116,407 @@ Key principles:
 Provide structured stakeholder impact assessment."""
     }
 
-    @classmethod
-    def get_business_value_prompt(cls, work_item: Dict[str, Any]) -> str:
-        """Generate business value analysis prompt."""
-        title = work_item.get('title', 'N/A')
-        description = work_item.get('description', 'N/A')
-        acceptance_criteria = work_item.get('acceptance_criteria', 'N/A')
-        
-        return f"""Analyze the business value of this work item:
-
-**Title:** {title}
-**Description:** {description}
-**Acceptance Criteria:** {acceptance_criteria}
-
-Please provide a structured analysis in the following JSON format:
-
-{{
+    # Expected JSON response format for each analysis type
+    RESPONSE_FORMATS = {
+        AnalysisType.BUSINESS_VALUE: """{
     "business_value_score": <1-10 integer score>,
     "value_drivers": [
-        {{
+        {
             "driver": "<specific value driver>",
             "impact": "<High/Medium/Low>",
             "rationale": "<explanation>"
-        }}
+        }
     ],
-    "customer_impact": {{
+    "customer_impact": {
         "direct_impact": "<description>",
         "indirect_impact": "<description>",
         "impact_timeline": "<Immediate/Short-term/Long-term>"
-    }},
-    "revenue_potential": {{
+    },
+    "revenue_potential": {
         "revenue_category": "<Revenue Generation/Cost Reduction/Risk Mitigation/Strategic>",
         "confidence": "<High/Medium/Low>",
         "rationale": "<explanation>"
-    }},
-    "competitive_advantage": {{
+    },
+    "competitive_advantage": {
         "provides_advantage": <true/false>,
         "advantage_type": "<Feature Parity/Differentiation/Innovation>",
         "sustainability": "<High/Medium/Low>"
-    }},
+    },
     "key_insights": [
         "<insight 1>",
         "<insight 2>",
         "<insight 3>"
     ],
     "confidence_level": <1-10 integer score>
-}}
-
-Focus on measurable business outcomes and be specific in your analysis."""
-
-    @classmethod
-    def get_strategic_alignment_prompt(cls, work_item: Dict[str, Any], strategic_context: Optional[Dict] = None) -> str:
-        """Generate strategic alignment analysis prompt."""
-        title = work_item.get('title', 'N/A')
-        description = work_item.get('description', 'N/A')
-        
-        context_section = ""
-        if strategic_context:
-            pi_objectives = strategic_context.get('pi_objectives', [])
-            business_outcomes = strategic_context.get('business_outcomes', [])
-            
-            if pi_objectives:
-                context_section += f"\n**PI Objectives:** {', '.join(pi_objectives)}"
-            if business_outcomes:
-                context_section += f"\n**Business Outcomes:** {', '.join(business_outcomes)}"
+}""",
         
-        return f"""Analyze the strategic alignment of this work item:
-
-**Title:** {title}
-**Description:** {description}{context_section}
-
-Please provide a structured analysis in the following JSON format:
-
-{{
+        AnalysisType.STRATEGIC_ALIGNMENT: """{
     "strategic_alignment_score": <1-10 integer score>,
     "alignment_factors": [
-        {{
+        {
             "factor": "<strategic factor>",
             "alignment_strength": "<Strong/Moderate/Weak>",
             "rationale": "<explanation>"
-        }}
+        }
     ],
     "pi_objective_alignment": [
-        {{
+        {
             "objective": "<PI objective>",
             "contribution_level": "<High/Medium/Low>",
             "contribution_type": "<Direct/Indirect/Enabling>"
-        }}
+        }
     ],
     "business_outcome_impact": [
-        {{
+        {
             "outcome": "<business outcome>",
             "impact_type": "<Accelerates/Enables/Supports>",
             "impact_magnitude": "<High/Medium/Low>"
-        }}
+        }
     ],
-    "architectural_alignment": {{
+    "architectural_alignment": {
         "supports_target_architecture": <true/false>,
         "architectural_impact": "<Positive/Neutral/Negative>",
         "technical_debt_impact": "<Reduces/Neutral/Increases>"
-    }},
-    "portfolio_coherence": {{
+    },
+    "portfolio_coherence": {
         "fits_portfolio_strategy": <true/false>,
         "synergy_opportunities": ["<opportunity 1>", "<opportunity 2>"],
         "dependency_alignment": "<Well-aligned/Moderately-aligned/Poorly-aligned>"
-    }},
+    },
     "key_insights": [
         "<insight 1>",
         "<insight 2>",
         "<insight 3>"
     ],
     "confidence_level": <1-10 integer score>
-}}
-
-Focus on how this work item advances strategic objectives and business outcomes."""
-
-    @classmethod
-    def get_risk_assessment_prompt(cls, work_item: Dict[str, Any]) -> str:
-        """Generate risk assessment prompt."""
-        title = work_item.get('title', 'N/A')
-        description = work_item.get('description', 'N/A')
-        dependencies = work_item.get('dependencies', 'N/A')
+}""",
         
-        return f"""Analyze the risks associated with this work item:
-
-**Title:** {title}
-**Description:** {description}
-**Dependencies:** {dependencies}
-
-Please provide a structured analysis in the following JSON format:
-
-{{
+        AnalysisType.RISK_ASSESSMENT: """{
     "overall_risk_score": <1-10 integer score>,
     "risk_factors": [
-        {{
+        {
             "risk_category": "<Technical/Business/Operational/External>",
             "risk_description": "<specific risk>",
             "probability": "<High/Medium/Low>",
             "impact": "<High/Medium/Low>",
             "risk_score": <1-10 integer>,
             "mitigation_strategies": ["<strategy 1>", "<strategy 2>"]
-        }}
+        }
     ],
     "technical_risks": [
-        {{
+        {
             "risk": "<technical risk>",
             "complexity_factor": "<High/Medium/Low>",
             "skill_availability": "<Available/Limited/Unavailable>",
             "technology_maturity": "<Mature/Emerging/Experimental>"
-        }}
+        }
     ],
     "business_risks": [
-        {{
+        {
             "risk": "<business risk>",
             "market_impact": "<High/Medium/Low>",
             "stakeholder_impact": "<High/Medium/Low>",
             "timeline_sensitivity": "<Critical/Important/Flexible>"
-        }}
+        }
     ],
     "dependency_risks": [
-        {{
+        {
             "dependency": "<dependency>",
             "dependency_risk": "<High/Medium/Low>",
             "impact_if_delayed": "<High/Medium/Low>",
             "mitigation_options": ["<option 1>", "<option 2>"]
-        }}
+        }
     ],
-    "risk_mitigation_plan": {{
+    "risk_mitigation_plan": {
         "primary_mitigations": ["<mitigation 1>", "<mitigation 2>"],
         "contingency_plans": ["<plan 1>", "<plan 2>"],
         "monitoring_indicators": ["<indicator 1>", "<indicator 2>"]
-    }},
+    },
     "confidence_level": <1-10 integer score>
-}}
-
-Focus on identifying actionable risks with specific mitigation strategies."""
-
-    @classmethod
-    def get_complexity_analysis_prompt(cls, work_item: Dict[str, Any]) -> str:
-        """Generate complexity analysis prompt."""
-        title = work_item.get('title', 'N/A')
-        description = work_item.get('description', 'N/A')
-        acceptance_criteria = work_item.get('acceptance_criteria', 'N/A')
+}""",
         
-        return f"""Analyze the technical complexity of this work item:
-
-**Title:** {title}
-**Description:** {description}
-**Acceptance Criteria:** {acceptance_criteria}
-
-Please provide a structured analysis in the following JSON format:
-
-{{
+        AnalysisType.COMPLEXITY_ANALYSIS: """{
     "complexity_score": <1-10 integer score>,
     "complexity_factors": [
-        {{
+        {
             "factor": "<complexity factor>",
             "complexity_level": "<High/Medium/Low>",
             "rationale": "<explanation>",
             "effort_multiplier": <decimal multiplier>
-        }}
+        }
     ],
-    "technical_complexity": {{
+    "technical_complexity": {
         "algorithmic_complexity": "<High/Medium/Low>",
         "integration_complexity": "<High/Medium/Low>",
         "data_complexity": "<High/Medium/Low>",
         "ui_complexity": "<High/Medium/Low>",
         "infrastructure_complexity": "<High/Medium/Low>"
-    }},
+    },
     "skill_requirements": [
-        {{
+        {
             "skill": "<required skill>",
             "proficiency_level": "<Expert/Advanced/Intermediate/Basic>",
             "availability": "<Available/Limited/Unavailable>",
             "learning_curve": "<Steep/Moderate/Gentle>"
-        }}
+        }
     ],
-    "effort_estimation": {{
+    "effort_estimation": {
         "base_effort": "<story points or days>",
         "complexity_multiplier": <decimal>,
         "adjusted_effort": "<adjusted estimate>",
         "confidence": "<High/Medium/Low>"
-    }},
+    },
     "implementation_challenges": [
-        {{
+        {
             "challenge": "<specific challenge>",
             "difficulty": "<High/Medium/Low>",
             "solution_approach": "<suggested approach>"
-        }}
+        }
     ],
-    "testing_complexity": {{
+    "testing_complexity": {
         "unit_testing": "<High/Medium/Low>",
         "integration_testing": "<High/Medium/Low>",
         "performance_testing": "<Required/Optional/Not-needed>",
         "user_acceptance_testing": "<Complex/Standard/Simple>"
-    }},
+    },
     "key_insights": [
         "<insight 1>",
         "<insight 2>",
         "<insight 3>"
     ],
     "confidence_level": <1-10 integer score>
-}}
-
-Focus on technical factors that impact implementation effort and success."""
-
-    @classmethod
-    def get_financial_impact_prompt(cls, work_item: Dict[str, Any]) -> str:
-        """Generate financial impact analysis prompt."""
-        title = work_item.get('title', 'N/A')
-        description = work_item.get('description', 'N/A')
+}""",
         
-        return f"""Analyze the financial impact of this work item:
-
-**Title:** {title}
-**Description:** {description}
-
-Please provide a structured analysis in the following JSON format:
-
-{{
+        AnalysisType.FINANCIAL_IMPACT: """{
     "financial_impact_score": <1-10 integer score>,
-    "revenue_impact": {{
+    "revenue_impact": {
         "revenue_type": "<Direct Revenue/Revenue Enabler/Revenue Protection/Cost Avoidance>",
         "impact_magnitude": "<High/Medium/Low>",
         "timeline": "<Immediate/Short-term/Medium-term/Long-term>",
         "confidence": "<High/Medium/Low>",
         "rationale": "<explanation>"
-    }},
-    "cost_impact": {{
+    },
+    "cost_impact": {
         "cost_category": "<Development/Operational/Maintenance/Infrastructure>",
         "cost_change": "<Increase/Decrease/Neutral>",
         "magnitude": "<High/Medium/Low>",
         "recurring": <true/false>
-    }},
+    },
     "roi_indicators": [
-        {{
+        {
             "indicator": "<ROI indicator>",
             "measurement": "<how to measure>",
             "expected_value": "<expected outcome>",
             "timeframe": "<when to measure>"
-        }}
+        }
     ],
-    "investment_requirements": {{
+    "investment_requirements": {
         "development_cost": "<High/Medium/Low/Unknown>",
         "infrastructure_cost": "<High/Medium/Low/None>",
         "training_cost": "<High/Medium/Low/None>",
         "ongoing_costs": "<High/Medium/Low/None>"
-    }},
+    },
     "financial_risks": [
-        {{
+        {
             "risk": "<financial risk>",
             "probability": "<High/Medium/Low>",
             "potential_impact": "<cost/revenue impact>",
             "mitigation": "<mitigation strategy>"
-        }}
+        }
     ],
-    "business_case_strength": {{
+    "business_case_strength": {
         "payback_period": "<Quick/Moderate/Long/Unknown>",
         "business_justification": "<Strong/Moderate/Weak>",
         "financial_certainty": "<High/Medium/Low>"
-    }},
+    },
     "key_insights": [
         "<insight 1>",
         "<insight 2>",
         "<insight 3>"
     ],
     "confidence_level": <1-10 integer score>
-}}
-
-Focus on quantifiable financial impacts and business value creation."""
-
-    @classmethod
-    def get_stakeholder_impact_prompt(cls, work_item: Dict[str, Any]) -> str:
-        """Generate stakeholder impact analysis prompt."""
-        title = work_item.get('title', 'N/A')
-        description = work_item.get('description', 'N/A')
+}""",
         
-        return f"""Analyze the stakeholder impact of this work item:
-
-**Title:** {title}
-**Description:** {description}
-
-Please provide a structured analysis in the following JSON format:
-
-{{
+        AnalysisType.STAKEHOLDER_IMPACT: """{
     "stakeholder_impact_score": <1-10 integer score>,
     "affected_stakeholders": [
-        {{
+        {
             "stakeholder_group": "<stakeholder group>",
             "impact_type": "<Positive/Negative/Mixed>",
             "impact_magnitude": "<High/Medium/Low>",
             "impact_description": "<specific impact>",
             "change_required": "<High/Medium/Low/None>"
-        }}
+        }
     ],
-    "customer_impact": {{
-        "external_customers": {{
+    "customer_impact": {
+        "external_customers": {
             "impact_type": "<Positive/Negative/Neutral>",
             "impact_areas": ["<area 1>", "<area 2>"],
             "adoption_effort": "<High/Medium/Low>"
-        }},
-        "internal_customers": {{
+        },
+        "internal_customers": {
             "impact_type": "<Positive/Negative/Neutral>",
             "affected_teams": ["<team 1>", "<team 2>"],
             "workflow_changes": "<Major/Minor/None>"
-        }}
-    }},
-    "organizational_impact": {{
+        }
+    },
+    "organizational_impact": {
         "process_changes": ["<process change 1>", "<process change 2>"],
         "skill_development_needs": ["<skill 1>", "<skill 2>"],
         "cultural_impact": "<High/Medium/Low>",
         "communication_complexity": "<High/Medium/Low>"
-    }},
-    "change_management": {{
+    },
+    "change_management": {
         "change_readiness": "<High/Medium/Low>",
         "resistance_factors": ["<factor 1>", "<factor 2>"],
         "success_factors": ["<factor 1>", "<factor 2>"],
         "communication_strategy": "<Complex/Standard/Simple>"
-    }},
-    "support_requirements": {{
+    },
+    "support_requirements": {
         "training_needed": "<Extensive/Moderate/Minimal/None>",
         "documentation_updates": "<Extensive/Moderate/Minimal/None>",
         "ongoing_support": "<High/Medium/Low>",
         "transition_support": "<Complex/Standard/Simple>"
-    }},
-    "stakeholder_alignment": {{
+    },
+    "stakeholder_alignment": {
         "consensus_level": "<High/Medium/Low>",
         "conflicting_interests": ["<conflict 1>", "<conflict 2>"],
         "alignment_strategies": ["<strategy 1>", "<strategy 2>"]
-    }},
+    },
     "key_insights": [
         "<insight 1>",
         "<insight 2>",
         "<insight 3>"
     ],
     "confidence_level": <1-10 integer score>
-}}
+}"""
+    }
+    
+    # Fields a response must contain to be accepted for each analysis type
+    REQUIRED_FIELDS = {
+        AnalysisType.BUSINESS_VALUE: ["business_value_score", "value_drivers", "confidence_level"],
+        AnalysisType.STRATEGIC_ALIGNMENT: ["strategic_alignment_score", "alignment_factors", "confidence_level"],
+        AnalysisType.RISK_ASSESSMENT: ["overall_risk_score", "risk_factors", "confidence_level"],
+        AnalysisType.COMPLEXITY_ANALYSIS: ["complexity_score", "complexity_factors", "confidence_level"],
+        AnalysisType.FINANCIAL_IMPACT: ["financial_impact_score", "revenue_impact", "confidence_level"],
+        AnalysisType.STAKEHOLDER_IMPACT: ["stakeholder_impact_score", "affected_stakeholders", "confidence_level"]
+    }
+    
+    @classmethod
+    def get_business_value_prompt(cls, work_item: Dict[str, Any]) -> str:
+        """Generate business value analysis prompt."""
+        title = work_item.get('title', 'N/A')
+        description = work_item.get('description', 'N/A')
+        acceptance_criteria = work_item.get('acceptance_criteria', 'N/A')
+        
+        return f"""Analyze the business value of this work item:
+
+**Title:** {title}
+**Description:** {description}
+**Acceptance Criteria:** {acceptance_criteria}
+
+Please provide a structured analysis in the following JSON format:
+
+{cls.RESPONSE_FORMATS[AnalysisType.BUSINESS_VALUE]}
+
+Focus on measurable business outcomes and be specific in your analysis."""
+
+    @classmethod
+    def get_strategic_alignment_prompt(cls, work_item: Dict[str, Any], strategic_context: Optional[Dict] = None) -> str:
+        """Generate strategic alignment analysis prompt."""
+        title = work_item.get('title', 'N/A')
+        description = work_item.get('description', 'N/A')
+        
+        context_section = ""
+        if strategic_context:
+            pi_objectives = strategic_context.get('pi_objectives', [])
+            business_outcomes = strategic_context.get('business_outcomes', [])
+            
+            if pi_objectives:
+                context_section += f"\n**PI Objectives:** {', '.join(pi_objectives)}"
+            if business_outcomes:
+                context_section += f"\n**Business Outcomes:** {', '.join(business_outcomes)}"
+        
+        return f"""Analyze the strategic alignment of this work item:
+
+**Title:** {title}
+**Description:** {description}{context_section}
+
+Please provide a structured analysis in the following JSON format:
+
+{cls.RESPONSE_FORMATS[AnalysisType.STRATEGIC_ALIGNMENT]}
+
+Focus on how this work item advances strategic objectives and business outcomes."""
+
+    @classmethod
+    def get_risk_assessment_prompt(cls, work_item: Dict[str, Any]) -> str:
+        """Generate risk assessment prompt."""
+        title = work_item.get('title', 'N/A')
+        description = work_item.get('description', 'N/A')
+        dependencies = work_item.get('dependencies', 'N/A')
+        
+        return f"""Analyze the risks associated with this work item:
+
+**Title:** {title}
+**Description:** {description}
+**Dependencies:** {dependencies}
+
+Please provide a structured analysis in the following JSON format:
+
+{cls.RESPONSE_FORMATS[AnalysisType.RISK_ASSESSMENT]}
+
+Focus on identifying actionable risks with specific mitigation strategies."""
+
+    @classmethod
+    def get_complexity_analysis_prompt(cls, work_item: Dict[str, Any]) -> str:
+        """Generate complexity analysis prompt."""
+        title = work_item.get('title', 'N/A')
+        description = work_item.get('description', 'N/A')
+        acceptance_criteria = work_item.get('acceptance_criteria', 'N/A')
+        
+        return f"""Analyze the technical complexity of this work item:
+
+**Title:** {title}
+**Description:** {description}
+**Acceptance Criteria:** {acceptance_criteria}
+
+Please provide a structured analysis in the following JSON format:
+
+{cls.RESPONSE_FORMATS[AnalysisType.COMPLEXITY_ANALYSIS]}
+
+Focus on technical factors that impact implementation effort and success."""
+
+    @classmethod
+    def get_financial_impact_prompt(cls, work_item: Dict[str, Any]) -> str:
+        """Generate financial impact analysis prompt."""
+        title = work_item.get('title', 'N/A')
+        description = work_item.get('description', 'N/A')
+        
+        return f"""Analyze the financial impact of this work item:
+
+**Title:** {title}
+**Description:** {description}
+
+Please provide a structured analysis in the following JSON format:
+
+{cls.RESPONSE_FORMATS[AnalysisType.FINANCIAL_IMPACT]}
+
+Focus on quantifiable financial impacts and business value creation."""
+
+    @classmethod
+    def get_stakeholder_impact_prompt(cls, work_item: Dict[str, Any]) -> str:
+        """Generate stakeholder impact analysis prompt."""
+        title = work_item.get('title', 'N/A')
+        description = work_item.get('description', 'N/A')
+        
+        return f"""Analyze the stakeholder impact of this work item:
+
+**Title:** {title}
+**Description:** {description}
+
+Please provide a structured analysis in the following JSON format:
+
+{cls.RESPONSE_FORMATS[AnalysisType.STAKEHOLDER_IMPACT]}
 
 Focus on identifying all affected parties and their specific impacts."""
 
@@ -564,6 +590,81 @@ Focus on identifying all affected parties and their specific impacts."""
         else:
             raise ValueError(f"Unknown analysis type: {analysis_type}")
 
+    @classmethod
+    def get_multi_analysis_system_prompt(cls, analysis_types: List[AnalysisType]) -> str:
+        """Get system prompt for analyzing several types in one response."""
+        sections = [
+            "You are a QVF analyst for Agile Release Trains. You perform several analyses "
+            "of the same work item and return them together in a single JSON object."
+        ]
+        for analysis_type in analysis_types:
+            sections.append(f"## {analysis_type.value}\n{cls.get_system_prompt(analysis_type)}")
+        
+        return "\n\n".join(sections)
+    
+    @classmethod
+    def get_multi_analysis_prompt(cls,
+                                analysis_types: List[AnalysisType],
+                                work_item: Dict[str, Any],
+                                context: Optional[Dict[str, Any]] = None) -> str:
+        """Get a single prompt requesting every analysis type for a work item.
+        
+        The work item is described once and the response is a JSON object keyed by
+        analysis type value, each section following that type's response format.
+        """
+        lines = [
+            f"**Title:** {work_item.get('title', 'N/A')}",
+            f"**Description:** {work_item.get('description', 'N/A')}"
+        ]
+        if {AnalysisType.BUSINESS_VALUE, AnalysisType.COMPLEXITY_ANALYSIS} & set(analysis_types):
+            lines.append(f"**Acceptance Criteria:** {work_item.get('acceptance_criteria', 'N/A')}")
+        if AnalysisType.RISK_ASSESSMENT in analysis_types:
+            lines.append(f"**Dependencies:** {work_item.get('dependencies', 'N/A')}")
+        if AnalysisType.STRATEGIC_ALIGNMENT in analysis_types and context:
+            if context.get('pi_objectives'):
+                lines.append(f"**PI Objectives:** {', '.join(context['pi_objectives'])}")
+            if context.get('business_outcomes'):
+                lines.append(f"**Business Outcomes:** {', '.join(context['business_outcomes'])}")
+        
+        work_item_section = "\n".join(lines)
+        sections = ",\n".join(
+            f'"{analysis_type.value}": {cls.RESPONSE_FORMATS[analysis_type]}'
+            for analysis_type in analysis_types
+        )
+        analysis_names = ", ".join(analysis_type.value for analysis_type in analysis_types)
+        
+        return f"""Analyze this work item for each of the following: {analysis_names}
+
+{work_item_section}
+
+Please provide a single JSON object with one key per analysis, each following its format:
+
+{{
+{sections}
+}}
+
+Return every requested analysis, with specific insights for each."""
+    
+    @classmethod
+    def get_multi_analysis_options(cls, analysis_types: List[AnalysisType]) -> Dict[str, Any]:
+        """Get Ollama options for a combined analysis.
+        
+        Uses the most conservative temperature of the requested types and enough
+        tokens for every section of the response.
+        """
+        type_options = [cls.get_default_options(analysis_type) for analysis_type in analysis_types]
+        options = dict(type_options[0])
+        options["temperature"] = min(option["temperature"] for option in type_options)
+        options["num_predict"] = sum(option.get("num_predict", 1000) for option in type_options)
+        return options
+    
+    @classmethod
+    def has_required_fields(cls, data: Any, analysis_type: AnalysisType) -> bool:
+        """Check that parsed response data contains the fields required for the analysis type."""
+        if not isinstance(data, dict):
+            return False
+        return all(field in data for field in cls.REQUIRED_FIELDS.get(analysis_type, []))
+    
     @classmethod
     def validate_response_format(cls, response: str, analysis_type: AnalysisType) -> bool:
         """Validate that response matches expected JSON format."""
@@ -572,17 +673,8 @@ Focus on identifying all affected parties and their specific impacts."""
             data = json.loads(response)
             
             # Check for required fields based on analysis type
-            required_fields = {
-                AnalysisType.BUSINESS_VALUE: ["business_value_score", "value_drivers", "confidence_level"],
-                AnalysisType.STRATEGIC_ALIGNMENT: ["strategic_alignment_score", "alignment_factors", "confidence_level"],
-                AnalysisType.RISK_ASSESSMENT: ["overall_risk_score", "risk_factors", "confidence_level"],
-                AnalysisType.COMPLEXITY_ANALYSIS: ["complexity_score", "complexity_factors", "confidence_level"],
-                AnalysisType.FINANCIAL_IMPACT: ["financial_impact_score", "revenue_impact", "confidence_level"],
-                AnalysisType.STAKEHOLDER_IMPACT: ["stakeholder_impact_score", "affected_stakeholders", "confidence_level"]
-            }
-            
-            fields = required_fields.get(analysis_type, [])
+            fields = cls.REQUIRED_FIELDS.get(analysis_type, [])
             return all(field in data for field in fields)
             
         except (json.JSONDecodeError, KeyError, TypeError):
-            return False
\ No newline at end of file
+            return False
@@ -6,10 +6,11 @@ indicators from work item descriptions to enhance QVF mathematical scoring.
 
 Key Features:
 - Multi-faceted work item analysis using local LLMs
+- Optional single-prompt analysis of several types per work item
 - Structured output parsing for consistent results
 - Automatic fallback to mathematical analysis
 - Caching for performance optimization
-- Batch processing for efficiency
+- Batch processing for efficiency, with bounded concurrent async batches
 - Confidence scoring and validation
 
 Architecture:
@@ -23,7 +24,7 @@ import json
 import logging
 import asyncio
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import hashlib
@@ -98,7 +99,8 @@ class SemanticAnalyzer:
                  ollama_manager: Optional[OllamaManager] = None,
                  fallback_engine: Optional[FallbackEngine] = None,
                  enable_caching: bool = True,
-                 max_concurrent: int = 5):
+                 max_concurrent: int = 5,
+                 combine_analyses: bool = False):
         """Initialize semantic analyzer.
         
         Args:
@@ -106,11 +108,15 @@ class SemanticAnalyzer:
             fallback_engine: Mathematical fallback engine
             enable_caching: Whether to cache analysis results
             max_concurrent: Maximum concurrent analyses
+            combine_analyses: Request all analysis types of a work item in one
+                prompt, falling back to per-type prompts for unparsed types
         """
         self.ollama_manager = ollama_manager or OllamaManager()
+        self._owns_ollama_manager = ollama_manager is None
         self.fallback_engine = fallback_engine or FallbackEngine()
         self.enable_caching = enable_caching
         self.max_concurrent = max_concurrent
+        self.combine_analyses = combine_analyses
         
         # Performance tracking
         self._analysis_count = 0
@@ -123,6 +129,16 @@ class SemanticAnalyzer:
         self._analysis_cache: Dict[str, SemanticAnalysisResult] = {}
         self._cache_ttl = 3600  # 1 hour TTL
     
+    def close(self) -> None:
+        """Release the HTTP connections of an Ollama manager created by this analyzer."""
+        if self._owns_ollama_manager:
+            self.ollama_manager.close()
+    
+    async def aclose(self) -> None:
+        """Async close, also releasing the async connections of an owned manager."""
+        if self._owns_ollama_manager:
+            await self.ollama_manager.aclose()
+    
     def analyze_work_item(self,
                          work_item: Dict[str, Any],
                          analysis_types: List[AnalysisType],
@@ -142,57 +158,23 @@ class SemanticAnalyzer:
         work_item_id = str(work_item.get('id', hash(str(work_item))))
         results = []
         
+        # Analyze uncached types in one request when combining is enabled
+        combined_results = self._perform_combined_ai_analysis(work_item, analysis_types, context)
+        
         for analysis_type in analysis_types:
             start_time = time.time()
+            cache_key, cached_result = self._get_cached_analysis(work_item, analysis_type, context)
+            if cached_result:
+                results.append(cached_result)
+                continue
             
             try:
-                # Check cache first
-                if self.enable_caching:
-                    cache_key = self._get_cache_key(work_item, analysis_type, context)
-                    cached_result = self._get_cached_result(cache_key)
-                    if cached_result:
-                        results.append(cached_result)
-                        continue
-                
-                # Perform analysis
-                result = self._analyze_single(work_item, analysis_type, context)
-                
-                # Cache successful result
-                if self.enable_caching and result.error_message is None:
-                    self._cache_result(cache_key, result)
-                
-                results.append(result)
-                
-                # Update metrics
-                self._analysis_count += 1
-                if result.used_ai:
-                    self._ai_analysis_count += 1
-                else:
-                    self._fallback_count += 1
-                    
-                processing_time = time.time() - start_time
-                self._total_processing_time += processing_time
-                
-                logger.debug(f"Analyzed {work_item_id} for {analysis_type.value} "
-                           f"in {processing_time:.2f}s (AI: {result.used_ai})")
-                
+                result = combined_results.get(analysis_type) or self._analyze_single(work_item, analysis_type, context)
             except Exception as e:
-                self._error_count += 1
-                logger.error(f"Analysis failed for {work_item_id}: {e}")
+                results.append(self._record_analysis(work_item_id, analysis_type, cache_key, start_time, error=e))
+                continue
                 
-                # Create error result
-                error_result = SemanticAnalysisResult(
-                    work_item_id=work_item_id,
-                    analysis_type=analysis_type,
-                    score=0.0,
-                    confidence=0.0,
-                    insights=[],
-                    structured_data={},
-                    processing_time=time.time() - start_time,
-                    used_ai=False,
-                    error_message=str(e)
-                )
-                results.append(error_result)
+            results.append(self._record_analysis(work_item_id, analysis_type, cache_key, start_time, result=result))
         
         return results
     
@@ -204,14 +186,22 @@ class SemanticAnalyzer:
         """Async version of work item analysis."""
         work_item_id = str(work_item.get('id', hash(str(work_item))))
         
-        # Create async tasks for each analysis type
+        # Analyze types in one request when combining is enabled
+        combined_results = await self._perform_combined_ai_analysis_async(work_item, analysis_types, context)
+        
+        # Create async tasks for each remaining analysis type
+        remaining_types = [analysis_type for analysis_type in analysis_types if analysis_type not in combined_results]
         tasks = []
-        for analysis_type in analysis_types:
+        for analysis_type in remaining_types:
             task = self._analyze_single_async(work_item, analysis_type, context)
             tasks.append(task)
         
         # Run analyses concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        remaining_results = dict(zip(remaining_types, await asyncio.gather(*tasks, return_exceptions=True)))
+        results = [
+            combined_results.get(analysis_type) or remaining_results[analysis_type]
+            for analysis_type in analysis_types
+        ]
         
         # Process results and handle exceptions
         processed_results = []
@@ -262,17 +252,12 @@ class SemanticAnalyzer:
         max_concurrent = max_concurrent or self.max_concurrent
         
         all_results = []
-        successful_count = 0
-        failed_count = 0
-        ai_count = 0
-        fallback_count = 0
         
         # Process in batches to manage concurrency
         for i in range(0, len(work_items), max_concurrent):
             batch = work_items[i:i + max_concurrent]
             
-            # Process batch synchronously for now (can be made async)
-            batch_results = []
+            # Process batch synchronously; see analyze_batch_async for concurrent analysis
             for work_item in batch:
                 item_results = self.analyze_work_item(
                     work_item=work_item,
@@ -280,30 +265,209 @@ class SemanticAnalyzer:
                     priority=AnalysisPriority.BATCH,
                     context=context
                 )
-                batch_results.extend(item_results)
+                all_results.extend(item_results)
             
-            # Collect statistics
-            for result in batch_results:
-                all_results.append(result)
-                if result.error_message is None:
-                    successful_count += 1
-                    if result.used_ai:
-                        ai_count += 1
-                    else:
-                        fallback_count += 1
-                else:
-                    failed_count += 1
+        return self._build_batch_result(
+            all_results,
+            total_items=len(work_items) * len(analysis_types),
+            total_processing_time=time.time() - start_time
+        )
         
-        total_time = time.time() - start_time
+    async def analyze_batch_async(self,
+                                work_items: List[Dict[str, Any]],
+                                analysis_types: List[AnalysisType],
+                                context: Optional[Dict[str, Any]] = None,
+                                max_concurrent: Optional[int] = None) -> BatchAnalysisResult:
+        """Analyze a batch of work items concurrently.
         
-        return BatchAnalysisResult(
+        Every (work item, analysis type) pair is analyzed as its own task, with at
+        most ``max_concurrent`` analyses in flight at a time. With combine_analyses,
+        the uncached types of each work item are first requested in one prompt and
+        only the types missing from its response are analyzed on their own.
+        
+        Args:
+            work_items: List of work items to analyze
+            analysis_types: Types of analysis to perform
+            context: Additional context for analysis
+            max_concurrent: Override default concurrency limit
+            
+        Returns:
+            Batch analysis result with results in work item and analysis type order
+        """
+        start_time = time.time()
+        
+        indexed_results = []
+        async for index, result in self._iter_batch_async(work_items, analysis_types, context, max_concurrent):
+            indexed_results.append((index, result))
+        indexed_results.sort(key=lambda indexed: indexed[0])
+        
+        return self._build_batch_result(
+            [result for _, result in indexed_results],
             total_items=len(work_items) * len(analysis_types),
-            successful_analyses=successful_count,
-            failed_analyses=failed_count,
+            total_processing_time=time.time() - start_time
+        )
+    
+    async def stream_batch_async(self,
+                               work_items: List[Dict[str, Any]],
+                               analysis_types: List[AnalysisType],
+                               context: Optional[Dict[str, Any]] = None,
+                               max_concurrent: Optional[int] = None) -> AsyncIterator[SemanticAnalysisResult]:
+        """Analyze a batch of work items concurrently, yielding results as they complete.
+        
+        Args:
+            work_items: List of work items to analyze
+            analysis_types: Types of analysis to perform
+            context: Additional context for analysis
+            max_concurrent: Override default concurrency limit
+            
+        Yields:
+            Analysis results in completion order
+        """
+        async for _, result in self._iter_batch_async(work_items, analysis_types, context, max_concurrent):
+            yield result
+    
+    async def _iter_batch_async(self,
+                              work_items: List[Dict[str, Any]],
+                              analysis_types: List[AnalysisType],
+                              context: Optional[Dict[str, Any]],
+                              max_concurrent: Optional[int]) -> AsyncIterator[Tuple[int, SemanticAnalysisResult]]:
+        """Run batch analyses under a semaphore and yield (index, result) as they complete."""
+        semaphore = asyncio.Semaphore(max_concurrent or self.max_concurrent)
+        
+        async def run(index: int,
+                      work_item: Dict[str, Any],
+                      analysis_type: AnalysisType,
+                      combined_result: Optional[SemanticAnalysisResult] = None):
+            if combined_result is not None:
+                # Answered by the combined request; no Ollama request left to run
+                return [(index, await self._analyze_cached_async(work_item, analysis_type, context, combined_result))]
+            async with semaphore:
+                return [(index, await self._analyze_cached_async(work_item, analysis_type, context))]
+        
+        async def run_combined(item_index: int, work_item: Dict[str, Any]):
+            async with semaphore:
+                combined_results = await self._perform_combined_ai_analysis_async(work_item, analysis_types, context)
+            
+            item_results = await asyncio.gather(*[
+                run(item_index * len(analysis_types) + type_index, work_item, analysis_type,
+                    combined_results.get(analysis_type))
+                for type_index, analysis_type in enumerate(analysis_types)
+            ])
+            return [indexed for indexed_results in item_results for indexed in indexed_results]
+        
+        if self.combine_analyses and len(analysis_types) > 1:
+            # One task per work item, so its types can share a combined request
+            tasks = [
+                asyncio.create_task(run_combined(item_index, work_item))
+                for item_index, work_item in enumerate(work_items)
+            ]
+        else:
+            pairs = [(work_item, analysis_type) for work_item in work_items for analysis_type in analysis_types]
+            tasks = [
+                asyncio.create_task(run(index, work_item, analysis_type))
+                for index, (work_item, analysis_type) in enumerate(pairs)
+            ]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for indexed in await next_done:
+                    yield indexed
+        finally:
+            # Consumer stopped early or failed: do not leave analyses running
+            for task in tasks:
+                task.cancel()
+    
+    async def _analyze_cached_async(self,
+                                  work_item: Dict[str, Any],
+                                  analysis_type: AnalysisType,
+                                  context: Optional[Dict[str, Any]] = None,
+                                  combined_result: Optional[SemanticAnalysisResult] = None) -> SemanticAnalysisResult:
+        """Analyze one work item for one analysis type, using the cache and updating metrics.
+        
+        A result already parsed from a combined request is recorded instead of
+        running a separate analysis.
+        """
+        work_item_id = str(work_item.get('id', hash(str(work_item))))
+        start_time = time.time()
+        cache_key, cached_result = self._get_cached_analysis(work_item, analysis_type, context)
+        if cached_result:
+            return cached_result
+        
+        try:
+            result = combined_result or await self._analyze_single_async(work_item, analysis_type, context)
+        except Exception as e:
+            return self._record_analysis(work_item_id, analysis_type, cache_key, start_time, error=e)
+        
+        return self._record_analysis(work_item_id, analysis_type, cache_key, start_time, result=result)
+    
+    def _get_cached_analysis(self,
+                             work_item: Dict[str, Any],
+                             analysis_type: AnalysisType,
+                             context: Optional[Dict[str, Any]] = None) -> Tuple[Optional[str], Optional[SemanticAnalysisResult]]:
+        """Look up a cached analysis; returns the cache key (None without caching) and the cached result."""
+        if not self.enable_caching:
+            return None, None
+        
+        cache_key = self._get_cache_key(work_item, analysis_type, context)
+        return cache_key, self._get_cached_result(cache_key)
+    
+    def _record_analysis(self,
+                         work_item_id: str,
+                         analysis_type: AnalysisType,
+                         cache_key: Optional[str],
+                         start_time: float,
+                         result: Optional[SemanticAnalysisResult] = None,
+                         error: Optional[Exception] = None) -> SemanticAnalysisResult:
+        """Cache a finished analysis and update metrics, or build the error result of a failed one."""
+        if error is not None:
+            self._error_count += 1
+            logger.error(f"Analysis failed for {work_item_id}: {error}")
+            
+            return SemanticAnalysisResult(
+                work_item_id=work_item_id,
+                analysis_type=analysis_type,
+                score=0.0,
+                confidence=0.0,
+                insights=[],
+                structured_data={},
+                processing_time=time.time() - start_time,
+                used_ai=False,
+                error_message=str(error)
+            )
+        
+        if cache_key is not None and result.error_message is None:
+            self._cache_result(cache_key, result)
+        
+        # Update metrics
+        self._analysis_count += 1
+        if result.used_ai:
+            self._ai_analysis_count += 1
+        else:
+            self._fallback_count += 1
+        
+        processing_time = time.time() - start_time
+        self._total_processing_time += processing_time
+        
+        logger.debug(f"Analyzed {work_item_id} for {analysis_type.value} "
+                     f"in {processing_time:.2f}s (AI: {result.used_ai})")
+        return result
+    
+    @staticmethod
+    def _build_batch_result(results: List[SemanticAnalysisResult],
+                            total_items: int,
+                            total_processing_time: float) -> BatchAnalysisResult:
+        """Collect batch statistics from individual analysis results."""
+        successful = [result for result in results if result.error_message is None]
+        ai_count = sum(1 for result in successful if result.used_ai)
+        
+        return BatchAnalysisResult(
+            total_items=total_items,
+            successful_analyses=len(successful),
+            failed_analyses=len(results) - len(successful),
             ai_analyses=ai_count,
-            fallback_analyses=fallback_count,
-            total_processing_time=total_time,
-            results=all_results
+            fallback_analyses=len(successful) - ai_count,
+            total_processing_time=total_processing_time,
+            results=results
         )
     
     def _analyze_single(self,
@@ -385,17 +549,7 @@ class SemanticAnalyzer:
                 # Parse structured response
                 parsed_data = self._parse_ai_response(response.response, analysis_type)
                 if parsed_data:
-                    return SemanticAnalysisResult(
-                        work_item_id=work_item_id,
-                        analysis_type=analysis_type,
-                        score=self._extract_score(parsed_data, analysis_type),
-                        confidence=parsed_data.get('confidence_level', 5) / 10.0,
-                        insights=parsed_data.get('key_insights', []),
-                        structured_data=parsed_data,
-                        processing_time=0.0,  # Will be set by caller
-                        used_ai=True,
-                        model_used=response.model
-                    )
+                    return self._build_ai_result(work_item_id, analysis_type, parsed_data, response.model)
             
             logger.warning(f"Failed to parse AI response for {work_item_id}")
             return None
@@ -429,17 +583,7 @@ class SemanticAnalyzer:
                 # Parse structured response
                 parsed_data = self._parse_ai_response(response.response, analysis_type)
                 if parsed_data:
-                    return SemanticAnalysisResult(
-                        work_item_id=work_item_id,
-                        analysis_type=analysis_type,
-                        score=self._extract_score(parsed_data, analysis_type),
-                        confidence=parsed_data.get('confidence_level', 5) / 10.0,
-                        insights=parsed_data.get('key_insights', []),
-                        structured_data=parsed_data,
-                        processing_time=0.0,  # Will be set by caller
-                        used_ai=True,
-                        model_used=response.model
-                    )
+                    return self._build_ai_result(work_item_id, analysis_type, parsed_data, response.model)
             
             logger.warning(f"Failed to parse async AI response for {work_item_id}")
             return None
@@ -448,6 +592,119 @@ class SemanticAnalyzer:
             logger.error(f"Async AI analysis error for {work_item_id}: {e}")
             return None
     
+    def _combinable_types(self,
+                          work_item: Dict[str, Any],
+                          analysis_types: List[AnalysisType],
+                          context: Optional[Dict[str, Any]] = None) -> List[AnalysisType]:
+        """Get the uncached analysis types worth requesting in one combined prompt."""
+        if not self.combine_analyses:
+            return []
+        
+        pending = []
+        for analysis_type in analysis_types:
+            if analysis_type in pending:
+                continue
+            if self.enable_caching and self._get_cached_result(self._get_cache_key(work_item, analysis_type, context)):
+                continue
+            pending.append(analysis_type)
+        
+        # A single type gains nothing from the combined prompt
+        if len(pending) < 2 or not self.ollama_manager.is_available():
+            return []
+        return pending
+    
+    def _perform_combined_ai_analysis(self,
+                                      work_item: Dict[str, Any],
+                                      analysis_types: List[AnalysisType],
+                                      context: Optional[Dict[str, Any]] = None) -> Dict[AnalysisType, SemanticAnalysisResult]:
+        """Analyze several types with a single Ollama request.
+        
+        Returns results for the types that could be parsed from the combined
+        response; missing types are left for per-type analysis.
+        """
+        pending = self._combinable_types(work_item, analysis_types, context)
+        if not pending:
+            return {}
+        
+        work_item_id = str(work_item.get('id', hash(str(work_item))))
+        start_time = time.time()
+        
+        try:
+            response = self.ollama_manager.generate(
+                prompt=QVFPromptTemplates.get_multi_analysis_prompt(pending, work_item, context),
+                system=QVFPromptTemplates.get_multi_analysis_system_prompt(pending),
+                options=QVFPromptTemplates.get_multi_analysis_options(pending),
+                use_cache=True
+            )
+        except Exception as e:
+            logger.warning(f"Combined AI analysis failed for {work_item_id}: {e}")
+            return {}
+        
+        return self._split_combined_response(work_item_id, pending, response, time.time() - start_time)
+    
+    async def _perform_combined_ai_analysis_async(self,
+                                                  work_item: Dict[str, Any],
+                                                  analysis_types: List[AnalysisType],
+                                                  context: Optional[Dict[str, Any]] = None) -> Dict[AnalysisType, SemanticAnalysisResult]:
+        """Async version of combined AI analysis."""
+        pending = self._combinable_types(work_item, analysis_types, context)
+        if not pending:
+            return {}
+        
+        work_item_id = str(work_item.get('id', hash(str(work_item))))
+        start_time = time.time()
+        
+        try:
+            response = await self.ollama_manager.generate_async(
+                prompt=QVFPromptTemplates.get_multi_analysis_prompt(pending, work_item, context),
+                system=QVFPromptTemplates.get_multi_analysis_system_prompt(pending),
+                options=QVFPromptTemplates.get_multi_analysis_options(pending),
+                use_cache=True
+            )
+        except Exception as e:
+            logger.warning(f"Async combined AI analysis failed for {work_item_id}: {e}")
+            return {}
+        
+        return self._split_combined_response(work_item_id, pending, response, time.time() - start_time)
+    
+    def _split_combined_response(self,
+                                 work_item_id: str,
+                                 analysis_types: List[AnalysisType],
+                                 response: Optional[InferenceResponse],
+                                 processing_time: float) -> Dict[AnalysisType, SemanticAnalysisResult]:
+        """Build per-type results from a combined response."""
+        if not response or not response.response:
+            logger.warning(f"Empty combined AI response for {work_item_id}")
+            return {}
+        
+        sections = self._parse_multi_ai_response(response.response, analysis_types)
+        results = {}
+        for analysis_type, parsed_data in sections.items():
+            result = self._build_ai_result(work_item_id, analysis_type, parsed_data, response.model)
+            # Share the request time between the analyses it produced
+            result.processing_time = processing_time / len(analysis_types)
+            results[analysis_type] = result
+        
+        return results
+    
+    def _build_ai_result(self,
+                         work_item_id: str,
+                         analysis_type: AnalysisType,
+                         parsed_data: Dict[str, Any],
+                         model: Optional[str]) -> SemanticAnalysisResult:
+        """Create an analysis result from parsed AI response data."""
+        return SemanticAnalysisResult(
+            work_item_id=work_item_id,
+            analysis_type=analysis_type,
+            score=self._extract_score(parsed_data, analysis_type),
+            confidence=parsed_data.get('confidence_level', 5) / 10.0,
+            insights=parsed_data.get('key_insights', []),
+            structured_data=parsed_data,
+            processing_time=0.0,  # Will be set by caller
+            used_ai=True,
+            model_used=model
+        )
+    
     def _perform_fallback_analysis(self,
                                  work_item: Dict[str, Any],
                                  analysis_type: AnalysisType,
@@ -472,6 +729,41 @@ class SemanticAnalyzer:
     
     def _parse_ai_response(self, response: str, analysis_type: AnalysisType) -> Optional[Dict[str, Any]]:
         """Parse AI response into structured data."""
+        parsed_data = self._extract_json(response)
+        if parsed_data is None:
+            return None
+        
+        # Validate response format
+        if QVFPromptTemplates.has_required_fields(parsed_data, analysis_type):
+            return parsed_data
+        else:
+            logger.warning(f"Response format validation failed for {analysis_type.value}")
+            return None
+    
+    def _parse_multi_ai_response(self,
+                                 response: str,
+                                 analysis_types: List[AnalysisType]) -> Dict[AnalysisType, Dict[str, Any]]:
+        """Split a combined AI response into structured data per analysis type.
+        
+        Only sections that pass format validation are returned; callers analyze
+        the missing types individually.
+        """
+        parsed_data = self._extract_json(response)
+        if not isinstance(parsed_data, dict):
+            return {}
+        
+        sections = {}
+        for analysis_type in analysis_types:
+            section = parsed_data.get(analysis_type.value)
+            if QVFPromptTemplates.has_required_fields(section, analysis_type):
+                sections[analysis_type] = section
+            else:
+                logger.warning(f"Combined response format validation failed for {analysis_type.value}")
+        
+        return sections
+    
+    def _extract_json(self, response: str) -> Optional[Any]:
+        """Extract and load the JSON payload of an AI response."""
         try:
             # Try to extract JSON from response
             response = response.strip()
@@ -493,15 +785,7 @@ class SemanticAnalyzer:
                 logger.warning(f"No JSON found in response: {response[:100]}...")
                 return None
             
-            # Parse JSON
-            parsed_data = json.loads(json_str)
-            
-            # Validate response format
-            if QVFPromptTemplates.validate_response_format(json_str, analysis_type):
-                return parsed_data
-            else:
-                logger.warning(f"Response format validation failed for {analysis_type.value}")
-                return None
+            return json.loads(json_str)
                 
         except json.JSONDecodeError as e:
             logger.warning(f"JSON parsing failed: {e}")
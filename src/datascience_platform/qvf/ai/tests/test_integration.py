@@ -52,6 +52,8 @@ class TestQVFAIIntegration:
                         }]
                     }
                     mock_requests.get.return_value = mock_response
+                    # The manager's pooled session routes to the same mocks
+                    mock_requests.Session.return_value = mock_requests
                     
                     yield OllamaManager(cache_dir=Path(temp_dir))
     
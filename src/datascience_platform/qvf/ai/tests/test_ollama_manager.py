@@ -12,7 +12,9 @@ from pathlib import Path
 import tempfile
 import aiohttp
 import asyncio
+import threading
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 from ..ollama_manager import (
     OllamaManager, 
@@ -36,6 +38,8 @@ class TestOllamaManager:
     def mock_requests(self):
         """Mock requests module."""
         with patch('datascience_platform.qvf.ai.ollama_manager.requests') as mock_requests:
+            # Route calls on the pooled session to the module-level mocks
+            mock_requests.Session.return_value = mock_requests
             yield mock_requests
     
     @pytest.fixture
@@ -280,11 +284,12 @@ class TestOllamaManager:
             "done": True
         })
         
-        mock_session = Mock()
+        mock_session = MagicMock()
         mock_session.post.return_value.__aenter__.return_value = mock_response
         
-        with patch('aiohttp.ClientSession') as mock_client_session:
-            mock_client_session.return_value.__aenter__.return_value = mock_session
+        with patch('aiohttp.ClientSession') as mock_client_session, patch('aiohttp.TCPConnector'):
+            mock_client_session.return_value = mock_session
+            mock_session.closed = False
             
             result = await manager_healthy.generate_async("Test async prompt")
             
@@ -415,6 +420,124 @@ class TestOllamaManager:
         assert manager_healthy._last_health_check > initial_check_time
 
 
+class StubOllamaHandler(BaseHTTPRequestHandler):
+    """Minimal Ollama API over keep-alive HTTP/1.1 that counts connections."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+    
+    def do_GET(self):
+        self._send_json({"models": []})
+    
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self._send_json({"model": body["model"], "response": f"echo: {body['prompt']}", "done": True})
+    
+    def _send_json(self, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class TestOllamaConnectionPooling:
+    """Test HTTP connection reuse against a local stub server."""
+    
+    @pytest.fixture
+    def stub_server(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StubOllamaHandler)
+        server.daemon_threads = True
+        server.lock = threading.Lock()
+        server.connections = 0
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+    
+    @pytest.fixture
+    def manager(self, stub_server, tmp_path):
+        with patch('datascience_platform.qvf.ai.ollama_manager.psutil') as mock_psutil:
+            mock_process = Mock()
+            mock_process.name.return_value = "ollama"
+            mock_psutil.process_iter.return_value = [mock_process]
+            
+            host, port = stub_server.server_address
+            yield OllamaManager(
+                base_url=f"http://{host}:{port}",
+                cache_dir=tmp_path,
+                max_connections=3
+            )
+    
+    def test_sync_requests_reuse_connection(self, manager, stub_server):
+        """Test sync requests share one keep-alive connection."""
+        assert manager.is_available()
+        
+        for i in range(10):
+            result = manager.generate(f"prompt {i}", model="stub", use_cache=False)
+            assert result.response == f"echo: prompt {i}"
+        
+        assert stub_server.connections == 1
+    
+    def test_sync_close_releases_session(self, manager, stub_server):
+        """Test the sync context manager closes the pooled requests session."""
+        with manager:
+            assert manager.generate("prompt", model="stub", use_cache=False).response == "echo: prompt"
+            assert manager._sync_session is not None
+        
+        assert manager._sync_session is None
+    
+    @pytest.mark.asyncio
+    async def test_async_requests_use_bounded_pool(self, manager, stub_server):
+        """Test concurrent async requests reuse a fixed pool of connections."""
+        async with manager:
+            for _ in range(2):
+                results = await asyncio.gather(*[
+                    manager.generate_async(f"prompt {i}", model="stub", use_cache=False)
+                    for i in range(12)
+                ])
+                assert [result.response for result in results] == [f"echo: prompt {i}" for i in range(12)]
+        
+        # One connection for the health check plus at most max_connections async ones
+        assert stub_server.connections <= 1 + 3
+        assert manager._async_sessions == {}
+    
+    @pytest.mark.asyncio
+    async def test_sessions_of_other_loops_are_closed(self, manager, stub_server):
+        """Test a session created on another running loop is kept and closed on that loop."""
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            result = asyncio.run_coroutine_threadsafe(
+                manager.generate_async("other", model="stub", use_cache=False), other_loop
+            ).result(timeout=10)
+            assert result.response == "echo: other"
+            
+            await manager.generate_async("current", model="stub", use_cache=False)
+            other_session = manager._async_sessions[other_loop]
+            current_session = manager._async_sessions[asyncio.get_running_loop()]
+            
+            await manager.aclose()
+            
+            assert other_session.closed
+            assert current_session.closed
+            assert manager._async_sessions == {}
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(timeout=5)
+            other_loop.close()
+
+
 class AsyncMock(MagicMock):
     """Helper for mocking async methods."""
     
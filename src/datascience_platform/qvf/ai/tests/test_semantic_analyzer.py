@@ -381,6 +381,194 @@ class TestSemanticAnalyzer:
         # Check mixed AI usage rate
         assert batch_result.ai_usage_rate == 0.5
     
+    @pytest.mark.asyncio
+    async def test_batch_analysis_async(self, analyzer_with_ai, mock_ai_response, mock_ollama_manager):
+        """Test async batch analysis runs analyses concurrently up to the limit."""
+        calls = 0
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def generate_async(*args, **kwargs):
+            nonlocal calls, in_flight, max_in_flight
+            calls += 1
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mock_ai_response
+        
+        mock_ollama_manager.generate_async = generate_async
+        
+        work_items = [{'id': f'ITEM-{i:03d}', 'title': f'Item {i}'} for i in range(5)]
+        analysis_types = [AnalysisType.BUSINESS_VALUE, AnalysisType.RISK_ASSESSMENT]
+        
+        batch_result = await analyzer_with_ai.analyze_batch_async(work_items, analysis_types)
+        
+        assert batch_result.total_items == 10
+        assert batch_result.successful_analyses == 10
+        assert batch_result.failed_analyses == 0
+        assert max_in_flight == 3  # analyzer max_concurrent
+        
+        # Results keep work item and analysis type order
+        assert [(r.work_item_id, r.analysis_type) for r in batch_result.results] == [
+            (item['id'], analysis_type) for item in work_items for analysis_type in analysis_types
+        ]
+        
+        # Repeated batches are served from the cache
+        await analyzer_with_ai.analyze_batch_async(work_items, analysis_types)
+        assert calls == 10
+    
+    @pytest.mark.asyncio
+    async def test_stream_batch_async(self, analyzer_with_ai, mock_ai_response, mock_ollama_manager, mock_fallback_engine):
+        """Test streamed results arrive in completion order and failures fall back."""
+        async def generate_async(prompt, **kwargs):
+            if 'Slow item' in prompt:
+                await asyncio.sleep(0.05)
+            if 'Broken item' in prompt:
+                raise Exception("AI Error")
+            return mock_ai_response
+        
+        mock_ollama_manager.generate_async = generate_async
+        
+        work_items = [
+            {'id': 'SLOW', 'title': 'Slow item'},
+            {'id': 'FAST', 'title': 'Fast item'},
+            {'id': 'BROKEN', 'title': 'Broken item'}
+        ]
+        
+        results = [
+            result async for result in analyzer_with_ai.stream_batch_async(
+                work_items, [AnalysisType.BUSINESS_VALUE], max_concurrent=3
+            )
+        ]
+        
+        assert results[-1].work_item_id == 'SLOW'
+        assert results[-1].used_ai == True
+        broken = next(result for result in results if result.work_item_id == 'BROKEN')
+        assert broken.used_ai == False
+        assert broken.error_message is None
+    
+    def test_combined_analysis_single_request(self, mock_ollama_manager, mock_fallback_engine, sample_work_item):
+        """Test combined mode analyzes every type with one AI request."""
+        analyzer = SemanticAnalyzer(
+            ollama_manager=mock_ollama_manager,
+            fallback_engine=mock_fallback_engine,
+            combine_analyses=True
+        )
+        mock_ollama_manager.generate.return_value = InferenceResponse(
+            model="llama2:7b",
+            response=json.dumps({
+                "business_value": {"business_value_score": 8, "value_drivers": [], "confidence_level": 9,
+                                   "key_insights": ["Drives revenue"]},
+                "risk_assessment": {"overall_risk_score": 3, "risk_factors": [], "confidence_level": 7}
+            }),
+            done=True
+        )
+        
+        analysis_types = [AnalysisType.BUSINESS_VALUE, AnalysisType.RISK_ASSESSMENT]
+        results = analyzer.analyze_work_item(sample_work_item, analysis_types)
+        
+        assert [result.analysis_type for result in results] == analysis_types
+        assert all(result.used_ai for result in results)
+        assert results[0].score == 0.8
+        assert results[0].insights == ["Drives revenue"]
+        assert results[1].score == 0.3
+        assert results[1].confidence == 0.7
+        
+        # The work item is sent once, with every requested format
+        mock_ollama_manager.generate.assert_called_once()
+        prompt = mock_ollama_manager.generate.call_args.kwargs['prompt']
+        assert prompt.count(sample_work_item['title']) == 1
+        assert '"business_value":' in prompt and '"risk_assessment":' in prompt
+        
+        # Cached results are not requested again
+        analyzer.analyze_work_item(sample_work_item, analysis_types)
+        mock_ollama_manager.generate.assert_called_once()
+    
+    def test_combined_analysis_falls_back_per_type(self, mock_ollama_manager, mock_fallback_engine,
+                                                   sample_work_item, mock_ai_response):
+        """Test types missing from the combined response are analyzed individually."""
+        analyzer = SemanticAnalyzer(
+            ollama_manager=mock_ollama_manager,
+            fallback_engine=mock_fallback_engine,
+            combine_analyses=True
+        )
+        combined_response = InferenceResponse(
+            model="llama2:7b",
+            response=json.dumps({"risk_assessment": {"overall_risk_score": 3, "risk_factors": [], "confidence_level": 7}}),
+            done=True
+        )
+        mock_ollama_manager.generate.side_effect = [combined_response, mock_ai_response]
+        
+        results = analyzer.analyze_work_item(
+            sample_work_item, [AnalysisType.BUSINESS_VALUE, AnalysisType.RISK_ASSESSMENT]
+        )
+        
+        assert all(result.used_ai for result in results)
+        assert results[0].score == 0.9  # From the per-type request
+        assert results[1].score == 0.3  # From the combined request
+        assert mock_ollama_manager.generate.call_count == 2
+        
+        # Unparseable combined responses fall back for every type
+        mock_ollama_manager.generate.side_effect = None
+        mock_ollama_manager.generate.return_value = InferenceResponse(model="llama2:7b", response="not json", done=True)
+        results = analyzer.analyze_work_item(
+            {'id': 'OTHER', 'title': 'Other item'}, [AnalysisType.BUSINESS_VALUE, AnalysisType.RISK_ASSESSMENT]
+        )
+        
+        assert not any(result.used_ai for result in results)
+        assert all(result.error_message is None for result in results)
+        assert mock_ollama_manager.generate.call_count == 5
+    
+    @pytest.mark.asyncio
+    async def test_combined_batch_analysis_async(self, mock_ollama_manager, mock_fallback_engine, mock_ai_response):
+        """Test async batches send one combined request per work item and fall back per type."""
+        analyzer = SemanticAnalyzer(
+            ollama_manager=mock_ollama_manager,
+            fallback_engine=mock_fallback_engine,
+            max_concurrent=2,
+            combine_analyses=True
+        )
+        combined_prompts = []
+        single_prompts = []
+        
+        async def generate_async(prompt, **kwargs):
+            if '"risk_assessment":' not in prompt:
+                single_prompts.append(prompt)
+                return mock_ai_response
+            
+            combined_prompts.append(prompt)
+            sections = {"risk_assessment": {"overall_risk_score": 3, "risk_factors": [], "confidence_level": 7}}
+            if 'Partial item' not in prompt:
+                sections["business_value"] = {"business_value_score": 8, "value_drivers": [], "confidence_level": 9}
+            return InferenceResponse(model="llama2:7b", response=json.dumps(sections), done=True)
+        
+        mock_ollama_manager.generate_async = generate_async
+        
+        work_items = [
+            {'id': 'ITEM-1', 'title': 'First item'},
+            {'id': 'ITEM-2', 'title': 'Partial item'},
+            {'id': 'ITEM-3', 'title': 'Third item'}
+        ]
+        analysis_types = [AnalysisType.BUSINESS_VALUE, AnalysisType.RISK_ASSESSMENT]
+        
+        batch_result = await analyzer.analyze_batch_async(work_items, analysis_types)
+        
+        assert len(combined_prompts) == 3
+        assert len(single_prompts) == 1
+        assert 'Partial item' in single_prompts[0]
+        assert batch_result.successful_analyses == 6
+        assert batch_result.ai_analyses == 6
+        assert [(r.work_item_id, r.analysis_type) for r in batch_result.results] == [
+            (item['id'], analysis_type) for item in work_items for analysis_type in analysis_types
+        ]
+        assert [r.score for r in batch_result.results] == [0.8, 0.3, 0.9, 0.3, 0.8, 0.3]
+        assert analyzer.get_performance_stats()['total_analyses'] == 6
+        
+        # Cached results are not requested again
+        await analyzer.analyze_batch_async(work_items, analysis_types)
+        assert len(combined_prompts) + len(single_prompts) == 4
+    
     def test_performance_stats_tracking(self, analyzer_with_ai, sample_work_item, mock_ai_response, mock_ollama_manager):
         """Test performance statistics tracking."""
         mock_ollama_manager.generate.return_value = mock_ai_response
@@ -181,6 +181,58 @@ class IntegrationResult:
         return 0.0
 
 
+@dataclass
+class _ScoreTable:
+    """Dense items × names view of one per-item score dict (e.g. ``criterion_scores``).
+    
+    Built once from the QVF score entries so that level averages, weighted
+    rankings and per-item lookups are array operations instead of repeated
+    scans over every work item's score dict.
+    """
+    
+    values: np.ndarray                              # (entries, names); NaN where an entry has no score
+    columns: Dict[str, int]                         # Score name -> column
+    rows: Dict[Any, int]                            # Work item ID -> row (first entry wins)
+    
+    @classmethod
+    def from_qvf_scores(cls, qvf_scores: List[Dict[str, Any]], key: str) -> '_ScoreTable':
+        """Build the table for ``key`` from QVF score entries."""
+        columns: Dict[str, int] = {}
+        for entry in qvf_scores:
+            for name in entry.get(key, {}):
+                columns.setdefault(name, len(columns))
+        
+        values = np.full((len(qvf_scores), len(columns)), np.nan)
+        rows: Dict[Any, int] = {}
+        for row, entry in enumerate(qvf_scores):
+            rows.setdefault(entry.get('work_item_id'), row)
+            for name, score in entry.get(key, {}).items():
+                values[row, columns[name]] = score
+        
+        return cls(values=values, columns=columns, rows=rows)
+    
+    def select(self, names: List[str]) -> np.ndarray:
+        """Scores for ``names`` as an (entries, len(names)) array, missing scores as 0."""
+        selected = np.zeros((self.values.shape[0], len(names)))
+        for i, name in enumerate(names):
+            column = self.columns.get(name)
+            if column is not None:
+                selected[:, i] = self.values[:, column]
+        return np.nan_to_num(selected, nan=0.0)
+    
+    def column_means(self, names: List[str]) -> np.ndarray:
+        """Mean score per name over the entries that have it (0 if none do)."""
+        present = ~np.isnan(self.values)
+        sums = np.where(present, self.values, 0.0).sum(axis=0)
+        counts = present.sum(axis=0)
+        means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+        
+        return np.array([
+            means[self.columns[name]] if name in self.columns else 0.0
+            for name in names
+        ])
+
+
 class QVFAHPIntegrator:
     """Advanced QVF-AHP integration engine.
     
@@ -221,6 +273,8 @@ class QVFAHPIntegrator:
         self.hierarchy_engines: Dict[str, AHPEngine] = {}
         self.conversion_cache: Dict[str, np.ndarray] = {}
         self.quality_metrics: Dict[str, float] = {}
+        # Score tables of the conversion in progress (None outside convert_qvf_to_ahp)
+        self._score_tables: Optional[Dict[str, _ScoreTable]] = None
         
         logger.info(f"QVF-AHP Integrator initialized with {self.config.conversion_method.value} conversion method")
     
@@ -240,6 +294,21 @@ class QVFAHPIntegrator:
         Returns:
             Comprehensive integration result with AHP analysis
         """
+        # Score tables are built once per conversion, so edits to the score
+        # entries between calls are always picked up
+        self._score_tables = {}
+        try:
+            return self._convert_qvf_to_ahp(qvf_results, work_items, stakeholder_preferences)
+        finally:
+            self._score_tables = None
+    
+    def _convert_qvf_to_ahp(
+        self,
+        qvf_results: Dict[str, Any],
+        work_items: List[ADOWorkItem],
+        stakeholder_preferences: Optional[Dict[str, Dict[str, float]]]
+    ) -> IntegrationResult:
+        """Run the conversion for convert_qvf_to_ahp."""
         logger.info(f"Converting QVF results to AHP for {len(work_items)} work items")
         
         integration_start = datetime.now()
@@ -481,60 +550,47 @@ class QVFAHPIntegrator:
         
         return matrix
     
-    def _generate_matrix_score_ratio(self, level_config: Dict[str, Any], qvf_scores: List[Dict[str, Any]]) -> np.ndarray:
-        """Generate comparison matrix using direct score ratios."""
-        items = level_config['items']
-        n = len(items)
-        matrix = np.eye(n)
+    def _get_score_table(self, qvf_scores: List[Dict[str, Any]], key: str) -> _ScoreTable:
+        """Get the items × names score table for a QVF score key.
         
-        # Calculate average scores for each item
-        item_scores = {}
+        During convert_qvf_to_ahp, whose steps all read the same score list,
+        each table is built once; outside a conversion it is built per call.
+        """
+        if self._score_tables is None:
+            return _ScoreTable.from_qvf_scores(qvf_scores, key)
+        
+        table = self._score_tables.get(key)
+        if table is None:
+            table = _ScoreTable.from_qvf_scores(qvf_scores, key)
+            self._score_tables[key] = table
+        
+        return table
+    
+    def _get_level_scores(self, level_config: Dict[str, Any], qvf_scores: List[Dict[str, Any]]) -> np.ndarray:
+        """Average QVF score of each hierarchy-level item across all work items."""
+        items = level_config['items']
         
         if level_config['type'] == 'categories':
-            # Category-level scores
-            for i, category in enumerate(items):
-                category_score = 0.0
-                count = 0
-                
-                for work_item_score in qvf_scores:
-                    category_scores = work_item_score.get('category_scores', {})
-                    if category in category_scores:
-                        category_score += category_scores[category]
-                        count += 1
-                
-                item_scores[i] = category_score / count if count > 0 else 0.0
-        
-        elif level_config['type'] == 'criteria':
-            # Criteria-level scores
-            for i, criterion_config in enumerate(items):
-                criterion_name = criterion_config.get('name') if isinstance(criterion_config, dict) else str(criterion_config)
-                criterion_score = 0.0
-                count = 0
-                
-                for work_item_score in qvf_scores:
-                    criterion_scores = work_item_score.get('criterion_scores', {})
-                    if criterion_name in criterion_scores:
-                        criterion_score += criterion_scores[criterion_name]
-                        count += 1
-                
-                item_scores[i] = criterion_score / count if count > 0 else 0.0
-        
-        # Create comparison matrix from score ratios
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    score_i = item_scores.get(i, 0.0)
-                    score_j = item_scores.get(j, 0.0)
-                    
-                    if score_j > 0:
-                        ratio = score_i / score_j
-                        # Map to AHP 1-9 scale
-                        if ratio > 1:
-                            matrix[i, j] = min(9.0, max(1.0, ratio))
-                        else:
-                            matrix[i, j] = max(1/9.0, min(1.0, ratio))
-                    else:
-                        matrix[i, j] = 1.0
+            table = self._get_score_table(qvf_scores, 'category_scores')
+            names = [str(category) for category in items]
+        else:
+            table = self._get_score_table(qvf_scores, 'criterion_scores')
+            names = [
+                item.get('name') if isinstance(item, dict) else str(item)
+                for item in items
+            ]
+        
+        return table.column_means(names)
+    
+    def _generate_matrix_score_ratio(self, level_config: Dict[str, Any], qvf_scores: List[Dict[str, Any]]) -> np.ndarray:
+        """Generate comparison matrix using direct score ratios."""
+        item_scores = self._get_level_scores(level_config, qvf_scores)
+        
+        # Ratio of every pair mapped to the AHP 1/9-9 scale; undefined ratios stay neutral
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = item_scores[:, np.newaxis] / item_scores[np.newaxis, :]
+        matrix = np.where(item_scores[np.newaxis, :] > 0, np.clip(ratios, 1/9.0, 9.0), 1.0)
+        np.fill_diagonal(matrix, 1.0)
         
         return matrix
     
@@ -542,69 +598,34 @@ class QVFAHPIntegrator:
         """Generate comparison matrix using logarithmic scale mapping."""
         # First get score ratios
         matrix = self._generate_matrix_score_ratio(level_config, qvf_scores)
-        n = matrix.shape[0]
-        
-        # Apply logarithmic transformation to map to AHP scale more smoothly
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    ratio = matrix[i, j]
-                    if ratio > 1:
-                        # Map ratios > 1 to AHP scale 1-9 using log transformation
-                        log_ratio = math.log(ratio)
-                        ahp_value = 1 + (8 * log_ratio) / math.log(9)  # Scale to 1-9
-                        matrix[i, j] = min(9.0, max(1.0, ahp_value))
-                    elif ratio < 1:
-                        # Map ratios < 1 to AHP scale 1/9-1
-                        log_ratio = math.log(1/ratio)
-                        ahp_value = 1 + (8 * log_ratio) / math.log(9)
-                        matrix[i, j] = max(1/9.0, min(1.0, 1/ahp_value))
+        
+        # Apply logarithmic transformation to map to AHP scale more smoothly:
+        # |log(ratio)| is scaled onto 1-9, inverted again for ratios below 1
+        ahp_values = 1 + (8 * np.abs(np.log(matrix))) / math.log(9)
+        matrix = np.where(
+            matrix > 1,
+            np.clip(ahp_values, 1.0, 9.0),
+            np.where(matrix < 1, np.clip(1 / ahp_values, 1/9.0, 1.0), matrix)
+        )
         
         return matrix
     
     def _generate_matrix_percentile(self, level_config: Dict[str, Any], qvf_scores: List[Dict[str, Any]]) -> np.ndarray:
         """Generate comparison matrix using percentile mapping."""
-        items = level_config['items']
-        n = len(items)
-        matrix = np.eye(n)
-        
-        # Get item scores (same as score ratio method)
-        item_scores = {}
-        all_scores = []
+        item_scores = self._get_level_scores(level_config, qvf_scores)
+        n = len(item_scores)
         
-        # Calculate scores similar to score_ratio method
-        if level_config['type'] == 'categories':
-            for i, category in enumerate(items):
-                category_score = 0.0
-                count = 0
-                for work_item_score in qvf_scores:
-                    category_scores = work_item_score.get('category_scores', {})
-                    if category in category_scores:
-                        category_score += category_scores[category]
-                        count += 1
-                item_scores[i] = category_score / count if count > 0 else 0.0
-                all_scores.append(item_scores[i])
+        if n == 0:
+            return np.eye(0)
         
         # Convert scores to percentiles
-        percentiles = stats.rankdata(all_scores, method='average') / len(all_scores)
-        
-        # Create matrix based on percentile differences
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    percentile_i = percentiles[i] if i < len(percentiles) else 0.5
-                    percentile_j = percentiles[j] if j < len(percentiles) else 0.5
-                    
-                    # Map percentile difference to AHP scale
-                    diff = percentile_i - percentile_j
-                    if diff > 0:
-                        # Map positive differences to 1-9 scale
-                        ahp_value = 1 + 8 * diff  # Linear mapping
-                        matrix[i, j] = min(9.0, max(1.0, ahp_value))
-                    else:
-                        # Map negative differences to 1/9-1 scale
-                        ahp_value = 1 + 8 * abs(diff)
-                        matrix[i, j] = max(1/9.0, min(1.0, 1/ahp_value))
+        percentiles = stats.rankdata(item_scores, method='average') / n
+        
+        # Map percentile differences linearly onto the AHP scale
+        diff = percentiles[:, np.newaxis] - percentiles[np.newaxis, :]
+        ahp_values = 1 + 8 * np.abs(diff)
+        matrix = np.clip(np.where(diff > 0, ahp_values, 1 / ahp_values), 1/9.0, 9.0)
+        np.fill_diagonal(matrix, 1.0)
         
         return matrix
     
@@ -641,18 +662,58 @@ class QVFAHPIntegrator:
                 aggregated_preferences[item_name] = 1.0
         
         # Create comparison matrix from aggregated preferences
-        for i, name_i in enumerate(item_names):
-            for j, name_j in enumerate(item_names):
-                if i != j:
-                    pref_i = aggregated_preferences.get(name_i, 1.0)
-                    pref_j = aggregated_preferences.get(name_j, 1.0)
-                    
-                    if pref_j > 0:
-                        ratio = pref_i / pref_j
-                        matrix[i, j] = min(9.0, max(1/9.0, ratio))
+        prefs = np.array([aggregated_preferences.get(name, 1.0) for name in item_names], dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = prefs[:, np.newaxis] / prefs[np.newaxis, :]
+        matrix = np.where(prefs[np.newaxis, :] > 0, np.clip(ratios, 1/9.0, 9.0), matrix)
+        np.fill_diagonal(matrix, 1.0)
         
         return matrix
     
+    def _generate_stakeholder_matrices(
+        self,
+        level_config: Dict[str, Any],
+        stakeholder_preferences: Dict[str, Dict[str, float]]
+    ) -> Tuple[List[str], np.ndarray]:
+        """Generate one preference comparison matrix per stakeholder.
+        
+        Equivalent to calling _generate_matrix_preferences for each stakeholder
+        alone, but builds all matrices with a single broadcast.
+        
+        Returns:
+            Tuple of (stakeholder IDs, matrices of shape (stakeholders, n, n))
+        """
+        items = level_config['items']
+        if level_config['type'] == 'categories':
+            item_names = items
+        else:
+            item_names = [item.get('name') if isinstance(item, dict) else str(item) for item in items]
+        
+        stakeholder_ids = []
+        rows = []
+        given = []
+        for stakeholder_id, prefs in stakeholder_preferences.items():
+            try:
+                rows.append([float(prefs[name]) if name in prefs else 1.0 for name in item_names])
+                given.append([name in prefs for name in item_names])
+                stakeholder_ids.append(stakeholder_id)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Failed to create matrix for stakeholder {stakeholder_id}: {e}")
+        
+        n = len(item_names)
+        preferences = np.array(rows, dtype=float).reshape(len(rows), n)
+        given = np.array(given, dtype=bool).reshape(len(rows), n)
+        
+        # Geometric mean of a single preference, 1.0 where the stakeholder gave none
+        with np.errstate(divide='ignore', invalid='ignore'):
+            preferences = np.where(given, np.exp(np.log(preferences + 1e-10)), 1.0)
+            ratios = preferences[:, :, np.newaxis] / preferences[:, np.newaxis, :]
+        
+        matrices = np.where(preferences[:, np.newaxis, :] > 0, np.clip(ratios, 1/9.0, 9.0), np.eye(n))
+        matrices[:, np.arange(n), np.arange(n)] = 1.0
+        
+        return stakeholder_ids, matrices
+    
     def _generate_matrix_hybrid(
         self, 
         level_config: Dict[str, Any], 
@@ -667,18 +728,9 @@ class QVFAHPIntegrator:
         if stakeholder_preferences:
             pref_matrix = self._generate_matrix_preferences(level_config, stakeholder_preferences)
             
-            # Blend matrices using geometric mean
-            n = score_matrix.shape[0]
-            hybrid_matrix = np.eye(n)
-            
-            for i in range(n):
-                for j in range(n):
-                    if i != j:
-                        score_value = score_matrix[i, j]
-                        pref_value = pref_matrix[i, j]
-                        
-                        # Geometric mean of the two values
-                        hybrid_matrix[i, j] = np.sqrt(score_value * pref_value)
+            # Blend matrices using element-wise geometric mean
+            hybrid_matrix = np.sqrt(score_matrix * pref_matrix)
+            np.fill_diagonal(hybrid_matrix, 1.0)
         else:
             hybrid_matrix = score_matrix
         
@@ -686,28 +738,22 @@ class QVFAHPIntegrator:
     
     def _validate_and_adjust_matrix(self, matrix: np.ndarray) -> np.ndarray:
         """Validate and adjust comparison matrix for AHP requirements."""
-        n = matrix.shape[0]
-        adjusted_matrix = matrix.copy()
+        adjusted_matrix = matrix.astype(float, copy=True)
         
         # Ensure diagonal is 1
         np.fill_diagonal(adjusted_matrix, 1.0)
         
-        # Ensure reciprocal property
-        for i in range(n):
-            for j in range(n):
-                if i != j and adjusted_matrix[j, i] != 0:
-                    adjusted_matrix[j, i] = 1.0 / adjusted_matrix[i, j]
-        
-        # Check for extreme ratios and adjust
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    if adjusted_matrix[i, j] > self.config.extreme_ratio_threshold:
-                        adjusted_matrix[i, j] = self.config.extreme_ratio_threshold
-                        adjusted_matrix[j, i] = 1.0 / self.config.extreme_ratio_threshold
-                    elif adjusted_matrix[i, j] < 1.0 / self.config.extreme_ratio_threshold:
-                        adjusted_matrix[i, j] = 1.0 / self.config.extreme_ratio_threshold
-                        adjusted_matrix[j, i] = self.config.extreme_ratio_threshold
+        # Ensure reciprocal property: the lower triangle mirrors the upper one
+        upper_rows, upper_cols = np.triu_indices(adjusted_matrix.shape[0], k=1)
+        lower_values = adjusted_matrix[upper_cols, upper_rows]
+        with np.errstate(divide='ignore'):
+            adjusted_matrix[upper_cols, upper_rows] = np.where(
+                lower_values != 0, 1.0 / adjusted_matrix[upper_rows, upper_cols], lower_values
+            )
+        
+        # Clip extreme ratios (symmetric in log space, so reciprocity is kept)
+        threshold = self.config.extreme_ratio_threshold
+        adjusted_matrix = np.clip(adjusted_matrix, 1.0 / threshold, threshold)
         
         # Ensure positive values
         adjusted_matrix = np.abs(adjusted_matrix)
@@ -791,36 +837,21 @@ class QVFAHPIntegrator:
             padded_weights[:len(global_weights)] = global_weights
             global_weights = padded_weights
         
-        # Calculate weighted scores for each work item
+        # Weighted criterion scores for every QVF entry in one broadcast
+        score_table = self._get_score_table(qvf_scores, 'criterion_scores')
+        weighted_scores = score_table.select(all_criteria) * global_weights[:len(all_criteria)]
+        total_scores = weighted_scores.sum(axis=1)
+        
         for work_item in work_items:
             work_item_id = work_item.work_item_id
+            row = score_table.rows.get(work_item_id)
             
-            # Find QVF scores for this work item
-            work_item_qvf = None
-            for qvf_entry in qvf_scores:
-                if qvf_entry.get('work_item_id') == work_item_id:
-                    work_item_qvf = qvf_entry
-                    break
-            
-            if work_item_qvf is None:
+            if row is None:
                 work_item_rankings.append((work_item_id, 0.0, {}))
                 continue
             
-            # Get criterion scores
-            criterion_scores = work_item_qvf.get('criterion_scores', {})
-            
-            # Calculate weighted total score
-            total_score = 0.0
-            detailed_scores = {}
-            
-            for i, criterion_name in enumerate(all_criteria):
-                if i < len(global_weights):
-                    criterion_score = criterion_scores.get(criterion_name, 0.0)
-                    weighted_score = criterion_score * global_weights[i]
-                    total_score += weighted_score
-                    detailed_scores[criterion_name] = weighted_score
-            
-            work_item_rankings.append((work_item_id, total_score, detailed_scores))
+            detailed_scores = dict(zip(all_criteria, weighted_scores[row].tolist()))
+            work_item_rankings.append((work_item_id, float(total_scores[row]), detailed_scores))
         
         # Sort by total score descending
         work_item_rankings.sort(key=lambda x: x[1], reverse=True)
@@ -940,30 +971,26 @@ class QVFAHPIntegrator:
     ) -> Dict[str, Any]:
         """Perform comprehensive sensitivity analysis across the integrated system."""
         sensitivity_results = {}
+        score_table = self._get_score_table(qvf_scores, 'criterion_scores')
+        
+        # Rows of the score table for work items that have QVF scores, in work item order
+        item_rows = [
+            score_table.rows[work_item.work_item_id]
+            for work_item in work_items
+            if work_item.work_item_id in score_table.rows
+        ]
         
         # Perform sensitivity analysis for each AHP engine
         for level_name, engine in ahp_engines.items():
             if engine.weights is not None and len(engine.weights) > 1:
                 try:
                     # Create work items in format expected by AHP engine
-                    ahp_work_items = []
-                    for work_item in work_items:
-                        # Find corresponding QVF scores
-                        work_item_qvf = None
-                        for qvf_entry in qvf_scores:
-                            if qvf_entry.get('work_item_id') == work_item.work_item_id:
-                                work_item_qvf = qvf_entry
-                                break
-                        
-                        if work_item_qvf:
-                            # Convert to format expected by AHP
-                            ahp_item = {}
-                            criterion_scores = work_item_qvf.get('criterion_scores', {})
-                            
-                            for criterion in engine.config.criteria:
-                                ahp_item[criterion.data_source] = criterion_scores.get(criterion.name, 0.0)
-                            
-                            ahp_work_items.append(ahp_item)
+                    data_sources = [criterion.data_source for criterion in engine.config.criteria]
+                    level_scores = score_table.select([criterion.name for criterion in engine.config.criteria])
+                    ahp_work_items = [
+                        dict(zip(data_sources, level_scores[row].tolist()))
+                        for row in item_rows
+                    ]
                     
                     if ahp_work_items:
                         level_sensitivity = engine.perform_advanced_sensitivity_analysis(
@@ -983,9 +1010,6 @@ class QVFAHPIntegrator:
         hierarchy_structure: Dict[str, Dict[str, Any]]
     ) -> GroupAHPResult:
         """Perform group AHP analysis using stakeholder inputs."""
-        # Create participant matrices for the main criteria level
-        participant_matrices = {}
-        
         # Find the main criteria level
         criteria_level = None
         for level_name, level_config in hierarchy_structure.items():
@@ -996,13 +1020,9 @@ class QVFAHPIntegrator:
         if not criteria_level:
             raise QVFAHPIntegrationError("No criteria level found for group analysis")
         
-        # Generate comparison matrix for each stakeholder
-        for stakeholder_id, preferences in stakeholder_preferences.items():
-            try:
-                matrix = self._generate_matrix_preferences(criteria_level, {stakeholder_id: preferences})
-                participant_matrices[stakeholder_id] = matrix
-            except Exception as e:
-                logger.warning(f"Failed to create matrix for stakeholder {stakeholder_id}: {e}")
+        # Generate comparison matrices for all stakeholders at once
+        stakeholder_ids, matrices = self._generate_stakeholder_matrices(criteria_level, stakeholder_preferences)
+        participant_matrices = dict(zip(stakeholder_ids, matrices))
         
         # Use AHP engine for group analysis
         if participant_matrices:
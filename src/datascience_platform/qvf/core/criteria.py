@@ -761,27 +761,8 @@ class QVFCriteriaEngine:
         if validation_issues:
             raise QVFValidationError(f"Configuration validation failed: {validation_issues}")
         
-        # Convert to AHP configuration
-        ahp_config = config.to_ahp_configuration()
-        ahp_engine = AHPEngine(ahp_config)
-        
-        # Create comparison matrix from QVF weights
-        # Use weight-based comparison matrix generation
-        weights_dict = {}
-        for criterion in config.get_active_criteria():
-            weights_dict[criterion.criterion_id] = criterion.global_weight
-        
-        # Generate comparison matrix
-        comparison_matrix = ahp_engine.create_comparison_matrix_from_preferences(weights_dict)
-        
-        # Calculate AHP weights
-        ahp_weights = ahp_engine.calculate_weights(comparison_matrix)
-        
-        # Check consistency
-        consistency_ratio = ahp_engine.calculate_consistency_ratio(comparison_matrix)
-        
-        if consistency_ratio > config.consistency_threshold:
-            logger.warning(f"Consistency ratio {consistency_ratio:.3f} exceeds threshold {config.consistency_threshold}")
+        # Build AHP engine with weights derived from the QVF configuration
+        ahp_engine, consistency_ratio = self.build_ahp_engine(config)
         
         # Convert work items to scoring format
         scoring_items = []
@@ -816,17 +797,7 @@ class QVFCriteriaEngine:
             }
             
             if include_breakdown:
-                # Add category breakdown
-                category_scores = {}
-                for category in CriteriaCategory:
-                    category_criteria = config.get_criteria_by_category(category)
-                    category_score = sum(
-                        criterion_scores.get(c.criterion_id, 0) * c.global_weight
-                        for c in category_criteria if c.is_active
-                    )
-                    category_scores[category.value] = category_score
-                
-                score_entry['category_scores'] = category_scores
+                score_entry['category_scores'] = self.calculate_category_scores(criterion_scores, config)
                 score_entry['criterion_scores'] = criterion_scores
             
             results['scores'].append(score_entry)
@@ -844,6 +815,62 @@ class QVFCriteriaEngine:
         logger.info(f"QVF scoring completed. Mean score: {results['statistics']['mean_score']:.3f}")
         return results
     
+    def build_ahp_engine(self, config: QVFCriteriaConfiguration) -> Tuple[AHPEngine, float]:
+        """Build an AHP engine weighted by a QVF configuration.
+        
+        Args:
+            config: QVF criteria configuration
+            
+        Returns:
+            Tuple of (AHP engine with calculated weights, consistency ratio)
+        """
+        # Convert to AHP configuration
+        ahp_config = config.to_ahp_configuration()
+        ahp_engine = AHPEngine(ahp_config)
+        
+        # Create comparison matrix from QVF weights
+        # Use weight-based comparison matrix generation
+        weights_dict = {}
+        for criterion in config.get_active_criteria():
+            weights_dict[criterion.criterion_id] = criterion.global_weight
+        
+        # Generate comparison matrix
+        comparison_matrix = ahp_engine.create_comparison_matrix_from_preferences(weights_dict)
+        
+        # Calculate AHP weights
+        ahp_engine.calculate_weights(comparison_matrix)
+        
+        # Check consistency
+        consistency_ratio = ahp_engine.calculate_consistency_ratio(comparison_matrix)
+        
+        if consistency_ratio > config.consistency_threshold:
+            logger.warning(f"Consistency ratio {consistency_ratio:.3f} exceeds threshold {config.consistency_threshold}")
+        
+        return ahp_engine, consistency_ratio
+    
+    def calculate_category_scores(
+        self,
+        criterion_scores: Dict[str, float],
+        config: QVFCriteriaConfiguration
+    ) -> Dict[str, float]:
+        """Aggregate criterion scores into weighted QVF category scores.
+        
+        Args:
+            criterion_scores: Scores keyed by criterion ID
+            config: QVF criteria configuration
+            
+        Returns:
+            Category scores keyed by category value
+        """
+        category_scores = {}
+        for category in CriteriaCategory:
+            category_criteria = config.get_criteria_by_category(category)
+            category_scores[category.value] = sum(
+                criterion_scores.get(c.criterion_id, 0) * c.global_weight
+                for c in category_criteria if c.is_active
+            )
+        return category_scores
+    
     def create_custom_configuration(
         self,
         name: str,
@@ -48,7 +48,8 @@ import logging
 import math
 from datetime import datetime
 from enum import Enum
-from typing import List, Dict, Optional, Any, Union, Tuple
+from collections.abc import Sequence
+from typing import List, Dict, Optional, Any, Union, Tuple, Iterator
 from pydantic import BaseModel, Field, field_validator
 import numpy as np
 from dataclasses import dataclass
@@ -183,6 +184,234 @@ class WorkItemScore:
             self.calculation_timestamp = datetime.now()
 
 
+class WorkItemScoreTable(Sequence):
+    """Columnar table of work item scores.
+    
+    Scores are held in a structured numpy array plus criterion and category
+    score matrices, so ranking and portfolio analytics run as column
+    operations. The table behaves as a read-only sequence of WorkItemScore
+    objects; each object is materialized on first access and cached.
+    
+    Missing criterion or category scores are stored as NaN and left out of
+    the materialized dictionaries.
+    """
+    
+    SCORE_DTYPE = np.dtype([
+        ('work_item_id', np.int64),
+        ('total_score', np.float64),
+        ('financial_score', np.float64),
+        ('strategic_score', np.float64),
+        ('overall_rank', np.int64),
+        ('financial_rank', np.int64),
+        ('strategic_rank', np.int64),
+        ('npv_score', np.float64),
+        ('roi_score', np.float64),
+        ('copq_score', np.float64),
+        ('delay_urgency_score', np.float64),
+        ('confidence_level', np.float64),
+        ('risk_adjustment', np.float64),
+        ('data_quality_score', np.float64)
+    ])
+    
+    FINANCIAL_COMPONENTS = ('npv_score', 'roi_score', 'copq_score', 'delay_urgency_score')
+    
+    def __init__(
+        self,
+        data: np.ndarray,
+        titles: List[str],
+        work_item_types: List[str],
+        criteria_names: List[str],
+        criteria_values: np.ndarray,
+        category_names: List[str],
+        category_values: np.ndarray,
+        calculation_timestamp: Optional[datetime] = None
+    ):
+        self.data = data
+        self.titles = titles
+        self.work_item_types = work_item_types
+        self.criteria_names = criteria_names
+        self.criteria_values = criteria_values
+        self.category_names = category_names
+        self.category_values = category_values
+        self.calculation_timestamp = calculation_timestamp or datetime.now()
+        
+        self._materialized: Dict[int, WorkItemScore] = {}
+        self._positions: Optional[Dict[int, int]] = None
+    
+    @classmethod
+    def from_scores(cls, scores: List[WorkItemScore]) -> 'WorkItemScoreTable':
+        """Build a table from existing WorkItemScore objects (kept in order)."""
+        data = np.zeros(len(scores), dtype=cls.SCORE_DTYPE)
+        for row, score in enumerate(scores):
+            data[row] = (
+                score.work_item_id, score.total_score, score.financial_score, score.strategic_score,
+                score.overall_rank, score.financial_rank, score.strategic_rank,
+                *(score.financial_components.get(name, 0.0) for name in cls.FINANCIAL_COMPONENTS),
+                score.confidence_level, score.risk_adjustment, score.data_quality_score
+            )
+        
+        criteria_names, criteria_values = cls._dicts_to_matrix([score.criteria_scores for score in scores])
+        category_names, category_values = cls._dicts_to_matrix([score.category_scores for score in scores])
+        
+        table = cls(
+            data,
+            [score.title for score in scores],
+            [score.work_item_type for score in scores],
+            criteria_names, criteria_values,
+            category_names, category_values
+        )
+        table._materialized = dict(enumerate(scores))
+        return table
+    
+    @classmethod
+    def coerce(cls, scores: Union['WorkItemScoreTable', List[WorkItemScore]]) -> 'WorkItemScoreTable':
+        """Return scores as a table, converting a list if needed."""
+        return scores if isinstance(scores, cls) else cls.from_scores(list(scores))
+    
+    @staticmethod
+    def _dicts_to_matrix(rows: List[Dict[str, float]]) -> Tuple[List[str], np.ndarray]:
+        """Convert per-item score dictionaries to (column names, NaN-padded matrix)."""
+        names: Dict[str, int] = {}
+        for row in rows:
+            for name in row:
+                names.setdefault(name, len(names))
+        
+        matrix = np.full((len(rows), len(names)), np.nan)
+        for row_idx, row in enumerate(rows):
+            for name, value in row.items():
+                matrix[row_idx, names[name]] = value
+        
+        return list(names), matrix
+    
+    def __len__(self) -> int:
+        return len(self.data)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._materialize(position) for position in range(*index.indices(len(self)))]
+        
+        position = index + len(self) if index < 0 else index
+        if not 0 <= position < len(self):
+            raise IndexError("work item score index out of range")
+        return self._materialize(position)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (WorkItemScoreTable, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def column(self, name: str) -> np.ndarray:
+        """Get a score column (e.g. 'total_score', 'overall_rank')."""
+        return self.data[name]
+    
+    def category_column(self, category: str) -> np.ndarray:
+        """Get category scores for all items (NaN where missing)."""
+        return self.category_values[:, self.category_names.index(category)]
+    
+    def top(self, n: int) -> List[WorkItemScore]:
+        """Materialize the first n scores."""
+        return self[:n]
+    
+    def page(self, offset: int, limit: int) -> List[WorkItemScore]:
+        """Materialize a page of scores starting at offset."""
+        return self[offset:offset + limit]
+    
+    def iter_pages(self, page_size: int = 50, offset: int = 0) -> Iterator[List[WorkItemScore]]:
+        """Yield consecutive pages of scores in table order.
+        
+        Scores created for a page are not cached on the table, so iterating
+        a large table only holds one page of WorkItemScore objects at a time.
+        
+        Args:
+            page_size: Number of scores per page
+            offset: Position of the first score to yield
+            
+        Yields:
+            Lists of at most page_size scores
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        
+        for start in range(max(offset, 0), len(self), page_size):
+            yield [
+                self._materialized.get(position) or self._create_score(position)
+                for position in range(start, min(start + page_size, len(self)))
+            ]
+    
+    def get_score(self, work_item_id: int) -> WorkItemScore:
+        """Materialize the score of a specific work item."""
+        if self._positions is None:
+            self._positions = {}
+            for position, item_id in enumerate(self.data['work_item_id'].tolist()):
+                self._positions.setdefault(item_id, position)
+        return self._materialize(self._positions[work_item_id])
+    
+    def reorder(self, order: np.ndarray) -> 'WorkItemScoreTable':
+        """Create a table with rows taken in the given order."""
+        return WorkItemScoreTable(
+            self.data[order],
+            [self.titles[i] for i in order],
+            [self.work_item_types[i] for i in order],
+            self.criteria_names, self.criteria_values[order],
+            self.category_names, self.category_values[order],
+            self.calculation_timestamp
+        )
+    
+    def _materialize(self, position: int) -> WorkItemScore:
+        """Create (or reuse) the WorkItemScore for a row."""
+        score = self._materialized.get(position)
+        if score is None:
+            score = self._create_score(position)
+            self._materialized[position] = score
+        return score
+        
+    def _create_score(self, position: int) -> WorkItemScore:
+        """Create the WorkItemScore for a row."""
+        row = self.data[position]
+        return WorkItemScore(
+            work_item_id=int(row['work_item_id']),
+            title=self.titles[position],
+            work_item_type=self.work_item_types[position],
+            total_score=float(row['total_score']),
+            financial_score=float(row['financial_score']),
+            strategic_score=float(row['strategic_score']),
+            overall_rank=int(row['overall_rank']),
+            financial_rank=int(row['financial_rank']),
+            strategic_rank=int(row['strategic_rank']),
+            financial_components={name: float(row[name]) for name in self.FINANCIAL_COMPONENTS},
+            criteria_scores=self._row_dict(self.criteria_names, self.criteria_values[position]),
+            category_scores=self._row_dict(self.category_names, self.category_values[position]),
+            confidence_level=float(row['confidence_level']),
+            risk_level='medium',  # TODO: Extract from financial data
+            risk_adjustment=float(row['risk_adjustment']),
+            calculation_timestamp=self.calculation_timestamp,
+            data_quality_score=float(row['data_quality_score'])
+        )
+    
+    @staticmethod
+    def _row_dict(names: List[str], values: np.ndarray) -> Dict[str, float]:
+        """Convert a matrix row back to a score dictionary, skipping missing values."""
+        return {name: float(value) for name, value in zip(names, values.tolist()) if not math.isnan(value)}
+
+
+# Component scores used for work items without financial or strategic data
+DEFAULT_FINANCIAL_SCORES: Dict[str, float] = {
+    'combined_financial_score': 0.0,
+    'npv_score': 0.0,
+    'roi_score': 0.0,
+    'copq_score': 0.0,
+    'delay_urgency_score': 0.0,
+    'confidence_level': 0.0,
+    'risk_adjustment_factor': 1.0
+}
+
+DEFAULT_STRATEGIC_SCORES: Dict[str, Any] = {
+    'total_score': 0.0,
+    'category_scores': {},
+    'criterion_scores': {}
+}
+
+
 class QVFScoringEngine:
     """Advanced QVF scoring engine with financial integration.
     
@@ -225,7 +454,8 @@ class QVFScoringEngine:
         work_items: List[ADOWorkItem],
         qvf_config: QVFCriteriaConfiguration,
         financial_data: Dict[int, FinancialMetrics],  # work_item_id -> financial_metrics
-        custom_scoring_config: Optional[ScoringConfiguration] = None
+        custom_scoring_config: Optional[ScoringConfiguration] = None,
+        top_k: Optional[int] = None
     ) -> Dict[str, Any]:
         """Score work items with integrated financial and criteria analysis.
         
@@ -234,6 +464,10 @@ class QVFScoringEngine:
             qvf_config: QVF criteria configuration
             financial_data: Financial metrics by work item ID
             custom_scoring_config: Override default scoring configuration
+            top_k: Only rank and return the k highest scoring items. Their
+                ranks and the score distributions still cover every item,
+                while ranking insights and recommendations describe the
+                returned items.
             
         Returns:
             Comprehensive scoring results with rankings and analysis
@@ -241,6 +475,9 @@ class QVFScoringEngine:
         config = custom_scoring_config or self.scoring_config
         logger.info(f"Scoring {len(work_items)} work items with financial integration")
         
+        if top_k is not None and top_k < 1:
+            raise ScoringValidationError(f"top_k must be positive, got {top_k}")
+        
         # Validate inputs
         self._validate_scoring_inputs(work_items, qvf_config, financial_data)
         
@@ -256,11 +493,14 @@ class QVFScoringEngine:
         )
         
         # Generate rankings
-        ranked_scores = self._generate_rankings(combined_scores)
+        ranked_scores = self._generate_rankings(combined_scores, top_k)
+        
+        # Portfolio-wide statistics cover every scored item, also in top-K mode
+        portfolio_scores = ranked_scores if top_k is None else combined_scores
         
         # Calculate portfolio-level analytics
         portfolio_analytics = self._calculate_portfolio_analytics(
-            ranked_scores, financial_data, strategic_results
+            ranked_scores, financial_data, strategic_results, portfolio_scores
         )
         
         # Build comprehensive results
@@ -269,11 +509,12 @@ class QVFScoringEngine:
                 'integration_mode': config.integration_mode.value,
                 'financial_weight': config.financial_weight,
                 'strategic_weight': config.strategic_weight,
-                'total_items_scored': len(ranked_scores)
+                'total_items_scored': len(portfolio_scores),
+                'top_k': top_k
             },
             'work_item_scores': ranked_scores,
             'portfolio_analytics': portfolio_analytics,
-            'scoring_quality': self._assess_scoring_quality(ranked_scores, financial_scores, strategic_results),
+            'scoring_quality': self._assess_scoring_quality(portfolio_scores, financial_scores, strategic_results),
             'financial_summary': self._summarize_financial_impact(financial_scores),
             'strategic_summary': self._summarize_strategic_alignment(strategic_results),
             'calculation_metadata': {
@@ -284,9 +525,42 @@ class QVFScoringEngine:
             }
         }
         
-        logger.info(f"Scoring completed. Top item: '{ranked_scores[0].title}' with score {ranked_scores[0].total_score:.3f}")
+        logger.info(f"Scoring completed. Top item: '{ranked_scores.titles[0]}' with score {ranked_scores.column('total_score')[0]:.3f}")
         return results
     
+    def iter_ranked_pages(
+        self,
+        work_items: List[ADOWorkItem],
+        qvf_config: QVFCriteriaConfiguration,
+        financial_data: Dict[int, FinancialMetrics],
+        page_size: int = 50,
+        custom_scoring_config: Optional[ScoringConfiguration] = None
+    ) -> Iterator[List[WorkItemScore]]:
+        """Stream ranked work item scores one page at a time.
+        
+        Scores are combined and ranked as columns without portfolio
+        analytics; WorkItemScore objects are only created for the page being
+        yielded, so callers can stop early or page through large portfolios.
+        
+        Args:
+            work_items: List of work items to score
+            qvf_config: QVF criteria configuration
+            financial_data: Financial metrics by work item ID
+            page_size: Number of scores per page
+            custom_scoring_config: Override default scoring configuration
+            
+        Yields:
+            Pages of scores in overall rank order
+        """
+        config = custom_scoring_config or self.scoring_config
+        self._validate_scoring_inputs(work_items, qvf_config, financial_data)
+        
+        financial_scores = self._calculate_financial_scores(financial_data, work_items)
+        strategic_results = self._calculate_strategic_scores(work_items, qvf_config)
+        combined_scores = self._combine_scores(financial_scores, strategic_results, config, work_items)
+        
+        yield from self._generate_rankings(combined_scores).iter_pages(page_size)
+    
     def _validate_scoring_inputs(
         self,
         work_items: List[ADOWorkItem],
@@ -333,19 +607,35 @@ class QVFScoringEngine:
             all_financial_values.append(scores['combined_financial_score'])
         
         # Dynamic normalization if enabled
-        if self.scoring_config.enable_dynamic_normalization and all_financial_values:
-            normalization_factor = np.percentile(all_financial_values, 
-                                                self.scoring_config.normalization_percentile * 100)
+        normalization_factor = self.financial_normalization_factor(all_financial_values)
             
-            if normalization_factor > 0:
-                for work_item_id in financial_scores:
-                    scores = financial_scores[work_item_id]
-                    scores['normalized_combined_score'] = min(1.0, scores['combined_financial_score'] / normalization_factor)
+        if normalization_factor:
+            for scores in financial_scores.values():
+                self.apply_financial_normalization(scores, normalization_factor)
                 
-                logger.info(f"Applied dynamic normalization with factor {normalization_factor:.3f}")
+            logger.info(f"Applied dynamic normalization with factor {normalization_factor:.3f}")
         
         return financial_scores
     
+    def financial_normalization_factor(self, combined_financial_scores: List[float]) -> Optional[float]:
+        """Percentile-based normalization factor for combined financial scores.
+        
+        Returns None when dynamic normalization is disabled, there are no
+        scores, or the percentile is not positive.
+        """
+        if not (self.scoring_config.enable_dynamic_normalization and combined_financial_scores):
+            return None
+        
+        normalization_factor = float(np.percentile(
+            combined_financial_scores, self.scoring_config.normalization_percentile * 100
+        ))
+        return normalization_factor if normalization_factor > 0 else None
+    
+    @staticmethod
+    def apply_financial_normalization(scores: Dict[str, float], normalization_factor: float) -> None:
+        """Set the normalized combined financial score for one work item."""
+        scores['normalized_combined_score'] = min(1.0, scores['combined_financial_score'] / normalization_factor)
+    
     def _calculate_strategic_scores(
         self,
         work_items: List[ADOWorkItem],
@@ -374,147 +664,266 @@ class QVFScoringEngine:
         strategic_results: Dict[str, Any],
         config: ScoringConfiguration,
         work_items: List[ADOWorkItem]
-    ) -> List[WorkItemScore]:
+    ) -> WorkItemScoreTable:
         """Combine financial and strategic scores based on integration mode."""
         logger.info(f"Combining scores using {config.integration_mode.value} integration")
         
-        combined_scores = []
         strategic_by_id = strategic_results['scores_by_id']
+        data = np.zeros(len(work_items), dtype=WorkItemScoreTable.SCORE_DTYPE)
+        financial_components = np.zeros(len(work_items))
+        criteria_rows = []
+        category_rows = []
         
-        # Collect all strategic scores for normalization
-        all_strategic_scores = [strategic_by_id.get(item.work_item_id, {'total_score': 0.0})['total_score'] 
-                               for item in work_items]
+        for row, work_item in enumerate(work_items):
+            work_item_id = work_item.work_item_id
+            
+            # Get financial scores (default to zero if not available)
+            financial_data = financial_scores.get(work_item_id, DEFAULT_FINANCIAL_SCORES)
+            
+            # Get strategic scores (should always be available)
+            strategic_data = strategic_by_id.get(work_item_id, DEFAULT_STRATEGIC_SCORES)
+            
+            data[row] = (
+                work_item_id, 0.0,
+                financial_data['combined_financial_score'],
+                strategic_data['total_score'],
+                0, 0, 0,  # Ranks are set in ranking step
+                financial_data.get('npv_score', 0.0),
+                financial_data.get('roi_score', 0.0),
+                financial_data.get('copq_score', 0.0),
+                financial_data.get('delay_urgency_score', 0.0),
+                financial_data.get('confidence_level', 0.5),
+                financial_data['risk_adjustment_factor'],
+                1.0
+            )
+            financial_components[row] = financial_data.get(
+                'normalized_combined_score', financial_data['combined_financial_score']
+            )
+            criteria_rows.append(strategic_data.get('criterion_scores', {}))
+            category_rows.append(strategic_data.get('category_scores', {}))
         
         # Calculate normalization factor for strategic scores if needed
-        max_strategic_score = max(all_strategic_scores) if all_strategic_scores else 1.0
-        strategic_normalization_factor = max(1.0, max_strategic_score)  # Ensure we don't amplify scores
+        strategic_normalization_factor = self.strategic_normalization_factor(data['strategic_score'].tolist())
         
         if strategic_normalization_factor > 1.0:
             logger.info(f"Normalizing strategic scores with factor {strategic_normalization_factor:.3f}")
         
-        for work_item in work_items:
-            work_item_id = work_item.work_item_id
+        # Normalize strategic score to 0-1 range
+        data['strategic_score'] /= strategic_normalization_factor
             
-            # Get financial scores (default to zero if not available)
-            financial_data = financial_scores.get(work_item_id, {
-                'combined_financial_score': 0.0,
-                'npv_score': 0.0,
-                'roi_score': 0.0,
-                'copq_score': 0.0,
-                'delay_urgency_score': 0.0,
-                'confidence_level': 0.0,
-                'risk_adjustment_factor': 1.0
-            })
+        data['total_score'] = self.combine_score_columns(
+            data['financial_score'], financial_components, data['risk_adjustment'],
+            data['strategic_score'], config
+        )
             
-            # Get strategic scores (should always be available)
-            strategic_data = strategic_by_id.get(work_item_id, {
-                'total_score': 0.0,
-                'category_scores': {},
-                'criterion_scores': {}
-            })
+        criteria_names, criteria_values = WorkItemScoreTable._dicts_to_matrix(criteria_rows)
+        category_names, category_values = WorkItemScoreTable._dicts_to_matrix(category_rows)
             
-            # Normalize strategic score to 0-1 range if it's outside this range
-            strategic_score = strategic_data['total_score']
-            if strategic_score > 1.0:
-                logger.debug(f"Strategic score {strategic_score:.3f} > 1.0 for item {work_item_id}, will normalize")
-                # We'll normalize after collecting all strategic scores
+        return WorkItemScoreTable(
+            data,
+            [work_item.title for work_item in work_items],
+            [work_item.work_item_type.value for work_item in work_items],
+            criteria_names, criteria_values,
+            category_names, category_values
+        )
             
-            # Normalize strategic score
-            normalized_strategic_score = strategic_data['total_score'] / strategic_normalization_factor
+    @staticmethod
+    def strategic_normalization_factor(strategic_scores: List[float]) -> float:
+        """Factor that scales strategic scores into 0-1 without amplifying them."""
+        max_strategic_score = max(strategic_scores) if strategic_scores else 1.0
+        return max(1.0, max_strategic_score)
             
-            # Calculate combined score based on integration mode
-            if config.integration_mode == IntegrationMode.FINANCIAL_ONLY:
-                total_score = financial_data['combined_financial_score']
-            elif config.integration_mode == IntegrationMode.CRITERIA_ONLY:
-                total_score = normalized_strategic_score
-            elif config.integration_mode == IntegrationMode.BALANCED:
-                financial_component = financial_data.get('normalized_combined_score', financial_data['combined_financial_score'])
-                strategic_component = normalized_strategic_score
-                total_score = (config.financial_weight * financial_component + 
-                             config.strategic_weight * strategic_component)
-            elif config.integration_mode == IntegrationMode.FINANCIAL_PRIORITY:
-                # Higher weight to financial, but include strategic as modifier
-                financial_component = financial_data.get('normalized_combined_score', financial_data['combined_financial_score'])
-                strategic_modifier = 1.0 + (normalized_strategic_score - 0.5) * 0.2  # ±20% modifier
-                total_score = financial_component * strategic_modifier
-            elif config.integration_mode == IntegrationMode.STRATEGIC_PRIORITY:
-                # Higher weight to strategic, but include financial as modifier
-                strategic_component = normalized_strategic_score
-                financial_modifier = 1.0 + (financial_data['combined_financial_score'] - 0.5) * 0.2  # ±20% modifier
-                total_score = strategic_component * financial_modifier
-            else:
-                # Default to balanced
-                total_score = (config.financial_weight * financial_data['combined_financial_score'] + 
-                             config.strategic_weight * normalized_strategic_score)
+    def combine_item_score(
+        self,
+        financial_data: Dict[str, float],
+        normalized_strategic_score: float,
+        config: ScoringConfiguration
+    ) -> float:
+        """Combine one work item's financial and strategic scores into a total score in [0, 1]."""
+        total_score = self.combine_score_columns(
+            np.array([financial_data['combined_financial_score']]),
+            np.array([financial_data.get('normalized_combined_score', financial_data['combined_financial_score'])]),
+            np.array([financial_data['risk_adjustment_factor']]),
+            np.array([normalized_strategic_score]),
+            config
+        )
+        return float(total_score[0])
             
-            # Apply risk adjustment if enabled
-            if config.risk_adjustment_enabled:
-                risk_penalty = min(config.max_risk_penalty, 
-                                 (2.0 - financial_data['risk_adjustment_factor']) * config.max_risk_penalty)
-                total_score = total_score * (1.0 - risk_penalty)
+    @staticmethod
+    def combine_score_columns(
+        financial_scores: np.ndarray,
+        financial_components: np.ndarray,
+        risk_adjustment_factors: np.ndarray,
+        normalized_strategic_scores: np.ndarray,
+        config: ScoringConfiguration
+    ) -> np.ndarray:
+        """Combine financial and strategic score columns into total scores in [0, 1].
             
-            # Create work item score object
-            score_obj = WorkItemScore(
-                work_item_id=work_item_id,
-                title=work_item.title,
-                work_item_type=work_item.work_item_type.value,
-                total_score=max(0.0, min(1.0, total_score)),  # Clamp to [0,1]
-                financial_score=financial_data['combined_financial_score'],
-                strategic_score=normalized_strategic_score,
-                overall_rank=0,  # Will be set in ranking step
-                financial_rank=0,  # Will be set in ranking step
-                strategic_rank=0,  # Will be set in ranking step
-                financial_components={
-                    'npv_score': financial_data.get('npv_score', 0.0),
-                    'roi_score': financial_data.get('roi_score', 0.0),
-                    'copq_score': financial_data.get('copq_score', 0.0),
-                    'delay_urgency_score': financial_data.get('delay_urgency_score', 0.0)
-                },
-                criteria_scores=strategic_data.get('criterion_scores', {}),
-                category_scores=strategic_data.get('category_scores', {}),
-                confidence_level=financial_data.get('confidence_level', 0.5),
-                risk_level='medium',  # TODO: Extract from financial data
-                risk_adjustment=financial_data.get('risk_adjustment_factor', 1.0),
-                npv_value=None,  # TODO: Extract from financial calculations
-                roi_percentage=None,  # TODO: Extract from financial calculations
-                payback_period=None  # TODO: Extract from financial calculations
-            )
+        Args:
+            financial_scores: Combined financial scores
+            financial_components: Normalized financial scores (combined score where not normalized)
+            risk_adjustment_factors: Financial risk adjustment factors
+            normalized_strategic_scores: Strategic scores normalized to 0-1
+            config: Scoring configuration
             
-            combined_scores.append(score_obj)
-        
-        return combined_scores
+        Returns:
+            Total scores clamped to [0, 1]
+        """
+        # Calculate combined score based on integration mode
+        if config.integration_mode == IntegrationMode.FINANCIAL_ONLY:
+            total_scores = financial_scores.copy()
+        elif config.integration_mode == IntegrationMode.CRITERIA_ONLY:
+            total_scores = normalized_strategic_scores.copy()
+        elif config.integration_mode == IntegrationMode.BALANCED:
+            total_scores = (config.financial_weight * financial_components + 
+                          config.strategic_weight * normalized_strategic_scores)
+        elif config.integration_mode == IntegrationMode.FINANCIAL_PRIORITY:
+            # Higher weight to financial, but include strategic as modifier
+            strategic_modifier = 1.0 + (normalized_strategic_scores - 0.5) * 0.2  # ±20% modifier
+            total_scores = financial_components * strategic_modifier
+        elif config.integration_mode == IntegrationMode.STRATEGIC_PRIORITY:
+            # Higher weight to strategic, but include financial as modifier
+            financial_modifier = 1.0 + (financial_scores - 0.5) * 0.2  # ±20% modifier
+            total_scores = normalized_strategic_scores * financial_modifier
+        else:
+            # Default to balanced
+            total_scores = (config.financial_weight * financial_scores + 
+                          config.strategic_weight * normalized_strategic_scores)
+        
+        # Apply risk adjustment if enabled
+        if config.risk_adjustment_enabled:
+            risk_penalty = np.minimum(config.max_risk_penalty, 
+                                      (2.0 - risk_adjustment_factors) * config.max_risk_penalty)
+            total_scores = total_scores * (1.0 - risk_penalty)
     
-    def _generate_rankings(self, combined_scores: List[WorkItemScore]) -> List[WorkItemScore]:
-        """Generate rankings for all score types."""
-        # Sort by total score for overall ranking
-        combined_scores.sort(key=lambda x: x.total_score, reverse=True)
-        for rank, score in enumerate(combined_scores, 1):
-            score.overall_rank = rank
+        return np.clip(total_scores, 0.0, 1.0)  # Clamp to [0,1]
+        
+    @staticmethod
+    def create_work_item_score(
+        work_item_id: int,
+        title: str,
+        work_item_type: str,
+        total_score: float,
+        financial_data: Dict[str, float],
+        strategic_data: Dict[str, Any],
+        normalized_strategic_score: float
+    ) -> WorkItemScore:
+        """Create an unranked WorkItemScore from combined score components."""
+        return WorkItemScore(
+            work_item_id=work_item_id,
+            title=title,
+            work_item_type=work_item_type,
+            total_score=total_score,
+            financial_score=financial_data['combined_financial_score'],
+            strategic_score=normalized_strategic_score,
+            overall_rank=0,  # Will be set in ranking step
+            financial_rank=0,  # Will be set in ranking step
+            strategic_rank=0,  # Will be set in ranking step
+            financial_components={
+                'npv_score': financial_data.get('npv_score', 0.0),
+                'roi_score': financial_data.get('roi_score', 0.0),
+                'copq_score': financial_data.get('copq_score', 0.0),
+                'delay_urgency_score': financial_data.get('delay_urgency_score', 0.0)
+            },
+            criteria_scores=strategic_data.get('criterion_scores', {}),
+            category_scores=strategic_data.get('category_scores', {}),
+            confidence_level=financial_data.get('confidence_level', 0.5),
+            risk_level='medium',  # TODO: Extract from financial data
+            risk_adjustment=financial_data.get('risk_adjustment_factor', 1.0),
+            npv_value=None,  # TODO: Extract from financial calculations
+            roi_percentage=None,  # TODO: Extract from financial calculations
+            payback_period=None  # TODO: Extract from financial calculations
+        )
         
-        # Sort by financial score and set financial ranks
-        financial_sorted = sorted(combined_scores, key=lambda x: x.financial_score, reverse=True)
-        for rank, score in enumerate(financial_sorted, 1):
-            score.financial_rank = rank
+    def _generate_rankings(
+        self,
+        combined_scores: WorkItemScoreTable,
+        top_k: Optional[int] = None
+    ) -> WorkItemScoreTable:
+        """Generate rankings for all score types.
+        
+        With top_k only the k highest scoring items are ordered and returned.
+        Their financial and strategic ranks are the ones a full ranking of
+        the portfolio would assign.
+        """
+        if top_k is not None and top_k < len(combined_scores):
+            total_scores = combined_scores.column('total_score')
+            order = self._top_k_order(total_scores, top_k)
+            
+            ranked = combined_scores.reorder(order)
+            ranked.data['overall_rank'] = np.arange(1, len(order) + 1)
+            for score_column, rank_column in (('financial_score', 'financial_rank'), ('strategic_score', 'strategic_rank')):
+                ranked.data[rank_column] = self._portfolio_ranks(
+                    combined_scores.column(score_column), total_scores, order
+                )
+            return ranked
+        
+        ranks = np.arange(1, len(combined_scores) + 1)
         
-        # Sort by strategic score and set strategic ranks
-        strategic_sorted = sorted(combined_scores, key=lambda x: x.strategic_score, reverse=True)
-        for rank, score in enumerate(strategic_sorted, 1):
-            score.strategic_rank = rank
+        # Sort by total score for overall ranking (stable, ties keep input order)
+        ranked = combined_scores.reorder(np.argsort(-combined_scores.column('total_score'), kind='stable'))
+        ranked.data['overall_rank'] = ranks
+        
+        # Set financial and strategic ranks from stable sorts of the overall order
+        for score_column, rank_column in (('financial_score', 'financial_rank'), ('strategic_score', 'strategic_rank')):
+            order = np.argsort(-ranked.column(score_column), kind='stable')
+            ranked.data[rank_column][order] = ranks
         
         # Return in overall ranking order
-        return combined_scores
+        return ranked
+    
+    @staticmethod
+    def _top_k_order(values: np.ndarray, k: int) -> np.ndarray:
+        """Positions of the k largest values, descending with ties in input order.
+        
+        Equivalent to np.argsort(-values, kind='stable')[:k] but partitions
+        instead of sorting the whole column.
+        """
+        cutoff = len(values) - k
+        threshold = np.partition(values, cutoff)[cutoff]
+        
+        above = np.flatnonzero(values > threshold)
+        tied = np.flatnonzero(values == threshold)[:k - len(above)]
+        candidates = np.sort(np.concatenate([above, tied]))
+        return candidates[np.argsort(-values[candidates], kind='stable')]
+    
+    @staticmethod
+    def _portfolio_ranks(scores: np.ndarray, total_scores: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Ranks of selected rows within a stable descending sort of scores.
+        
+        Ties are broken by overall order (total score, then input order), as
+        when the full ranking sorts the overall ordering by score.
+        """
+        positions = np.arange(len(scores))
+        ranks = np.empty(len(rows), dtype=np.int64)
+        for i, row in enumerate(rows):
+            ahead_overall = (total_scores > total_scores[row]) | (
+                (total_scores == total_scores[row]) & (positions < row)
+            )
+            ranks[i] = (
+                np.count_nonzero(scores > scores[row]) +
+                np.count_nonzero((scores == scores[row]) & ahead_overall) + 1
+            )
+        return ranks
     
     def _calculate_portfolio_analytics(
         self,
-        ranked_scores: List[WorkItemScore],
+        ranked_scores: WorkItemScoreTable,
         financial_data: Dict[int, FinancialMetrics],
-        strategic_results: Dict[str, Any]
+        strategic_results: Dict[str, Any],
+        portfolio_scores: Optional[WorkItemScoreTable] = None
     ) -> Dict[str, Any]:
-        """Calculate portfolio-level analytics and insights."""
+        """Calculate portfolio-level analytics and insights.
+        
+        Score distributions use portfolio_scores (every scored item) when
+        ranked_scores only holds the top of the ranking.
+        """
+        portfolio_scores = portfolio_scores if portfolio_scores is not None else ranked_scores
+        
         # Score distributions
-        total_scores = [s.total_score for s in ranked_scores]
-        financial_scores = [s.financial_score for s in ranked_scores]
-        strategic_scores = [s.strategic_score for s in ranked_scores]
+        total_scores = portfolio_scores.column('total_score')
+        financial_scores = portfolio_scores.column('financial_score')
+        strategic_scores = portfolio_scores.column('strategic_score')
         
         # Financial portfolio analysis
         portfolio_financial = None
@@ -524,6 +933,8 @@ class QVFScoringEngine:
                 financial_metrics_list
             )
         
+        total_percentiles = np.percentile(total_scores, [25, 50, 75, 90])
+        
         return {
             'score_distributions': {
                 'total_score': {
@@ -532,16 +943,16 @@ class QVFScoringEngine:
                     'min': np.min(total_scores),
                     'max': np.max(total_scores),
                     'percentiles': {
-                        '25th': np.percentile(total_scores, 25),
-                        '50th': np.percentile(total_scores, 50),
-                        '75th': np.percentile(total_scores, 75),
-                        '90th': np.percentile(total_scores, 90)
+                        '25th': total_percentiles[0],
+                        '50th': total_percentiles[1],
+                        '75th': total_percentiles[2],
+                        '90th': total_percentiles[3]
                     }
                 },
                 'financial_score': {
                     'mean': np.mean(financial_scores),
                     'std': np.std(financial_scores),
-                    'coverage': len([s for s in financial_scores if s > 0]) / len(financial_scores)
+                    'coverage': np.count_nonzero(financial_scores > 0) / len(financial_scores)
                 },
                 'strategic_score': {
                     'mean': np.mean(strategic_scores),
@@ -550,71 +961,86 @@ class QVFScoringEngine:
                 }
             },
             'portfolio_financial': portfolio_financial,
-            'ranking_insights': self._generate_ranking_insights(ranked_scores),
+            'ranking_insights': self._generate_ranking_insights(ranked_scores, len(portfolio_scores)),
             'optimization_recommendations': self._generate_optimization_recommendations(ranked_scores)
         }
     
-    def _generate_ranking_insights(self, ranked_scores: List[WorkItemScore]) -> Dict[str, Any]:
+    def _generate_ranking_insights(
+        self,
+        ranked_scores: WorkItemScoreTable,
+        portfolio_size: Optional[int] = None
+    ) -> Dict[str, Any]:
         """Generate insights about ranking patterns."""
-        # Find items where financial and strategic rankings differ significantly
-        ranking_misalignments = []
-        for score in ranked_scores:
-            rank_difference = abs(score.financial_rank - score.strategic_rank)
-            if rank_difference > len(ranked_scores) * 0.2:  # >20% of total items
-                ranking_misalignments.append({
-                    'work_item_id': score.work_item_id,
-                    'title': score.title,
-                    'financial_rank': score.financial_rank,
-                    'strategic_rank': score.strategic_rank,
-                    'rank_difference': rank_difference
-                })
+        financial_ranks = ranked_scores.column('financial_rank')
+        strategic_ranks = ranked_scores.column('strategic_rank')
+        portfolio_size = portfolio_size or len(ranked_scores)
         
-        # Top performers in each category
-        top_financial = sorted(ranked_scores, key=lambda x: x.financial_score, reverse=True)[:5]
-        top_strategic = sorted(ranked_scores, key=lambda x: x.strategic_score, reverse=True)[:5]
+        # Find items where financial and strategic rankings differ significantly
+        rank_differences = np.abs(financial_ranks - strategic_ranks)
+        misaligned = np.flatnonzero(rank_differences > portfolio_size * 0.2)  # >20% of total items
+        ranking_misalignments = [
+            {
+                'work_item_id': int(ranked_scores.data['work_item_id'][row]),
+                'title': ranked_scores.titles[row],
+                'financial_rank': int(financial_ranks[row]),
+                'strategic_rank': int(strategic_ranks[row]),
+                'rank_difference': int(rank_differences[row])
+            }
+            for row in misaligned
+        ]
+        
+        # Top performers in each category (ranks follow stable descending sorts)
+        def top_performers(rank_column: str, score_column: str) -> List[Dict[str, Any]]:
+            ranks = ranked_scores.column(rank_column)
+            rows = np.argsort(ranks)[:5]
+            return [
+                {
+                    'id': int(ranked_scores.data['work_item_id'][row]),
+                    'title': ranked_scores.titles[row],
+                    'score': float(ranked_scores.data[score_column][row])
+                }
+                for row in rows
+            ]
         
         return {
             'ranking_misalignments': ranking_misalignments,
-            'top_financial_performers': [{'id': s.work_item_id, 'title': s.title, 'score': s.financial_score} for s in top_financial],
-            'top_strategic_performers': [{'id': s.work_item_id, 'title': s.title, 'score': s.strategic_score} for s in top_strategic],
-            'score_correlation': np.corrcoef([s.financial_score for s in ranked_scores], 
-                                           [s.strategic_score for s in ranked_scores])[0,1] if len(ranked_scores) > 1 else 0.0
+            'top_financial_performers': top_performers('financial_rank', 'financial_score'),
+            'top_strategic_performers': top_performers('strategic_rank', 'strategic_score'),
+            'score_correlation': np.corrcoef(ranked_scores.column('financial_score'), 
+                                           ranked_scores.column('strategic_score'))[0,1] if len(ranked_scores) > 1 else 0.0
         }
     
-    def _generate_optimization_recommendations(self, ranked_scores: List[WorkItemScore]) -> List[Dict[str, str]]:
+    def _generate_optimization_recommendations(self, ranked_scores: WorkItemScoreTable) -> List[Dict[str, str]]:
         """Generate recommendations for portfolio optimization."""
         recommendations = []
         
         # Check for low-confidence high-ranking items
-        high_rank_low_confidence = [s for s in ranked_scores[:10] if s.confidence_level < 0.5]
+        high_rank_low_confidence = np.count_nonzero(ranked_scores.column('confidence_level')[:10] < 0.5)
         if high_rank_low_confidence:
             recommendations.append({
                 'type': 'data_quality',
                 'priority': 'high',
-                'message': f"Top-ranked items have low financial confidence. Consider gathering more financial data for {len(high_rank_low_confidence)} high-priority items."
+                'message': f"Top-ranked items have low financial confidence. Consider gathering more financial data for {high_rank_low_confidence} high-priority items."
             })
         
         # Check for high financial value but low strategic alignment
-        financial_strategic_mismatch = [s for s in ranked_scores if s.financial_score > 0.7 and s.strategic_score < 0.3]
+        financial_strategic_mismatch = np.count_nonzero(
+            (ranked_scores.column('financial_score') > 0.7) & (ranked_scores.column('strategic_score') < 0.3)
+        )
         if financial_strategic_mismatch:
             recommendations.append({
                 'type': 'strategic_alignment',
                 'priority': 'medium',
-                'message': f"Found {len(financial_strategic_mismatch)} items with high financial value but low strategic alignment. Review strategic criteria weighting."
+                'message': f"Found {financial_strategic_mismatch} items with high financial value but low strategic alignment. Review strategic criteria weighting."
             })
         
         # Check portfolio balance
-        top_quartile = ranked_scores[:len(ranked_scores)//4]
-        category_distribution = {}
-        for score in top_quartile:
-            for category, cat_score in score.category_scores.items():
-                if category not in category_distribution:
-                    category_distribution[category] = []
-                category_distribution[category].append(cat_score)
+        top_quartile_size = len(ranked_scores) // 4
+        category_counts = np.count_nonzero(~np.isnan(ranked_scores.category_values[:top_quartile_size]), axis=0)
         
         # Look for category imbalances
-        for category, scores in category_distribution.items():
-            if len(scores) < len(top_quartile) * 0.2:  # Less than 20% representation
+        for category, count in zip(ranked_scores.category_names, category_counts):
+            if 0 < count < top_quartile_size * 0.2:  # Less than 20% representation
                 recommendations.append({
                     'type': 'portfolio_balance',
                     'priority': 'low',
@@ -625,7 +1051,7 @@ class QVFScoringEngine:
     
     def _assess_scoring_quality(
         self,
-        ranked_scores: List[WorkItemScore],
+        ranked_scores: WorkItemScoreTable,
         financial_scores: Dict[int, Dict[str, float]],
         strategic_results: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -634,14 +1060,14 @@ class QVFScoringEngine:
         financial_coverage = len(financial_scores) / len(ranked_scores)
         
         # Average confidence levels
-        avg_confidence = np.mean([s.confidence_level for s in ranked_scores])
+        avg_confidence = np.mean(ranked_scores.column('confidence_level'))
         
         # Consistency with AHP
         ahp_consistency = strategic_results.get('configuration', {}).get('is_consistent', False)
         consistency_ratio = strategic_results.get('configuration', {}).get('consistency_ratio', 1.0)
         
         # Score distribution quality
-        total_scores = [s.total_score for s in ranked_scores]
+        total_scores = ranked_scores.column('total_score')
         score_range = np.max(total_scores) - np.min(total_scores)
         score_variance = np.var(total_scores)
         
@@ -717,31 +1143,31 @@ class QVFScoringEngine:
     
     def analyze_financial_contribution(self, scoring_results: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze the contribution of financial factors to final rankings."""
-        work_item_scores = scoring_results['work_item_scores']
+        work_item_scores = WorkItemScoreTable.coerce(scoring_results['work_item_scores'])
         
         # Correlation between financial scores and final rankings
-        financial_scores = [s.financial_score for s in work_item_scores]
-        total_scores = [s.total_score for s in work_item_scores]
+        financial_scores = work_item_scores.column('financial_score')
+        total_scores = work_item_scores.column('total_score')
         
         financial_correlation = np.corrcoef(financial_scores, total_scores)[0,1] if len(financial_scores) > 1 else 0.0
         
         # Items where financial factors significantly impacted ranking
-        significant_financial_impact = []
-        for score in work_item_scores:
-            # Calculate what ranking would be with strategic only
-            strategic_only_rank = score.strategic_rank
-            actual_rank = score.overall_rank
+        # (compare what ranking would be with strategic only)
+        strategic_only_ranks = work_item_scores.column('strategic_rank')
+        actual_ranks = work_item_scores.column('overall_rank')
+        rank_changes = strategic_only_ranks - actual_ranks
             
-            rank_change = strategic_only_rank - actual_rank
-            if abs(rank_change) > len(work_item_scores) * 0.1:  # >10% change
-                significant_financial_impact.append({
-                    'work_item_id': score.work_item_id,
-                    'title': score.title,
-                    'strategic_rank': strategic_only_rank,
-                    'actual_rank': actual_rank,
-                    'rank_change': rank_change,
-                    'financial_score': score.financial_score
-                })
+        significant_financial_impact = [
+            {
+                'work_item_id': int(work_item_scores.data['work_item_id'][row]),
+                'title': work_item_scores.titles[row],
+                'strategic_rank': int(strategic_only_ranks[row]),
+                'actual_rank': int(actual_ranks[row]),
+                'rank_change': int(rank_changes[row]),
+                'financial_score': float(financial_scores[row])
+            }
+            for row in np.flatnonzero(np.abs(rank_changes) > len(work_item_scores) * 0.1)  # >10% change
+        ]
         
         return {
             'financial_correlation_with_total': financial_correlation,
@@ -765,7 +1191,7 @@ class QVFScoringEngine:
         logger.info(f"Performing sensitivity analysis with {len(parameter_variations)} parameter variations")
         
         base_results = self.score_work_items_with_financials(work_items, qvf_config, financial_data)
-        base_rankings = {score.work_item_id: score.overall_rank for score in base_results['work_item_scores']}
+        base_rankings = self._rank_lookup(base_results['work_item_scores'])
         
         sensitivity_results = {}
         
@@ -789,7 +1215,7 @@ class QVFScoringEngine:
                     )
                     
                     # Calculate ranking changes
-                    modified_rankings = {score.work_item_id: score.overall_rank for score in modified_results['work_item_scores']}
+                    modified_rankings = self._rank_lookup(modified_results['work_item_scores'])
                     
                     rank_changes = []
                     for work_item_id in base_rankings:
@@ -819,6 +1245,14 @@ class QVFScoringEngine:
             'sensitivity_summary': self._summarize_sensitivity_results(sensitivity_results)
         }
     
+    @staticmethod
+    def _rank_lookup(work_item_scores: WorkItemScoreTable) -> Dict[int, int]:
+        """Map work item IDs to overall ranks."""
+        return dict(zip(
+            work_item_scores.column('work_item_id').tolist(),
+            work_item_scores.column('overall_rank').tolist()
+        ))
+    
     def _summarize_sensitivity_results(self, sensitivity_results: Dict[str, List[Dict]]) -> Dict[str, Any]:
         """Summarize sensitivity analysis results."""
         parameter_impacts = {}
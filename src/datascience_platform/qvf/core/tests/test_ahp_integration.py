@@ -420,6 +420,97 @@ class TestQVFAHPIntegrator:
                 assert matrix_log.shape == (n, n)
                 assert np.allclose(np.diag(matrix_log), 1.0, atol=1e-6)
     
+    def test_score_ratio_matrix_from_level_averages(self):
+        """Test that score ratio matrices use per-criterion averages across work items."""
+        self.integrator.config.conversion_method = ConversionMethod.SCORE_RATIO
+        qvf_scores = self.qvf_results['scores']
+        level_config = {
+            'type': 'criteria',
+            'items': self.qvf_results['configuration']['active_criteria']
+        }
+
+        matrix = self.integrator._generate_matrix_score_ratio(level_config, qvf_scores)
+
+        averages = np.array([
+            np.mean([s['criterion_scores'][c['name']] for s in qvf_scores])
+            for c in level_config['items']
+        ])
+        expected = np.clip(averages[:, None] / averages[None, :], 1/9.0, 9.0)
+        assert np.allclose(matrix, expected)
+
+        # Percentile mapping ranks the same criterion averages
+        matrix_percentile = self.integrator._generate_matrix_percentile(level_config, qvf_scores)
+        assert matrix_percentile.shape == (3, 3)
+        assert not np.allclose(matrix_percentile, 1.0)
+
+    def test_rankings_use_weighted_criterion_scores(self):
+        """Test ranking lookup of QVF entries by work item ID."""
+        qvf_scores = list(reversed(self.qvf_results['scores']))
+        result = self.integrator.convert_qvf_to_ahp(
+            {**self.qvf_results, 'scores': qvf_scores},
+            self.work_items + [
+                ADOWorkItem(work_item_id=99, title="Unscored", work_item_type=WorkItemType.TASK, state="New")
+            ]
+        )
+
+        rankings = {item_id: (score, detailed) for item_id, score, detailed in result.work_item_rankings}
+        assert rankings[99] == (0.0, {})
+
+        for entry in qvf_scores:
+            score, detailed = rankings[entry['work_item_id']]
+            assert np.isclose(score, sum(detailed.values()))
+            assert set(entry['criterion_scores']) <= set(detailed)
+
+    def test_in_place_score_edits_are_picked_up(self):
+        """Test edited score entries are not served from tables of an earlier conversion."""
+        qvf_scores = [dict(entry, criterion_scores=dict(entry['criterion_scores'])) for entry in self.qvf_results['scores']]
+        qvf_results = {**self.qvf_results, 'scores': qvf_scores}
+        level_config = {
+            'type': 'criteria',
+            'items': self.qvf_results['configuration']['active_criteria']
+        }
+        
+        self.integrator.convert_qvf_to_ahp(qvf_results, self.work_items)
+        
+        name = level_config['items'][0]['name']
+        for entry in qvf_scores:
+            entry['criterion_scores'][name] = 0.01
+        result = self.integrator.convert_qvf_to_ahp(qvf_results, self.work_items)
+        
+        fresh = QVFAHPIntegrator(integration_config=self.config).convert_qvf_to_ahp(qvf_results, self.work_items)
+        assert [item_id for item_id, _, _ in result.work_item_rankings] == [
+            item_id for item_id, _, _ in fresh.work_item_rankings
+        ]
+        assert np.allclose(
+            [score for _, score, _ in result.work_item_rankings],
+            [score for _, score, _ in fresh.work_item_rankings]
+        )
+        assert self.integrator._get_level_scores(level_config, qvf_scores)[0] == pytest.approx(0.01)
+    
+    def test_stakeholder_matrices_match_single_stakeholder_preferences(self):
+        """Test batched stakeholder matrices equal per-stakeholder preference matrices."""
+        level_config = {
+            'type': 'criteria',
+            'items': self.qvf_results['configuration']['active_criteria']
+        }
+        names = [item['name'] for item in level_config['items']]
+        stakeholder_preferences = {
+            'cfo': {names[0]: 8.0, names[1]: 2.0},
+            'cto': {name: float(i + 1) for i, name in enumerate(names)},
+            'pmo': {}
+        }
+        
+        stakeholder_ids, matrices = self.integrator._generate_stakeholder_matrices(
+            level_config, stakeholder_preferences
+        )
+        
+        assert stakeholder_ids == ['cfo', 'cto', 'pmo']
+        for stakeholder_id, matrix in zip(stakeholder_ids, matrices):
+            expected = self.integrator._generate_matrix_preferences(
+                level_config, {stakeholder_id: stakeholder_preferences[stakeholder_id]}
+            )
+            assert np.array_equal(matrix, expected)
+    
     def test_full_integration_workflow(self):
         """Test complete QVF to AHP conversion workflow."""
         # Perform conversion
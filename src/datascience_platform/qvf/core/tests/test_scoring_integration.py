@@ -12,11 +12,11 @@ from typing import Dict, List
 # Import modules under test
 from ..scoring import (
     QVFScoringEngine, ScoringConfiguration, IntegrationMode, 
-    FinancialMappingMode, WorkItemScore, ScoringValidationError
+    FinancialMappingMode, WorkItemScore, WorkItemScoreTable, ScoringValidationError
 )
 from ..financial import FinancialMetrics, RiskLevel
 from ..criteria import QVFCriteriaEngine, CriteriaCategory
-from ...ado.models import ADOWorkItem, WorkItemType, WorkItemState
+from ....ado.models import ADOWorkItem, WorkItemType, WorkItemState
 
 class TestQVFScoringEngine(unittest.TestCase):
     """Test suite for QVF scoring engine with financial integration."""
@@ -479,5 +479,147 @@ class TestWorkItemScore(unittest.TestCase):
         self.assertEqual(score.financial_components['roi_score'], 0.9)
 
 
+    def test_work_item_score_table_round_trip(self):
+        """Test tables built from scores materialize equivalent scores and columns."""
+        scores = [
+            WorkItemScore(
+                work_item_id=work_item_id,
+                title=f"Item {work_item_id}",
+                work_item_type="Feature",
+                total_score=total,
+                financial_score=0.5,
+                strategic_score=0.4,
+                overall_rank=rank,
+                financial_rank=rank,
+                strategic_rank=rank,
+                financial_components={'npv_score': 0.1, 'roi_score': 0.2, 'copq_score': 0.3, 'delay_urgency_score': 0.4},
+                criteria_scores={'criterion_1': total} if work_item_id == 1 else {},
+                category_scores={'business_value': total},
+                confidence_level=0.7,
+                risk_level='medium',
+                risk_adjustment=1.0
+            )
+            for rank, (work_item_id, total) in enumerate([(1, 0.9), (2, 0.6)], 1)
+        ]
+        
+        table = WorkItemScoreTable.from_scores(scores)
+        
+        self.assertEqual(len(table), 2)
+        np.testing.assert_array_equal(table.column('total_score'), [0.9, 0.6])
+        self.assertIs(table[0], scores[0])
+        self.assertIs(table.get_score(2), scores[1])
+        
+        # Fresh materialization restores the original values
+        rebuilt = table.reorder(np.array([1, 0]))
+        self.assertEqual(rebuilt[0].work_item_id, 2)
+        self.assertEqual(rebuilt[0].criteria_scores, {})
+        self.assertEqual(rebuilt[1].criteria_scores, {'criterion_1': 0.9})
+        self.assertEqual(rebuilt[1].financial_components, scores[0].financial_components)
+        self.assertEqual(rebuilt[:1][0].category_scores, {'business_value': 0.6})
+
+
+class TestWorkItemScoreTableScoring(unittest.TestCase):
+    """Test suite for columnar scoring results."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.engine = QVFScoringEngine()
+        self.qvf_config = self.engine.criteria_engine.get_default_configuration()
+        self.work_items = [
+            ADOWorkItem(
+                work_item_id=i,
+                title=f"Item {i}",
+                work_item_type=WorkItemType.FEATURE,
+                state=WorkItemState.NEW,
+                business_value_raw=10.0 * i,
+                story_points=i,
+                complexity_score=i,
+                risk_score=i
+            )
+            for i in range(1, 9)
+        ]
+        self.financial_data = {
+            i: FinancialMetrics(
+                initial_investment=10000 * i,
+                expected_revenue=[20000, 30000, 40000],
+                risk_level=RiskLevel.LOW
+            )
+            for i in range(1, 9, 2)
+        }
+        
+    def test_scoring_results_are_ranked_table(self):
+        """Test scoring returns a ranked table that materializes lazily."""
+        engine = self.engine
+        results = engine.score_work_items_with_financials(
+            self.work_items, self.qvf_config, self.financial_data
+        )
+        table = results['work_item_scores']
+        
+        self.assertIsInstance(table, WorkItemScoreTable)
+        self.assertEqual(table.column('overall_rank').tolist(), list(range(1, 9)))
+        self.assertTrue(np.all(np.diff(table.column('total_score')) <= 0))
+        self.assertEqual(sorted(table.column('financial_rank').tolist()), list(range(1, 9)))
+        self.assertEqual(len(table._materialized), 0)
+        
+        top = table.top(3)
+        self.assertEqual([s.overall_rank for s in top], [1, 2, 3])
+        self.assertEqual(len(table._materialized), 3)
+        self.assertEqual(top[0].calculation_timestamp, table.calculation_timestamp)
+        
+        # Analysis accepts plain lists of scores as well as tables
+        from_table = engine.analyze_financial_contribution(results)
+        from_list = engine.analyze_financial_contribution({'work_item_scores': list(table)})
+        self.assertAlmostEqual(
+            from_table['financial_correlation_with_total'],
+            from_list['financial_correlation_with_total']
+        )
+
+    def test_top_k_matches_full_ranking(self):
+        """Test top-K scoring returns the head of the full ranking."""
+        full = self.engine.score_work_items_with_financials(
+            self.work_items, self.qvf_config, self.financial_data
+        )
+        top = self.engine.score_work_items_with_financials(
+            self.work_items, self.qvf_config, self.financial_data, top_k=3
+        )
+        
+        self.assertEqual(len(top['work_item_scores']), 3)
+        self.assertEqual(top['configuration']['total_items_scored'], 8)
+        for column in ('work_item_id', 'overall_rank', 'financial_rank', 'strategic_rank'):
+            self.assertEqual(
+                top['work_item_scores'].column(column).tolist(),
+                full['work_item_scores'].column(column)[:3].tolist()
+            )
+        for stat in ('mean', 'std', 'min', 'max'):
+            self.assertAlmostEqual(
+                top['portfolio_analytics']['score_distributions']['total_score'][stat],
+                full['portfolio_analytics']['score_distributions']['total_score'][stat]
+            )
+        
+        with self.assertRaises(ScoringValidationError):
+            self.engine.score_work_items_with_financials(
+                self.work_items, self.qvf_config, self.financial_data, top_k=0
+            )
+    
+    def test_iter_ranked_pages(self):
+        """Test ranked pages stream the full ranking in order."""
+        full = self.engine.score_work_items_with_financials(
+            self.work_items, self.qvf_config, self.financial_data
+        )
+        pages = list(self.engine.iter_ranked_pages(
+            self.work_items, self.qvf_config, self.financial_data, page_size=3
+        ))
+        
+        self.assertEqual([len(page) for page in pages], [3, 3, 2])
+        self.assertEqual(
+            [score.work_item_id for page in pages for score in page],
+            full['work_item_scores'].column('work_item_id').tolist()
+        )
+        
+        table = full['work_item_scores']
+        self.assertEqual(table.page(3, 3), list(table)[3:6])
+        self.assertEqual(next(table.iter_pages(5, offset=5)), list(table)[5:])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -7,6 +7,7 @@ Key Components:
 - QVFOrchestrator: Main orchestration engine
 - ScoringWorkflow: Workflow management for scoring operations
 - BatchProcessor: High-performance batch processing
+- IncrementalScoringEngine: Rescoring of changed work items only
 - ScoreUpdateScheduler: Scheduling and queue management
 - OperationMonitor: Monitoring and reporting system
 
@@ -39,8 +40,16 @@ from .orchestrator import (
     ScoringMode,
     ScoringWorkflow,
     BatchProcessor,
+    BatchProcessingResult,
     WorkflowResult,
-    OrchestrationError
+    OrchestrationError,
+    IncrementalScoringWorkflow
+)
+from .incremental import (
+    IncrementalScoringEngine,
+    IncrementalScoringState,
+    IncrementalScoringResult,
+    ScoreRankIndex
 )
 
 __all__ = [
@@ -48,6 +57,12 @@ __all__ = [
     "ScoringMode", 
     "ScoringWorkflow",
     "BatchProcessor",
+    "BatchProcessingResult",
     "WorkflowResult",
-    "OrchestrationError"
+    "OrchestrationError",
+    "IncrementalScoringWorkflow",
+    "IncrementalScoringEngine",
+    "IncrementalScoringState",
+    "IncrementalScoringResult",
+    "ScoreRankIndex"
 ]
\ No newline at end of file
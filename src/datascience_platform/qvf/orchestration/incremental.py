@@ -0,0 +1,667 @@
+"""QVF Incremental Scoring
+
+Keeps the inputs and intermediate results of the last scoring run so that
+subsequent runs only recompute work items that actually changed.
+
+Key Features:
+- Persisted per-item inputs, normalized feature rows and normalization statistics
+- Change detection with per-item input fingerprints
+- Full renormalization only when normalization bounds shift
+- Order-statistics rank indexes updated per changed item
+- Write suppression for items whose score did not change
+
+Workflow:
+1. Load items changed since the state watermark (delta query)
+2. Recompute feature rows for changed items only
+3. Recompute normalization statistics over the stored rows
+4. Renormalize all rows from persisted inputs if the bounds shifted
+5. Re-derive ranks and return only items whose score changed
+
+Usage:
+    engine = IncrementalScoringEngine(scoring_engine, state=IncrementalScoringState.load(path))
+    
+    full_load = engine.begin(qvf_config)
+    result = engine.apply_changes(changed_items, financial_data=financial_data)
+    
+    # ... write result.work_item_scores to ADO ...
+    engine.mark_written(written_ids)
+    engine.state.save(path)
+"""
+
+import bisect
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Optional, Any, Iterable, Set, Tuple, Union
+
+import numpy as np
+
+from ..core.scoring import (
+    QVFScoringEngine,
+    ScoringConfiguration,
+    ScoringValidationError,
+    WorkItemScore,
+    DEFAULT_FINANCIAL_SCORES
+)
+from ..core.criteria import QVFCriteriaConfiguration
+from ..core.financial import FinancialMetrics
+from ...ado.ahp import AHPEngine
+from ...ado.models import ADOWorkItem
+
+logger = logging.getLogger(__name__)
+
+
+# State format version, bumped when the persisted layout changes
+STATE_VERSION = 1
+
+
+class ScoreRankIndex:
+    """Order-statistics index for descending score ranks.
+    
+    Keeps (-score, work_item_id) keys in sorted order so a single item can be
+    re-positioned and ranked with binary search instead of re-sorting the
+    whole portfolio. Ties are broken by work item ID.
+    """
+    
+    def __init__(self):
+        self._keys: List[Tuple[float, int]] = []
+        self._scores: Dict[int, float] = {}
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def __contains__(self, work_item_id: int) -> bool:
+        return work_item_id in self._scores
+    
+    def update(self, work_item_id: int, score: float) -> None:
+        """Insert or re-position a work item."""
+        if work_item_id in self._scores:
+            if self._scores[work_item_id] == score:
+                return
+            self.remove(work_item_id)
+        
+        bisect.insort(self._keys, (-score, work_item_id))
+        self._scores[work_item_id] = score
+    
+    def remove(self, work_item_id: int) -> None:
+        """Remove a work item if present."""
+        score = self._scores.pop(work_item_id, None)
+        if score is None:
+            return
+        
+        position = bisect.bisect_left(self._keys, (-score, work_item_id))
+        del self._keys[position]
+    
+    def rank(self, work_item_id: int) -> int:
+        """Get 1-based rank of a work item (highest score first)."""
+        score = self._scores[work_item_id]
+        return bisect.bisect_left(self._keys, (-score, work_item_id)) + 1
+    
+    def top(self, n: Optional[int] = None) -> List[int]:
+        """Get work item IDs in rank order."""
+        keys = self._keys if n is None else self._keys[:n]
+        return [work_item_id for _, work_item_id in keys]
+
+
+@dataclass
+class IncrementalScoringState:
+    """Persisted inputs and results of the last scoring run for a project."""
+    
+    project_name: str = ""
+    config_fingerprint: Optional[str] = None
+    watermark: Optional[datetime] = None
+    
+    # Per-item inputs
+    input_fingerprints: Dict[int, str] = field(default_factory=dict)
+    item_metadata: Dict[int, Dict[str, str]] = field(default_factory=dict)
+    raw_rows: Dict[int, List[float]] = field(default_factory=dict)
+    normalized_rows: Dict[int, List[float]] = field(default_factory=dict)
+    financial_scores: Dict[int, Dict[str, float]] = field(default_factory=dict)
+    
+    # Normalization statistics of the last run
+    normalization_stats: List[Dict[str, float]] = field(default_factory=list)
+    financial_normalization_factor: Optional[float] = None
+    strategic_normalization_factor: float = 1.0
+    
+    # Per-item results
+    strategic_scores: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    total_scores: Dict[int, float] = field(default_factory=dict)
+    written_scores: Dict[int, float] = field(default_factory=dict)
+    pending_writes: Set[int] = field(default_factory=set)
+    
+    @property
+    def work_item_ids(self) -> List[int]:
+        """IDs of all tracked work items."""
+        return list(self.raw_rows.keys())
+    
+    def reset(self, config_fingerprint: Optional[str] = None) -> None:
+        """Drop all tracked items and statistics.
+        
+        Written scores are kept since they describe ADO, not our inputs.
+        """
+        self.config_fingerprint = config_fingerprint
+        self.watermark = None
+        for mapping in self._item_mappings():
+            mapping.clear()
+        self.normalization_stats = []
+        self.financial_normalization_factor = None
+        self.strategic_normalization_factor = 1.0
+        self.pending_writes.clear()
+    
+    def remove_items(self, work_item_ids: Iterable[int]) -> List[int]:
+        """Stop tracking work items.
+        
+        Returns:
+            IDs that were actually tracked
+        """
+        removed = []
+        for work_item_id in work_item_ids:
+            if work_item_id not in self.raw_rows:
+                continue
+            for mapping in self._item_mappings() + (self.written_scores,):
+                mapping.pop(work_item_id, None)
+            self.pending_writes.discard(work_item_id)
+            removed.append(work_item_id)
+        return removed
+    
+    def _item_mappings(self) -> Tuple[Dict[int, Any], ...]:
+        """Per-item mappings derived from scoring inputs."""
+        return (
+            self.input_fingerprints, self.item_metadata, self.raw_rows, self.normalized_rows,
+            self.financial_scores, self.strategic_scores, self.total_scores
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert state to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data['version'] = STATE_VERSION
+        data['watermark'] = self.watermark.isoformat() if self.watermark else None
+        data['pending_writes'] = sorted(self.pending_writes)
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'IncrementalScoringState':
+        """Create state from a dictionary produced by to_dict."""
+        if data.get('version') != STATE_VERSION:
+            logger.warning(f"Discarding incremental state with version {data.get('version')}")
+            return cls(project_name=data.get('project_name', ""))
+        
+        def by_id(mapping: Dict[str, Any]) -> Dict[int, Any]:
+            return {int(key): value for key, value in mapping.items()}
+        
+        return cls(
+            project_name=data['project_name'],
+            config_fingerprint=data.get('config_fingerprint'),
+            watermark=datetime.fromisoformat(data['watermark']) if data.get('watermark') else None,
+            input_fingerprints=by_id(data['input_fingerprints']),
+            item_metadata=by_id(data['item_metadata']),
+            raw_rows=by_id(data['raw_rows']),
+            normalized_rows=by_id(data['normalized_rows']),
+            financial_scores=by_id(data['financial_scores']),
+            normalization_stats=data['normalization_stats'],
+            financial_normalization_factor=data.get('financial_normalization_factor'),
+            strategic_normalization_factor=data.get('strategic_normalization_factor', 1.0),
+            strategic_scores=by_id(data['strategic_scores']),
+            total_scores=by_id(data['total_scores']),
+            written_scores=by_id(data['written_scores']),
+            pending_writes=set(data.get('pending_writes', []))
+        )
+    
+    def save(self, path: Union[str, Path]) -> None:
+        """Save state to a JSON file (written atomically)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        temp_path = path.with_suffix(path.suffix + '.tmp')
+        temp_path.write_text(json.dumps(self.to_dict()))
+        temp_path.replace(path)
+    
+    @classmethod
+    def load(cls, path: Union[str, Path], project_name: str = "") -> 'IncrementalScoringState':
+        """Load state from a JSON file, returning empty state if it does not exist."""
+        path = Path(path)
+        if not path.exists():
+            return cls(project_name=project_name)
+        
+        try:
+            return cls.from_dict(json.loads(path.read_text()))
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable incremental state {path}: {e}")
+            return cls(project_name=project_name)
+
+
+@dataclass
+class IncrementalScoringResult:
+    """Result of applying changed work items to the incremental state."""
+    
+    # Scores whose value changed and should be written back
+    work_item_scores: List[WorkItemScore] = field(default_factory=list)
+    
+    changed_ids: List[int] = field(default_factory=list)
+    unchanged_ids: List[int] = field(default_factory=list)
+    removed_ids: List[int] = field(default_factory=list)
+    rescored_count: int = 0
+    
+    # Which level of recomputation was needed
+    renormalized: bool = False
+    recombined_all: bool = False
+    
+    total_items: int = 0
+
+
+class IncrementalScoringEngine:
+    """Incremental QVF scoring on top of QVFScoringEngine.
+    
+    Produces the same scores as a full QVFScoringEngine run over all tracked
+    items, but only recomputes rows whose inputs changed. When a change moves
+    the normalization bounds (criterion min/max/mean/std, financial percentile
+    or strategic maximum) the affected stage is recomputed for every item from
+    the persisted inputs, without reloading anything from Azure DevOps.
+    """
+    
+    def __init__(
+        self,
+        scoring_engine: QVFScoringEngine,
+        state: Optional[IncrementalScoringState] = None,
+        stats_tolerance: float = 1e-9,
+        score_tolerance: float = 1e-4
+    ):
+        """Initialize incremental scoring engine.
+        
+        Args:
+            scoring_engine: Scoring engine providing combination rules
+            state: Persisted state from the previous run (empty if None)
+            stats_tolerance: Change in a normalization bound that triggers renormalization
+            score_tolerance: Minimum score change that triggers a write
+        """
+        self.scoring_engine = scoring_engine
+        self.state = state or IncrementalScoringState()
+        self.stats_tolerance = stats_tolerance
+        self.score_tolerance = score_tolerance
+        
+        self._qvf_config: Optional[QVFCriteriaConfiguration] = None
+        self._scoring_config: Optional[ScoringConfiguration] = None
+        self._ahp_engine: Optional[AHPEngine] = None
+        
+        self._total_index = ScoreRankIndex()
+        self._financial_index = ScoreRankIndex()
+        self._strategic_index = ScoreRankIndex()
+        self._rebuild_rank_indexes()
+    
+    def begin(
+        self,
+        qvf_config: QVFCriteriaConfiguration,
+        scoring_config: Optional[ScoringConfiguration] = None
+    ) -> bool:
+        """Prepare a scoring run.
+        
+        Args:
+            qvf_config: QVF criteria configuration
+            scoring_config: Scoring configuration (engine default if None)
+            
+        Returns:
+            True if the state was reset and a full load is required
+        """
+        config_issues = self.scoring_engine.criteria_engine.validate_configuration(qvf_config)
+        if config_issues:
+            raise ScoringValidationError(f"QVF configuration issues: {config_issues}")
+        
+        self._qvf_config = qvf_config
+        self._scoring_config = scoring_config or self.scoring_engine.scoring_config
+        self._ahp_engine, _ = self.scoring_engine.criteria_engine.build_ahp_engine(qvf_config)
+        
+        fingerprint = self._config_fingerprint(qvf_config, self._scoring_config)
+        if fingerprint != self.state.config_fingerprint:
+            if self.state.config_fingerprint is not None:
+                logger.info("Scoring configuration changed, resetting incremental state")
+            self.state.reset(fingerprint)
+            self._rebuild_rank_indexes()
+        
+        return self.state.watermark is None
+    
+    def apply_changes(
+        self,
+        work_items: List[ADOWorkItem],
+        financial_data: Optional[Dict[int, FinancialMetrics]] = None,
+        removed_ids: Iterable[int] = (),
+        existing_scores: Optional[Dict[int, float]] = None,
+        watermark: Optional[datetime] = None
+    ) -> IncrementalScoringResult:
+        """Apply changed work items and recompute affected scores.
+        
+        Args:
+            work_items: Work items changed since the last run
+            financial_data: Financial metrics for changed items (others keep stored values)
+            removed_ids: Work items that left the scoring scope
+            existing_scores: QVF scores currently stored in ADO, to seed write suppression
+            watermark: Latest change time covered by this run
+            
+        Returns:
+            IncrementalScoringResult with scores that need to be written
+        """
+        if self._ahp_engine is None:
+            raise ScoringValidationError("begin() must be called before apply_changes()")
+        
+        state = self.state
+        financial_data = financial_data or {}
+        result = IncrementalScoringResult()
+        removed_ids = [work_item_id for work_item_id in removed_ids if work_item_id in state.raw_rows]
+        
+        # Detect changed inputs and validate the resulting portfolio before touching the state
+        inputs, financial_scores = self._stage_inputs(work_items, financial_data, removed_ids, result)
+        tracked_ids = (state.raw_rows.keys() - set(removed_ids)) | inputs.keys()
+        if tracked_ids:
+            covered_ids = (state.financial_scores.keys() - set(removed_ids)) | financial_scores.keys()
+            self._validate_financial_coverage(len(covered_ids), len(tracked_ids))
+        
+        # Drop items that left the scope
+        result.removed_ids = state.remove_items(removed_ids)
+        for work_item_id in result.removed_ids:
+            for index in (self._total_index, self._financial_index, self._strategic_index):
+                index.remove(work_item_id)
+        
+        for work_item_id, score in (existing_scores or {}).items():
+            if score is not None:
+                state.written_scores.setdefault(work_item_id, float(score))
+        
+        # Store the staged inputs
+        for work_item_id, (fingerprint, metadata, raw_row) in inputs.items():
+            state.input_fingerprints[work_item_id] = fingerprint
+            state.item_metadata[work_item_id] = metadata
+            state.raw_rows[work_item_id] = raw_row
+        state.financial_scores.update(financial_scores)
+        
+        changed = inputs.keys() | financial_scores.keys()
+        result.changed_ids = sorted(changed)
+        
+        if not state.raw_rows:
+            state.watermark = watermark or state.watermark
+            return result
+        
+        rescore_ids = self._recompute_strategic_scores(changed, result)
+        rescore_ids |= self._recompute_totals(rescore_ids, result)
+        result.rescored_count = len(rescore_ids)
+        
+        # Items whose score moved (or failed to write last time) need writing
+        for work_item_id in rescore_ids:
+            written = state.written_scores.get(work_item_id)
+            if written is None or abs(state.total_scores[work_item_id] - written) > self.score_tolerance:
+                state.pending_writes.add(work_item_id)
+            else:
+                state.pending_writes.discard(work_item_id)
+        
+        result.work_item_scores = [
+            self.get_work_item_score(work_item_id)
+            for work_item_id in self._total_index.top()
+            if work_item_id in state.pending_writes
+        ]
+        result.total_items = len(state.raw_rows)
+        
+        if watermark and (state.watermark is None or watermark > state.watermark):
+            state.watermark = watermark
+        
+        logger.info(
+            f"Incremental scoring: {len(result.changed_ids)} changed, {result.rescored_count} rescored, "
+            f"{len(result.work_item_scores)} to write of {result.total_items} items"
+        )
+        return result
+    
+    def mark_written(self, work_item_ids: Iterable[int]) -> None:
+        """Record that scores were successfully written to ADO."""
+        for work_item_id in work_item_ids:
+            if work_item_id in self.state.total_scores:
+                self.state.written_scores[work_item_id] = self.state.total_scores[work_item_id]
+                self.state.pending_writes.discard(work_item_id)
+    
+    def get_work_item_score(self, work_item_id: int) -> WorkItemScore:
+        """Build the current WorkItemScore for a tracked work item."""
+        state = self.state
+        metadata = state.item_metadata[work_item_id]
+        strategic_data = state.strategic_scores[work_item_id]
+        
+        score = QVFScoringEngine.create_work_item_score(
+            work_item_id,
+            metadata['title'],
+            metadata['work_item_type'],
+            state.total_scores[work_item_id],
+            self._financial_components(work_item_id),
+            strategic_data,
+            strategic_data['total_score'] / state.strategic_normalization_factor
+        )
+        score.overall_rank = self._total_index.rank(work_item_id)
+        score.financial_rank = self._financial_index.rank(work_item_id)
+        score.strategic_rank = self._strategic_index.rank(work_item_id)
+        return score
+    
+    def get_rankings(self, limit: Optional[int] = None) -> List[WorkItemScore]:
+        """Get current scores in overall rank order."""
+        return [self.get_work_item_score(work_item_id) for work_item_id in self._total_index.top(limit)]
+    
+    def _stage_inputs(
+        self,
+        work_items: List[ADOWorkItem],
+        financial_data: Dict[int, FinancialMetrics],
+        removed_ids: List[int],
+        result: IncrementalScoringResult
+    ) -> Tuple[Dict[int, Tuple[str, Dict[str, str], List[float]]], Dict[int, Dict[str, float]]]:
+        """Collect inputs that differ from the state without modifying it.
+        
+        Returns:
+            (fingerprint, metadata, raw row) of changed items and changed financial scores, by ID
+        """
+        state = self.state
+        criteria = self._ahp_engine.config.criteria
+        removed = set(removed_ids)
+        inputs: Dict[int, Tuple[str, Dict[str, str], List[float]]] = {}
+        
+        items_by_id = {item.work_item_id: item for item in work_items}
+        
+        for work_item_id, item in items_by_id.items():
+            item_dict = item.dict() if hasattr(item, 'dict') else item.__dict__
+            fingerprint = self._input_fingerprint(item_dict)
+            
+            if work_item_id not in removed and state.input_fingerprints.get(work_item_id) == fingerprint:
+                result.unchanged_ids.append(work_item_id)
+                continue
+            
+            metadata = {
+                'title': item.title,
+                'work_item_type': item.work_item_type.value
+            }
+            raw_row = [AHPEngine.extract_criterion_value(item_dict, criterion) for criterion in criteria]
+            inputs[work_item_id] = (fingerprint, metadata, raw_row)
+        
+        # Financial metrics may change without the work item itself changing
+        calculator = self.scoring_engine.financial_calculator
+        financial_scores: Dict[int, Dict[str, float]] = {}
+        for work_item_id, metrics in financial_data.items():
+            if work_item_id not in inputs and (work_item_id in removed or work_item_id not in state.raw_rows):
+                continue
+            scores = calculator.calculate_financial_score_for_qvf(metrics)
+            scores.pop('normalized_combined_score', None)
+            current = None if work_item_id in removed else state.financial_scores.get(work_item_id)
+            if current != scores:
+                financial_scores[work_item_id] = scores
+        
+        return inputs, financial_scores
+    
+    def _validate_financial_coverage(self, covered_count: int, item_count: int) -> None:
+        """Apply the scoring engine's financial coverage rule to a portfolio."""
+        coverage = covered_count / item_count
+        
+        if coverage < 0.1:
+            raise ScoringValidationError("Less than 10% financial data coverage")
+        
+        if coverage < 0.5:
+            logger.warning(f"Low financial data coverage: {coverage:.1%}")
+    
+    def _recompute_strategic_scores(self, changed: Set[int], result: IncrementalScoringResult) -> Set[int]:
+        """Recompute normalized rows and strategic scores.
+        
+        Returns:
+            IDs whose strategic scores were recomputed
+        """
+        state = self.state
+        criteria = self._ahp_engine.config.criteria
+        
+        work_item_ids = state.work_item_ids
+        raw_matrix = np.array([state.raw_rows[work_item_id] for work_item_id in work_item_ids], dtype=float)
+        raw_matrix = raw_matrix.reshape(len(work_item_ids), len(criteria))
+        
+        new_stats = [
+            AHPEngine.calculate_normalization_stats(raw_matrix[:, col], criterion.normalization_method)
+            for col, criterion in enumerate(criteria)
+        ]
+        
+        if self._stats_shifted(state.normalization_stats, new_stats):
+            logger.info("Normalization bounds shifted, renormalizing all work items")
+            result.renormalized = True
+            state.normalization_stats = new_stats
+            rows = np.arange(len(work_item_ids))
+        else:
+            row_of = {work_item_id: row for row, work_item_id in enumerate(work_item_ids)}
+            rows = np.array(sorted(row_of[work_item_id] for work_item_id in changed), dtype=int)
+        
+        if len(rows) == 0:
+            return set()
+        
+        normalized = np.empty((len(rows), len(criteria)))
+        for col, criterion in enumerate(criteria):
+            normalized[:, col] = AHPEngine.apply_normalization(
+                raw_matrix[rows, col], criterion.normalization_method, state.normalization_stats[col]
+            )
+        
+        recomputed = set()
+        for position, row in enumerate(rows):
+            work_item_id = work_item_ids[row]
+            normalized_row = normalized[position].tolist()
+            state.normalized_rows[work_item_id] = normalized_row
+            
+            item_normalized = {
+                criterion.data_source: value for criterion, value in zip(criteria, normalized_row)
+            }
+            total_score, criterion_scores = self._ahp_engine.calculate_work_item_score(item_normalized)
+            
+            state.strategic_scores[work_item_id] = {
+                'total_score': float(total_score),
+                'criterion_scores': {name: float(value) for name, value in criterion_scores.items()},
+                'category_scores': self.scoring_engine.criteria_engine.calculate_category_scores(
+                    criterion_scores, self._qvf_config
+                )
+            }
+            self._strategic_index.update(work_item_id, state.strategic_scores[work_item_id]['total_score'])
+            recomputed.add(work_item_id)
+        
+        return recomputed
+    
+    def _recompute_totals(self, rescore_ids: Set[int], result: IncrementalScoringResult) -> Set[int]:
+        """Recombine total scores, for every item if a combination factor moved.
+        
+        Returns:
+            IDs whose total scores were recomputed
+        """
+        state = self.state
+        
+        financial_factor = self.scoring_engine.financial_normalization_factor(
+            [scores['combined_financial_score'] for scores in state.financial_scores.values()]
+        )
+        strategic_factor = self.scoring_engine.strategic_normalization_factor(
+            [scores['total_score'] for scores in state.strategic_scores.values()]
+        )
+        
+        if (
+            self._bound_shifted(state.financial_normalization_factor, financial_factor)
+            or self._bound_shifted(state.strategic_normalization_factor, strategic_factor)
+            or result.renormalized
+        ):
+            result.recombined_all = True
+            rescore_ids = set(state.raw_rows)
+        
+        state.financial_normalization_factor = financial_factor
+        state.strategic_normalization_factor = strategic_factor
+        
+        for work_item_id in rescore_ids:
+            financial_components = self._financial_components(work_item_id)
+            normalized_strategic_score = state.strategic_scores[work_item_id]['total_score'] / strategic_factor
+            
+            total_score = self.scoring_engine.combine_item_score(
+                financial_components, normalized_strategic_score, self._scoring_config
+            )
+            state.total_scores[work_item_id] = total_score
+            
+            self._total_index.update(work_item_id, total_score)
+            self._financial_index.update(work_item_id, financial_components['combined_financial_score'])
+        
+        return rescore_ids
+    
+    def _financial_components(self, work_item_id: int) -> Dict[str, float]:
+        """Financial scores of an item with the current normalization applied."""
+        stored = self.state.financial_scores.get(work_item_id)
+        if stored is None:
+            return DEFAULT_FINANCIAL_SCORES
+        
+        scores = dict(stored)
+        if self.state.financial_normalization_factor:
+            QVFScoringEngine.apply_financial_normalization(scores, self.state.financial_normalization_factor)
+        return scores
+    
+    def _rebuild_rank_indexes(self) -> None:
+        """Rebuild rank indexes from the persisted scores."""
+        self._total_index = ScoreRankIndex()
+        self._financial_index = ScoreRankIndex()
+        self._strategic_index = ScoreRankIndex()
+        
+        for work_item_id, total_score in self.state.total_scores.items():
+            self._total_index.update(work_item_id, total_score)
+            self._financial_index.update(
+                work_item_id,
+                self.state.financial_scores.get(work_item_id, DEFAULT_FINANCIAL_SCORES)['combined_financial_score']
+            )
+            self._strategic_index.update(work_item_id, self.state.strategic_scores[work_item_id]['total_score'])
+    
+    def _stats_shifted(self, old_stats: List[Dict[str, float]], new_stats: List[Dict[str, float]]) -> bool:
+        """Check whether any normalization bound moved beyond tolerance."""
+        if len(old_stats) != len(new_stats):
+            return True
+        
+        for old, new in zip(old_stats, new_stats):
+            # Only whether there is more than one value matters, not the count itself
+            if (old.get('count', 0) > 1) != (new.get('count', 0) > 1):
+                return True
+            for key in new.keys() - {'count'}:
+                if self._bound_shifted(old.get(key), new[key]):
+                    return True
+        
+        return False
+    
+    def _bound_shifted(self, old: Optional[float], new: Optional[float]) -> bool:
+        """Check whether a single normalization bound moved beyond tolerance."""
+        if old is None or new is None:
+            return old is not new
+        return abs(old - new) > self.stats_tolerance
+    
+    @staticmethod
+    def _input_fingerprint(item_dict: Dict[str, Any]) -> str:
+        """Fingerprint the scoring inputs of a work item."""
+        payload = json.dumps(item_dict, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _config_fingerprint(
+        qvf_config: QVFCriteriaConfiguration,
+        scoring_config: ScoringConfiguration
+    ) -> str:
+        """Fingerprint everything that affects scores apart from item inputs."""
+        payload = json.dumps(
+            {
+                'criteria': qvf_config.model_dump(mode='json', exclude={'created_date', 'last_modified'}),
+                'scoring': asdict(scoring_config)
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
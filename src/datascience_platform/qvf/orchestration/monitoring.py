@@ -34,25 +34,31 @@ Usage:
 
 Performance:
 - Sub-millisecond metric recording
-- Efficient time-series storage with automatic compression
+- Columnar ring-buffer time-series storage with 1-minute and 1-hour rollups
 - <1% overhead on orchestration operations
 - Scalable to millions of operation records
 """
 
 import asyncio
+import itertools
 import logging
+import operator
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_for_futures
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Optional, Any, Callable, Union, Tuple
+from typing import List, Dict, Optional, Any, Callable, Union, Tuple, Set
 from dataclasses import dataclass, field
 from enum import Enum
 from contextlib import contextmanager
 from collections import defaultdict, deque
 import statistics
 import json
+import math
 import threading
 import time
 from pathlib import Path
 
+import numpy as np
+
 from .orchestrator import WorkflowResult, ScoringMode, WorkflowStatus
 from ...core.exceptions import DataSciencePlatformError
 
@@ -309,18 +315,288 @@ class OperationTracker:
             self.metrics.user_id = user_id
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Rollup bucket widths in microseconds, coarsest first
+ROLLUP_RESOLUTIONS = {
+    "1h": 3_600_000_000,
+    "1m": 60_000_000
+}
+
+
+def _to_microseconds(timestamp: datetime) -> int:
+    """Convert a datetime to integer microseconds since the epoch (naive = UTC)."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+class _RingColumns:
+    """Fixed-capacity ring of numpy columns kept sorted by the first column.
+    
+    Appending to a full ring overwrites the oldest row. The sorted key column
+    is searched in its (at most two) contiguous segments, so lookups are
+    O(log n) without copying.
+    """
+    
+    def __init__(self, capacity: int, columns: Dict[str, Any]):
+        self.capacity = capacity
+        self.columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in columns.items()}
+        self.key = next(iter(self.columns.values()))
+        self.head = 0
+        self.size = 0
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def physical(self, position: int) -> int:
+        """Array index of a logical position (0 = oldest)."""
+        return (self.head + position) % self.capacity
+    
+    def get(self, name: str, position: int) -> Any:
+        """Value of a column at a logical position."""
+        return self.columns[name][self.physical(position)]
+    
+    def last_key(self) -> Optional[int]:
+        """Key of the newest row."""
+        return int(self.key[self.physical(self.size - 1)]) if self.size else None
+    
+    def search(self, value: int, side: str = "left") -> int:
+        """Logical insertion position of a key value."""
+        first_length = min(self.size, self.capacity - self.head)
+        first = self.key[self.head:self.head + first_length]
+        position = int(np.searchsorted(first, value, side))
+        if position < first_length:
+            return position
+        
+        second = self.key[:self.size - first_length]
+        return first_length + int(np.searchsorted(second, value, side))
+    
+    def window(self, name: str, start: int, end: int) -> np.ndarray:
+        """Column values for logical positions [start, end)."""
+        column = self.columns[name]
+        if start >= end:
+            return column[:0]
+        
+        first = self.physical(start)
+        last = first + (end - start)
+        if last <= self.capacity:
+            return column[first:last]
+        return np.concatenate((column[first:], column[:last - self.capacity]))
+    
+    def append(self, row: Tuple) -> None:
+        """Append a row with the largest key, overwriting the oldest row if full."""
+        index = self.physical(self.size)
+        for column, value in zip(self.columns.values(), row):
+            column[index] = value
+        
+        if self.size == self.capacity:
+            self.head = (self.head + 1) % self.capacity
+        else:
+            self.size += 1
+    
+    def insert(self, position: int, row: Tuple) -> None:
+        """Insert a row at a logical position (O(n); for out-of-order rows)."""
+        for name, value in zip(list(self.columns), row):
+            values = np.insert(self.window(name, 0, self.size), position, value)
+            if len(values) > self.capacity:
+                values = values[1:]
+            self.columns[name][:len(values)] = values
+        
+        self.key = next(iter(self.columns.values()))
+        self.head = 0
+        self.size = min(self.size + 1, self.capacity)
+    
+    def drop_front(self, count: int) -> None:
+        """Drop the oldest rows."""
+        count = min(count, self.size)
+        for column in self.columns.values():
+            if column.dtype == object:
+                for position in range(count):
+                    column[self.physical(position)] = None
+        
+        self.head = (self.head + count) % self.capacity
+        self.size -= count
+
+
+class _MetricSeries:
+    """Points of one metric plus rolling min/max/sum/count rollups."""
+    
+    def __init__(self, capacity: int):
+        self.points = _RingColumns(capacity, {
+            "timestamp": np.int64,
+            "value": np.float64,
+            "tags": object,
+            "metadata": object
+        })
+        
+        # Every retained bucket holds at least one retained point
+        self.rollups = {
+            resolution: _RingColumns(capacity + 1, {
+                "start": np.int64,
+                "count": np.int64,
+                "sum": np.float64,
+                "min": np.float64,
+                "max": np.float64
+            })
+            for resolution in ROLLUP_RESOLUTIONS
+        }
+        
+        # Start of the bucket per resolution that lost points to eviction or
+        # cleanup; its totals include dropped points, so it is never read as
+        # an inner bucket (late older points can put it inside a range)
+        self.partial_buckets: Dict[str, Optional[int]] = {resolution: None for resolution in ROLLUP_RESOLUTIONS}
+    
+    def add(self, timestamp: int, point: MetricPoint) -> None:
+        """Add a point and fold it into the rollup buckets."""
+        value = float(point.value)
+        row = (timestamp, value, point.tags or None, point.metadata or None)
+        
+        evicting = len(self.points) == self.points.capacity
+        last_timestamp = self.points.last_key()
+        if last_timestamp is None or timestamp >= last_timestamp:
+            self.points.append(row)
+        else:
+            self.points.insert(self.points.search(timestamp, "right"), row)
+        
+        for resolution, width in ROLLUP_RESOLUTIONS.items():
+            self._add_to_bucket(self.rollups[resolution], timestamp - timestamp % width, value)
+        
+        if evicting:
+            self._trim_rollups()
+    
+    def drop_before(self, timestamp: int) -> None:
+        """Drop points older than a timestamp by moving the ring head."""
+        self.points.drop_front(self.points.search(timestamp, "left"))
+        self._trim_rollups()
+    
+    def bounds(
+        self,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime]
+    ) -> Tuple[int, int]:
+        """Logical point positions [start, end) within a time range (inclusive)."""
+        start = self.points.search(_to_microseconds(start_time), "left") if start_time else 0
+        end = self.points.search(_to_microseconds(end_time), "right") if end_time else len(self.points)
+        return start, end
+    
+    def summarize(self, start: int, end: int) -> Tuple[int, float, float, float]:
+        """Count, sum, min and max of points in [start, end) using the rollups."""
+        return self._summarize(start, end, list(ROLLUP_RESOLUTIONS.items()))
+    
+    def _summarize(self, start: int, end: int, resolutions: List[Tuple[str, int]]):
+        if start >= end:
+            return 0, 0.0, np.inf, -np.inf
+        
+        if resolutions:
+            resolution, width = resolutions[0]
+            
+            # Only buckets strictly after the first point's bucket and before
+            # the last point's bucket are complete within the range
+            inner_start = (int(self.points.get("timestamp", start)) // width + 1) * width
+            inner_end = (int(self.points.get("timestamp", end - 1)) // width) * width
+            
+            partial = self.partial_buckets[resolution]
+            if partial is not None and partial >= inner_start:
+                inner_start = partial + width
+            
+            if inner_start < inner_end:
+                rollup = self.rollups[resolution]
+                bucket_start = rollup.search(inner_start, "left")
+                bucket_end = rollup.search(inner_end, "left")
+                
+                parts = [
+                    self._summarize(start, self.points.search(inner_start, "left"), resolutions[1:]),
+                    (
+                        int(rollup.window("count", bucket_start, bucket_end).sum()),
+                        float(rollup.window("sum", bucket_start, bucket_end).sum()),
+                        float(rollup.window("min", bucket_start, bucket_end).min(initial=np.inf)),
+                        float(rollup.window("max", bucket_start, bucket_end).max(initial=-np.inf))
+                    ),
+                    self._summarize(self.points.search(inner_end, "left"), end, resolutions[1:])
+                ]
+                return (
+                    sum(part[0] for part in parts),
+                    sum(part[1] for part in parts),
+                    min(part[2] for part in parts),
+                    max(part[3] for part in parts)
+                )
+            
+            return self._summarize(start, end, resolutions[1:])
+        
+        values = self.points.window("value", start, end)
+        return len(values), float(values.sum()), float(values.min()), float(values.max())
+    
+    @staticmethod
+    def _add_to_bucket(rollup: _RingColumns, bucket: int, value: float) -> None:
+        last_bucket = rollup.last_key()
+        if last_bucket is None or bucket > last_bucket:
+            rollup.append((bucket, 1, value, value, value))
+            return
+        
+        if bucket == last_bucket:
+            index = rollup.physical(len(rollup) - 1)
+        else:
+            position = rollup.search(bucket, "left")
+            if rollup.get("start", position) != bucket:
+                rollup.insert(position, (bucket, 1, value, value, value))
+                return
+            index = rollup.physical(position)
+        
+        columns = rollup.columns
+        columns["count"][index] += 1
+        columns["sum"][index] += value
+        
+        minimum, maximum = columns["min"], columns["max"]
+        if value < minimum[index]:
+            minimum[index] = value
+        if value > maximum[index]:
+            maximum[index] = value
+    
+    def _trim_rollups(self) -> None:
+        """Drop buckets older than the bucket of the oldest retained point.
+        
+        Called after points were evicted or dropped, so the oldest retained
+        bucket may have lost points and is marked partial.
+        """
+        if not len(self.points):
+            for resolution, rollup in self.rollups.items():
+                rollup.drop_front(len(rollup))
+                self.partial_buckets[resolution] = None
+            return
+        
+        oldest = int(self.points.get("timestamp", 0))
+        for resolution, width in ROLLUP_RESOLUTIONS.items():
+            rollup = self.rollups[resolution]
+            cutoff = oldest - oldest % width
+            if len(rollup) and rollup.get("start", 0) < cutoff:
+                rollup.drop_front(rollup.search(cutoff, "left"))
+            self.partial_buckets[resolution] = cutoff
+
+
 class TimeSeriesStorage:
-    """Efficient time-series storage for metrics."""
+    """Efficient time-series storage for metrics.
+    
+    Each metric is kept in preallocated numpy ring arrays of timestamps and
+    values, so time windows are located with a binary search and cleanup
+    only moves the ring head. Rolling 1-minute and 1-hour min/max/sum/count
+    rollups are maintained as points arrive; aggregations over long windows
+    read whole buckets and only scan raw points at the window edges.
+    """
     
     def __init__(self, max_points_per_metric: int = 10000):
         self.max_points_per_metric = max_points_per_metric
-        self._metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_points_per_metric))
+        self._metrics: Dict[str, _MetricSeries] = {}
         self._lock = threading.RLock()
     
     def add_point(self, metric_name: str, point: MetricPoint):
         """Add a metric point."""
         with self._lock:
-            self._metrics[metric_name].append(point)
+            series = self._metrics.get(metric_name)
+            if series is None:
+                series = self._metrics[metric_name] = _MetricSeries(self.max_points_per_metric)
+            series.add(_to_microseconds(point.timestamp), point)
     
     def get_points(
         self,
@@ -331,30 +607,68 @@ class TimeSeriesStorage:
     ) -> List[MetricPoint]:
         """Get metric points within time range."""
         with self._lock:
-            points = list(self._metrics[metric_name])
+            series = self._metrics.get(metric_name)
+            if series is None:
+                return []
         
-        # Filter by time range
-        if start_time or end_time:
-            filtered_points = []
-            for point in points:
-                if start_time and point.timestamp < start_time:
-                    continue
-                if end_time and point.timestamp > end_time:
-                    continue
-                filtered_points.append(point)
-            points = filtered_points
+            start, end = series.bounds(start_time, end_time)
         
-        # Apply limit
-        if limit and len(points) > limit:
-            points = points[-limit:]  # Return most recent points
+            # Apply limit (most recent points)
+            if limit and end - start > limit:
+                start = end - limit
         
-        return points
+            # Build the points under the lock: the windows are views into the
+            # ring, which concurrent writers overwrite in place
+            ring = series.points
+            columns = [ring.window(name, start, end) for name in ("timestamp", "value", "tags", "metadata")]
+            
+            return [
+                MetricPoint(
+                    timestamp=_EPOCH + timedelta(microseconds=int(timestamp)),
+                    value=float(value),
+                    tags=dict(tags) if tags else {},
+                    metadata=dict(metadata) if metadata else {}
+                )
+                for timestamp, value, tags, metadata in zip(*columns)
+            ]
     
     def get_metric_names(self) -> List[str]:
         """Get all metric names."""
         with self._lock:
             return list(self._metrics.keys())
     
+    def summarize_points(
+        self,
+        metric_name: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> Optional[Dict[str, float]]:
+        """Summarize metric points within a time range.
+        
+        Returns:
+            Dictionary with count, sum, avg, min, max, first and last values,
+            or None if there are no points in the range
+        """
+        with self._lock:
+            series = self._metrics.get(metric_name)
+            if series is None:
+                return None
+            
+            start, end = series.bounds(start_time, end_time)
+            if start >= end:
+                return None
+            
+            count, total, minimum, maximum = series.summarize(start, end)
+            return {
+                "count": count,
+                "sum": total,
+                "avg": total / count,
+                "min": minimum,
+                "max": maximum,
+                "first": float(series.points.get("value", start)),
+                "last": float(series.points.get("value", end - 1))
+            }
+    
     def aggregate_points(
         self,
         metric_name: str,
@@ -363,45 +677,66 @@ class TimeSeriesStorage:
         end_time: Optional[datetime] = None
     ) -> Optional[float]:
         """Aggregate metric points."""
-        points = self.get_points(metric_name, start_time, end_time)
+        summary = self.summarize_points(metric_name, start_time, end_time)
         
-        if not points:
+        if summary is None:
             return None
         
-        values = [point.value for point in points]
-        
-        if aggregation == "avg":
-            return statistics.mean(values)
-        elif aggregation == "sum":
-            return sum(values)
-        elif aggregation == "min":
-            return min(values)
-        elif aggregation == "max":
-            return max(values)
-        elif aggregation == "count":
-            return len(values)
-        else:
+        if aggregation not in ("avg", "sum", "min", "max", "count"):
             raise ValueError(f"Unknown aggregation type: {aggregation}")
+        
+        return summary[aggregation]
     
     def cleanup_old_data(self, older_than: timedelta):
         """Remove data older than specified time."""
-        cutoff_time = datetime.now(timezone.utc) - older_than
+        cutoff = _to_microseconds(datetime.now(timezone.utc) - older_than)
         
         with self._lock:
-            for metric_name, points in self._metrics.items():
-                # Remove old points
-                while points and points[0].timestamp < cutoff_time:
-                    points.popleft()
+            for series in self._metrics.values():
+                series.drop_before(cutoff)
+
+
+# Alert rule comparison operators
+ALERT_OPERATORS = {
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "eq": operator.eq
+}
 
 
 class AlertManager:
-    """Alert management and notification system."""
+    """Alert management and notification system.
+    
+    Rules are indexed by metric name, so checking a metrics dictionary only
+    evaluates rules of the metrics it contains. Each rule's comparison is
+    compiled once into a callable. While an alert for a rule and context is
+    active, further triggers of that rule in the same context are ignored;
+    the alert is resolved automatically once a check finds the condition
+    cleared, so a later breach raises a new alert.
+    
+    Notifications never run on the caller's thread: coroutine callbacks are
+    scheduled on the running event loop, and plain callbacks (or coroutine
+    callbacks outside an event loop) run in a small thread pool.
+    """
     
-    def __init__(self):
+    def __init__(self, notification_workers: int = 2):
         self._alerts: Dict[str, Alert] = {}
         self._alert_rules: List[Dict[str, Any]] = []
+        self._rules_by_metric: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         self._notification_callbacks: List[Callable] = []
         self._lock = threading.RLock()
+        
+        # (rule name, context) -> ID of the active alert, and back
+        self._active_alert_keys: Dict[Tuple, str] = {}
+        self._alert_keys_by_id: Dict[str, Tuple] = {}
+        self._alert_sequence = itertools.count(1)
+        
+        # Notification dispatch
+        self.notification_workers = notification_workers
+        self._notification_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_notifications: Set[Union[Future, asyncio.Task]] = set()
     
     def add_alert_rule(
         self,
@@ -412,68 +747,96 @@ class AlertManager:
         severity: AlertSeverity = AlertSeverity.WARNING,
         description: Optional[str] = None
     ):
-        """Add an alert rule for automatic monitoring."""
+        """Add an alert rule for automatic monitoring.
+        
+        Raises:
+            MonitoringError: If the comparison operator is unknown
+        """
+        compare = ALERT_OPERATORS.get(comparison_operator)
+        if compare is None:
+            raise MonitoringError(
+                f"Unknown comparison operator '{comparison_operator}' "
+                f"(expected one of: {', '.join(ALERT_OPERATORS)})"
+            )
+        
         rule = {
             "rule_name": rule_name,
             "metric_name": metric_name,
             "threshold_value": threshold_value,
             "comparison_operator": comparison_operator,
             "severity": severity,
-            "description": description or f"{metric_name} {comparison_operator} {threshold_value}"
+            "description": description or f"{metric_name} {comparison_operator} {threshold_value}",
+            "condition": lambda value, compare=compare, threshold=threshold_value: compare(value, threshold)
         }
         
-        self._alert_rules.append(rule)
+        with self._lock:
+            self._alert_rules.append(rule)
+            self._rules_by_metric[metric_name].append(rule)
         logger.info(f"Added alert rule: {rule_name}")
     
     def check_alerts(self, metrics: Dict[str, float], context: Dict[str, str] = None):
         """Check current metrics against alert rules."""
         context = context or {}
+        context_key = None
         
-        for rule in self._alert_rules:
-            metric_name = rule["metric_name"]
-            if metric_name not in metrics:
+        for metric_name, current_value in metrics.items():
+            rules = self._rules_by_metric.get(metric_name)
+            if not rules or current_value is None:
                 continue
             
-            current_value = metrics[metric_name]
-            threshold = rule["threshold_value"]
-            operator = rule["comparison_operator"]
+            for rule in rules:
+                triggered = rule["condition"](current_value)
+                if not triggered and not self._active_alert_keys:
+                    continue
             
-            # Evaluate condition
-            triggered = False
-            if operator == "gt" and current_value > threshold:
-                triggered = True
-            elif operator == "gte" and current_value >= threshold:
-                triggered = True
-            elif operator == "lt" and current_value < threshold:
-                triggered = True
-            elif operator == "lte" and current_value <= threshold:
-                triggered = True
-            elif operator == "eq" and current_value == threshold:
-                triggered = True
+                if context_key is None:
+                    context_key = tuple(sorted((key, str(value)) for key, value in context.items()))
+                alert_key = (rule["rule_name"], context_key)
             
-            if triggered:
-                self._create_alert(rule, current_value, context)
-    
-    def _create_alert(self, rule: Dict[str, Any], current_value: float, context: Dict[str, str]):
-        """Create an alert from a triggered rule."""
-        alert_id = f"{rule['rule_name']}_{int(time.time())}"
-        
-        alert = Alert(
-            alert_id=alert_id,
-            severity=rule["severity"],
-            title=f"Alert: {rule['rule_name']}",
-            description=f"{rule['description']} (current: {current_value})",
-            created_at=datetime.now(timezone.utc),
-            metric_name=rule["metric_name"],
-            threshold_value=rule["threshold_value"],
-            comparison_operator=rule["comparison_operator"],
-            operation_id=context.get("operation_id"),
-            project_name=context.get("project_name"),
-            tags=context
-        )
+                if triggered:
+                    self._create_alert(rule, current_value, context, alert_key)
+                else:
+                    self._resolve_recovered_alert(alert_key, current_value)
+    
+    def _resolve_recovered_alert(self, alert_key: Tuple, current_value: float):
+        """Resolve the active alert of a rule whose condition no longer holds."""
+        with self._lock:
+            alert_id = self._active_alert_keys.get(alert_key)
+        
+        if alert_id is not None:
+            logger.info(f"Alert condition cleared for {alert_key[0]} (current: {current_value})")
+            self.resolve_alert(alert_id)
         
+    def _create_alert(
+        self,
+        rule: Dict[str, Any],
+        current_value: float,
+        context: Dict[str, str],
+        alert_key: Tuple
+    ):
+        """Create an alert from a triggered rule unless one is already active."""
         with self._lock:
+            if alert_key in self._active_alert_keys:
+                return
+            
+            alert_id = f"{rule['rule_name']}_{int(time.time())}_{next(self._alert_sequence)}"
+            alert = Alert(
+                alert_id=alert_id,
+                severity=rule["severity"],
+                title=f"Alert: {rule['rule_name']}",
+                description=f"{rule['description']} (current: {current_value})",
+                created_at=datetime.now(timezone.utc),
+                metric_name=rule["metric_name"],
+                threshold_value=rule["threshold_value"],
+                comparison_operator=rule["comparison_operator"],
+                operation_id=context.get("operation_id"),
+                project_name=context.get("project_name"),
+                tags=dict(context)
+            )
+            
             self._alerts[alert_id] = alert
+            self._active_alert_keys[alert_key] = alert_id
+            self._alert_keys_by_id[alert_id] = alert_key
         
         # Send notifications
         self._send_notifications(alert)
@@ -481,16 +844,72 @@ class AlertManager:
         logger.warning(f"Alert triggered: {alert.title} - {alert.description}")
     
     def _send_notifications(self, alert: Alert):
-        """Send alert notifications."""
+        """Dispatch alert notifications without waiting for the callbacks."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        
         for callback in self._notification_callbacks:
-            try:
-                callback(alert)
-                alert.notification_sent = True
-            except Exception as e:
-                logger.error(f"Error sending alert notification: {e}")
+            if asyncio.iscoroutinefunction(callback) and loop is not None:
+                pending = loop.create_task(callback(alert))
+            else:
+                pending = self._get_notification_executor().submit(self._run_callback, callback, alert)
+            
+            self._pending_notifications.add(pending)
+            pending.add_done_callback(lambda done, alert=alert: self._notification_done(done, alert))
+    
+    @staticmethod
+    def _run_callback(callback: Callable, alert: Alert):
+        """Run a notification callback on a worker thread."""
+        result = callback(alert)
+        if asyncio.iscoroutine(result):
+            asyncio.run(result)
+    
+    def _notification_done(self, done: Union[Future, asyncio.Task], alert: Alert):
+        """Record the outcome of a notification callback."""
+        self._pending_notifications.discard(done)
+        if done.cancelled():
+            return
+        
+        error = done.exception()
+        if error is not None:
+            logger.error(f"Error sending alert notification: {error}")
+        else:
+            alert.notification_sent = True
+    
+    def _get_notification_executor(self) -> ThreadPoolExecutor:
+        if self._notification_executor is None:
+            self._notification_executor = ThreadPoolExecutor(
+                max_workers=self.notification_workers,
+                thread_name_prefix="alert-notifications"
+            )
+        return self._notification_executor
+    
+    def wait_for_notifications(self, timeout: Optional[float] = None) -> bool:
+        """Wait for notifications running in the thread pool.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if no thread pool notifications are pending
+        """
+        pending = [item for item in list(self._pending_notifications) if isinstance(item, Future)]
+        if not pending:
+            return True
+        
+        _, not_done = wait_for_futures(pending, timeout=timeout)
+        return not not_done
+    
+    def close(self, wait: bool = False):
+        """Shut down the notification thread pool."""
+        if self._notification_executor is not None:
+            self._notification_executor.shutdown(wait=wait)
+            self._notification_executor = None
     
     def add_notification_callback(self, callback: Callable):
-        """Add notification callback function."""
+        """Add notification callback function (plain function or coroutine function)."""
         self._notification_callbacks.append(callback)
     
     def get_active_alerts(self) -> List[Alert]:
@@ -516,22 +935,99 @@ class AlertManager:
                 alert = self._alerts[alert_id]
                 alert.is_active = False
                 alert.resolved_at = datetime.now(timezone.utc)
+                
+                # Allow the rule to trigger again in this context
+                alert_key = self._alert_keys_by_id.pop(alert_id, None)
+                if alert_key is not None:
+                    self._active_alert_keys.pop(alert_key, None)
                 logger.info(f"Alert {alert_id} resolved")
                 return True
             return False
 
 
+# Smallest spread assumed by z-scores, relative to the mean and absolute, so a
+# history without variation does not make every small deviation anomalous
+Z_SCORE_MIN_STD_RATIO = 0.05
+Z_SCORE_MIN_STD = 1e-3
+
+
+@dataclass
+class RollingStatistic:
+    """Streaming mean and variance of a metric.
+    
+    Uses Welford's update (step 1/n) until 1/n drops below alpha and an
+    exponentially weighted update (step alpha) after that, so the estimate
+    is exact for the first observations and then follows recent behavior.
+    """
+    alpha: float = 0.05
+    count: int = 0
+    mean: float = 0.0
+    variance: float = 0.0
+    
+    def update(self, value: float):
+        """Add an observation."""
+        self.count += 1
+        step = max(self.alpha, 1.0 / self.count)
+        
+        difference = value - self.mean
+        increment = step * difference
+        self.mean += increment
+        self.variance = (1.0 - step) * (self.variance + difference * increment)
+    
+    @property
+    def std(self) -> float:
+        """Standard deviation."""
+        return math.sqrt(self.variance)
+    
+    def z_score(self, value: float) -> float:
+        """Standard score of a value, with the spread floored for flat histories."""
+        std = max(self.std, Z_SCORE_MIN_STD_RATIO * abs(self.mean), Z_SCORE_MIN_STD)
+        return (value - self.mean) / std
+
+
+@dataclass
+class OperationBaseline:
+    """Rolling baselines of one operation type used for anomaly detection."""
+    operation_count: int = 0
+    throughput: RollingStatistic = field(default_factory=RollingStatistic)
+    error_rate: RollingStatistic = field(default_factory=RollingStatistic)
+    duration: RollingStatistic = field(default_factory=RollingStatistic)
+
+
 class PerformanceAnalyzer:
-    """Performance analysis and optimization recommendations."""
+    """Performance analysis and optimization recommendations.
     
-    def __init__(self):
-        self._operation_history: deque = deque(maxlen=1000)
-        self._performance_baselines: Dict[str, Dict[str, float]] = {}
+    Baselines are streaming accumulators updated once per recorded operation,
+    so analysis is O(1) regardless of history length. Anomalies are z-score
+    tests of the operation against the baselines before it was added.
+    """
     
-    def analyze_operation(self, metrics: OperationMetrics) -> Dict[str, Any]:
-        """Analyze operation performance and generate insights."""
-        self._operation_history.append(metrics)
+    # Metrics compared in comparison_to_baseline
+    BASELINE_METRICS = ("items_per_second", "success_rate", "cpu_usage_percent", "data_quality_score")
+        
+    def __init__(self, baseline_alpha: float = 0.05, z_threshold: float = 3.0, min_samples: int = 5):
+        """Initialize performance analyzer.
         
+        Args:
+            baseline_alpha: Weight of each new observation once baselines warm up
+            z_threshold: Absolute z-score above which a metric is anomalous
+            min_samples: Operations of a type needed before anomaly detection
+        """
+        self.baseline_alpha = baseline_alpha
+        self.z_threshold = z_threshold
+        self.min_samples = min_samples
+        
+        self._operation_baselines: Dict[OperationType, OperationBaseline] = {}
+        self._performance_baselines: Dict[str, Dict[str, RollingStatistic]] = {}
+    
+    def analyze_operation(self, metrics: OperationMetrics, update_baseline: bool = True) -> Dict[str, Any]:
+        """Analyze operation performance and generate insights.
+        
+        Args:
+            metrics: Operation metrics to analyze
+            update_baseline: Fold the operation into the rolling baselines
+                (False when re-analyzing an already recorded operation)
+        """
         analysis = {
             "operation_id": metrics.operation_id,
             "performance_score": self._calculate_performance_score(metrics),
@@ -542,8 +1038,49 @@ class PerformanceAnalyzer:
             "anomalies": self._detect_anomalies(metrics)
         }
         
+        if update_baseline:
+            self._update_baselines(metrics)
+        
         return analysis
     
+    def _update_baselines(self, metrics: OperationMetrics):
+        """Fold an operation into the rolling baselines."""
+        baseline = self._operation_baselines.get(metrics.operation_type)
+        if baseline is None:
+            baseline = self._operation_baselines[metrics.operation_type] = OperationBaseline(
+                throughput=RollingStatistic(self.baseline_alpha),
+                error_rate=RollingStatistic(self.baseline_alpha),
+                duration=RollingStatistic(self.baseline_alpha)
+            )
+        
+        baseline.operation_count += 1
+        if metrics.items_per_second > 0:
+            baseline.throughput.update(metrics.items_per_second)
+        baseline.error_rate.update(self._error_rate(metrics))
+        if metrics.processing_duration:
+            baseline.duration.update(metrics.processing_duration)
+        
+        baseline_key = self._baseline_key(metrics)
+        statistics_by_metric = self._performance_baselines.get(baseline_key)
+        if statistics_by_metric is None:
+            statistics_by_metric = self._performance_baselines[baseline_key] = {
+                key: RollingStatistic(self.baseline_alpha) for key in self.BASELINE_METRICS
+            }
+        
+        for key in self.BASELINE_METRICS:
+            value = getattr(metrics, key)
+            if value is not None:
+                statistics_by_metric[key].update(value)
+    
+    @staticmethod
+    def _baseline_key(metrics: OperationMetrics) -> str:
+        return f"{metrics.operation_type.value}_{metrics.project_name or 'default'}"
+    
+    @staticmethod
+    def _error_rate(metrics: OperationMetrics) -> float:
+        """Error rate percentage of an operation."""
+        return (metrics.error_count / max(1, metrics.items_processed)) * 100
+    
     def _calculate_performance_score(self, metrics: OperationMetrics) -> float:
         """Calculate overall performance score (0-100)."""
         score = 100.0
@@ -659,70 +1196,61 @@ class PerformanceAnalyzer:
         return recommendations
     
     def _compare_to_baseline(self, metrics: OperationMetrics) -> Dict[str, float]:
-        """Compare metrics to established baselines."""
-        baseline_key = f"{metrics.operation_type.value}_{metrics.project_name or 'default'}"
-        
-        if baseline_key not in self._performance_baselines:
-            # Establish baseline from current metrics
-            self._performance_baselines[baseline_key] = {
-                "items_per_second": metrics.items_per_second,
-                "success_rate": metrics.success_rate,
-                "cpu_usage_percent": metrics.cpu_usage_percent or 50,
-                "data_quality_score": metrics.data_quality_score or 0.8
-            }
+        """Compare metrics to rolling baselines of the operation type and project."""
+        statistics_by_metric = self._performance_baselines.get(self._baseline_key(metrics))
+        if statistics_by_metric is None:
             return {"baseline_established": True}
         
-        baseline = self._performance_baselines[baseline_key]
         comparison = {}
         
-        # Calculate percentage differences
-        for key, current_value in [
-            ("items_per_second", metrics.items_per_second),
-            ("success_rate", metrics.success_rate),
-            ("cpu_usage_percent", metrics.cpu_usage_percent),
-            ("data_quality_score", metrics.data_quality_score)
-        ]:
-            if key in baseline and current_value is not None and baseline[key] != 0:
-                percent_change = ((current_value - baseline[key]) / baseline[key]) * 100
-                comparison[f"{key}_change_percent"] = percent_change
+        # Calculate percentage differences and standard scores
+        for key, statistic in statistics_by_metric.items():
+            current_value = getattr(metrics, key)
+            if current_value is None or not statistic.count:
+                continue
+            
+            if statistic.mean != 0:
+                comparison[f"{key}_change_percent"] = ((current_value - statistic.mean) / statistic.mean) * 100
+            if statistic.count > 1:
+                comparison[f"{key}_z_score"] = statistic.z_score(current_value)
         
         return comparison
     
     def _detect_anomalies(self, metrics: OperationMetrics) -> List[str]:
-        """Detect performance anomalies."""
-        anomalies = []
-        
-        # Get recent operation metrics for comparison
-        recent_operations = [
-            m for m in self._operation_history 
-            if m.operation_type == metrics.operation_type and m.end_time and
-            m.end_time > datetime.now(timezone.utc) - timedelta(hours=24)
-        ]
-        
-        if len(recent_operations) < 5:
+        """Detect performance anomalies with z-score tests against rolling baselines."""
+        baseline = self._operation_baselines.get(metrics.operation_type)
+        if baseline is None or baseline.operation_count < self.min_samples:
             return ["Insufficient data for anomaly detection"]
         
+        anomalies = []
+        
         # Check throughput anomalies
-        recent_throughputs = [m.items_per_second for m in recent_operations if m.items_per_second > 0]
-        if recent_throughputs:
-            avg_throughput = statistics.mean(recent_throughputs)
-            if metrics.items_per_second < avg_throughput * 0.5:
-                anomalies.append(f"Throughput is 50% below recent average ({avg_throughput:.2f} items/sec)")
-        
-        # Check error rate anomalies
-        recent_error_rates = [(m.error_count / max(1, m.items_processed)) * 100 for m in recent_operations]
-        current_error_rate = (metrics.error_count / max(1, metrics.items_processed)) * 100
-        if recent_error_rates:
-            avg_error_rate = statistics.mean(recent_error_rates)
-            if current_error_rate > avg_error_rate * 2 and current_error_rate > 5:
-                anomalies.append(f"Error rate is unusually high: {current_error_rate:.1f}% vs average {avg_error_rate:.1f}%")
+        throughput = baseline.throughput
+        if throughput.count >= self.min_samples:
+            z_score = throughput.z_score(metrics.items_per_second)
+            if z_score <= -self.z_threshold:
+                anomalies.append(
+                    f"Throughput is {abs(z_score):.1f} standard deviations below recent average "
+                    f"({throughput.mean:.2f} items/sec)"
+                )
+        
+        # Check error rate anomalies (ignoring small absolute error rates)
+        current_error_rate = self._error_rate(metrics)
+        z_score = baseline.error_rate.z_score(current_error_rate)
+        if z_score >= self.z_threshold and current_error_rate > 5:
+            anomalies.append(
+                f"Error rate is unusually high: {current_error_rate:.1f}% vs average {baseline.error_rate.mean:.1f}%"
+            )
         
         # Check duration anomalies
-        recent_durations = [m.processing_duration for m in recent_operations if m.processing_duration]
-        if recent_durations and metrics.processing_duration:
-            avg_duration = statistics.mean(recent_durations)
-            if metrics.processing_duration > avg_duration * 2:
-                anomalies.append(f"Processing time is unusually long: {metrics.processing_duration:.1f}s vs average {avg_duration:.1f}s")
+        duration = baseline.duration
+        if duration.count >= self.min_samples and metrics.processing_duration:
+            z_score = duration.z_score(metrics.processing_duration)
+            if z_score >= self.z_threshold:
+                anomalies.append(
+                    f"Processing time is unusually long: {metrics.processing_duration:.1f}s "
+                    f"vs average {duration.mean:.1f}s ({z_score:.1f} standard deviations)"
+                )
         
         return anomalies
 
@@ -1022,15 +1550,14 @@ class OperationMonitor:
         # Time series metrics
         time_series_metrics = {}
         for metric_name in ["success_rate", "items_per_second", "data_quality_score"]:
-            points = self._time_series.get_points(metric_name, start_time, end_time)
-            if points:
-                values = [p.value for p in points]
+            summary = self._time_series.summarize_points(metric_name, start_time, end_time)
+            if summary:
                 time_series_metrics[metric_name] = {
-                    "current": values[-1] if values else 0,
-                    "average": statistics.mean(values),
-                    "min": min(values),
-                    "max": max(values),
-                    "trend": "improving" if len(values) > 1 and values[-1] > values[0] else "declining"
+                    "current": summary["last"],
+                    "average": summary["avg"],
+                    "min": summary["min"],
+                    "max": summary["max"],
+                    "trend": "improving" if summary["count"] > 1 and summary["last"] > summary["first"] else "declining"
                 }
         
         # Performance analysis
@@ -1038,7 +1565,7 @@ class OperationMonitor:
         all_recommendations = set()
         
         for operation in operations[-10:]:  # Analyze last 10 operations
-            analysis = self._performance_analyzer.analyze_operation(operation)
+            analysis = self._performance_analyzer.analyze_operation(operation, update_baseline=False)
             performance_scores.append(analysis["performance_score"])
             all_recommendations.update(analysis["recommendations"])
         
@@ -1168,7 +1695,7 @@ class OperationMonitor:
                 return {
                     "status": "active",
                     "metrics": tracker.metrics.to_dict(),
-                    "analysis": self._performance_analyzer.analyze_operation(tracker.metrics)
+                    "analysis": self._performance_analyzer.analyze_operation(tracker.metrics, update_baseline=False)
                 }
         
         # Check operation history
@@ -1177,7 +1704,7 @@ class OperationMonitor:
                 return {
                     "status": "completed",
                     "metrics": metrics.to_dict(),
-                    "analysis": self._performance_analyzer.analyze_operation(metrics)
+                    "analysis": self._performance_analyzer.analyze_operation(metrics, update_baseline=False)
                 }
         
         return None
@@ -1208,6 +1735,8 @@ class OperationMonitor:
             except asyncio.CancelledError:
                 pass
         
+        self._alert_manager.close()
+        
         logger.info("Background monitoring tasks stopped")
     
     async def _cleanup_loop(self):
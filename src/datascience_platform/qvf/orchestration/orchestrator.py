@@ -48,22 +48,25 @@ Performance:
 
 import asyncio
 import logging
+import random
 import uuid
-from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Optional, Any, Union, Callable, Set
+from datetime import datetime, timezone
+from typing import List, Dict, Optional, Any, Union, Callable, Set, Iterable, AsyncIterable, AsyncIterator
 from dataclasses import dataclass, field
 from enum import Enum
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from pathlib import Path
 import json
 
 # Core QVF imports
 from ..core.scoring import QVFScoringEngine, WorkItemScore, ScoringConfiguration
 from ..core.criteria import QVFCriteriaConfiguration
 from ..core.financial import FinancialMetrics
-from ..ado.work_items import WorkItemManager, QVFWorkItemScore, UpdateResult
-from ..ado.models import ADOWorkItem, WorkItemType, WorkItemState
+from ..ado.work_items import WorkItemManager, QVFWorkItemScore, UpdateResult, INACTIVE_STATES
+from ...ado.models import ADOWorkItem, WorkItemType, WorkItemState
 from ...core.exceptions import DataSciencePlatformError
+from .incremental import IncrementalScoringEngine, IncrementalScoringState
 
 # Optional AI enhancement
 try:
@@ -265,7 +268,7 @@ class ScoringWorkflow:
             if self._cancellation_token.is_set():
                 return self._handle_cancellation()
             
-            if not work_items:
+            if not work_items and not self._has_pending_work():
                 logger.warning(f"No work items found for workflow {self.workflow_id}")
                 return self._complete_workflow([])
             
@@ -321,6 +324,10 @@ class ScoringWorkflow:
         logger.info(f"Loaded {len(work_items)} work items for workflow {self.workflow_id}")
         return work_items
     
+    def _has_pending_work(self) -> bool:
+        """Whether scoring must run even though no work items were loaded."""
+        return False
+    
     async def _apply_ai_enhancement(self, work_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Apply AI enhancement to work items."""
         if not self.ai_manager:
@@ -339,7 +346,25 @@ class ScoringWorkflow:
     
     async def _calculate_scores(self, work_items: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate QVF scores for work items."""
-        # Convert work items to ADOWorkItem objects
+        ado_work_items = self._convert_work_items(work_items)
+        criteria_config = self._resolve_criteria_config()
+        
+        # Financial data (empty dict if not provided)
+        financial_data = self.request.financial_data or {}
+        
+        # Calculate scores
+        scoring_results = self.scoring_engine.score_work_items_with_financials(
+            work_items=ado_work_items,
+            qvf_config=criteria_config,
+            financial_data=financial_data,
+            custom_scoring_config=self.request.scoring_config
+        )
+        
+        logger.info(f"Calculated QVF scores for {len(ado_work_items)} work items")
+        return scoring_results
+    
+    def _convert_work_items(self, work_items: List[Dict[str, Any]]) -> List[ADOWorkItem]:
+        """Convert ADO work item payloads to ADOWorkItem objects."""
         ado_work_items = []
         for item_data in work_items:
             try:
@@ -355,25 +380,13 @@ class ScoringWorkflow:
                 logger.warning(f"Error converting work item {item_data.get('id', 'unknown')}: {e}")
                 continue
         
-        # Use default configuration if none provided
-        criteria_config = self.request.criteria_config
-        if not criteria_config:
-            from ..core.criteria import create_default_qvf_configuration
-            criteria_config = create_default_qvf_configuration()
+        return ado_work_items
         
-        # Financial data (empty dict if not provided)
-        financial_data = self.request.financial_data or {}
-        
-        # Calculate scores
-        scoring_results = self.scoring_engine.score_work_items_with_financials(
-            work_items=ado_work_items,
-            qvf_config=criteria_config,
-            financial_data=financial_data,
-            custom_scoring_config=self.request.scoring_config
-        )
-        
-        logger.info(f"Calculated QVF scores for {len(ado_work_items)} work items")
-        return scoring_results
+    def _resolve_criteria_config(self) -> QVFCriteriaConfiguration:
+        """Get the request's criteria configuration, using the default if none provided."""
+        if self.request.criteria_config:
+            return self.request.criteria_config
+        return self.scoring_engine.criteria_engine.get_default_configuration()
     
     async def _update_work_items(self, scoring_results: Dict[str, Any]) -> UpdateResult:
         """Update work items with QVF scores."""
@@ -475,84 +488,342 @@ class ScoringWorkflow:
         return self.result
 
 
+class IncrementalScoringWorkflow(ScoringWorkflow):
+    """Scoring workflow that only rescores work items changed since the last run.
+    
+    Loads items whose System.ChangedDate is after the state watermark, applies
+    them to an IncrementalScoringEngine and writes back only scores that
+    changed. The first run (or a run after a configuration change) loads the
+    full portfolio to seed the state.
+    """
+    
+    def __init__(
+        self,
+        request: ScoringRequest,
+        scoring_engine: QVFScoringEngine,
+        work_item_manager: WorkItemManager,
+        incremental_engine: IncrementalScoringEngine,
+        ai_manager: Optional[Any] = None,
+        changed_since: Optional[datetime] = None,
+        state_path: Optional[Path] = None
+    ):
+        super().__init__(request, scoring_engine, work_item_manager, ai_manager)
+        
+        self.incremental_engine = incremental_engine
+        self.changed_since = changed_since
+        self.state_path = state_path
+        
+        # Delta load results consumed by the scoring stage
+        self._removed_ids: List[int] = []
+        self._existing_scores: Dict[int, float] = {}
+        self._watermark: Optional[datetime] = None
+    
+    async def _load_work_items(self) -> List[Dict[str, Any]]:
+        """Load work items changed since the last incremental run."""
+        full_load = self.incremental_engine.begin(
+            self._resolve_criteria_config(), self.request.scoring_config
+        )
+        changed_since = None if full_load else (self.changed_since or self.incremental_engine.state.watermark)
+        
+        # Without an explicit state filter, also load items that became inactive so they can be dropped
+        include_inactive = not full_load and not self.request.states
+        
+        query_started_at = datetime.now(timezone.utc)
+        work_items = await self.work_item_manager.load_work_items_for_scoring(
+            project_name=self.request.project_name,
+            work_item_types=self.request.work_item_types,
+            states=self.request.states,
+            area_path=self.request.area_path,
+            iteration_path=self.request.iteration_path,
+            include_qvf_fields=True,
+            changed_since=changed_since,
+            include_inactive=include_inactive
+        )
+        
+        active_items = []
+        for item_data in work_items:
+            fields = item_data.get("fields", {})
+            work_item_id = fields.get("System.Id", item_data.get("id"))
+            
+            changed_date = self._parse_changed_date(fields.get("System.ChangedDate"))
+            if changed_date and (self._watermark is None or changed_date > self._watermark):
+                self._watermark = changed_date
+            
+            if include_inactive and fields.get("System.State") in INACTIVE_STATES:
+                self._removed_ids.append(work_item_id)
+                continue
+            
+            if fields.get("Custom.QVFScore") is not None:
+                self._existing_scores[work_item_id] = fields["Custom.QVFScore"]
+            
+            active_items.append(item_data)
+        
+        # Mirror loads have seen every change up to the mirror's sync high-water mark. Without a
+        # mirror, an empty full load covers everything changed before the query started and an
+        # empty delta load keeps the previous watermark so later changes are not skipped
+        mirror_watermark = self.work_item_manager.get_mirror_watermark(self.request.project_name)
+        if mirror_watermark is not None:
+            self._watermark = mirror_watermark
+        elif self._watermark is None and full_load:
+            self._watermark = query_started_at
+        
+        logger.info(
+            f"Loaded {len(active_items)} changed work items for workflow {self.workflow_id} "
+            f"({'full' if full_load else 'delta'} load, {len(self._removed_ids)} left scope)"
+        )
+        return active_items
+    
+    def _has_pending_work(self) -> bool:
+        """Removals, failed writes and financial changes still need a scoring pass."""
+        state = self.incremental_engine.state
+        return bool(self._removed_ids or state.pending_writes or self.request.financial_data)
+    
+    async def _calculate_scores(self, work_items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Apply changed work items to the incremental state."""
+        incremental_result = self.incremental_engine.apply_changes(
+            self._convert_work_items(work_items),
+            financial_data=self.request.financial_data,
+            removed_ids=self._removed_ids,
+            existing_scores=self._existing_scores,
+            watermark=self._watermark
+        )
+        
+        self.result.skipped_items = incremental_result.total_items - len(incremental_result.work_item_scores)
+        
+        return {
+            'work_item_scores': incremental_result.work_item_scores,
+            'incremental_result': incremental_result
+        }
+    
+    async def _update_work_items(self, scoring_results: Dict[str, Any]) -> UpdateResult:
+        """Write changed scores and persist the incremental state."""
+        if scoring_results['work_item_scores']:
+            update_result = await super()._update_work_items(scoring_results)
+        else:
+            logger.info(f"No score changes to write for workflow {self.workflow_id}")
+            update_result = UpdateResult(
+                total_items=0, successful_updates=0, failed_updates=0, processing_time_seconds=0.0
+            )
+        
+        for batch in update_result.batch_results:
+            self.incremental_engine.mark_written(batch.successful_updates)
+        
+        # Suppressed writes: ADO already holds these scores
+        self.incremental_engine.mark_written(update_result.skipped_work_item_ids)
+        self.result.skipped_items += update_result.skipped_updates
+        
+        if self.state_path:
+            self.incremental_engine.state.save(self.state_path)
+        
+        return update_result
+    
+    @staticmethod
+    def _parse_changed_date(value: Any) -> Optional[datetime]:
+        """Parse an ADO System.ChangedDate value."""
+        if isinstance(value, datetime):
+            changed_date = value
+        elif isinstance(value, str):
+            try:
+                changed_date = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                return None
+        else:
+            return None
+        
+        return changed_date if changed_date.tzinfo else changed_date.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class BatchProcessingResult:
+    """Outcome of BatchProcessor.process_batches."""
+    
+    # Batch ID -> result, in batch order
+    results: Dict[str, Any] = field(default_factory=dict)
+    # Batch ID -> error message, for batches that failed every attempt
+    errors: Dict[str, str] = field(default_factory=dict)
+    
+    total_items: int = 0
+    total_batches: int = 0
+    retried_batches: int = 0
+    
+    @property
+    def successful_batches(self) -> int:
+        """Number of batches that produced a result."""
+        return len(self.results)
+    
+    @property
+    def success_rate(self) -> float:
+        """Fraction of batches that produced a result."""
+        return len(self.results) / self.total_batches if self.total_batches else 1.0
+
+
 class BatchProcessor:
-    """High-performance batch processor for QVF operations."""
+    """High-performance batch processor for QVF operations.
+    
+    Batches are produced lazily from the input and handed to a fixed pool of
+    max_concurrent consumers through a bounded queue, so only a few batches
+    exist at a time regardless of the input size. Failed batches are retried
+    with jittered exponential backoff.
+    """
     
-    def __init__(self, max_concurrent: int = 10, default_batch_size: int = 100):
+    def __init__(
+        self,
+        max_concurrent: int = 10,
+        default_batch_size: int = 100,
+        max_retries: int = 3,
+        retry_delay_seconds: float = 1.0,
+        max_retry_delay_seconds: float = 30.0
+    ):
         self.max_concurrent = max_concurrent
         self.default_batch_size = default_batch_size
+        self.max_retries = max_retries
+        self.retry_delay_seconds = retry_delay_seconds
+        self.max_retry_delay_seconds = max_retry_delay_seconds
         self._active_batches: Set[str] = set()
-        self._semaphore = asyncio.Semaphore(max_concurrent)
         
         logger.info(f"BatchProcessor initialized with {max_concurrent} concurrent operations")
     
     async def process_batches(
         self,
-        items: List[Any],
+        items: Union[Iterable[Any], AsyncIterable[Any]],
         processor_func: Callable,
         batch_size: Optional[int] = None,
-        progress_callback: Optional[Callable] = None
-    ) -> List[Any]:
-        """Process items in batches with concurrency control."""
+        progress_callback: Optional[Callable] = None,
+        total_items: Optional[int] = None
+    ) -> BatchProcessingResult:
+        """Process items in batches with concurrency control.
+        
+        Args:
+            items: Items to process (iterable or async iterable, consumed lazily)
+            processor_func: Coroutine function called with each list of items
+            batch_size: Items per batch (defaults to default_batch_size)
+            progress_callback: Called with (stage, progress, message) after
+                each batch when the number of items is known
+            total_items: Number of items, for progress of unsized inputs
+            
+        Returns:
+            Batch results and errors keyed by batch ID ("batch_1", ...)
+        """
         if batch_size is None:
             batch_size = self.default_batch_size
         
-        # Create batches
-        batches = []
-        for i in range(0, len(items), batch_size):
-            batch = items[i:i + batch_size]
-            batch_id = f"batch_{i//batch_size + 1}"
-            batches.append((batch_id, batch))
+        if total_items is None and hasattr(items, '__len__'):
+            total_items = len(items)
+        expected_batches = -(-total_items // batch_size) if total_items is not None else None
         
-        logger.info(f"Processing {len(items)} items in {len(batches)} batches")
-        
-        # Process batches concurrently
-        results = []
+        result = BatchProcessingResult()
+        batch_results: Dict[int, Any] = {}
+        batch_errors: Dict[int, str] = {}
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrent)
         completed_batches = 0
         
-        async def process_batch(batch_id: str, batch_items: List[Any]) -> Any:
+        async def produce():
+            async for index, batch_items in self._iter_batches(items, batch_size):
+                result.total_items += len(batch_items)
+                result.total_batches += 1
+                await queue.put((index, batch_items))
+            
+            for _ in range(self.max_concurrent):
+                await queue.put(None)
+        
+        async def consume():
             nonlocal completed_batches
             
-            async with self._semaphore:
-                self._active_batches.add(batch_id)
+            while True:
+                entry = await queue.get()
+                if entry is None:
+                    return
+                
+                index, batch_items = entry
+                batch_id = f"batch_{index + 1}"
+                
+                succeeded, value, attempts = await self._process_batch(batch_id, batch_items, processor_func)
+                if succeeded:
+                    batch_results[index] = value
+                else:
+                    batch_errors[index] = str(value)
+                if attempts > 1:
+                    result.retried_batches += 1
+                
+                completed_batches += 1
+                if progress_callback and expected_batches:
+                    progress = min(1.0, completed_batches / expected_batches)
+                    progress_callback("batch_processing", progress, f"Completed {batch_id}")
+        
+        logger.info(f"Processing items in batches of {batch_size} with {self.max_concurrent} concurrent batches")
+        
+        tasks = [asyncio.create_task(produce())]
+        tasks.extend(asyncio.create_task(consume()) for _ in range(self.max_concurrent))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        result.results = {f"batch_{index + 1}": batch_results[index] for index in sorted(batch_results)}
+        result.errors = {f"batch_{index + 1}": batch_errors[index] for index in sorted(batch_errors)}
+        
+        logger.info(
+            f"Batch processing completed: {result.successful_batches}/{result.total_batches} successful "
+            f"({result.total_items} items, {result.retried_batches} retried)"
+        )
+        return result
+    
+    async def _process_batch(self, batch_id: str, batch_items: List[Any], processor_func: Callable):
+        """Run one batch, retrying failures with jittered exponential backoff.
+        
+        Returns:
+            Tuple of (succeeded, result or last exception, attempts made)
+        """
+        self._active_batches.add(batch_id)
+        last_error: Optional[Exception] = None
+        
+        try:
+            for attempt in range(self.max_retries + 1):
+                if attempt > 0:
+                    # Full jitter keeps retried batches from hitting ADO in lockstep
+                    delay = min(self.max_retry_delay_seconds, self.retry_delay_seconds * (2 ** (attempt - 1)))
+                    await asyncio.sleep(random.uniform(0, delay))
                 
                 try:
-                    logger.debug(f"Processing {batch_id} with {len(batch_items)} items")
-                    result = await processor_func(batch_items)
+                    logger.debug(f"Processing {batch_id} with {len(batch_items)} items (attempt {attempt + 1})")
+                    return True, await processor_func(batch_items), attempt + 1
+                except Exception as e:
+                    last_error = e
+                    logger.warning(f"Error processing {batch_id} (attempt {attempt + 1}): {e}")
                     
-                    completed_batches += 1
+            logger.error(f"Batch {batch_id} failed after {self.max_retries + 1} attempts: {last_error}")
+            return False, last_error, self.max_retries + 1
                     
-                    if progress_callback:
-                        progress = completed_batches / len(batches)
-                        progress_callback("batch_processing", progress, f"Completed {batch_id}")
+        finally:
+            self._active_batches.discard(batch_id)
                     
-                    return result
+    @staticmethod
+    async def _iter_batches(
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+        batch_size: int
+    ) -> AsyncIterator:
+        """Yield (index, batch) pairs without materializing the input."""
+        index = 0
+        batch: List[Any] = []
                 
-                except Exception as e:
-                    logger.error(f"Error processing {batch_id}: {e}")
-                    raise
+        if hasattr(items, '__aiter__'):
+            async for item in items:
+                batch.append(item)
+                if len(batch) == batch_size:
+                    yield index, batch
+                    index += 1
+                    batch = []
+        else:
+            for item in items:
+                batch.append(item)
+                if len(batch) == batch_size:
+                    yield index, batch
+                    index += 1
+                    batch = []
                 
-                finally:
-                    self._active_batches.discard(batch_id)
-        
-        # Execute all batches concurrently
-        batch_tasks = [
-            process_batch(batch_id, batch_items)
-            for batch_id, batch_items in batches
-        ]
-        
-        batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-        
-        # Handle results and exceptions
-        for i, result in enumerate(batch_results):
-            if isinstance(result, Exception):
-                logger.error(f"Batch {i+1} failed: {result}")
-                # Could implement retry logic here
-            else:
-                results.append(result)
-        
-        logger.info(f"Batch processing completed: {len(results)}/{len(batches)} successful")
-        return results
+        if batch:
+            yield index, batch
     
     def get_active_batches(self) -> List[str]:
         """Get list of currently active batch IDs."""
@@ -580,7 +851,8 @@ class QVFOrchestrator:
         batch_size: int = 100,
         max_concurrent_workflows: int = 5,
         enable_ai_enhancement: bool = True,
-        performance_monitoring: bool = True
+        performance_monitoring: bool = True,
+        incremental_state_dir: Optional[Union[str, Path]] = None
     ):
         """Initialize QVF orchestrator.
         
@@ -591,6 +863,8 @@ class QVFOrchestrator:
             max_concurrent_workflows: Maximum concurrent workflows
             enable_ai_enhancement: Enable AI enhancement by default
             performance_monitoring: Enable performance monitoring
+            incremental_state_dir: Directory for persisted incremental scoring
+                state (kept in memory only if None)
         """
         self.organization_url = organization_url
         self.personal_access_token = personal_access_token
@@ -627,6 +901,12 @@ class QVFOrchestrator:
         self._workflow_history: List[WorkflowResult] = []
         self._scheduled_jobs: Dict[str, Dict[str, Any]] = {}
         
+        # Incremental scoring state per project
+        self.incremental_state_dir = Path(incremental_state_dir) if incremental_state_dir else None
+        self._incremental_engines: Dict[str, IncrementalScoringEngine] = {}
+        # Serializes load -> score -> commit of runs sharing a project's engine
+        self._incremental_locks: Dict[str, asyncio.Lock] = {}
+        
         # Performance tracking
         self._operation_stats = {
             "workflows_executed": 0,
@@ -695,15 +975,22 @@ class QVFOrchestrator:
         
         logger.info(f"Starting QVF scoring: {request.description}")
         
-        # Execute workflow
+        workflow = ScoringWorkflow(
+            request=request,
+            scoring_engine=self.scoring_engine,
+            work_item_manager=self.work_item_manager,
+            ai_manager=self.ai_manager
+        )
+        
+        return await self._run_workflow(workflow, progress_callback)
+    
+    async def _run_workflow(
+        self,
+        workflow: ScoringWorkflow,
+        progress_callback: Optional[Callable] = None
+    ) -> WorkflowResult:
+        """Execute a workflow with concurrency control, tracking and statistics."""
         async with self._workflow_semaphore:
-            workflow = ScoringWorkflow(
-                request=request,
-                scoring_engine=self.scoring_engine,
-                work_item_manager=self.work_item_manager,
-                ai_manager=self.ai_manager
-            )
-            
             if progress_callback:
                 workflow.set_progress_callback(progress_callback)
             
@@ -773,36 +1060,77 @@ class QVFOrchestrator:
         financial_data: Optional[Dict[int, FinancialMetrics]] = None,
         progress_callback: Optional[Callable] = None
     ) -> WorkflowResult:
-        """Update scores for work items changed since specified time.
+        """Update scores for work items changed since the last incremental run.
+        
+        Only items changed after the stored watermark are loaded and rescored;
+        the rest of the portfolio is taken from the persisted incremental state.
+        The first run for a project (or after a configuration change) loads
+        and scores all eligible items to seed that state. Overlapping runs for
+        the same project wait for each other, so each starts from the state
+        and watermark committed by the previous one.
         
         Args:
             project_name: Azure DevOps project name
             criteria_config: QVF criteria configuration
-            changed_since: Only process items changed after this time
-            financial_data: Financial metrics by work item ID
+            changed_since: Override the stored watermark for the delta query
+            financial_data: Financial metrics by work item ID (changed items only
+                are sufficient once the state is seeded)
             progress_callback: Progress reporting callback
             
         Returns:
             WorkflowResult with incremental update details
         """
-        if changed_since is None:
-            # Default to last 24 hours
-            changed_since = datetime.now(timezone.utc) - timedelta(hours=24)
-        
-        logger.info(f"Starting incremental update for {project_name} (changed since {changed_since})")
-        
-        # TODO: Implement changed_since filtering in work item loading
-        # For now, we'll process all items but this should be optimized
+        lock = self._incremental_locks.setdefault(project_name, asyncio.Lock())
+        async with lock:
+            incremental_engine = self._get_incremental_engine(project_name)
+            watermark = changed_since or incremental_engine.state.watermark
+            
+            logger.info(f"Starting incremental update for {project_name} (changed since {watermark or 'never'})")
+            
+            request = ScoringRequest(
+                project_name=project_name,
+                mode=ScoringMode.INCREMENTAL,
+                criteria_config=criteria_config,
+                financial_data=financial_data,
+                priority=OperationPriority.HIGH,
+                batch_size=self.batch_size,
+                enable_ai_enhancement=self.enable_ai_enhancement,
+                description=f"Incremental update for {project_name}"
+            )
+            
+            workflow = IncrementalScoringWorkflow(
+                request=request,
+                scoring_engine=self.scoring_engine,
+                work_item_manager=self.work_item_manager,
+                incremental_engine=incremental_engine,
+                ai_manager=self.ai_manager,
+                changed_since=changed_since,
+                state_path=self._incremental_state_path(project_name)
+            )
+            
+            return await self._run_workflow(workflow, progress_callback)
+    
+    def _get_incremental_engine(self, project_name: str) -> IncrementalScoringEngine:
+        """Get the incremental scoring engine for a project, loading persisted state."""
+        if project_name not in self._incremental_engines:
+            state_path = self._incremental_state_path(project_name)
+            if state_path:
+                state = IncrementalScoringState.load(state_path, project_name=project_name)
+            else:
+                state = IncrementalScoringState(project_name=project_name)
+            
+            self._incremental_engines[project_name] = IncrementalScoringEngine(
+                self.scoring_engine, state=state
+            )
         
-        return await self.score_work_items(
-            project_name=project_name,
-            mode=ScoringMode.INCREMENTAL,
-            criteria_config=criteria_config,
-            financial_data=financial_data,
-            priority=OperationPriority.HIGH,
-            progress_callback=progress_callback,
-            description=f"Incremental update for {project_name}"
-        )
+        return self._incremental_engines[project_name]
+    
+    def _incremental_state_path(self, project_name: str) -> Optional[Path]:
+        """Path of the persisted incremental state for a project."""
+        if not self.incremental_state_dir:
+            return None
+        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in project_name)
+        return self.incremental_state_dir / f"{safe_name}.incremental.json"
     
     async def schedule_batch_scoring(
         self,
@@ -9,8 +9,10 @@ This module provides advanced scheduling capabilities for QVF operations includi
 - Comprehensive job lifecycle management
 
 Key Features:
-- Cron expression support for flexible scheduling
+- Full five-field cron expressions with arithmetic next-run calculation
+- Min-heap of job run times so the schedule loop sleeps until the next due job
 - Priority-based job queuing with SLA guarantees
+- Event-driven worker wakeup with a single timer for request deadlines
 - Resource monitoring and adaptive throttling
 - Dead letter queue for failed jobs with retry logic
 - Job dependencies and workflow orchestration
@@ -44,23 +46,33 @@ Performance:
 import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Optional, Any, Callable, Union
-from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Any, Callable, Union, Set, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum, IntEnum
 from contextlib import asynccontextmanager
+import bisect
+import calendar
 import heapq
+import itertools
 import uuid
 from collections import defaultdict, deque
 import json
 import re
+from functools import lru_cache
 
-# Cron parsing (could use external library like croniter in production)
-from ..orchestrator import (
+from .orchestrator import (
     ScoringRequest, ScoringMode, OperationPriority, 
     WorkflowResult, OrchestrationError
 )
 from ...core.exceptions import DataSciencePlatformError
 
+# System metrics for resource monitoring (optional)
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -100,6 +112,10 @@ class Priority(IntEnum):
     CRITICAL = 5
 
 
+# Job statuses from which a scheduled job can fire again
+RUNNABLE_JOB_STATUSES = frozenset({JobStatus.SCHEDULED, JobStatus.QUEUED, JobStatus.RETRYING})
+
+
 class ResourceType(str, Enum):
     """System resource types for monitoring."""
     CPU = "cpu"
@@ -179,6 +195,178 @@ class ResourceUsage:
         return factors
 
 
+class CronExpression:
+    """Five-field cron expression (minute hour day-of-month month day-of-week).
+    
+    Fields accept ``*``, single values, lists (``1,15``), ranges (``1-5``)
+    and steps (``*/15``, ``0-30/10``, ``5/20``). Months and weekdays also
+    accept three-letter names, and both 0 and 7 mean Sunday. As in Vixie
+    cron, when both day-of-month and day-of-week are restricted a day
+    matches if either field matches.
+    """
+    
+    FIELD_NAMES = ("minute", "hour", "day of month", "month", "day of week")
+    FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+    MONTH_NAMES = {name.upper(): i for i, name in enumerate(calendar.month_abbr) if name}
+    WEEKDAY_NAMES = {"SUN": 0, "MON": 1, "TUE": 2, "WED": 3, "THU": 4, "FRI": 5, "SAT": 6}
+    
+    # A day that matches must occur within this many years (covers Feb 29)
+    MAX_SEARCH_YEARS = 8
+    
+    def __init__(self, expression: str):
+        """Parse a cron expression.
+        
+        Args:
+            expression: Cron expression with five whitespace-separated fields
+            
+        Raises:
+            SchedulingError: If the expression is malformed
+        """
+        self.expression = expression
+        parts = expression.strip().split()
+        if len(parts) != 5:
+            raise SchedulingError(f"Cron expression must have 5 fields: '{expression}'")
+        
+        names = (None, None, None, self.MONTH_NAMES, self.WEEKDAY_NAMES)
+        minutes, hours, days, months, weekdays = (
+            self._parse_field(part, field_name, bounds, field_names)
+            for part, field_name, bounds, field_names in zip(parts, self.FIELD_NAMES, self.FIELD_RANGES, names)
+        )
+        
+        self.minutes = minutes
+        self.hours = hours
+        self.days = frozenset(days)
+        self.months = months
+        self.weekdays = frozenset(day % 7 for day in weekdays)
+        
+        self._days_restricted = parts[2][0] not in "*?"
+        self._weekdays_restricted = parts[4][0] not in "*?"
+    
+    def __repr__(self) -> str:
+        return f"CronExpression({self.expression!r})"
+    
+    def next_after(self, after: datetime) -> datetime:
+        """Get the first matching time strictly after the given time.
+        
+        Args:
+            after: Reference time (the result keeps its tzinfo)
+            
+        Returns:
+            Next fire time, truncated to the minute
+            
+        Raises:
+            SchedulingError: If no matching day exists (e.g. "0 0 31 2 *")
+        """
+        start = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        year, month, day = start.year, start.month, start.day
+        hour, minute = start.hour, start.minute
+        
+        for _ in range(self.MAX_SEARCH_YEARS * 12):
+            # Jump to the next allowed month
+            month_index = bisect.bisect_left(self.months, month)
+            if month_index == len(self.months):
+                year += 1
+                month_index = 0
+            if self.months[month_index] != month:
+                month = self.months[month_index]
+                day, hour, minute = 1, 0, 0
+            
+            # Walk the matching days of this month until a time fits
+            last_day = calendar.monthrange(year, month)[1]
+            while day <= last_day:
+                if self._day_matches(year, month, day):
+                    run_time = self._next_time(hour, minute)
+                    if run_time is not None:
+                        return start.replace(
+                            year=year, month=month, day=day, hour=run_time[0], minute=run_time[1]
+                        )
+                day += 1
+                hour, minute = 0, 0
+            
+            month += 1
+            if month > 12:
+                year += 1
+                month = 1
+            day, hour, minute = 1, 0, 0
+        
+        raise SchedulingError(f"Cron expression '{self.expression}' never matches")
+    
+    def _day_matches(self, year: int, month: int, day: int) -> bool:
+        """Check day-of-month and day-of-week restrictions."""
+        if not self._weekdays_restricted:
+            return day in self.days
+        
+        # Python weekdays start on Monday, cron weekdays on Sunday
+        weekday_match = (calendar.weekday(year, month, day) + 1) % 7 in self.weekdays
+        if not self._days_restricted:
+            return weekday_match
+        
+        return weekday_match or day in self.days
+    
+    def _next_time(self, hour: int, minute: int) -> Optional[Tuple[int, int]]:
+        """First allowed (hour, minute) at or after the given time of day."""
+        hour_index = bisect.bisect_left(self.hours, hour)
+        if hour_index < len(self.hours) and self.hours[hour_index] == hour:
+            minute_index = bisect.bisect_left(self.minutes, minute)
+            if minute_index < len(self.minutes):
+                return hour, self.minutes[minute_index]
+            hour_index += 1
+        
+        if hour_index < len(self.hours):
+            return self.hours[hour_index], self.minutes[0]
+        return None
+    
+    @staticmethod
+    def _parse_field(
+        value: str,
+        field_name: str,
+        bounds: Tuple[int, int],
+        names: Optional[Dict[str, int]]
+    ) -> Tuple[int, ...]:
+        """Expand one cron field into its sorted allowed values."""
+        low, high = bounds
+        
+        def to_int(text: str) -> int:
+            if names and text.upper() in names:
+                return names[text.upper()]
+            return int(text)
+        
+        allowed = set()
+        try:
+            for part in value.split(","):
+                step = 1
+                stepped = "/" in part
+                if stepped:
+                    part, step_text = part.split("/", 1)
+                    step = int(step_text)
+                    if step < 1:
+                        raise ValueError("step must be positive")
+                
+                if part in ("*", "?"):
+                    start, end = low, high
+                elif "-" in part:
+                    start_text, end_text = part.split("-", 1)
+                    start, end = to_int(start_text), to_int(end_text)
+                else:
+                    start = to_int(part)
+                    end = high if stepped else start
+                
+                if not low <= start <= end <= high:
+                    raise ValueError(f"values must be within {low}-{high}")
+                
+                allowed.update(range(start, end + 1, step))
+        except ValueError as e:
+            raise SchedulingError(f"Invalid cron {field_name} field '{value}': {e}") from e
+        
+        return tuple(sorted(allowed))
+
+
+@lru_cache(maxsize=1024)
+def parse_cron_expression(expression: str) -> CronExpression:
+    """Parse a cron expression, reusing parsed expressions shared by many jobs."""
+    return CronExpression(expression)
+
+
 @dataclass
 class ScheduledJob:
     """Scheduled job definition."""
@@ -220,7 +408,7 @@ class ScheduledJob:
     
     def is_ready_to_run(self, completed_jobs: Set[str]) -> bool:
         """Check if job dependencies are satisfied."""
-        if not self.enabled or self.status != JobStatus.SCHEDULED:
+        if not self.enabled or self.status not in RUNNABLE_JOB_STATUSES:
             return False
         
         # Check if it's time to run
@@ -233,51 +421,24 @@ class ScheduledJob:
         
         return True
     
-    def calculate_next_run_time(self) -> Optional[datetime]:
-        """Calculate next run time based on cron expression."""
+    def calculate_next_run_time(self, after: Optional[datetime] = None) -> Optional[datetime]:
+        """Calculate next run time based on cron expression.
+        
+        Args:
+            after: Reference time (defaults to now)
+            
+        Returns:
+            Next run time, or None if the job has no valid cron expression
+        """
         if not self.cron_expression:
             return None
         
-        # Simple cron parsing - in production, use croniter library
         try:
-            return self._parse_cron_expression()
-        except Exception as e:
+            cron = parse_cron_expression(self.cron_expression)
+            return cron.next_after(after or datetime.now(timezone.utc))
+        except SchedulingError as e:
             logger.error(f"Error parsing cron expression '{self.cron_expression}': {e}")
             return None
-    
-    def _parse_cron_expression(self) -> Optional[datetime]:
-        """Parse cron expression (simplified implementation)."""
-        # This is a simplified parser - use croniter in production
-        # Format: minute hour day month day_of_week
-        
-        now = datetime.now(timezone.utc)
-        parts = self.cron_expression.strip().split()
-        
-        if len(parts) != 5:
-            raise ValueError("Cron expression must have 5 parts")
-        
-        minute, hour, day, month, day_of_week = parts
-        
-        # Handle simple cases
-        if self.cron_expression == "0 2 * * *":  # Daily at 2 AM
-            next_run = now.replace(hour=2, minute=0, second=0, microsecond=0)
-            if next_run <= now:
-                next_run += timedelta(days=1)
-            return next_run
-        
-        elif self.cron_expression == "0 * * * *":  # Every hour
-            next_run = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
-            return next_run
-        
-        elif self.cron_expression == "*/15 * * * *":  # Every 15 minutes
-            minutes_to_add = 15 - (now.minute % 15)
-            next_run = now.replace(second=0, microsecond=0) + timedelta(minutes=minutes_to_add)
-            return next_run
-        
-        else:
-            # For complex expressions, would need full cron parser
-            logger.warning(f"Complex cron expression not supported: {self.cron_expression}")
-            return now + timedelta(hours=1)  # Default to 1 hour
 
 
 @dataclass
@@ -331,7 +492,13 @@ class QueuedRequest:
 
 
 class ResourceMonitor:
-    """System resource monitoring and throttling."""
+    """System resource monitoring and throttling.
+    
+    CPU usage is sampled without blocking: psutil compares CPU times with the
+    previous call, so a baseline is primed when monitoring starts and every
+    tick reports usage since the last one. Sampling runs in the default
+    executor so the event loop is never blocked by system calls.
+    """
     
     def __init__(self, limits: ResourceLimits):
         self.limits = limits
@@ -342,12 +509,17 @@ class ResourceMonitor:
         # Monitoring task
         self._monitoring_task: Optional[asyncio.Task] = None
         self._monitoring_interval = 30  # seconds
+        self._cpu_warmup_seconds = 1.0  # Window of the first CPU sample
     
     async def start_monitoring(self):
         """Start resource monitoring task."""
         if self._monitoring_task:
             return
         
+        # Prime the CPU baseline so the first sample covers the warmup window
+        if PSUTIL_AVAILABLE:
+            psutil.cpu_percent(interval=None)
+        
         self._monitoring_task = asyncio.create_task(self._monitor_resources())
         logger.info("Resource monitoring started")
     
@@ -364,6 +536,11 @@ class ResourceMonitor:
     
     async def _monitor_resources(self):
         """Background task to monitor system resources."""
+        try:
+            await asyncio.sleep(self._cpu_warmup_seconds)
+        except asyncio.CancelledError:
+            return
+        
         while True:
             try:
                 await self._update_resource_usage()
@@ -376,33 +553,35 @@ class ResourceMonitor:
     
     async def _update_resource_usage(self):
         """Update current resource usage metrics."""
-        # In production, these would use actual system monitoring
-        # For now, we'll simulate or use basic metrics
-        
-        import psutil
+        if PSUTIL_AVAILABLE:
+            loop = asyncio.get_running_loop()
+            cpu_percent, memory_percent = await loop.run_in_executor(None, self._sample_system_usage)
+        else:
+            # psutil not available - use placeholder values
+            cpu_percent, memory_percent = 25.0, 45.0  # Simulated values
+        
+        # Other metrics are maintained by the scheduler and carried over
+        self.current_usage = replace(
+            self.current_usage,
+            cpu_percent=cpu_percent,
+            memory_percent=memory_percent,
+            timestamp=datetime.now(timezone.utc)
+        )
         
-        try:
-            self.current_usage = ResourceUsage(
-                cpu_percent=psutil.cpu_percent(interval=1),
-                memory_percent=psutil.virtual_memory().percent,
-                # Other metrics would be updated by the scheduler
-                timestamp=datetime.now(timezone.utc)
-            )
+        if not PSUTIL_AVAILABLE:
+            return
             
-            self.usage_history.append(self.current_usage)
+        self.usage_history.append(self.current_usage)
             
-            # Log if over limits
-            if self.current_usage.is_over_limit(self.limits):
-                limiting_factors = self.current_usage.get_limiting_factors(self.limits)
-                logger.warning(f"Resource limits exceeded: {', '.join(limiting_factors)}")
-        
-        except ImportError:
-            # psutil not available - use placeholder values
-            self.current_usage = ResourceUsage(
-                cpu_percent=25.0,  # Simulated values
-                memory_percent=45.0,
-                timestamp=datetime.now(timezone.utc)
-            )
+        # Log if over limits
+        if self.current_usage.is_over_limit(self.limits):
+            limiting_factors = self.current_usage.get_limiting_factors(self.limits)
+            logger.warning(f"Resource limits exceeded: {', '.join(limiting_factors)}")
+        
+    @staticmethod
+    def _sample_system_usage() -> Tuple[float, float]:
+        """Read CPU usage since the previous sample and current memory usage."""
+        return psutil.cpu_percent(interval=None), psutil.virtual_memory().percent
     
     def record_api_call(self):
         """Record an API call for rate limiting."""
@@ -481,6 +660,15 @@ class QVFScheduler:
         self._dead_letter_queue: List[QueuedRequest] = []
         self._completed_jobs: Set[str] = set()
         
+        # Workers wait on this condition until a request is queued
+        self._queue_condition = asyncio.Condition()
+        
+        # Deadlines of queued requests; one timer is armed for the earliest
+        self._deadline_heap: List[Tuple[datetime, int, QueuedRequest]] = []
+        self._deadline_sequence = itertools.count()
+        self._expiry_timer: Optional[asyncio.TimerHandle] = None
+        self._expiry_deadline: Optional[datetime] = None
+        
         # Resource monitoring
         self._resource_monitor = ResourceMonitor(self.resource_limits)
         
@@ -488,9 +676,14 @@ class QVFScheduler:
         self._workers: List[asyncio.Task] = []
         self._worker_stats: Dict[str, Dict[str, Any]] = {}
         
-        # Scheduling
+        # Scheduling: jobs are kept in a min-heap of (run time, token, job ID);
+        # entries whose token is no longer current are skipped when popped
         self._scheduler_task: Optional[asyncio.Task] = None
-        self._schedule_check_interval = 60  # Check every minute
+        self._schedule_check_interval = 60  # Retry delay for deferred jobs
+        self._job_heap: List[Tuple[datetime, int, str]] = []
+        self._job_heap_tokens: Dict[str, int] = {}
+        self._job_sequence = itertools.count()
+        self._schedule_wakeup = asyncio.Event()
         
         # Statistics
         self._stats = {
@@ -555,6 +748,12 @@ class QVFScheduler:
             except:
                 pass
         
+        # Stop the request expiry timer
+        if self._expiry_timer:
+            self._expiry_timer.cancel()
+            self._expiry_timer = None
+            self._expiry_deadline = None
+        
         # Stop resource monitoring
         await self._resource_monitor.stop_monitoring()
         
@@ -598,7 +797,12 @@ class QVFScheduler:
             
         Returns:
             Unique job ID
+            
+        Raises:
+            SchedulingError: If the cron expression is invalid
         """
+        parse_cron_expression(cron_expression)
+        
         job = ScheduledJob(
             job_name=job_name,
             job_type=job_type,
@@ -616,6 +820,7 @@ class QVFScheduler:
         job.next_run_time = job.calculate_next_run_time()
         
         self._scheduled_jobs[job.job_id] = job
+        self._push_scheduled_job(job)
         self._stats["jobs_scheduled"] += 1
         
         logger.info(f"Scheduled job '{job_name}' ({job.job_id}) - next run: {job.next_run_time}")
@@ -634,6 +839,7 @@ class QVFScheduler:
         if job_id in self._scheduled_jobs:
             self._scheduled_jobs[job_id].status = JobStatus.CANCELLED
             self._scheduled_jobs[job_id].enabled = False
+            self._job_heap_tokens.pop(job_id, None)
             logger.info(f"Cancelled job {job_id}")
             return True
         else:
@@ -651,6 +857,7 @@ class QVFScheduler:
         """
         if job_id in self._scheduled_jobs:
             self._scheduled_jobs[job_id].enabled = False
+            self._job_heap_tokens.pop(job_id, None)
             logger.info(f"Paused job {job_id}")
             return True
         else:
@@ -670,6 +877,7 @@ class QVFScheduler:
             job = self._scheduled_jobs[job_id]
             job.enabled = True
             job.next_run_time = job.calculate_next_run_time()
+            self._push_scheduled_job(job)
             logger.info(f"Resumed job {job_id} - next run: {job.next_run_time}")
             return True
         else:
@@ -701,13 +909,10 @@ class QVFScheduler:
             max_wait_seconds=max_wait_seconds
         )
         
-        # Add to priority queue (heapq maintains order)
-        heapq.heappush(self._priority_queue, request)
+        # Add to priority queue and wake a worker
+        await self._enqueue_request(request)
         self._stats["requests_queued"] += 1
         
-        # Update resource monitor
-        self._resource_monitor.current_usage.queue_size = len(self._priority_queue)
-        
         logger.info(f"Queued priority request {request.request_id} with {priority.name} priority")
         
         return request.request_id
@@ -828,41 +1033,97 @@ class QVFScheduler:
         }
     
     async def _schedule_loop(self):
-        """Main scheduling loop to check for ready jobs."""
+        """Main scheduling loop, sleeping until the next job is due."""
         while True:
             try:
+                self._schedule_wakeup.clear()
                 await self._check_scheduled_jobs()
-                await asyncio.sleep(self._schedule_check_interval)
+                
+                # Sleep until the earliest job is due or an earlier one is added
+                try:
+                    await asyncio.wait_for(self._schedule_wakeup.wait(), timeout=self._seconds_until_next_job())
+                except asyncio.TimeoutError:
+                    pass
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in schedule loop: {e}")
                 await asyncio.sleep(self._schedule_check_interval)
     
+    def _push_scheduled_job(self, job: ScheduledJob, run_time: Optional[datetime] = None):
+        """Add a job to the run-time heap, replacing any earlier entry.
+        
+        Args:
+            job: Job to schedule
+            run_time: Time to check the job (defaults to its next run time)
+        """
+        run_time = run_time or job.next_run_time
+        if not job.enabled or job.status not in RUNNABLE_JOB_STATUSES or run_time is None:
+            self._job_heap_tokens.pop(job.job_id, None)
+            return
+        
+        token = next(self._job_sequence)
+        self._job_heap_tokens[job.job_id] = token
+        heapq.heappush(self._job_heap, (run_time, token, job.job_id))
+        
+        # Wake the schedule loop if this job is now the earliest
+        if self._job_heap[0][1] == token:
+            self._schedule_wakeup.set()
+    
+    def _pop_due_jobs(self, now: datetime) -> List[ScheduledJob]:
+        """Pop jobs whose run time has passed, in run time order."""
+        due_jobs = []
+        
+        while self._job_heap and self._job_heap[0][0] <= now:
+            _, token, job_id = heapq.heappop(self._job_heap)
+            if self._job_heap_tokens.get(job_id) != token:
+                continue
+            
+            del self._job_heap_tokens[job_id]
+            job = self._scheduled_jobs.get(job_id)
+            if job is not None:
+                due_jobs.append(job)
+        
+        return due_jobs
+    
+    def _seconds_until_next_job(self) -> Optional[float]:
+        """Seconds until the earliest scheduled job, or None if there is none."""
+        while self._job_heap:
+            run_time, token, job_id = self._job_heap[0]
+            if self._job_heap_tokens.get(job_id) == token:
+                return max(0.0, (run_time - datetime.now(timezone.utc)).total_seconds())
+            heapq.heappop(self._job_heap)
+        
+        return None
+    
     async def _check_scheduled_jobs(self):
-        """Check for scheduled jobs that are ready to run."""
+        """Run scheduled jobs that are due."""
         now = datetime.now(timezone.utc)
-        ready_jobs = []
-        
-        for job in self._scheduled_jobs.values():
-            if job.is_ready_to_run(self._completed_jobs):
-                # Check if max runs exceeded
-                if job.max_runs and job.run_count >= job.max_runs:
-                    job.status = JobStatus.COMPLETED
-                    job.enabled = False
-                    continue
+        retry_time = now + timedelta(seconds=self._schedule_check_interval)
+        deferred_jobs = []
+        
+        for job in self._pop_due_jobs(now):
+            # Check if max runs exceeded
+            if job.max_runs and job.run_count >= job.max_runs:
+                job.status = JobStatus.COMPLETED
+                job.enabled = False
+                continue
                 
-                ready_jobs.append(job)
-        
-        # Sort by priority (if we had job priorities) and next run time
-        ready_jobs.sort(key=lambda j: j.next_run_time or now)
+            if not job.is_ready_to_run(self._completed_jobs):
+                # Waiting on dependencies; paused or cancelled jobs are dropped
+                deferred_jobs.append(job)
+                continue
         
-        for job in ready_jobs:
             if not self._resource_monitor.can_accept_new_work():
                 logger.info(f"Deferring job {job.job_id} due to resource constraints")
+                deferred_jobs.append(job)
                 continue
             
             await self._execute_scheduled_job(job)
+            self._push_scheduled_job(job)
+        
+        for job in deferred_jobs:
+            self._push_scheduled_job(job, retry_time)
     
     async def _execute_scheduled_job(self, job: ScheduledJob):
         """Execute a scheduled job by converting it to a priority request."""
@@ -877,7 +1138,7 @@ class QVFScheduler:
                 job_reference=job.job_id
             )
             
-            heapq.heappush(self._priority_queue, request)
+            await self._enqueue_request(request)
             
             # Update job status
             job.status = JobStatus.QUEUED
@@ -933,11 +1194,8 @@ class QVFScheduler:
         
         while True:
             try:
-                # Get next request from priority queue
-                request = await self._get_next_request()
-                if not request:
-                    await asyncio.sleep(1)  # No work available
-                    continue
+                # Wait for the next request from the priority queue
+                request = await self._wait_for_next_request()
                 
                 # Check resource constraints
                 throttle_delay = self._resource_monitor.get_throttling_delay()
@@ -956,18 +1214,35 @@ class QVFScheduler:
         
         logger.info(f"Worker {worker_id} stopped")
     
+    async def _enqueue_request(self, request: QueuedRequest):
+        """Add a request to the priority queue and notify one waiting worker."""
+        async with self._queue_condition:
+            heapq.heappush(self._priority_queue, request)
+            self._resource_monitor.current_usage.queue_size = len(self._priority_queue)
+            
+            if request.deadline:
+                heapq.heappush(self._deadline_heap, (request.deadline, next(self._deadline_sequence), request))
+                self._arm_expiry_timer()
+            
+            self._queue_condition.notify()
+    
+    async def _wait_for_next_request(self) -> QueuedRequest:
+        """Block until a request is available and take it from the queue."""
+        async with self._queue_condition:
+            while True:
+                request = await self._get_next_request()
+                if request:
+                    return request
+                await self._queue_condition.wait()
+    
     async def _get_next_request(self) -> Optional[QueuedRequest]:
         """Get the next request from the priority queue."""
         if not self._priority_queue:
             return None
         
-        # Remove expired requests
+        # Remove expired requests the timer has not caught yet
         while self._priority_queue and self._priority_queue[0].is_expired():
-            expired_request = heapq.heappop(self._priority_queue)
-            expired_request.status = JobStatus.FAILED
-            expired_request.error_message = "Request expired while waiting in queue"
-            self._dead_letter_queue.append(expired_request)
-            logger.warning(f"Request {expired_request.request_id} expired in queue")
+            self._dead_letter_expired(heapq.heappop(self._priority_queue))
         
         if not self._priority_queue:
             return None
@@ -982,6 +1257,54 @@ class QVFScheduler:
         
         return request
     
+    def _dead_letter_expired(self, request: QueuedRequest):
+        """Move a request that waited past its deadline to the dead letter queue."""
+        request.status = JobStatus.FAILED
+        request.error_message = "Request expired while waiting in queue"
+        self._dead_letter_queue.append(request)
+        logger.warning(f"Request {request.request_id} expired in queue")
+    
+    def _arm_expiry_timer(self):
+        """Arm the expiry timer for the earliest deadline still in the queue."""
+        # Requests that already left the queue no longer need a deadline
+        while self._deadline_heap and self._deadline_heap[0][2].status != JobStatus.QUEUED:
+            heapq.heappop(self._deadline_heap)
+        
+        if not self._deadline_heap:
+            return
+        
+        deadline = self._deadline_heap[0][0]
+        if self._expiry_timer is not None:
+            if self._expiry_deadline <= deadline:
+                return
+            self._expiry_timer.cancel()
+        
+        delay = max(0.0, (deadline - datetime.now(timezone.utc)).total_seconds())
+        self._expiry_timer = asyncio.get_running_loop().call_later(delay, self._expire_queued_requests)
+        self._expiry_deadline = deadline
+    
+    def _expire_queued_requests(self):
+        """Timer callback moving every request past its deadline to the dead letter queue."""
+        self._expiry_timer = None
+        self._expiry_deadline = None
+        now = datetime.now(timezone.utc)
+        
+        expired_any = False
+        while self._deadline_heap and self._deadline_heap[0][0] <= now:
+            _, _, request = heapq.heappop(self._deadline_heap)
+            if request.status == JobStatus.QUEUED:
+                self._dead_letter_expired(request)
+                expired_any = True
+        
+        if expired_any:
+            self._priority_queue = [
+                request for request in self._priority_queue if request.status == JobStatus.QUEUED
+            ]
+            heapq.heapify(self._priority_queue)
+            self._resource_monitor.current_usage.queue_size = len(self._priority_queue)
+        
+        self._arm_expiry_timer()
+    
     async def _process_request(self, worker_id: str, request: QueuedRequest):
         """Process a queued request."""
         start_time = datetime.now(timezone.utc)
@@ -1107,15 +1430,19 @@ async def schedule_incremental_updates(
         
     Returns:
         Job ID
+        
+    Raises:
+        ValueError: If interval_minutes is not positive
     """
-    if interval_minutes == 15:
-        cron_expr = "*/15 * * * *"
-    elif interval_minutes == 30:
-        cron_expr = "*/30 * * * *"
-    elif interval_minutes == 60:
-        cron_expr = "0 * * * *"
+    if interval_minutes <= 0:
+        raise ValueError(f"interval_minutes must be positive, got {interval_minutes}")
+    
+    if interval_minutes < 60 and 60 % interval_minutes == 0:
+        cron_expr = f"*/{interval_minutes} * * * *"
+    elif interval_minutes % 60 == 0 and 24 % (interval_minutes // 60) == 0:
+        cron_expr = f"0 */{interval_minutes // 60} * * *"
     else:
-        # For other intervals, use hourly and adjust in code
+        # Intervals that do not divide an hour or a day fall back to hourly
         cron_expr = "0 * * * *"
     
     return await scheduler.schedule_job(
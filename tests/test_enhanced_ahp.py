@@ -317,6 +317,41 @@ class TestEnhancedAHPFeatures:
         correlation_consistent = np.corrcoef(group_result.group_weights, consistent_weights)[0, 1]
         assert not np.isnan(correlation_consistent)
     
+    def test_group_ahp_batch_matches_individual_analysis(self):
+        """Test batched group analysis matches per-participant weight calculation."""
+        self.engine.config.criteria = self.criteria[:3]
+        rng = np.random.default_rng(3)
+        
+        participant_matrices = {}
+        for participant in range(25):
+            priorities = rng.uniform(1.0, 9.0, 3)
+            matrix = np.clip(priorities[:, None] / priorities[None, :] * rng.uniform(0.8, 1.25, (3, 3)), 1/9.0, 9.0)
+            np.fill_diagonal(matrix, 1.0)
+            participant_matrices[f'stakeholder{participant}'] = matrix
+        participant_matrices['malformed'] = np.ones((2, 2))
+        
+        group_result = self.engine.perform_group_ahp_analysis(participant_matrices)
+        
+        assert 'malformed' not in group_result.individual_weights
+        assert len(group_result.individual_weights) == 25
+        
+        reference = AHPEngine(AHPConfiguration(criteria=self.criteria[:3]))
+        for participant_id, weights in group_result.individual_weights.items():
+            matrix = participant_matrices[participant_id]
+            expected_weights = reference.calculate_weights(matrix)
+            assert np.allclose(weights, expected_weights)
+            assert np.isclose(
+                group_result.participant_consistency[participant_id],
+                reference.calculate_consistency_ratio(matrix, expected_weights)
+            )
+        
+        weights_array = np.array(list(group_result.individual_weights.values()))
+        assert np.allclose(group_result.agreement_matrix[0, 1], max(0, np.corrcoef(weights_array[0], weights_array[1])[0, 1]))
+        assert np.isclose(
+            group_result.consensus_ratio,
+            max(0.0, 1.0 - np.mean(np.linalg.norm(weights_array - group_result.group_weights, axis=1)))
+        )
+    
     def test_incomplete_matrix_completion(self):
         """Test completion of matrices with missing comparisons."""
         # Create matrix with some missing comparisons (zeros)
@@ -459,6 +494,33 @@ class TestEnhancedAHPFeatures:
             assert 'impact_score' in comparison
             assert comparison['impact_score'] > 0
     
+    def test_rank_work_items_top_k(self):
+        """Test top-K ranking returns the head of the full ranking."""
+        rng = np.random.default_rng(7)
+        work_items = [
+            {
+                'business_value': float(rng.integers(1, 10)),
+                'implementation_risk': float(rng.integers(1, 10)),
+                'customer_impact': float(rng.integers(1, 10)),
+                'regulatory_compliance': float(rng.integers(1, 10))
+            }
+            for _ in range(40)
+        ]
+        
+        self.engine.comparison_matrix = np.array([
+            [1.0, 3.0, 2.0, 4.0],
+            [1/3.0, 1.0, 1/2.0, 2.0],
+            [1/2.0, 2.0, 1.0, 3.0],
+            [1/4.0, 1/2.0, 1/3.0, 1.0]
+        ])
+        self.engine.calculate_weights()
+        
+        full_ranking = self.engine.rank_work_items(work_items)
+        top_ranking = self.engine.rank_work_items(work_items, top_k=5)
+        
+        assert top_ranking == full_ranking[:5]
+        assert sorted(self.engine.score_work_items(work_items)) == sorted(full_ranking)
+    
     def test_matrix_completeness_calculation(self):
         """Test calculation of matrix completeness percentage."""
         # Complete matrix
@@ -0,0 +1,3 @@
+"""
+Unit tests for ADO analytics components.
+"""
\ No newline at end of file
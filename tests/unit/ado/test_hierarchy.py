@@ -0,0 +1,87 @@
+"""
+Unit tests for the indexed work item hierarchy.
+"""
+
+import pytest
+
+from datascience_platform.ado.models import (
+    ADOWorkItem, WorkItemHierarchy, WorkItemType, WorkItemState
+)
+
+
+def make_item(work_item_id, parent_id=None, state=WorkItemState.NEW, story_points=None, risk_score=None):
+    return ADOWorkItem(
+        work_item_id=work_item_id,
+        title=f"Item {work_item_id}",
+        work_item_type=WorkItemType.FEATURE,
+        state=state,
+        parent_id=parent_id,
+        story_points=story_points,
+        risk_score=risk_score
+    )
+
+
+@pytest.fixture
+def hierarchy():
+    """Epic 1 with features 2 and 3; feature 2 has stories 4 and 5."""
+    hierarchy = WorkItemHierarchy()
+    hierarchy.add_work_item(make_item(1, risk_score=50))
+    hierarchy.add_work_item(make_item(2, parent_id=1))
+    hierarchy.add_work_item(make_item(3, parent_id=1, state=WorkItemState.CANCELLED, story_points=2))
+    hierarchy.add_work_item(make_item(4, parent_id=2, state=WorkItemState.CLOSED, story_points=5, risk_score=10))
+    hierarchy.add_work_item(make_item(5, parent_id=2, state=WorkItemState.ACTIVE, story_points=3))
+    return hierarchy
+
+
+class TestWorkItemHierarchy:
+    """Test cases for WorkItemHierarchy queries."""
+    
+    def test_descendants_and_levels(self, hierarchy):
+        """Test descendants come back in depth-first order with levels."""
+        assert [item.work_item_id for item in hierarchy.get_descendants(1)] == [2, 4, 5, 3]
+        assert [item.work_item_id for item in hierarchy.get_descendants(2)] == [4, 5]
+        assert hierarchy.get_descendants(4) == []
+        assert [hierarchy.get_hierarchy_level(item_id) for item_id in range(1, 6)] == [0, 1, 1, 2, 2]
+        assert [item.work_item_id for item in hierarchy.get_ancestors(5)] == [2, 1]
+    
+    def test_rollup_metrics(self, hierarchy):
+        """Test subtree totals and averages."""
+        rollup = hierarchy.calculate_rollup_metrics(1)
+        
+        assert rollup["total_story_points"] == 10
+        assert rollup["completed_story_points"] == 5
+        assert rollup["cancelled_story_points"] == 2
+        assert rollup["completion_percentage"] == 50
+        assert rollup["total_items"] == 5
+        assert rollup["completed_items"] == 1
+        assert rollup["active_items"] == 1
+        assert rollup["average_risk_score"] == 30
+        assert rollup["average_complexity_score"] is None
+        assert rollup["descendant_count"] == 4
+        assert hierarchy.calculate_rollup_metrics(99) == {}
+    
+    def test_index_rebuilt_after_add(self, hierarchy):
+        """Test adding items refreshes descendants and roll-ups."""
+        assert hierarchy.calculate_rollup_metrics(2)["total_story_points"] == 8
+        
+        hierarchy.add_work_item(make_item(6, parent_id=4, story_points=1))
+        
+        assert [item.work_item_id for item in hierarchy.get_descendants(2)] == [4, 6, 5]
+        assert hierarchy.calculate_rollup_metrics(2)["total_story_points"] == 9
+        assert hierarchy.get_hierarchy_level(6) == 3
+    
+    def test_orphans_and_cycles(self):
+        """Test missing parents and cycles do not break queries."""
+        hierarchy = WorkItemHierarchy()
+        hierarchy.add_work_item(make_item(1, parent_id=99))
+        hierarchy.add_work_item(make_item(2, parent_id=1))
+        hierarchy.add_work_item(make_item(3, parent_id=4))
+        hierarchy.add_work_item(make_item(4, parent_id=3))
+        
+        assert hierarchy.get_hierarchy_level(2) == 1
+        assert [item.work_item_id for item in hierarchy.get_descendants(99)] == [1, 2]
+        assert len(hierarchy.get_descendants(3)) == 1
+        
+        validation = hierarchy.validate_hierarchy()
+        assert not validation["is_valid"]
+        assert len(validation["errors"]) == 2
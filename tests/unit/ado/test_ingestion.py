@@ -0,0 +1,98 @@
+"""
+Unit tests for columnar ADO DataFrame ingestion.
+"""
+
+import numpy as np
+import pandas as pd
+
+from datascience_platform.ado.analyzer import ADOAnalyzer
+from datascience_platform.ado.data_validator import DataTypeInferencer
+from datascience_platform.ado.models import WorkItemType, WorkItemState
+
+
+class TestDataTypeInferencer:
+    """Test cases for vectorized type conversion."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.inferencer = DataTypeInferencer()
+    
+    def test_convert_to_numeric(self):
+        """Test currency, percentage and parenthesized values."""
+        series = pd.Series(['$1,200', '15%', ' 40 ', '(5)', 'abc', None, '€3.5'])
+        
+        result = self.inferencer.convert_to_numeric(series, 'Business Value')
+        
+        expected = [1200.0, 0.15, 40.0, -5.0, np.nan, np.nan, 3.5]
+        np.testing.assert_allclose(result.to_numpy(), expected)
+    
+    def test_story_points_snap_to_valid_values(self):
+        """Test story points round to the nearest valid value."""
+        series = pd.Series(['1', '4', '7', '0.2', '100', None])
+        
+        result = self.inferencer.convert_to_numeric(series, 'Story Points')
+        
+        np.testing.assert_allclose(result.to_numpy(), [1.0, 3.0, 8.0, 0.5, 89.0, np.nan])
+    
+    def test_convert_to_date(self):
+        """Test each value uses the first matching format."""
+        series = pd.Series(
+            ['2024-01-05', '01/02/2024', '13/02/2024', 'Jan 5 2024', 'garbage', None],
+            index=[10, 11, 12, 13, 14, 15]
+        )
+        
+        result = self.inferencer.convert_to_date(series)
+        
+        assert list(result.index) == [10, 11, 12, 13, 14, 15]
+        assert list(result[:4]) == [
+            pd.Timestamp(2024, 1, 5), pd.Timestamp(2024, 1, 2),
+            pd.Timestamp(2024, 2, 13), pd.Timestamp(2024, 1, 5)
+        ]
+        assert result[14:].isna().all()
+
+
+class TestColumnarIngestion:
+    """Test cases for ADOAnalyzer.load_from_dataframe."""
+    
+    def test_load_from_dataframe(self):
+        """Test work items are built with parsed columns and invalid rows skipped."""
+        df = pd.DataFrame({
+            'ID': [1, 2, 3, 4],
+            'Title': ['Story', 'Bug', 'Bad type', 'Bad value'],
+            'Work Item Type': ['User Story', 'Bug', 'Unknown', 'Task'],
+            'State': ['Active', 'Closed', 'New', 'New'],
+            'Parent': [np.nan, 1.0, np.nan, 1.0],
+            'Business Value': [40, 70, 10, 150],
+            'Complexity': [10.0, np.nan, 5.0, 200.0],
+            'Created Date': ['2024-01-05', '2024-01-06', None, '2024-01-07'],
+            'Tags': ['api;backend', None, None, 'x']
+        })
+        
+        work_items = ADOAnalyzer().load_from_dataframe(df)
+        
+        assert [item.work_item_id for item in work_items] == [1, 2]
+        story, bug = work_items
+        assert story.work_item_type == WorkItemType.USER_STORY
+        assert bug.state == WorkItemState.CLOSED
+        assert story.parent_id is None and bug.parent_id == 1
+        assert story.created_date == pd.Timestamp(2024, 1, 5)
+        assert story.tags == ['api', 'backend'] and bug.tags == []
+        assert bug.complexity_score is None
+        assert story.children_ids is not bug.children_ids
+    
+    def test_load_from_dataframe_nullable_integers(self):
+        """Test nullable Int64 columns with missing values pass the range checks."""
+        df = pd.DataFrame({
+            'ID': pd.array([1, 2], dtype='Int64'),
+            'Title': ['Epic', 'Feature'],
+            'Work Item Type': ['Epic', 'Feature'],
+            'State': ['Active', 'New'],
+            'Parent': pd.array([None, 1], dtype='Int64'),
+            'Business Value': pd.array([40, None], dtype='Int64')
+        })
+        
+        work_items = ADOAnalyzer().load_from_dataframe(df)
+        
+        assert [item.work_item_id for item in work_items] == [1, 2]
+        assert work_items[0].parent_id is None and work_items[1].parent_id == 1
+        assert work_items[1].business_value_raw is None
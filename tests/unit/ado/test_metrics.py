@@ -0,0 +1,87 @@
+"""
+Unit tests for the columnar Agile metrics calculator.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from datascience_platform.ado.metrics import AgileMetricsCalculator
+from datascience_platform.ado.models import ADOWorkItem, WorkItemType, WorkItemState
+
+
+START = datetime(2024, 1, 1)
+
+
+def make_item(work_item_id, days, team, state=WorkItemState.CLOSED, story_points=5, **kwargs):
+    return ADOWorkItem(
+        work_item_id=work_item_id,
+        title=f"Story {work_item_id}",
+        work_item_type=WorkItemType.USER_STORY,
+        state=state,
+        story_points=story_points,
+        created_date=START + timedelta(days=days),
+        area_path=team,
+        **kwargs
+    )
+
+
+@pytest.fixture
+def calculator():
+    """Two teams over two 10-week PIs."""
+    work_items = [
+        make_item(1, 0, "Team A", cycle_time_days=4),
+        make_item(2, 10, "Team A", state=WorkItemState.ACTIVE, blocked_days=8),
+        make_item(3, 20, "Team B", state=WorkItemState.CANCELLED, story_points=3),
+        make_item(4, 75, "Team A", cycle_time_days=22),
+        make_item(5, 80, "Team B", story_points=8, cycle_time_days=6),
+        make_item(6, 90, None, state=WorkItemState.DEFERRED, story_points=2)
+    ]
+    return AgileMetricsCalculator(work_items, seed=7)
+
+
+class TestAgileMetricsCalculator:
+    """Test cases for AgileMetricsCalculator."""
+    
+    def test_pi_metrics(self, calculator):
+        """Test PI grouping and per-team totals."""
+        pi_1, pi_2 = calculator.calculate_pi_metrics()
+        
+        assert (pi_1.pi_number, pi_1.start_date) == (1, START)
+        assert pi_1.planned_story_points == 5
+        assert pi_1.completed_story_points == 5
+        assert pi_1.cancelled_story_points == 3
+        assert pi_1.team_metrics["Team A"] == {
+            'velocity': 5, 'throughput': 1, 'cycle_time_avg': 4, 'items_count': 2
+        }
+        
+        assert pi_2.end_date == START + timedelta(weeks=20)
+        assert pi_2.completed_story_points == 13
+        assert pi_2.deferred_story_points == 2
+        assert set(pi_2.team_metrics) == {"Team A", "Team B", "Unassigned"}
+    
+    def test_team_metrics_and_bottlenecks(self, calculator):
+        """Test team aggregates and bottleneck detection."""
+        team_metrics = calculator.calculate_team_metrics()
+        
+        assert list(team_metrics) == ["Team A", "Team B", "Unassigned"]
+        assert team_metrics["Team A"].velocity_trend == [5, 5]
+        assert team_metrics["Team A"].cycle_time_p50 == 13
+        assert team_metrics["Team A"].blocked_time_percentage == pytest.approx(100 * 8 / 26)
+        assert team_metrics["Team B"].throughput == 0.5
+        
+        bottlenecks = calculator.identify_bottlenecks()
+        assert [item['work_item_id'] for item in bottlenecks['blocked_items']] == [2]
+        assert [item['work_item_id'] for item in bottlenecks['long_cycle_time']] == [4]
+        assert bottlenecks['work_type_issues']['User Story']['count'] == 6
+    
+    def test_seeded_monte_carlo_forecasts(self, calculator):
+        """Test forecasts are reproducible and cover every team."""
+        forecast = calculator.calculate_predictability_metrics()
+        repeat = AgileMetricsCalculator(calculator.work_items, seed=7).calculate_predictability_metrics()
+        
+        assert forecast['monte_carlo_forecast'] == repeat['monte_carlo_forecast']
+        assert set(forecast['team_forecasts']) == {"Team A", "Team B", "Unassigned"}
+        
+        # Constant velocity gives a deterministic forecast
+        assert forecast['team_forecasts']["Team A"] == {'p10': 5, 'p50': 5, 'p90': 5, 'mean': 5}
+        assert calculator._monte_carlo_velocity_forecast([]) == {}
@@ -0,0 +1,69 @@
+"""
+Unit tests for bulk ADO data generation.
+"""
+
+import pytest
+import pandas as pd
+from datetime import datetime
+
+from datascience_platform.ado.simulation import ADODataSimulator
+
+
+START = datetime(2024, 1, 1)
+
+
+def generate(seed=11, **kwargs):
+    return ADODataSimulator(seed=seed).generate_bulk_data(num_epics=20, start_date=START, **kwargs)
+
+
+class TestBulkGeneration:
+    """Test cases for ADODataSimulator bulk generation."""
+    
+    def test_hierarchy_is_consistent(self):
+        """Test every parent exists, precedes its children and has the right type."""
+        df = generate(epics_per_chunk=7)
+        
+        assert df["WorkItemId"].is_unique
+        assert (df["ParentId"].isna() == (df["WorkItemType"] == "Epic")).all()
+        
+        position = pd.Series(range(len(df)), index=df["WorkItemId"])
+        children = df[df["ParentId"].notna()]
+        parent_rows = position[children["ParentId"].astype(int)].to_numpy()
+        assert (parent_rows < position[children["WorkItemId"]].to_numpy()).all()
+        
+        parent_types = df["WorkItemType"].to_numpy()[parent_rows]
+        allowed = {"PIO": {"Epic"}, "Feature": {"Epic", "PIO"}, "User Story": {"Feature"}}
+        assert all(
+            parent_type in allowed[child_type]
+            for child_type, parent_type in zip(children["WorkItemType"], parent_types)
+        )
+    
+    def test_reproducible_and_consistent_dates(self):
+        """Test the same seed gives the same data and state dates line up."""
+        df = generate()
+        
+        pd.testing.assert_frame_equal(df, generate())
+        assert not df.equals(generate(seed=12))
+        
+        closed = df[df["State"] == "Closed"]
+        assert (closed["ResolvedDate"] >= closed["ActivatedDate"]).all()
+        assert (closed["CycleTimeDays"] == (closed["ResolvedDate"] - closed["ActivatedDate"]).dt.days).all()
+        assert df.loc[df["State"] == "New", "ActivatedDate"].isna().all()
+    
+    def test_write_csv_and_load(self, tmp_path):
+        """Test streamed CSV output loads back into the analyzer."""
+        from datascience_platform.ado.analyzer import ADOAnalyzer
+        
+        path = tmp_path / "work_items.csv"
+        rows = ADODataSimulator(seed=3).write_bulk_data(path, num_epics=10, start_date=START, epics_per_chunk=4)
+        
+        df = pd.read_csv(path)
+        assert len(df) == rows
+        assert df["WorkItemId"].is_unique
+        
+        work_items = ADOAnalyzer().load_from_dataframe(df)
+        assert len(work_items) == rows
+        assert {item.parent_id for item in work_items} - {None} <= set(df["WorkItemId"])
+        
+        with pytest.raises(ValueError):
+            ADODataSimulator().write_bulk_data(tmp_path / "work_items.txt", num_epics=1)
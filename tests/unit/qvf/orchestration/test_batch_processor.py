@@ -0,0 +1,114 @@
+"""Unit tests for the QVF batch processor.
+
+Tests covering:
+- Results keyed by batch ID in batch order
+- Bounded concurrency and lazy consumption of the input
+- Async iterator input
+- Retry of failed batches
+"""
+
+import asyncio
+import random
+import pytest
+
+from datascience_platform.qvf.orchestration import BatchProcessor, BatchProcessingResult
+
+
+class TestBatchProcessor:
+    """Test streaming batch processing."""
+    
+    @pytest.mark.asyncio
+    async def test_results_ordered_by_batch(self):
+        """Test results stay aligned with their batches despite completion order."""
+        processor = BatchProcessor(max_concurrent=4, default_batch_size=10)
+        progress = []
+        
+        async def process(batch):
+            await asyncio.sleep(random.uniform(0, 0.005))
+            return sum(batch)
+        
+        result = await processor.process_batches(
+            list(range(95)), process, progress_callback=lambda stage, value, message: progress.append(value)
+        )
+        
+        assert isinstance(result, BatchProcessingResult)
+        assert list(result.results) == [f"batch_{i}" for i in range(1, 11)]
+        assert result.results["batch_1"] == sum(range(10))
+        assert result.results["batch_10"] == sum(range(90, 95))
+        assert result.total_items == 95
+        assert result.success_rate == 1.0
+        assert progress[-1] == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_input_consumed_lazily_with_bounded_concurrency(self):
+        """Test only a bounded number of batches are pulled ahead of processing."""
+        processor = BatchProcessor(max_concurrent=3, default_batch_size=5)
+        pulled = 0
+        processed = 0
+        in_flight = 0
+        max_in_flight = 0
+        max_ahead = 0
+        
+        def items():
+            nonlocal pulled
+            for i in range(1000):
+                pulled += 1
+                yield i
+        
+        async def process(batch):
+            nonlocal processed, in_flight, max_in_flight, max_ahead
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            max_ahead = max(max_ahead, pulled - processed)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            processed += len(batch)
+            return len(batch)
+        
+        result = await processor.process_batches(items(), process)
+        
+        assert result.total_batches == 200
+        assert max_in_flight <= 3
+        # In-flight batches, queued batches and the batch being built
+        assert max_ahead <= (3 + 3 + 1) * 5
+    
+    @pytest.mark.asyncio
+    async def test_async_iterator_input(self):
+        """Test items can come from an async iterator."""
+        processor = BatchProcessor(max_concurrent=2, default_batch_size=3)
+        
+        async def items():
+            for i in range(7):
+                await asyncio.sleep(0)
+                yield i
+        
+        async def process(batch):
+            return batch
+        
+        result = await processor.process_batches(items(), process)
+        
+        assert result.results == {"batch_1": [0, 1, 2], "batch_2": [3, 4, 5], "batch_3": [6]}
+    
+    @pytest.mark.asyncio
+    async def test_failed_batches_are_retried(self):
+        """Test transient failures are retried and permanent ones reported."""
+        processor = BatchProcessor(max_concurrent=2, default_batch_size=2, max_retries=2, retry_delay_seconds=0.001)
+        attempts = {}
+        
+        async def process(batch):
+            key = batch[0]
+            attempts[key] = attempts.get(key, 0) + 1
+            if key == 0 and attempts[key] < 3:
+                raise ConnectionError("transient")
+            if key == 4:
+                raise ValueError("permanent")
+            return batch
+        
+        result = await processor.process_batches(list(range(6)), process)
+        
+        assert result.results == {"batch_1": [0, 1], "batch_2": [2, 3]}
+        assert result.errors == {"batch_3": "permanent"}
+        assert attempts[0] == 3
+        assert attempts[4] == 3
+        assert result.retried_batches == 2
+        assert processor.get_active_batches() == []
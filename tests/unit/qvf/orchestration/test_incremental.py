@@ -0,0 +1,367 @@
+"""Unit tests for QVF incremental scoring.
+
+Tests covering:
+- ScoreRankIndex ordering and re-positioning
+- Equivalence of incremental and full scoring runs
+- Change detection, renormalization and write suppression
+- State persistence and configuration change resets
+- Delta loading in IncrementalScoringWorkflow
+- Serialized incremental runs per project in QVFOrchestrator
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from datascience_platform.qvf.core.scoring import QVFScoringEngine, ScoringValidationError
+from datascience_platform.qvf.core.criteria import QVFCriteriaEngine
+from datascience_platform.qvf.ado.work_items import UpdateResult, WorkItemUpdateBatch
+from datascience_platform.ado.models import ADOWorkItem, WorkItemType, WorkItemState
+from datascience_platform.qvf.orchestration import (
+    IncrementalScoringEngine,
+    IncrementalScoringState,
+    IncrementalScoringWorkflow,
+    ScoreRankIndex
+)
+from datascience_platform.qvf.orchestration.orchestrator import QVFOrchestrator, ScoringRequest, ScoringMode
+from ..test_fixtures import create_test_financial_metrics
+
+
+@pytest.fixture
+def qvf_config():
+    return QVFCriteriaEngine().get_default_configuration()
+
+
+@pytest.fixture
+def work_items():
+    return [
+        ADOWorkItem(
+            work_item_id=i + 1,
+            title=f"Test Work Item {i + 1}",
+            work_item_type=WorkItemType.USER_STORY,
+            state=WorkItemState.ACTIVE,
+            business_value_raw=20.0 + i * 15.0,
+            story_points=2.0 + i * 2.0,
+            complexity_score=10.0 + i * 12.0,
+            risk_score=15.0 + i * 10.0
+        )
+        for i in range(5)
+    ]
+
+
+@pytest.fixture
+def financial_data(work_items):
+    return {
+        item.work_item_id: create_test_financial_metrics(initial_investment=50000.0 * item.work_item_id)
+        for item in work_items
+    }
+
+
+def full_scores(work_items, qvf_config, financial_data):
+    """Score with the full engine, keyed by work item ID."""
+    results = QVFScoringEngine().score_work_items_with_financials(work_items, qvf_config, financial_data)
+    return {score.work_item_id: score for score in results['work_item_scores']}
+
+
+class TestScoreRankIndex:
+    """Test cases for ScoreRankIndex."""
+    
+    def test_ranks_descending_with_id_tiebreak(self):
+        """Test ranks follow descending score, ties broken by ID."""
+        index = ScoreRankIndex()
+        for work_item_id, score in [(1, 0.5), (2, 0.9), (3, 0.5), (4, 0.1)]:
+            index.update(work_item_id, score)
+        
+        assert index.top() == [2, 1, 3, 4]
+        assert [index.rank(i) for i in (1, 2, 3, 4)] == [2, 1, 3, 4]
+    
+    def test_update_and_remove(self):
+        """Test re-positioning and removing items."""
+        index = ScoreRankIndex()
+        for work_item_id, score in [(1, 0.5), (2, 0.9), (3, 0.3)]:
+            index.update(work_item_id, score)
+        
+        index.update(3, 1.0)
+        index.remove(2)
+        
+        assert index.top() == [3, 1]
+        assert 2 not in index
+        assert len(index) == 2
+
+
+class TestIncrementalScoringEngine:
+    """Test cases for IncrementalScoringEngine."""
+    
+    def test_initial_run_matches_full_scoring(self, work_items, qvf_config, financial_data):
+        """Test seeding the state produces the full engine's scores and ranks."""
+        engine = IncrementalScoringEngine(QVFScoringEngine())
+        assert engine.begin(qvf_config) is True
+        
+        result = engine.apply_changes(work_items, financial_data)
+        expected = full_scores(work_items, qvf_config, financial_data)
+        
+        assert result.total_items == 5
+        assert len(result.work_item_scores) == 5
+        for score in engine.get_rankings():
+            assert score.total_score == pytest.approx(expected[score.work_item_id].total_score)
+            assert score.strategic_score == pytest.approx(expected[score.work_item_id].strategic_score)
+            assert score.overall_rank == expected[score.work_item_id].overall_rank
+            assert score.financial_rank == expected[score.work_item_id].financial_rank
+    
+    def test_unchanged_inputs_are_skipped(self, work_items, qvf_config, financial_data):
+        """Test items with identical inputs are neither rescored nor written."""
+        engine = IncrementalScoringEngine(QVFScoringEngine())
+        engine.begin(qvf_config)
+        seeded = engine.apply_changes(work_items, financial_data)
+        engine.mark_written(score.work_item_id for score in seeded.work_item_scores)
+        
+        result = engine.apply_changes(work_items[:2])
+        
+        assert result.changed_ids == []
+        assert sorted(result.unchanged_ids) == [1, 2]
+        assert result.rescored_count == 0
+        assert result.work_item_scores == []
+    
+    def test_change_within_bounds_rescores_only_changed_item(self, work_items, qvf_config, financial_data):
+        """Test a change that keeps normalization bounds only rescores the changed row."""
+        engine = IncrementalScoringEngine(QVFScoringEngine())
+        engine.begin(qvf_config)
+        seeded = engine.apply_changes(work_items, financial_data)
+        engine.mark_written(score.work_item_id for score in seeded.work_item_scores)
+        
+        work_items[2] = work_items[2].model_copy(update={'title': 'Renamed'})
+        result = engine.apply_changes([work_items[2]])
+        
+        assert result.changed_ids == [3]
+        assert result.rescored_count == 1
+        assert result.renormalized is False
+        assert result.work_item_scores == []
+    
+    def test_bound_shift_renormalizes_from_persisted_inputs(self, work_items, qvf_config, financial_data):
+        """Test a shifted bound renormalizes every item and stays equivalent to a full run."""
+        engine = IncrementalScoringEngine(QVFScoringEngine())
+        engine.begin(qvf_config)
+        engine.apply_changes(work_items, financial_data)
+        
+        work_items[0] = work_items[0].model_copy(update={'business_value_raw': 500.0})
+        result = engine.apply_changes([work_items[0]])
+        expected = full_scores(work_items, qvf_config, financial_data)
+        
+        assert result.renormalized is True
+        assert result.rescored_count == 5
+        for score in engine.get_rankings():
+            assert score.total_score == pytest.approx(expected[score.work_item_id].total_score)
+            assert score.overall_rank == expected[score.work_item_id].overall_rank
+    
+    def test_existing_scores_suppress_writes(self, work_items, qvf_config, financial_data):
+        """Test scores already stored in ADO are not rewritten."""
+        expected = full_scores(work_items, qvf_config, financial_data)
+        existing = {work_item_id: score.total_score for work_item_id, score in expected.items()}
+        existing[4] = 0.0
+        
+        engine = IncrementalScoringEngine(QVFScoringEngine())
+        engine.begin(qvf_config)
+        result = engine.apply_changes(work_items, financial_data, existing_scores=existing)
+        
+        assert [score.work_item_id for score in result.work_item_scores] == [4]
+    
+    def test_removed_items_leave_rankings(self, work_items, qvf_config, financial_data):
+        """Test removed items are dropped from state and ranks."""
+        engine = IncrementalScoringEngine(QVFScoringEngine())
+        engine.begin(qvf_config)
+        engine.apply_changes(work_items, financial_data)
+        
+        result = engine.apply_changes([], removed_ids=[1, 99])
+        
+        assert result.removed_ids == [1]
+        assert result.total_items == 4
+        assert sorted(score.overall_rank for score in engine.get_rankings()) == [1, 2, 3, 4]
+    
+    def test_failed_coverage_check_leaves_state_unchanged(self, work_items, qvf_config, financial_data):
+        """Test a run rejected for low financial coverage does not modify the state."""
+        engine = IncrementalScoringEngine(QVFScoringEngine())
+        engine.begin(qvf_config)
+        engine.apply_changes(work_items, financial_data)
+        state_before = engine.state.to_dict()
+        rankings_before = [score.work_item_id for score in engine.get_rankings()]
+        
+        new_items = [
+            work_items[0].model_copy(update={'work_item_id': work_item_id, 'title': f"New {work_item_id}"})
+            for work_item_id in range(6, 60)
+        ]
+        with pytest.raises(ScoringValidationError, match="financial data coverage"):
+            engine.apply_changes(new_items, removed_ids=[1], existing_scores={2: 0.0})
+        
+        assert engine.state.to_dict() == state_before
+        assert [score.work_item_id for score in engine.get_rankings()] == rankings_before
+    
+    def test_state_round_trip(self, tmp_path, work_items, qvf_config, financial_data):
+        """Test persisted state restores rankings without rescoring."""
+        engine = IncrementalScoringEngine(QVFScoringEngine())
+        engine.begin(qvf_config)
+        engine.apply_changes(work_items, financial_data, watermark=datetime(2024, 1, 1, tzinfo=timezone.utc))
+        
+        state_path = tmp_path / "state.json"
+        engine.state.save(state_path)
+        
+        restored = IncrementalScoringEngine(QVFScoringEngine(), state=IncrementalScoringState.load(state_path))
+        
+        assert restored.begin(qvf_config) is False
+        assert restored.state.watermark == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert [s.work_item_id for s in restored.get_rankings()] == [s.work_item_id for s in engine.get_rankings()]
+    
+    def test_configuration_change_resets_state(self, work_items, qvf_config, financial_data):
+        """Test a different configuration requires a full load."""
+        engine = IncrementalScoringEngine(QVFScoringEngine())
+        engine.begin(qvf_config)
+        engine.apply_changes(work_items, financial_data, watermark=datetime.now(timezone.utc))
+        
+        changed_config = qvf_config.model_copy(update={'consistency_threshold': 0.2})
+        
+        assert engine.begin(changed_config) is True
+        assert engine.state.raw_rows == {}
+
+
+class TestIncrementalScoringWorkflow:
+    """Test cases for IncrementalScoringWorkflow."""
+    
+    def _ado_payload(self, work_item_id, title="Item", state="New", changed="2024-01-02T10:00:00Z"):
+        return {
+            "id": work_item_id,
+            "fields": {
+                "System.Id": work_item_id,
+                "System.Title": title,
+                "System.WorkItemType": "User Story",
+                "System.State": state,
+                "System.ChangedDate": changed
+            }
+        }
+    
+    def _workflow(self, manager, engine, qvf_config, financial_data=None):
+        request = ScoringRequest(
+            project_name="TestProject",
+            mode=ScoringMode.INCREMENTAL,
+            criteria_config=qvf_config,
+            financial_data=financial_data,
+            enable_ai_enhancement=False
+        )
+        return IncrementalScoringWorkflow(request, QVFScoringEngine(), manager, engine)
+    
+    def _manager(self, payloads, mirror_watermark=None):
+        manager = MagicMock()
+        manager.load_work_items_for_scoring = AsyncMock(return_value=payloads)
+        manager.get_mirror_watermark = MagicMock(return_value=mirror_watermark)
+        
+        def update_work_item_scores(project_name, work_item_scores, **kwargs):
+            batch = WorkItemUpdateBatch(
+                batch_id="batch_1",
+                project_name=project_name,
+                work_item_scores=work_item_scores,
+                successful_updates=set(work_item_scores)
+            )
+            return UpdateResult(
+                total_items=len(work_item_scores),
+                successful_updates=len(work_item_scores),
+                failed_updates=0,
+                processing_time_seconds=0.0,
+                batch_results=[batch]
+            )
+        
+        manager.update_work_item_scores = AsyncMock(side_effect=update_work_item_scores)
+        return manager
+    
+    @pytest.mark.asyncio
+    async def test_delta_load_after_seeding(self, qvf_config):
+        """Test the second run queries by watermark and drops inactive items."""
+        financial_data = {i: create_test_financial_metrics() for i in (1, 2, 3)}
+        engine = IncrementalScoringEngine(QVFScoringEngine())
+        
+        manager = self._manager([self._ado_payload(i) for i in (1, 2, 3)])
+        result = await self._workflow(manager, engine, qvf_config, financial_data).execute()
+        
+        assert result.total_items_processed == 3
+        assert manager.load_work_items_for_scoring.call_args.kwargs['changed_since'] is None
+        assert engine.state.watermark == datetime(2024, 1, 2, 10, tzinfo=timezone.utc)
+        
+        manager = self._manager([
+            self._ado_payload(2, changed="2024-01-03T10:00:00Z"),
+            self._ado_payload(3, state="Closed", changed="2024-01-03T11:00:00Z")
+        ])
+        result = await self._workflow(manager, engine, qvf_config).execute()
+        
+        load_kwargs = manager.load_work_items_for_scoring.call_args.kwargs
+        assert load_kwargs['changed_since'] == datetime(2024, 1, 2, 10, tzinfo=timezone.utc)
+        assert load_kwargs['include_inactive'] is True
+        assert sorted(engine.state.raw_rows) == [1, 2]
+        assert engine.state.watermark == datetime(2024, 1, 3, 11, tzinfo=timezone.utc)
+        assert result.skipped_items == 2
+        assert manager.update_work_item_scores.call_count == 0
+    
+    @pytest.mark.asyncio
+    async def test_empty_delta_load_keeps_watermark(self, qvf_config):
+        """Test a run without changes does not advance the watermark to the current time."""
+        financial_data = {1: create_test_financial_metrics()}
+        engine = IncrementalScoringEngine(QVFScoringEngine())
+        
+        manager = self._manager([self._ado_payload(1)])
+        await self._workflow(manager, engine, qvf_config, financial_data).execute()
+        assert engine.state.watermark == datetime(2024, 1, 2, 10, tzinfo=timezone.utc)
+        
+        # Financial changes force a scoring pass even though no work items changed
+        manager = self._manager([])
+        await self._workflow(manager, engine, qvf_config, financial_data).execute()
+        
+        assert engine.state.watermark == datetime(2024, 1, 2, 10, tzinfo=timezone.utc)
+        
+        manager = self._manager([])
+        await self._workflow(manager, engine, qvf_config).execute()
+        
+        load_kwargs = manager.load_work_items_for_scoring.call_args.kwargs
+        assert load_kwargs['changed_since'] == datetime(2024, 1, 2, 10, tzinfo=timezone.utc)
+    
+    @pytest.mark.asyncio
+    async def test_watermark_follows_mirror_sync(self, qvf_config):
+        """Test loads from a mirror resume from its sync high-water mark."""
+        financial_data = {1: create_test_financial_metrics()}
+        engine = IncrementalScoringEngine(QVFScoringEngine())
+        mirror_watermark = datetime(2024, 1, 5, tzinfo=timezone.utc)
+        
+        manager = self._manager([self._ado_payload(1)], mirror_watermark=mirror_watermark)
+        await self._workflow(manager, engine, qvf_config, financial_data).execute()
+        
+        assert engine.state.watermark == mirror_watermark
+
+
+class TestOrchestratorIncrementalUpdate:
+    """Test cases for QVFOrchestrator.incremental_update."""
+    
+    @pytest.mark.asyncio
+    async def test_runs_for_one_project_do_not_overlap(self, qvf_config):
+        """Test overlapping runs for a project wait for each other, other projects do not."""
+        orchestrator = QVFOrchestrator(
+            "https://dev.azure.com/testorg", "pat", enable_ai_enhancement=False
+        )
+        running = {}
+        max_running = {}
+        max_total = 0
+        
+        async def fake_run_workflow(workflow, progress_callback=None):
+            nonlocal max_total
+            project = workflow.request.project_name
+            running[project] = running.get(project, 0) + 1
+            max_running[project] = max(max_running.get(project, 0), running[project])
+            max_total = max(max_total, sum(running.values()))
+            await asyncio.sleep(0.01)
+            running[project] -= 1
+            return project
+        
+        with patch.object(orchestrator, '_run_workflow', side_effect=fake_run_workflow):
+            results = await asyncio.gather(*[
+                orchestrator.incremental_update(project, qvf_config)
+                for project in ("A", "A", "A", "B")
+            ])
+        
+        assert results == ["A", "A", "A", "B"]
+        assert max_running == {"A": 1, "B": 1}
+        assert max_total == 2
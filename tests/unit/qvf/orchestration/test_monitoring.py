@@ -0,0 +1,343 @@
+"""Unit tests for QVF operation monitoring.
+
+Tests covering:
+- Ring-buffer time-series storage and time window queries
+- Rollup-based aggregation over long windows
+- Cleanup of old data
+- Rolling baselines and z-score anomaly detection
+- Indexed alert rules, alert de-duplication and non-blocking notifications
+"""
+
+import asyncio
+import math
+import random
+import threading
+import pytest
+from datetime import datetime, timezone, timedelta
+
+from datascience_platform.qvf.orchestration import monitoring
+from datascience_platform.qvf.orchestration.monitoring import (
+    TimeSeriesStorage, MetricPoint, PerformanceAnalyzer, RollingStatistic, OperationMetrics, OperationType,
+    AlertManager, AlertSeverity, MonitoringError
+)
+
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def at(seconds):
+    return BASE_TIME + timedelta(seconds=seconds)
+
+
+def operation(duration, items=100, errors=0):
+    return OperationMetrics(
+        operation_id=f"op_{duration}_{random.random()}",
+        operation_type=OperationType.BATCH_SCORING,
+        start_time=BASE_TIME,
+        end_time=BASE_TIME + timedelta(seconds=duration),
+        items_processed=items,
+        items_successful=items - errors,
+        error_count=errors,
+        processing_duration=duration
+    )
+
+
+class TestTimeSeriesStorage:
+    """Test columnar time-series storage."""
+    
+    def test_get_points_in_window(self):
+        """Test window queries, limits and tags round-trip."""
+        storage = TimeSeriesStorage()
+        for i in range(10):
+            storage.add_point("latency", MetricPoint(at(i * 10), float(i), {"operation_type": "batch"}))
+        
+        points = storage.get_points("latency", at(20), at(50))
+        assert [point.value for point in points] == [2.0, 3.0, 4.0, 5.0]
+        assert points[0].timestamp == at(20)
+        assert points[0].tags == {"operation_type": "batch"}
+        
+        assert [point.value for point in storage.get_points("latency", limit=2)] == [8.0, 9.0]
+        assert storage.get_points("missing") == []
+    
+    def test_ring_overwrites_oldest_and_keeps_order(self):
+        """Test capacity is bounded and out-of-order points are placed in time order."""
+        storage = TimeSeriesStorage(max_points_per_metric=5)
+        for i in range(8):
+            storage.add_point("rate", MetricPoint(at(i * 60), float(i)))
+        storage.add_point("rate", MetricPoint(at(4 * 60 + 30), 99.0))
+        
+        values = [point.value for point in storage.get_points("rate")]
+        assert values == [4.0, 99.0, 5.0, 6.0, 7.0]
+        assert storage.aggregate_points("rate", "count") == 5
+    
+    def test_get_points_not_torn_by_concurrent_writes(self, monkeypatch):
+        """Test writes that land while points are being built do not leak into the result."""
+        storage = TimeSeriesStorage(max_points_per_metric=10)
+        for i in range(10):
+            storage.add_point("latency", MetricPoint(at(i), float(i)))
+        
+        def overwrite_ring():
+            for i in range(10, 15):
+                storage.add_point("latency", MetricPoint(at(i), float(i)))
+        
+        writer = threading.Thread(target=overwrite_ring)
+        
+        def make_point(**kwargs):
+            # Let a writer run while the first point is built
+            if writer.ident is None:
+                writer.start()
+                writer.join(timeout=0.2)
+            return MetricPoint(**kwargs)
+        
+        monkeypatch.setattr(monitoring, "MetricPoint", make_point)
+        values = [point.value for point in storage.get_points("latency")]
+        writer.join()
+        
+        assert values == [float(i) for i in range(10)]
+        assert [point.value for point in storage.get_points("latency")] == [float(i) for i in range(5, 15)]
+    
+    def test_aggregation_matches_raw_points(self):
+        """Test rollup-based aggregates equal aggregates of the raw points."""
+        random.seed(7)
+        storage = TimeSeriesStorage(max_points_per_metric=2000)
+        
+        timestamp = 0
+        for _ in range(3000):
+            timestamp += random.randint(1, 240)
+            storage.add_point("success_rate", MetricPoint(at(timestamp), random.uniform(0, 1)))
+        
+        for start, end in [(None, None), (20000, 400000), (150000, 150500)]:
+            start_time = at(start) if start is not None else None
+            end_time = at(end) if end is not None else None
+            values = [point.value for point in storage.get_points("success_rate", start_time, end_time)]
+            
+            assert storage.aggregate_points("success_rate", "count", start_time, end_time) == len(values)
+            assert math.isclose(storage.aggregate_points("success_rate", "sum", start_time, end_time), sum(values))
+            assert storage.aggregate_points("success_rate", "min", start_time, end_time) == min(values)
+            assert storage.aggregate_points("success_rate", "max", start_time, end_time) == max(values)
+        
+        assert storage.aggregate_points("success_rate", "avg", at(10 ** 9)) is None
+        with pytest.raises(ValueError):
+            storage.aggregate_points("success_rate", "median")
+    
+    def test_cleanup_old_data(self):
+        """Test cleanup drops points before the retention cutoff."""
+        storage = TimeSeriesStorage()
+        now = datetime.now(timezone.utc)
+        for hours_ago in (50, 30, 10, 1):
+            storage.add_point("items_per_second", MetricPoint(now - timedelta(hours=hours_ago), float(hours_ago)))
+        
+        storage.cleanup_old_data(timedelta(hours=24))
+        
+        assert [point.value for point in storage.get_points("items_per_second")] == [10.0, 1.0]
+        summary = storage.summarize_points("items_per_second")
+        assert summary["count"] == 2
+        assert summary["first"] == 10.0
+        assert summary["last"] == 1.0
+    
+    def test_aggregation_after_cleanup_and_late_points(self):
+        """Test buckets that lost points are not reused once late points arrive."""
+        storage = TimeSeriesStorage(max_points_per_metric=100)
+        now = datetime.now(timezone.utc)
+        for minutes_ago in (200, 190, 180, 130, 70):
+            storage.add_point("m", MetricPoint(now - timedelta(minutes=minutes_ago), 1.0))
+        
+        storage.cleanup_old_data(timedelta(minutes=185))
+        storage.add_point("m", MetricPoint(now - timedelta(minutes=260), 1.0))
+        
+        assert len(storage.get_points("m")) == 4
+        assert storage.aggregate_points("m", "count") == 4
+        assert storage.aggregate_points("m", "sum") == 4.0
+    
+    def test_aggregation_with_interleaved_cleanup_and_late_points(self):
+        """Test aggregates stay exact when cleanups, evictions and late points interleave."""
+        random.seed(11)
+        storage = TimeSeriesStorage(max_points_per_metric=50)
+        now = datetime.now(timezone.utc)
+        
+        seconds_ago = 48 * 3600
+        for step in range(1, 500):
+            seconds_ago -= random.randint(1, 300)
+            late = seconds_ago + random.randint(0, 20000)
+            storage.add_point("m", MetricPoint(now - timedelta(seconds=late), random.uniform(0, 1)))
+            if step % 40 == 0:
+                storage.cleanup_old_data(timedelta(seconds=seconds_ago + random.randint(0, 10000)))
+            
+            values = [point.value for point in storage.get_points("m")]
+            if values:
+                assert storage.aggregate_points("m", "count") == len(values)
+                assert math.isclose(storage.aggregate_points("m", "sum"), sum(values))
+                assert storage.aggregate_points("m", "min") == min(values)
+                assert storage.aggregate_points("m", "max") == max(values)
+
+
+class TestPerformanceAnalyzer:
+    """Test streaming baselines and anomaly detection."""
+    
+    def test_rolling_statistic(self):
+        """Test the warm-up phase matches the exact mean and variance."""
+        values = [3.0, 5.0, 4.0, 8.0, 6.0]
+        statistic = RollingStatistic(alpha=0.05)
+        for value in values:
+            statistic.update(value)
+        
+        mean = sum(values) / len(values)
+        assert math.isclose(statistic.mean, mean)
+        assert math.isclose(statistic.variance, sum((v - mean) ** 2 for v in values) / len(values))
+        assert math.isclose(statistic.z_score(mean + 2 * statistic.std), 2.0)
+        
+        # After warm-up, recent values dominate
+        for _ in range(200):
+            statistic.update(100.0)
+        assert statistic.mean > 99
+    
+    def test_anomalies_are_z_score_tests(self):
+        """Test slow or failing operations are flagged against the baseline."""
+        random.seed(3)
+        analyzer = PerformanceAnalyzer()
+        
+        assert analyzer.analyze_operation(operation(10.0))["anomalies"] == ["Insufficient data for anomaly detection"]
+        for _ in range(30):
+            analyzer.analyze_operation(operation(random.uniform(9.0, 11.0)))
+        
+        assert analyzer.analyze_operation(operation(10.5), update_baseline=False)["anomalies"] == []
+        
+        slow = analyzer.analyze_operation(operation(40.0), update_baseline=False)
+        assert any("Processing time is unusually long" in anomaly for anomaly in slow["anomalies"])
+        assert any("Throughput" in anomaly for anomaly in slow["anomalies"])
+        assert slow["comparison_to_baseline"]["items_per_second_z_score"] < -3
+        
+        failing = analyzer.analyze_operation(operation(10.0, errors=20), update_baseline=False)
+        assert any("Error rate is unusually high" in anomaly for anomaly in failing["anomalies"])
+    
+    def test_constant_history_has_finite_z_scores(self):
+        """Test a baseline without spread neither yields infinite scores nor flags tiny deviations."""
+        statistic = RollingStatistic()
+        for _ in range(10):
+            statistic.update(5.0)
+        
+        assert statistic.z_score(5.0) == 0.0
+        assert math.isclose(statistic.z_score(5.1), 0.4)
+        
+        analyzer = PerformanceAnalyzer()
+        for _ in range(10):
+            analyzer.analyze_operation(operation(10.0))
+        
+        assert analyzer.analyze_operation(operation(10.1), update_baseline=False)["anomalies"] == []
+        
+        slow = analyzer.analyze_operation(operation(40.0), update_baseline=False)
+        assert any("Processing time is unusually long" in anomaly for anomaly in slow["anomalies"])
+        assert not any("inf" in anomaly for anomaly in slow["anomalies"])
+        assert math.isfinite(slow["comparison_to_baseline"]["items_per_second_z_score"])
+    
+    def test_reanalysis_does_not_update_baselines(self):
+        """Test update_baseline=False leaves the accumulators unchanged."""
+        analyzer = PerformanceAnalyzer()
+        metrics = operation(10.0)
+        
+        assert analyzer.analyze_operation(metrics)["comparison_to_baseline"] == {"baseline_established": True}
+        for _ in range(3):
+            analyzer.analyze_operation(metrics, update_baseline=False)
+        
+        baseline = analyzer._operation_baselines[OperationType.BATCH_SCORING]
+        assert baseline.operation_count == 1
+        assert baseline.duration.count == 1
+
+
+class TestAlertManager:
+    """Test alert rule evaluation and notifications."""
+    
+    def make_manager(self):
+        manager = AlertManager()
+        manager.add_alert_rule("low_success_rate", "success_rate", 90.0, "lt")
+        manager.add_alert_rule("critical_success_rate", "success_rate", 75.0, "lt", AlertSeverity.CRITICAL)
+        manager.add_alert_rule("slow", "items_per_second", 1.0, "lte")
+        return manager
+    
+    def test_rules_evaluated_for_present_metrics(self):
+        """Test only rules of the given metrics trigger."""
+        manager = self.make_manager()
+        
+        manager.check_alerts({"success_rate": 80.0, "unrelated": 0.0})
+        
+        alerts = manager.get_active_alerts()
+        assert [alert.metric_name for alert in alerts] == ["success_rate"]
+        assert alerts[0].title == "Alert: low_success_rate"
+        
+        with pytest.raises(MonitoringError):
+            manager.add_alert_rule("bad", "success_rate", 1.0, "approximately")
+    
+    def test_active_alerts_deduplicated_by_rule_and_context(self):
+        """Test repeated triggers do not create duplicate active alerts."""
+        manager = self.make_manager()
+        
+        for _ in range(3):
+            manager.check_alerts({"success_rate": 70.0}, {"project_name": "A"})
+        manager.check_alerts({"success_rate": 70.0}, {"project_name": "B"})
+        
+        assert len(manager.get_active_alerts()) == 4
+        
+        alert = manager.get_active_alerts()[0]
+        assert manager.resolve_alert(alert.alert_id)
+        manager.check_alerts({"success_rate": 70.0}, {"project_name": "A"})
+        assert len(manager.get_active_alerts()) == 4
+    
+    def test_alert_resolved_when_condition_clears(self):
+        """Test an alert resolves on recovery so the next breach fires again."""
+        manager = self.make_manager()
+        context = {"context": "system_health"}
+        
+        manager.check_alerts({"items_per_second": 0.5}, context)
+        first = manager.get_active_alerts()
+        assert len(first) == 1
+        
+        # Recovery in another context leaves the alert active
+        manager.check_alerts({"items_per_second": 5.0}, {"context": "other"})
+        assert manager.get_active_alerts() == first
+        
+        manager.check_alerts({"items_per_second": 5.0}, context)
+        assert manager.get_active_alerts() == []
+        assert first[0].resolved_at is not None
+        
+        manager.check_alerts({"items_per_second": 0.2}, context)
+        second = manager.get_active_alerts()
+        assert len(second) == 1
+        assert second[0].alert_id != first[0].alert_id
+        manager.close()
+    
+    def test_slow_callback_does_not_block(self):
+        """Test plain callbacks run off the caller's thread."""
+        manager = self.make_manager()
+        release = threading.Event()
+        notified = []
+        
+        def slow_callback(alert):
+            release.wait(5)
+            notified.append(alert.alert_id)
+        
+        manager.add_notification_callback(slow_callback)
+        manager.check_alerts({"items_per_second": 0.5})
+        
+        assert notified == []
+        release.set()
+        assert manager.wait_for_notifications(timeout=5)
+        assert len(notified) == 1
+        assert manager.get_active_alerts()[0].notification_sent
+        manager.close()
+    
+    @pytest.mark.asyncio
+    async def test_coroutine_callbacks_scheduled_on_loop(self):
+        """Test coroutine callbacks become tasks on the running loop."""
+        manager = self.make_manager()
+        notified = []
+        
+        async def callback(alert):
+            await asyncio.sleep(0.01)
+            notified.append(alert.alert_id)
+        
+        manager.add_notification_callback(callback)
+        manager.check_alerts({"items_per_second": 0.5})
+        
+        assert notified == []
+        await asyncio.sleep(0.05)
+        assert len(notified) == 1
@@ -0,0 +1,215 @@
+"""Unit tests for QVF scheduler request queueing.
+
+Tests covering:
+- Workers waking as soon as a request is queued
+- Priority order of queued requests
+- Deadline expiry into the dead letter queue
+- Resource sampling without blocking the event loop
+- Cron expression evaluation and heap-driven scheduled jobs
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timezone, timedelta
+
+from datascience_platform.qvf.orchestration.orchestrator import ScoringRequest
+from datascience_platform.qvf.orchestration.scheduler import (
+    QVFScheduler, Priority, JobStatus, JobType, ResourceMonitor, ResourceLimits,
+    CronExpression, SchedulingError, schedule_incremental_updates
+)
+
+
+def make_scheduler(worker_count=1):
+    scheduler = QVFScheduler(worker_count=worker_count, enable_monitoring=False)
+    processed = []
+    
+    async def process_request(worker_id, request):
+        processed.append(request)
+        request.status = JobStatus.COMPLETED
+    
+    scheduler._process_request = process_request
+    return scheduler, processed
+
+
+class TestQVFSchedulerQueue:
+    """Test priority request queueing."""
+    
+    @pytest.mark.asyncio
+    async def test_idle_worker_wakes_on_enqueue(self):
+        """Test a waiting worker picks up a request without polling delay."""
+        scheduler, processed = make_scheduler()
+        
+        async with scheduler.managed_scheduler():
+            await asyncio.sleep(0.01)
+            
+            loop = asyncio.get_running_loop()
+            queued_at = loop.time()
+            await scheduler.queue_priority_request(ScoringRequest(project_name="Test"))
+            
+            while not processed:
+                await asyncio.sleep(0.001)
+            
+            assert loop.time() - queued_at < 0.1
+            assert processed[0].started_at is not None
+    
+    @pytest.mark.asyncio
+    async def test_requests_taken_in_priority_order(self):
+        """Test requests queued before workers start are served by priority."""
+        scheduler, processed = make_scheduler()
+        
+        low = await scheduler.queue_priority_request(ScoringRequest(), priority=Priority.LOW)
+        high = await scheduler.queue_priority_request(ScoringRequest(), priority=Priority.HIGH)
+        
+        async with scheduler.managed_scheduler():
+            while len(processed) < 2:
+                await asyncio.sleep(0.001)
+        
+        assert [request.request_id for request in processed] == [high, low]
+    
+    @pytest.mark.asyncio
+    async def test_expired_request_moves_to_dead_letter_queue(self):
+        """Test the expiry timer removes requests past their deadline."""
+        scheduler, processed = make_scheduler()
+        
+        request_id = await scheduler.queue_priority_request(ScoringRequest(), max_wait_seconds=0.05)
+        kept_id = await scheduler.queue_priority_request(ScoringRequest(), max_wait_seconds=60)
+        
+        await asyncio.sleep(0.1)
+        
+        status = await scheduler.get_request_status(request_id)
+        assert status["status"] == "dead_letter"
+        assert [request.request_id for request in scheduler._priority_queue] == [kept_id]
+        assert scheduler._expiry_deadline is not None
+        
+        await scheduler.stop()
+        assert scheduler._expiry_timer is None
+
+
+class TestResourceMonitor:
+    """Test background resource sampling."""
+    
+    @pytest.mark.asyncio
+    async def test_sampling_does_not_block_event_loop(self):
+        """Test loop lag stays low while the monitor samples."""
+        monitor = ResourceMonitor(ResourceLimits())
+        monitor._monitoring_interval = 0.01
+        monitor._cpu_warmup_seconds = 0.01
+        monitor.current_usage.queue_size = 7
+        
+        loop = asyncio.get_running_loop()
+        max_lag = 0.0
+        
+        await monitor.start_monitoring()
+        try:
+            for _ in range(30):
+                expected = loop.time() + 0.005
+                await asyncio.sleep(0.005)
+                max_lag = max(max_lag, loop.time() - expected)
+        finally:
+            await monitor.stop_monitoring()
+        
+        assert max_lag < 0.05
+        assert len(monitor.usage_history) > 0
+        # Scheduler-maintained metrics survive a sample
+        assert monitor.current_usage.queue_size == 7
+        assert monitor.usage_history.maxlen == 100
+
+
+class TestCronExpression:
+    """Test cron expression evaluation."""
+    
+    def test_next_after(self):
+        """Test lists, ranges, steps and names."""
+        now = datetime(2026, 10, 18, 10, 7, 30, tzinfo=timezone.utc)  # Sunday
+        
+        assert CronExpression("*/15 * * * *").next_after(now) == now.replace(minute=15, second=0)
+        assert CronExpression("0 2 * * *").next_after(now) == datetime(2026, 10, 19, 2, 0, tzinfo=timezone.utc)
+        assert CronExpression("5,35 9-17/2 * * MON-FRI").next_after(now) == datetime(2026, 10, 19, 9, 5, tzinfo=timezone.utc)
+        assert CronExpression("15 3 29 FEB *").next_after(now) == datetime(2028, 2, 29, 3, 15, tzinfo=timezone.utc)
+        assert CronExpression("0 0 * * 7").next_after(now) == datetime(2026, 10, 25, tzinfo=timezone.utc)
+    
+    def test_day_of_month_or_day_of_week(self):
+        """Test a restricted day-of-month and day-of-week match either."""
+        cron = CronExpression("0 0 13 * 5")
+        start = datetime(2026, 10, 18, tzinfo=timezone.utc)
+        
+        assert cron.next_after(start) == datetime(2026, 10, 23, tzinfo=timezone.utc)  # Friday
+        assert cron.next_after(datetime(2026, 11, 12, tzinfo=timezone.utc)) == datetime(2026, 11, 13, tzinfo=timezone.utc)
+    
+    @pytest.mark.parametrize("expression", ["* * *", "60 * * * *", "*/0 * * * *", "5-2 * * * *", "x * * * *"])
+    def test_invalid_expressions(self, expression):
+        """Test malformed expressions are rejected."""
+        with pytest.raises(SchedulingError):
+            CronExpression(expression)
+    
+    def test_expression_that_never_matches(self):
+        """Test impossible dates raise instead of searching forever."""
+        with pytest.raises(SchedulingError):
+            CronExpression("0 0 31 2 *").next_after(datetime.now(timezone.utc))
+
+
+class TestQVFSchedulerJobs:
+    """Test heap-driven scheduled jobs."""
+    
+    @pytest.mark.asyncio
+    async def test_schedule_loop_wakes_for_due_job(self):
+        """Test the schedule loop runs a job when it becomes due."""
+        scheduler, processed = make_scheduler()
+        
+        async with scheduler.managed_scheduler():
+            job_id = await scheduler.schedule_job(
+                job_name="Hourly", job_type=JobType.BATCH_SCORING,
+                cron_expression="0 * * * *", project_name="Test", configuration={}
+            )
+            
+            job = scheduler._scheduled_jobs[job_id]
+            assert job.next_run_time.minute == 0
+            
+            job.next_run_time = datetime.now(timezone.utc) + timedelta(milliseconds=50)
+            scheduler._push_scheduled_job(job)
+            
+            for _ in range(200):
+                if processed:
+                    break
+                await asyncio.sleep(0.01)
+            
+            assert processed[0].job_reference == job_id
+            assert job.run_count == 1
+            assert job.next_run_time > datetime.now(timezone.utc)
+            assert scheduler._seconds_until_next_job() > 0
+    
+    @pytest.mark.asyncio
+    async def test_paused_and_invalid_jobs(self):
+        """Test paused jobs leave the heap and invalid cron expressions are rejected."""
+        scheduler, _ = make_scheduler()
+        
+        job_id = await scheduler.schedule_job(
+            job_name="Nightly", job_type=JobType.MAINTENANCE,
+            cron_expression="0 2 * * *", project_name="Test", configuration={}
+        )
+        assert scheduler._seconds_until_next_job() is not None
+        
+        scheduler.pause_job(job_id)
+        assert scheduler._seconds_until_next_job() is None
+        
+        scheduler.resume_job(job_id)
+        assert scheduler._seconds_until_next_job() is not None
+        
+        with pytest.raises(SchedulingError):
+            await scheduler.schedule_job(
+                job_name="Broken", job_type=JobType.CUSTOM,
+                cron_expression="every day", project_name="Test", configuration={}
+            )
+    
+    @pytest.mark.asyncio
+    async def test_incremental_update_intervals(self):
+        """Test incremental update intervals map to cron expressions and are validated."""
+        scheduler, _ = make_scheduler()
+        
+        for interval_minutes, expected in [(15, "*/15 * * * *"), (120, "0 */2 * * *"), (45, "0 * * * *")]:
+            job_id = await schedule_incremental_updates(scheduler, "Test", {}, interval_minutes)
+            assert scheduler._scheduled_jobs[job_id].cron_expression == expected
+        
+        for interval_minutes in (0, -5):
+            with pytest.raises(ValueError):
+                await schedule_incremental_updates(scheduler, "Test", {}, interval_minutes)